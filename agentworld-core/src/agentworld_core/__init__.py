@@ -12,6 +12,7 @@ from . import (
     versions,
     http,
     subprocess_security,
+    bounds,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "versions",
     "http",
     "subprocess_security",
+    "bounds",
 ]
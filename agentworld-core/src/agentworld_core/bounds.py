@@ -0,0 +1,293 @@
+"""Shared world-bounds service backed by per-stage ``UsdGeom.BBoxCache`` instances.
+
+Extensions previously built a fresh BBoxCache per call (or per prim), discarding
+the cached child extents every time. This service keeps one cache per stage and
+time code, clears it lazily after ``Usd.Notice.ObjectsChanged`` reports an edit
+that can affect extents, and hands out bounds in plain-Python form. Records are
+keyed by the stage's layers rather than the stage object, so the service never
+keeps a closed stage alive; they are dropped on :meth:`StageBoundsService.release`,
+which the process-wide service calls for Kit's stage-closed events.
+
+``pxr`` is imported lazily so the module stays importable from MCP servers and
+tests that run without USD.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+Vec3 = Tuple[float, float, float]
+
+# Property namespaces whose edits never change a prim's extent or transform
+_BOUNDS_NEUTRAL_PREFIXES = (
+    'primvars:',
+    'material:',
+    'semantic:',
+    'worldbuilder:',
+    'worldsurveyor:',
+)
+
+# Layer metadata fields on the pseudo-root that hold bookkeeping, not geometry
+_BOUNDS_NEUTRAL_LAYER_FIELDS = frozenset({'customLayerData'})
+
+
+class _StageRecord:
+    __slots__ = ('session_layer', 'listener', 'caches', 'dirty')
+
+    def __init__(self, session_layer: Any) -> None:
+        # Pins the (small) session layer, not the stage, so its identifier in the
+        # record key cannot be reused by a later stage while the record exists
+        self.session_layer = session_layer
+        self.listener = None
+        self.caches: Dict[Tuple[Any, Tuple[str, ...]], Any] = {}
+        self.dirty = False
+
+
+class StageBoundsService:
+    """Serve world-space bounds from one shared BBoxCache per stage and time code.
+
+    All methods are expected to run on the thread that owns the stage (Kit's
+    main thread); the internal lock only guards bookkeeping against notice
+    callbacks and concurrent lookups.
+    """
+
+    def __init__(self, *, max_stages: int = 4) -> None:
+        self._lock = threading.RLock()
+        self._records: "OrderedDict[Any, _StageRecord]" = OrderedDict()
+        self._max_stages = max(1, max_stages)
+        self._stats = {'cache_hits': 0, 'cache_misses': 0, 'invalidations': 0, 'releases': 0}
+        self._stage_event_subscription = None
+
+    # ------------------------------------------------------------------
+    def get_bbox_cache(
+        self,
+        stage: Any,
+        time_code: Any = None,
+        purposes: Optional[Sequence[Any]] = None,
+    ) -> Any:
+        """Return the shared BBoxCache for ``stage`` at ``time_code`` (default time)."""
+        from pxr import Usd, UsdGeom
+
+        if time_code is None:
+            time_code = Usd.TimeCode.Default()
+        if purposes is None:
+            purposes = [UsdGeom.Tokens.default_]
+        key = (_time_key(time_code), tuple(str(p) for p in purposes))
+
+        with self._lock:
+            record = self._record_for(stage)
+            if record.dirty or record.listener is None:
+                for cache in record.caches.values():
+                    cache.Clear()
+                record.dirty = False
+            cache = record.caches.get(key)
+            if cache is None:
+                self._stats['cache_misses'] += 1
+                cache = UsdGeom.BBoxCache(time_code, list(purposes))
+                record.caches[key] = cache
+            else:
+                self._stats['cache_hits'] += 1
+            return cache
+
+    def compute_world_range(self, stage: Any, prim: Any, time_code: Any = None) -> Optional[Tuple[Vec3, Vec3]]:
+        """Return the axis-aligned world ``(min, max)`` of ``prim`` or ``None`` when empty.
+
+        ``prim`` may be a ``Usd.Prim`` or a path string.
+        """
+        if isinstance(prim, str):
+            prim = stage.GetPrimAtPath(prim)
+        if not prim or not prim.IsValid():
+            return None
+
+        with self._lock:
+            bound = self.get_bbox_cache(stage, time_code).ComputeWorldBound(prim)
+        aligned = bound.ComputeAlignedRange()
+        if aligned.IsEmpty():
+            return None
+        min_pt, max_pt = aligned.GetMin(), aligned.GetMax()
+        min_coords = (float(min_pt[0]), float(min_pt[1]), float(min_pt[2]))
+        max_coords = (float(max_pt[0]), float(max_pt[1]), float(max_pt[2]))
+        if not all(abs(coord) < 1e30 for coord in min_coords + max_coords):
+            return None
+        return min_coords, max_coords
+
+    def compute_world_bounds(self, stage: Any, prim: Any, time_code: Any = None) -> Optional[Dict[str, list]]:
+        """Return ``{'min', 'max', 'center', 'size'}`` lists for ``prim`` or ``None``."""
+        world_range = self.compute_world_range(stage, prim, time_code)
+        if world_range is None:
+            return None
+        return _bounds_dict(*world_range)
+
+    def compute_union_bounds(self, stage: Any, prims: Iterable[Any], time_code: Any = None) -> Optional[Dict[str, list]]:
+        """Return the combined bounds of several prims/paths, skipping empty ones."""
+        all_min = [float('inf')] * 3
+        all_max = [float('-inf')] * 3
+        found = False
+        for prim in prims:
+            world_range = self.compute_world_range(stage, prim, time_code)
+            if world_range is None:
+                continue
+            found = True
+            for i in range(3):
+                all_min[i] = min(all_min[i], world_range[0][i])
+                all_max[i] = max(all_max[i], world_range[1][i])
+        if not found:
+            return None
+        return _bounds_dict(tuple(all_min), tuple(all_max))
+
+    def invalidate(self, stage: Any = None) -> None:
+        """Force the next lookup to recompute bounds (all stages when ``stage`` is None)."""
+        with self._lock:
+            records = self._records.values() if stage is None else [self._records.get(_stage_key(stage))]
+            for record in records:
+                if record is not None:
+                    record.dirty = True
+            self._stats['invalidations'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache hit/miss counters and the number of tracked stages."""
+        with self._lock:
+            return {**self._stats, 'stages': len(self._records)}
+
+    def release(self, stage: Any = None) -> int:
+        """Drop the caches and listener of ``stage`` (every stage when None); call on close or detach."""
+        with self._lock:
+            if stage is None:
+                records = list(self._records.values())
+                self._records.clear()
+            else:
+                record = self._records.pop(_stage_key(stage), None)
+                records = [record] if record is not None else []
+            for record in records:
+                _revoke(record)
+            self._stats['releases'] += len(records)
+            return len(records)
+
+    def subscribe_stage_events(self, usd_context: Any) -> None:
+        """Release every record when ``usd_context`` closes or replaces its stage."""
+        def on_stage_event(event: Any) -> None:
+            import omni.usd
+
+            if event.type in (int(omni.usd.StageEventType.CLOSING), int(omni.usd.StageEventType.CLOSED)):
+                self.release()
+
+        self._stage_event_subscription = usd_context.get_stage_event_stream().create_subscription_to_pop(
+            on_stage_event, name="agentworld_core_bounds_release"
+        )
+
+    def shutdown(self) -> None:
+        """Revoke notice listeners and drop every cache."""
+        self._stage_event_subscription = None
+        self.release()
+
+    # ------------------------------------------------------------------
+    def _record_for(self, stage: Any) -> _StageRecord:
+        key = _stage_key(stage)
+        record = self._records.get(key)
+        if record is not None:
+            self._records.move_to_end(key)
+            return record
+
+        record = _StageRecord(stage.GetSessionLayer())
+        try:
+            from pxr import Tf, Usd
+
+            record.listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged,
+                lambda notice, sender, rec=record: self._on_objects_changed(rec, notice),
+                stage,
+            )
+        except Exception:
+            # Without notices the cache cannot be trusted across edits
+            record.listener = None
+        self._records[key] = record
+        while len(self._records) > self._max_stages:
+            _, evicted = self._records.popitem(last=False)
+            _revoke(evicted)
+        return record
+
+    def _on_objects_changed(self, record: _StageRecord, notice: Any) -> None:
+        if record.dirty:
+            return
+        try:
+            affects_bounds = any(_affects_bounds(path) for path in notice.GetResyncedPaths()) or any(
+                _affects_bounds(path, notice) for path in notice.GetChangedInfoOnlyPaths()
+            )
+        except Exception:
+            affects_bounds = True
+        if affects_bounds:
+            with self._lock:
+                record.dirty = True
+                self._stats['invalidations'] += 1
+
+
+def _affects_bounds(path: Any, notice: Any = None) -> bool:
+    if notice is not None and path.IsAbsoluteRootPath():
+        fields = set(notice.GetChangedFields(path))
+        return not (fields and fields <= _BOUNDS_NEUTRAL_LAYER_FIELDS)
+    if not path.IsPropertyPath():
+        return True
+    name = str(path.name)
+    return not name.startswith(_BOUNDS_NEUTRAL_PREFIXES)
+
+
+def _stage_key(stage: Any) -> Tuple[str, str]:
+    """Identity of a stage that does not reference it: its root and session layers.
+
+    A stage's layers live exactly as long as it does, and two stages on the same
+    root layer still have distinct anonymous session layers.
+    """
+    session_layer = stage.GetSessionLayer()
+    return stage.GetRootLayer().identifier, session_layer.identifier if session_layer else ''
+
+
+def _time_key(time_code: Any) -> Any:
+    try:
+        return 'default' if time_code.IsDefault() else float(time_code.GetValue())
+    except AttributeError:
+        return float(time_code)
+
+
+def _revoke(record: _StageRecord) -> None:
+    if record.listener is not None:
+        try:
+            record.listener.Revoke()
+        except Exception:
+            pass
+        record.listener = None
+    record.caches.clear()
+    record.session_layer = None
+
+
+def _bounds_dict(min_coords: Sequence[float], max_coords: Sequence[float]) -> Dict[str, list]:
+    return {
+        'min': [float(v) for v in min_coords],
+        'max': [float(v) for v in max_coords],
+        'center': [(min_coords[i] + max_coords[i]) / 2.0 for i in range(3)],
+        'size': [max_coords[i] - min_coords[i] for i in range(3)],
+    }
+
+
+_service: Optional[StageBoundsService] = None
+_service_lock = threading.Lock()
+
+
+def get_bounds_service() -> StageBoundsService:
+    """Return the process-wide bounds service shared by all extensions."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = StageBoundsService()
+            try:
+                import omni.usd
+
+                _service.subscribe_stage_events(omni.usd.get_context())
+            except Exception:
+                # Outside Kit there are no stage events; callers release stages explicitly
+                pass
+        return _service
+
+
+__all__ = ['StageBoundsService', 'get_bounds_service']
@@ -23,6 +23,7 @@ Usage:
 
 import json
 import logging
+import tempfile
 import time
 from http.server import BaseHTTPRequestHandler
 from pathlib import Path
@@ -53,6 +54,20 @@ def _load_http_config():
 # Initialize HTTP configuration (version info already handled above)
 HTTP_CONFIG = _load_http_config()
 
+# POST bodies with these content types are spooled to disk instead of parsed as JSON
+BINARY_CONTENT_TYPES = ('application/octet-stream', 'application/x-ndjson', 'model/')
+DEFAULT_MAX_UPLOAD_LENGTH = 1024 * 1024 * 1024
+DEFAULT_UPLOAD_SPOOL_SIZE = 8 * 1024 * 1024
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class RequestBodyError(Exception):
+    """Malformed or oversized request body; carries the HTTP status to reply with."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class WorldHTTPHandler(BaseHTTPRequestHandler):
     """
@@ -201,6 +216,22 @@ class WorldHTTPHandler(BaseHTTPRequestHandler):
             start_t = time.time()
             if method == 'GET':
                 response = self._handle_get_request(endpoint, params)
+            elif method == 'POST' and self._is_binary_upload():
+                # Binary uploads arrive as a spooled file; options come from the query string
+                try:
+                    upload, upload_size = self._read_upload_body()
+                except RequestBodyError as exc:
+                    self.close_connection = True
+                    self._send_error_response(exc.status_code, str(exc))
+                    return
+                with upload:
+                    data = dict(params)
+                    data.update({
+                        '_upload': upload,
+                        '_upload_size': upload_size,
+                        '_content_type': self.headers.get('Content-Type', ''),
+                    })
+                    response = self._handle_post_request(endpoint, data)
             elif method == 'POST':
                 # Read POST data
                 content_length = int(self.headers.get('Content-Length', 0))
@@ -222,10 +253,21 @@ class WorldHTTPHandler(BaseHTTPRequestHandler):
                 is_spec = 'openapi' in response
                 self._send_json_response(response, status_code=200 if is_spec else 500)
                 return
-            if isinstance(response, dict) and response.get('_raw_text') is not None:
+            if isinstance(response, dict) and response.get('_stream') is not None:
+                self._send_stream_response(
+                    response['_stream'],
+                    response.get('_content_type', 'application/octet-stream'),
+                    response.get('_headers'),
+                )
+            elif isinstance(response, dict) and response.get('_raw_text') is not None:
                 # Raw response support with optional content type override
                 content_type = response.get('_content_type', 'text/plain; version=0.0.4')
                 self._send_raw_response(response.get('_raw_text', ''), content_type)
+            elif isinstance(response, dict):
+                # Routes may add headers (e.g. ETag) and pick the status, e.g. 304 for a matching If-None-Match
+                headers = response.pop('_headers', None)
+                status_code = response.pop('_status_code', 200)
+                self._send_json_response(response, status_code=status_code, headers=headers)
             else:
                 self._send_json_response(response)
             try:
@@ -420,13 +462,16 @@ class WorldHTTPHandler(BaseHTTPRequestHandler):
             hsts_value = security_config.get('hsts_max_age', 'max-age=31536000; includeSubDomains')
             self.send_header('Strict-Transport-Security', hsts_value)
     
-    def _send_json_response(self, data: Dict[str, Any], status_code: int = 200):
+    def _send_json_response(self, data: Dict[str, Any], status_code: int = 200,
+                            headers: Optional[Dict[str, str]] = None):
         """Send JSON response with proper headers including security headers."""
         response_config = HTTP_CONFIG.get('response_formats', {})
         cors_config = HTTP_CONFIG.get('cors_headers', {})
 
         self.send_response(status_code)
         self.send_header('Content-Type', 'application/json')
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
 
         # Add security headers
         self._add_security_headers()
@@ -436,6 +481,10 @@ class WorldHTTPHandler(BaseHTTPRequestHandler):
                         cors_config.get('access_control_allow_origin', '*'))
         self.send_header('Vary', cors_config.get('vary_header', 'Origin'))
         self.end_headers()
+
+        if status_code == 304:
+            # Not Modified never carries a body
+            return
         
         # Use configured JSON formatting
         json_response = json.dumps(
@@ -465,6 +514,123 @@ class WorldHTTPHandler(BaseHTTPRequestHandler):
         
         self.wfile.write(content.encode('utf-8'))
     
+    def _send_stream_response(self, chunks, content_type: str, headers: Optional[Dict[str, str]] = None,
+                              status_code: int = 200):
+        """
+        Stream an iterable of byte chunks with security headers.
+
+        HTTP/1.1 clients get ``Transfer-Encoding: chunked``; HTTP/1.0 clients
+        get the raw bytes terminated by closing the connection. Either way the
+        connection is closed afterwards and the iterable is closed even if the
+        client disconnects mid-transfer.
+        """
+        cors_config = HTTP_CONFIG.get('cors_headers', {})
+        chunked = self.request_version == 'HTTP/1.1'
+        if chunked:
+            self.protocol_version = 'HTTP/1.1'
+        self.close_connection = True
+
+        try:
+            self.send_response(status_code)
+            self.send_header('Content-Type', content_type)
+            for name, value in (headers or {}).items():
+                self.send_header(name, str(value))
+
+            # Add security headers
+            self._add_security_headers()
+
+            # Add CORS headers
+            self.send_header('Access-Control-Allow-Origin',
+                            cors_config.get('access_control_allow_origin', '*'))
+            self.send_header('Vary', cors_config.get('vary_header', 'Origin'))
+            if chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+
+            try:
+                for chunk in chunks:
+                    if not chunk:
+                        continue
+                    if chunked:
+                        self.wfile.write(b'%X\r\n' % len(chunk))
+                        self.wfile.write(chunk)
+                        self.wfile.write(b'\r\n')
+                    else:
+                        self.wfile.write(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                logger.info("Client disconnected during streamed response")
+                return
+            except Exception as exc:
+                # Headers are already out; omitting the final chunk tells the client the body is incomplete
+                logger.error(f"Streamed response failed: {exc}", exc_info=True)
+                return
+            if chunked:
+                self.wfile.write(b'0\r\n\r\n')
+        finally:
+            close = getattr(chunks, 'close', None)
+            if callable(close):
+                close()
+
+    def _is_binary_upload(self) -> bool:
+        """True when the POST body is a file upload rather than JSON."""
+        content_type = (self.headers.get('Content-Type') or '').split(';', 1)[0].strip().lower()
+        return content_type.startswith(BINARY_CONTENT_TYPES)
+
+    def _read_upload_body(self):
+        """
+        Spool a binary request body to a temporary file and return ``(file, size)``.
+
+        Supports ``Content-Length`` and ``Transfer-Encoding: chunked`` bodies up
+        to ``server_defaults.max_upload_length`` bytes; small bodies stay in memory.
+        """
+        server_config = HTTP_CONFIG.get('server_defaults', {})
+        limit = int(server_config.get('max_upload_length', DEFAULT_MAX_UPLOAD_LENGTH))
+        body = tempfile.SpooledTemporaryFile(
+            max_size=int(server_config.get('upload_spool_size', DEFAULT_UPLOAD_SPOOL_SIZE))
+        )
+        try:
+            if 'chunked' in (self.headers.get('Transfer-Encoding') or '').lower():
+                total = 0
+                while True:
+                    line = self.rfile.readline(65537)
+                    try:
+                        size = int(line.split(b';', 1)[0].strip(), 16)
+                    except ValueError:
+                        raise RequestBodyError(400, 'Malformed chunked request body')
+                    if size == 0:
+                        # Discard optional trailers up to the terminating blank line
+                        while self.rfile.readline(65537) not in (b'\r\n', b'\n', b''):
+                            pass
+                        break
+                    total += size
+                    if total > limit:
+                        raise RequestBodyError(413, f'Request body exceeds {limit} bytes')
+                    self._copy_body(body, size)
+                    self.rfile.readline(3)
+            else:
+                try:
+                    total = int(self.headers.get('Content-Length', 0))
+                except ValueError:
+                    raise RequestBodyError(400, 'Invalid Content-Length')
+                if total > limit:
+                    raise RequestBodyError(413, f'Request body exceeds {limit} bytes')
+                self._copy_body(body, total)
+        except BaseException:
+            body.close()
+            raise
+        body.seek(0)
+        return body, total
+
+    def _copy_body(self, target, length: int):
+        remaining = length
+        while remaining > 0:
+            chunk = self.rfile.read(min(_COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise RequestBodyError(400, 'Request body ended early')
+            target.write(chunk)
+            remaining -= len(chunk)
+
     def _send_error_response(self, status_code: int, error_message: str):
         """Send error response with proper status code and security headers."""
         cors_config = HTTP_CONFIG.get('cors_headers', {})
@@ -23,6 +23,7 @@ from .config import get_config
 from agentworld_core.logging import setup_logging
 from .http_handler import WorldBuilderHTTPHandler
 from .scene_builder import SceneBuilder
+from .scene.type_index import matches_semantic_category
 from .security import WorldBuilderAuth
 from .utils import count_world_children
 
@@ -198,6 +199,11 @@ class HTTPAPIInterface:
         except Exception:
             return None
     
+    @property
+    def scene_builder(self) -> Optional[SceneBuilder]:
+        """Scene builder owning the request queue and stage caches."""
+        return self._scene_builder
+    
     def get_port(self):
         """Get the server port (for health endpoint compatibility)."""
         return self._port
@@ -263,6 +269,9 @@ class HTTPAPIInterface:
                 
             if self._server_thread and self._server_thread.is_alive():
                 self._server_thread.join(timeout=2)
+
+            if self._scene_builder:
+                self._scene_builder.shutdown()
                 
             logger.info("WorldBuilder HTTP API shutdown complete")
             
@@ -273,50 +282,32 @@ class HTTPAPIInterface:
             self._server_thread = None
 
     # Query methods restored from backup
-    def _query_objects_by_type(self, object_type: str):
-        """Query objects by semantic type (e.g., 'furniture', 'cube', 'sphere')."""
+    def _query_objects_by_type(self, object_type: str, match: str = 'auto', page: int = 1, page_size: Optional[int] = None):
+        """Query objects by semantic type (e.g., 'furniture', 'cube', 'sphere').
+
+        Matching uses the inverted type index: ``auto`` (default) matches a
+        substring of the prim name or type plus semantic category members;
+        ``substring``, ``prefix``, ``category`` and ``type`` narrow the match.
+        """
         try:
-            import omni.usd
-            from pxr import Usd, UsdGeom
-            
-            context = omni.usd.get_context()
-            stage = context.get_stage()
+            stage = self._get_stage()
             
             if not stage:
                 return {'success': False, 'error': 'No USD stage available'}
             
-            matching_objects = []
-            object_type_lower = object_type.lower()
             max_results = max(1, int(getattr(self, '_max_query_results', 200) or 200))
+            page = max(1, int(page or 1))
+            page_size = max(1, min(int(page_size or max_results), max_results))
 
-            # Traverse stage to find matching objects
-            for prim in stage.Traverse():
-                if not prim.IsValid():
-                    continue
-                
-                # Check by USD type name
-                type_name = prim.GetTypeName().lower()
-                if object_type_lower in type_name:
-                    obj_info = self._extract_object_info(prim)
-                    if obj_info:
-                        matching_objects.append(obj_info)
-                    continue
-                
-                # Check by name contains type
-                prim_name = prim.GetName().lower()
-                if object_type_lower in prim_name:
-                    obj_info = self._extract_object_info(prim)
-                    if obj_info:
-                        matching_objects.append(obj_info)
-                    continue
-                
-                # Check semantic keywords
-                if self._matches_semantic_type(prim_name, type_name, object_type_lower):
-                    obj_info = self._extract_object_info(prim)
-                    if obj_info:
-                        matching_objects.append(obj_info)
-                if len(matching_objects) >= max_results:
-                    break
+            # Sorted path list from the index; only the requested page touches USD
+            matching_paths = self._scene_builder.type_index.query(object_type, match)
+            total = len(matching_paths)
+            start = (page - 1) * page_size
+
+            from .scene.transform_service import read_transforms
+
+            snapshot = read_transforms(stage, matching_paths[start:start + page_size])
+            matching_objects = [snapshot.object_info(row) for row in range(len(snapshot))]
 
             with self._stats_lock:
                 self._api_stats['objects_queried'] = self._api_stats.get('objects_queried', 0) + len(matching_objects)
@@ -326,9 +317,23 @@ class HTTPAPIInterface:
                 'objects': matching_objects,
                 'count': len(matching_objects),
                 'query_type': object_type,
+                'match': match,
+                'pagination': {
+                    'page': page,
+                    'page_size': page_size,
+                    'total_items': total,
+                    'total_pages': max(1, (total + page_size - 1) // page_size),
+                },
                 'timestamp': datetime.utcnow().isoformat()
             }
             
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_code': 'VALIDATION_ERROR',
+                'timestamp': datetime.utcnow().isoformat()
+            }
         except Exception as e:
             logger.error(f"Error querying objects by type: {e}")
             return {
@@ -340,42 +345,16 @@ class HTTPAPIInterface:
     def _query_objects_in_bounds(self, min_bounds: list, max_bounds: list):
         """Query objects within spatial bounds."""
         try:
-            import omni.usd
-            from pxr import Usd, UsdGeom
-            
-            context = omni.usd.get_context()
-            stage = context.get_stage()
+            stage = self._get_stage()
             
             if not stage:
                 return {'success': False, 'error': 'No USD stage available'}
             
-            matching_objects = []
-            min_x, min_y, min_z = min_bounds
-            max_x, max_y, max_z = max_bounds
             max_results = max(1, int(getattr(self, '_max_query_results', 200) or 200))
 
-            # Traverse stage to find objects within bounds
-            for prim in stage.Traverse():
-                if not prim.IsValid() or not self._is_geometric_object(prim):
-                    continue
-                
-                # Get object position
-                position = self._get_object_position(prim)
-                if not position:
-                    continue
-                
-                x, y, z = position
-                
-                # Check if position is within bounds
-                if (min_x <= x <= max_x and 
-                    min_y <= y <= max_y and 
-                    min_z <= z <= max_z):
-                    
-                    obj_info = self._extract_object_info(prim)
-                    if obj_info:
-                        matching_objects.append(obj_info)
-                if len(matching_objects) >= max_results:
-                    break
+            # Spatial index returns geometric prims whose position lies inside the box
+            entries = self._scene_builder.spatial_index.query_box(tuple(min_bounds), tuple(max_bounds))
+            matching_objects = [entry.to_object_info() for entry in entries[:max_results]]
 
             with self._stats_lock:
                 self._api_stats['objects_queried'] = self._api_stats.get('objects_queried', 0) + len(matching_objects)
@@ -399,47 +378,20 @@ class HTTPAPIInterface:
     def _query_objects_near_point(self, point: list, radius: float):
         """Query objects near a specific point within radius."""
         try:
-            import omni.usd
-            from pxr import Usd, UsdGeom
-            import math
-            
-            context = omni.usd.get_context()
-            stage = context.get_stage()
+            stage = self._get_stage()
             
             if not stage:
                 return {'success': False, 'error': 'No USD stage available'}
             
-            matching_objects = []
-            px, py, pz = point
             max_results = max(1, int(getattr(self, '_max_query_results', 200) or 200))
             
-            # Traverse stage to find objects near point
-            for prim in stage.Traverse():
-                if not prim.IsValid() or not self._is_geometric_object(prim):
-                    continue
-                
-                # Get object position
-                position = self._get_object_position(prim)
-                if not position:
-                    continue
-                
-                x, y, z = position
-                
-                # Calculate distance from point
-                distance = math.sqrt((x - px)**2 + (y - py)**2 + (z - pz)**2)
-                
-                if distance <= radius:
-                    obj_info = self._extract_object_info(prim)
-                    if obj_info:
-                        obj_info['distance_from_point'] = distance
-                        matching_objects.append(obj_info)
-                if len(matching_objects) >= max_results:
-                    break
-            
-            # Sort by distance (closest first)
-            matching_objects.sort(key=lambda obj: obj.get('distance_from_point', float('inf')))
-            if len(matching_objects) > max_results:
-                matching_objects = matching_objects[:max_results]
+            # Spatial index returns matches sorted by distance (closest first)
+            matches = self._scene_builder.spatial_index.query_radius(tuple(point), float(radius))
+            matching_objects = []
+            for entry, distance in matches[:max_results]:
+                obj_info = entry.to_object_info()
+                obj_info['distance_from_point'] = distance
+                matching_objects.append(obj_info)
 
             with self._stats_lock:
                 self._api_stats['objects_queried'] = self._api_stats.get('objects_queried', 0) + len(matching_objects)
@@ -463,13 +415,11 @@ class HTTPAPIInterface:
 
     # Utility functions restored from backup
     def _calculate_bounds(self, object_paths: list):
-        """Calculate combined bounding box using the reliable BoundsCalculator."""
+        """Calculate combined bounding box from one batched transform/bounds snapshot."""
         try:
-            import omni.usd
-            from .bounds_calculator import BoundsCalculator
+            from .scene.transform_service import read_transforms
             
-            context = omni.usd.get_context()
-            stage = context.get_stage()
+            stage = self._get_stage()
             
             if not stage:
                 return {'success': False, 'error': 'No USD stage available'}
@@ -477,26 +427,17 @@ class HTTPAPIInterface:
             if not object_paths:
                 return {'success': False, 'error': 'No objects provided'}
             
-            # Use the same reliable bounds calculation as the UI
-            bounds_calculator = BoundsCalculator()
-            bounds_data = bounds_calculator.calculate_selection_bounds(stage, object_paths)
+            # Prims without an extent contribute their world position, as in the UI
+            snapshot = read_transforms(stage, object_paths)
+            combined_bounds = snapshot.combined_bounds()
             
-            if not bounds_data:
+            if not combined_bounds:
                 return {
                     'success': False,
                     'error': 'No valid objects with bounds found',
                     'timestamp': datetime.utcnow().isoformat()
                 }
             
-            # Format results to match expected API format
-            combined_bounds = {
-                'min': bounds_data['min'],
-                'max': bounds_data['max'], 
-                'center': bounds_data['center'],
-                'size': bounds_data['size'],
-                'volume': bounds_data['size'][0] * bounds_data['size'][1] * bounds_data['size'][2]
-            }
-            
             return {
                 'success': True,
                 'bounds': combined_bounds,
@@ -516,72 +457,29 @@ class HTTPAPIInterface:
     def _find_ground_level(self, position: list, search_radius: float = 10.0):
         """Find ground level at position using consensus algorithm."""
         try:
-            import omni.usd
-            from pxr import Usd, UsdGeom
-            import math
-            
-            context = omni.usd.get_context()
-            stage = context.get_stage()
+            stage = self._get_stage()
             
             if not stage:
                 return {'success': False, 'error': 'No USD stage available'}
             
             px, py, pz = position
             
-            # Find all objects within search radius
+            # Find all objects within search radius (2D distance from position)
             objects_in_area = []
             lowest_points = []
-            max_results = max(1, int(getattr(self, '_max_query_results', 200) or 200))
-            
-            for prim in stage.Traverse():
-                if not prim.IsValid() or not self._is_geometric_object(prim):
-                    continue
-                
-                # Get object position
-                obj_position = self._get_object_position(prim)
-                if not obj_position:
-                    continue
-                
-                x, y, z = obj_position
-                
-                # Check if object is within search radius (2D distance from position)
-                distance = math.sqrt((x - px)**2 + (z - pz)**2)
-                
-                if distance <= search_radius:
-                    try:
-                        # Get object's lowest point
-                        bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), ['default'])
-                        bound = bbox_cache.ComputeWorldBound(prim)
-                        
-                        # Check if bounding box is empty using USD API
-                        if not bound.GetRange().IsEmpty():
-                            bbox_range = bound.ComputeAlignedRange()
-                            min_point = bbox_range.GetMin()
-                            lowest_y = float(min_point[1])  # Y is up in Isaac Sim
-                            lowest_points.append(lowest_y)
-                            objects_in_area.append({
-                                'path': str(prim.GetPath()),
-                                'name': prim.GetName(),
-                                'type': prim.GetTypeName(),
-                                'position': [float(x), float(y), float(z)],
-                                'distance': distance,
-                                'lowest_y': lowest_y
-                            })
-                    
-                    except Exception as e:
-                        logger.debug(f"Error processing object {prim.GetPath()}: {e}")
-                        # Fallback: use object center Y as lowest point
-                        lowest_points.append(float(y))
-                        objects_in_area.append({
-                            'path': str(prim.GetPath()),
-                            'name': prim.GetName(),
-                            'type': prim.GetTypeName(),
-                            'position': [float(x), float(y), float(z)],
-                            'distance': distance,
-                            'lowest_y': float(y)
-                        })
-                if len(objects_in_area) >= max_results:
-                    break
+            for entry, distance in self._scene_builder.spatial_index.query_column(px, pz, float(search_radius)):
+                x, y, z = entry.position
+                # Y is up in Isaac Sim; without a world bound fall back to the object's center Y
+                lowest_y = float(entry.bounds_min[1]) if entry.bounds_min is not None else float(y)
+                lowest_points.append(lowest_y)
+                objects_in_area.append({
+                    'path': entry.path,
+                    'name': entry.name,
+                    'type': entry.type_name,
+                    'position': [float(x), float(y), float(z)],
+                    'distance': distance,
+                    'lowest_y': lowest_y
+                })
 
             if not lowest_points:
                 return {
@@ -618,13 +516,19 @@ class HTTPAPIInterface:
             }
 
     def _align_objects(self, object_paths: list, axis: str, alignment: str = 'center', spacing: float = None):
-        """Align objects along specified axis with optional uniform spacing."""
+        """Align objects along specified axis with optional uniform spacing.
+
+        The first object is the reference: ``min``/``max``/``center`` line up
+        that side of every object's world bounds with it, and ``spacing``
+        distributes the objects ``i * spacing`` apart along the axis. Positions
+        are read and written in one batch (single change block).
+        """
         try:
-            import omni.usd
-            from pxr import Usd, UsdGeom
+            from .scene.transform_service import (
+                ALIGNMENTS, aligned_positions, read_transforms, write_world_positions,
+            )
             
-            context = omni.usd.get_context()
-            stage = context.get_stage()
+            stage = self._get_stage()
             
             if not stage:
                 return {'success': False, 'error': 'No USD stage available'}
@@ -636,99 +540,50 @@ class HTTPAPIInterface:
             if axis not in ['x', 'y', 'z']:
                 return {'success': False, 'error': "axis must be 'x', 'y', or 'z'"}
             
-            # Get object information using proper Omniverse USD methods
-            objects = []
-            for obj_path in object_paths:
-                prim = stage.GetPrimAtPath(obj_path)
-                if not prim or not prim.IsValid():
-                    logger.warning(f"Invalid object path: {obj_path}")
-                    continue
-                
-                try:
-                    # Use Omniverse-specific method (most reliable)
-                    world_transform = omni.usd.get_world_transform_matrix(prim)
-                    translation = world_transform.ExtractTranslation()
-                    
-                    objects.append({
-                        'path': obj_path,
-                        'prim': prim,
-                        'position': [float(translation[0]), float(translation[1]), float(translation[2])],
-                        'world_transform': world_transform
-                    })
-                    logger.debug(f"Got position for {obj_path}: {[float(translation[0]), float(translation[1]), float(translation[2])]}")
-                    
-                except Exception as e:
-                    logger.warning(f"Could not get transform for object {obj_path}: {e}")
-                    continue
+            alignment = alignment or 'center'
+            if alignment not in ALIGNMENTS:
+                return {'success': False, 'error': f"alignment must be one of {', '.join(ALIGNMENTS)}"}
             
-            if len(objects) < 2:
-                logger.warning(f"Only found {len(objects)} valid objects out of {len(object_paths)} provided")
-                return {'success': False, 'error': f'Not enough valid objects found for alignment. Found {len(objects)} out of {len(object_paths)} objects.'}
+            snapshot = read_transforms(stage, object_paths)
+            for obj_path in snapshot.missing:
+                logger.warning(f"Invalid object path: {obj_path}")
             
-            # Use first object as reference
-            reference_pos = objects[0]['position']
-            axis_index = {'x': 0, 'y': 1, 'z': 2}[axis]
+            if len(snapshot) < 2:
+                logger.warning(f"Only found {len(snapshot)} valid objects out of {len(object_paths)} provided")
+                return {'success': False, 'error': f'Not enough valid objects found for alignment. Found {len(snapshot)} out of {len(object_paths)} objects.'}
             
-            # Apply alignment
-            alignment_results = []
+            new_positions = aligned_positions(
+                snapshot.positions, snapshot.bounds_min, snapshot.bounds_max, axis, alignment, spacing
+            )
+            write_result = write_world_positions(stage, snapshot, new_positions)
+            moved = set(write_result['moved'])
+            failed = write_result['failed']
             
-            for i, obj in enumerate(objects):
-                current_pos = obj['position'].copy()
-                new_pos = current_pos.copy()
-                
-                # Align to reference object's axis position
-                new_pos[axis_index] = reference_pos[axis_index]
-                
-                # Apply spacing if specified
-                if spacing is not None and i > 0:
-                    new_pos[axis_index] += spacing * i
-                
-                # Apply transformation if position changed
-                if new_pos != current_pos:
-                    try:
-                        # Use scene builder to transform the object
-                        transform_result = self._scene_builder.transform_asset_in_stage(
-                            obj['path'], tuple(new_pos), None, None
-                        )
-                        
-                        transform_success = transform_result.get('success', False)
-                        logger.debug(f"Transform result for {obj['path']}: {transform_result}")
-                        logger.debug(f"Transform success: {transform_success}")
-                        
-                        alignment_results.append({
-                            'object': obj['path'],
-                            'old_position': current_pos,
-                            'new_position': new_pos,
-                            'transformed': transform_success
-                        })
-                    
-                    except Exception as e:
-                        logger.error(f"Error transforming object {obj['path']}: {e}")
-                        alignment_results.append({
-                            'object': obj['path'],
-                            'old_position': current_pos,
-                            'new_position': new_pos,
-                            'transformed': False,
-                            'error': str(e)
-                        })
-                else:
-                    alignment_results.append({
-                        'object': obj['path'],
-                        'old_position': current_pos,
-                        'new_position': new_pos,
-                        'transformed': True,
-                        'note': 'Already aligned'
-                    })
+            alignment_results = []
+            for row, obj_path in enumerate(snapshot.paths):
+                result = {
+                    'object': obj_path,
+                    'old_position': snapshot.positions[row].tolist(),
+                    'new_position': new_positions[row].tolist(),
+                    'transformed': obj_path not in failed,
+                }
+                if obj_path in failed:
+                    result['error'] = failed[obj_path]
+                elif obj_path not in moved:
+                    result['note'] = 'Already aligned'
+                alignment_results.append(result)
             
             successful_alignments = sum(1 for result in alignment_results if result.get('transformed', False))
             
             return {
                 'success': True,
                 'axis': axis,
+                'alignment': alignment,
                 'spacing': spacing,
                 'objects_processed': len(alignment_results),
                 'successful_alignments': successful_alignments,
                 'alignment_results': alignment_results,
+                'write_ms': write_result['elapsed_ms'],
                 'timestamp': datetime.utcnow().isoformat()
             }
             
@@ -743,21 +598,7 @@ class HTTPAPIInterface:
     # Helper methods for query operations
     def _matches_semantic_type(self, prim_name: str, type_name: str, query_type: str) -> bool:
         """Check if object matches semantic type based on naming patterns."""
-        # Define semantic mappings
-        semantic_mappings = {
-            'furniture': ['chair', 'table', 'desk', 'sofa', 'bed', 'cabinet', 'shelf'],
-            'lighting': ['lamp', 'light', 'fixture', 'bulb', 'chandelier'],
-            'decoration': ['plant', 'vase', 'picture', 'art', 'frame', 'ornament'],
-            'architecture': ['wall', 'door', 'window', 'column', 'beam', 'floor', 'ceiling'],
-            'vehicle': ['car', 'truck', 'bike', 'motorcycle', 'boat', 'plane'],
-            'primitive': ['cube', 'sphere', 'cylinder', 'cone', 'plane', 'mesh']
-        }
-        
-        if query_type in semantic_mappings:
-            keywords = semantic_mappings[query_type]
-            return any(keyword in prim_name or keyword in type_name for keyword in keywords)
-        
-        return False
+        return matches_semantic_category(prim_name, type_name, query_type)
 
     def _is_geometric_object(self, prim) -> bool:
         """Check if prim represents a geometric object using USD proper API."""
@@ -769,73 +610,3 @@ class HTTPAPIInterface:
             return prim.IsA(UsdGeom.Gprim)
         except Exception:
             return False
-
-    def _get_object_position(self, prim):
-        """Get object world position using multiple USD methods."""
-        try:
-            from pxr import UsdGeom, Usd
-            
-            # Primary method: Try Xformable API
-            if prim.HasAPI(UsdGeom.Xformable):
-                xformable = UsdGeom.Xformable(prim)
-                transform_matrix = xformable.ComputeLocalToWorldTransform(Usd.TimeCode.Default())
-                translation = transform_matrix.ExtractTranslation()
-                return (float(translation[0]), float(translation[1]), float(translation[2]))
-            
-            # Fallback method: Check for transform attributes directly
-            if prim.IsA(UsdGeom.Gprim):
-                for attr_name in ['xformOp:translate', 'translate']:
-                    if prim.HasAttribute(attr_name):
-                        attr = prim.GetAttribute(attr_name)
-                        if attr.IsValid():
-                            value = attr.Get()
-                            if value:
-                                return (float(value[0]), float(value[1]), float(value[2]))
-            
-            return None
-            
-        except Exception:
-            return None
-
-    def _extract_object_info(self, prim):
-        """Extract basic object information for query results."""
-        try:
-            from pxr import UsdGeom, Usd
-            
-            path = str(prim.GetPath())
-            name = prim.GetName()
-            type_name = prim.GetTypeName()
-            
-            # Get position
-            position = self._get_object_position(prim)
-            if not position:
-                position = (0.0, 0.0, 0.0)
-            
-            # Get basic bounding box info if available
-            bounds = None
-            try:
-                bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), ['default'])
-                bound = bbox_cache.ComputeWorldBound(prim)
-                # Check if bounding box is empty using USD API
-                if not bound.GetRange().IsEmpty():
-                    bbox_range = bound.ComputeAlignedRange()
-                    min_point = bbox_range.GetMin()
-                    max_point = bbox_range.GetMax()
-                    bounds = {
-                        'min': [float(min_point[0]), float(min_point[1]), float(min_point[2])],
-                        'max': [float(max_point[0]), float(max_point[1]), float(max_point[2])]
-                    }
-            except Exception:
-                pass
-            
-            return {
-                'path': path,
-                'name': name,
-                'type': type_name,
-                'position': list(position),
-                'bounds': bounds
-            }
-            
-        except Exception as e:
-            logger.debug(f"Error extracting object info: {e}")
-            return None
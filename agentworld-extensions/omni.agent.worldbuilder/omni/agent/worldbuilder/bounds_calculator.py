@@ -29,44 +29,29 @@ class BoundsCalculator:
             for prim_path in prim_paths:
                 logger.debug(f"Processing prim {prim_path}")
                 
-                # Method 1: Use Omniverse USD context (most reliable)
-                bounds_data = self._try_omniverse_context_bounds(prim_path)
+                # Method 1: Shared per-stage BBoxCache (reuses cached extents across calls)
+                bounds_data = self._try_shared_cache_bounds(stage, prim_path)
                 if bounds_data:
                     min_pt, max_pt = bounds_data
                     for i in range(3):
                         all_min[i] = min(all_min[i], min_pt[i])
                         all_max[i] = max(all_max[i], max_pt[i])
                     valid_bounds_count += 1
-                    logger.debug(f"Omniverse context bounds success for {prim_path}: min={min_pt}, max={max_pt}")
+                    logger.debug(f"Shared BBoxCache bounds success for {prim_path}: min={min_pt}, max={max_pt}")
                     continue
                 
-                # Method 2: Try Isaac Sim bounds utilities
-                bounds_data = self._try_isaac_sim_bounds(prim_path)
+                # Method 2: Use Omniverse USD context
+                bounds_data = self._try_omniverse_context_bounds(prim_path)
                 if bounds_data:
-                    # bounds_data is numpy array [min_x, min_y, min_z, max_x, max_y, max_z]
-                    min_pt = bounds_data[:3]
-                    max_pt = bounds_data[3:]
+                    min_pt, max_pt = bounds_data
                     for i in range(3):
                         all_min[i] = min(all_min[i], min_pt[i])
                         all_max[i] = max(all_max[i], max_pt[i])
                     valid_bounds_count += 1
-                    logger.debug(f"Isaac Sim bounds success for {prim_path}: min={min_pt}, max={max_pt}")
+                    logger.debug(f"Omniverse context bounds success for {prim_path}: min={min_pt}, max={max_pt}")
                     continue
                 
-                # Method 3: Standard USD Imageable approach
-                prim = stage.GetPrimAtPath(prim_path)
-                if prim and prim.IsValid():
-                    bounds_data = self._try_usd_imageable_bounds(prim)
-                    if bounds_data:
-                        min_pt, max_pt = bounds_data
-                        for i in range(3):
-                            all_min[i] = min(all_min[i], min_pt[i])
-                            all_max[i] = max(all_max[i], max_pt[i])
-                        valid_bounds_count += 1
-                        logger.debug(f"USD Imageable bounds success for {prim_path}: min={min_pt}, max={max_pt}")
-                        continue
-                
-                # Method 4: Fallback to transform position
+                # Method 3: Fallback to transform position
                 bounds_data = self._try_transform_position(stage, prim_path)
                 if bounds_data:
                     pos = bounds_data
@@ -97,7 +82,7 @@ class BoundsCalculator:
             return None
     
     def _try_omniverse_context_bounds(self, prim_path: str):
-        """Use Omniverse USD context bounds calculation (most reliable)."""
+        """Use Omniverse USD context bounds calculation."""
         try:
             import omni.usd
             context = omni.usd.get_context()
@@ -115,49 +100,18 @@ class BoundsCalculator:
             logger.debug(f"Omniverse context bounds failed for {prim_path}: {e}")
         return None
     
-    def _try_isaac_sim_bounds(self, prim_path: str):
-        """Use Isaac Sim bounds utilities."""
+    def _try_shared_cache_bounds(self, stage, prim_path: str):
+        """Use the shared agentworld_core bounds service (one BBoxCache per stage)."""
         try:
-            # Try Isaac Sim bounds utilities
-            from isaacsim.core.utils import bounds_utils
-            cache = bounds_utils.create_bbox_cache()
-            bounds = bounds_utils.compute_aabb(cache, prim_path)
+            from agentworld_core.bounds import get_bounds_service
             
-            # bounds is numpy array [min_x, min_y, min_z, max_x, max_y, max_z]
-            if bounds is not None and len(bounds) == 6:
-                # Check if bounds are valid
-                is_valid = all(abs(coord) < 1e30 for coord in bounds)
-                if is_valid:
-                    return bounds
-        except Exception as e:
-            logger.debug(f"Isaac Sim bounds failed for {prim_path}: {e}")
-        return None
-    
-    def _try_usd_imageable_bounds(self, prim):
-        """Use standard USD Imageable bounds calculation."""
-        try:
-            from pxr import UsdGeom, Usd, Gf
-            
-            imageable = UsdGeom.Imageable(prim)
-            if imageable:
-                time = Usd.TimeCode.Default()
-                bound = imageable.ComputeWorldBound(time, UsdGeom.Tokens.default_)
-                
-                if bound:
-                    bound_range = bound.ComputeAlignedBox()
-                    if bound_range and not bound_range.IsEmpty():
-                        min_pt = bound_range.GetMin()
-                        max_pt = bound_range.GetMax()
-                        
-                        min_coords = (float(min_pt[0]), float(min_pt[1]), float(min_pt[2]))
-                        max_coords = (float(max_pt[0]), float(max_pt[1]), float(max_pt[2]))
-                        
-                        # Check if bounds are valid
-                        is_valid = all(abs(coord) < 1e30 for coord in min_coords + max_coords)
-                        if is_valid:
-                            return min_coords, max_coords
+            world_range = get_bounds_service().compute_world_range(stage, prim_path)
+            if world_range:
+                min_coords, max_coords = world_range
+                if any(min_coords[i] != max_coords[i] for i in range(3)):
+                    return min_coords, max_coords
         except Exception as e:
-            logger.debug(f"USD Imageable bounds failed for {prim.GetPath()}: {e}")
+            logger.debug(f"Shared BBoxCache bounds failed for {prim_path}: {e}")
         return None
     
     def _try_transform_position(self, stage, prim_path: str):
@@ -78,13 +78,24 @@ class WorldBuilderConfig(WorldExtensionConfig if CONFIG_AVAILABLE else object):
         'batch_processing_delay': 0.05,
         'asset_loading_timeout': 30.0,
         'scene_validation_interval': 5.0,
+        'ui_refresh_interval': 0.5,
         'startup_delay': 0.1,  # Extension startup delay
         'shutdown_timeout': 5.0,  # Extension shutdown timeout
         
         # Asset management
         'auto_save_scene': False,
         'scene_backup_enabled': False,
-        'asset_cache_size': 50,
+        'asset_cache_size': 50,  # Also bounds the prefetched layer cache
+        'asset_prefetch_workers': 2,
+        'payload_load_budget_ms': 4.0,
+        'change_journal_size': 0,  # Revisions kept for scene/changes (0 = bounded by paths only)
+        'change_journal_max_paths': 50000,
+        'material_mode': 'display_color',  # 'shared' binds deduplicated /World/Looks materials
+        'material_quantization_steps': 32,
+        'authoring_backend': 'usd',  # 'sdf' writes element specs directly to the edit target layer
+        'scene_import_dir': '',  # Stored scene/import uploads; empty uses the system temp dir
+        'scene_transfer_timeout': 120.0,  # Main-thread wait for scene export snapshots and imports
+        'scene_transfer_chunk_size': 1048576,
         'texture_quality': 'medium',
         
         # Spatial settings
@@ -213,6 +224,10 @@ class WorldBuilderConfig(WorldExtensionConfig if CONFIG_AVAILABLE else object):
     def scene_validation_interval(self) -> float:
         return self.get('scene_validation_interval', 5.0)
     
+    @property
+    def ui_refresh_interval(self) -> float:
+        return self.get('ui_refresh_interval', 0.5)
+    
     @property
     def auto_save_scene(self) -> bool:
         return self.get('auto_save_scene', False)
@@ -225,6 +240,46 @@ class WorldBuilderConfig(WorldExtensionConfig if CONFIG_AVAILABLE else object):
     def asset_cache_size(self) -> int:
         return self.get('asset_cache_size', 50)
     
+    @property
+    def asset_prefetch_workers(self) -> int:
+        return self.get('asset_prefetch_workers', 2)
+    
+    @property
+    def payload_load_budget_ms(self) -> float:
+        return self.get('payload_load_budget_ms', 4.0)
+    
+    @property
+    def change_journal_size(self) -> int:
+        return self.get('change_journal_size', 0)
+    
+    @property
+    def change_journal_max_paths(self) -> int:
+        return self.get('change_journal_max_paths', 50000)
+    
+    @property
+    def material_mode(self) -> str:
+        return self.get('material_mode', 'display_color')
+    
+    @property
+    def material_quantization_steps(self) -> int:
+        return self.get('material_quantization_steps', 32)
+    
+    @property
+    def authoring_backend(self) -> str:
+        return self.get('authoring_backend', 'usd')
+    
+    @property
+    def scene_import_dir(self) -> str:
+        return self.get('scene_import_dir', '')
+    
+    @property
+    def scene_transfer_timeout(self) -> float:
+        return self.get('scene_transfer_timeout', 120.0)
+    
+    @property
+    def scene_transfer_chunk_size(self) -> int:
+        return self.get('scene_transfer_chunk_size', 1048576)
+    
     @property
     def texture_quality(self) -> str:
         return self.get('texture_quality', 'medium')
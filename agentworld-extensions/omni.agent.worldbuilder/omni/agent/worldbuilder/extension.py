@@ -15,6 +15,7 @@ import omni.ui as ui
 from .config import get_config
 from .http_api_interface import HTTPAPIInterface
 from .bounds_calculator import BoundsCalculator
+from .ui.refresh_scheduler import API, SCENE, SELECTION, ALL_PARTS, UIRefreshScheduler
 
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,11 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
         # Bounds calculator for selection display
         self._bounds_calculator = BoundsCalculator()
         
+        # Event-driven UI refresh: events mark parts dirty, the update loop redraws throttled
+        self._ui_refresh = UIRefreshScheduler(self._config.ui_refresh_interval)
+        self._stage_event_subscription = None
+        self._selected_paths = []
+        
         # Then attempt risky operations in on_startup()
         # Protected constructor pattern - don't do heavy initialization here
 
@@ -76,6 +82,9 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
             # Start processing timer for queue operations
             self._start_processing_timer()
             
+            # Redraw on selection, queue and stage changes instead of polling
+            self._subscribe_ui_events()
+            
             # Initial UI update (replaces async delayed update)
             self._update_ui_stats()
             
@@ -120,6 +129,8 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
         if self._config.debug_mode:
             logger.info("Phase 1: Cleaning up main thread operations")
         
+        self._unsubscribe_ui_events()
+        
         try:
             # Stop processing timer
             if self._processing_timer:
@@ -242,19 +253,14 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
             import omni.kit.app
             
             def process_operations(dt):
-                """Process queued operations and update UI"""
+                """Process queued operations and redraw UI parts marked dirty"""
                 if self._http_api_interface:
                     self._http_api_interface.process_queued_operations()
                 
-                # Update UI stats periodically (every ~1 second)
-                if hasattr(self, '_ui_update_counter'):
-                    self._ui_update_counter += 1
-                else:
-                    self._ui_update_counter = 0
-                
-                # Update UI every 10 timer cycles (~1 second at 100ms intervals)
-                if self._ui_update_counter % 10 == 0:
-                    self._update_ui_stats()
+                # Idle frames return immediately; changes redraw at most every ui_refresh_interval
+                parts = self._ui_refresh.due()
+                if parts:
+                    self._update_ui_stats(parts)
             
             # Create timer to process operations every 100ms
             update_stream = omni.kit.app.get_app().get_update_event_stream()
@@ -267,6 +273,66 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
         except Exception as e:
             logger.error(f"Failed to start processing timer: {e}")
 
+    def _subscribe_ui_events(self):
+        """Mark UI parts dirty from selection events, queue changes and stage notices."""
+        try:
+            import omni.usd
+            
+            self._stage_event_subscription = (
+                omni.usd.get_context().get_stage_event_stream().create_subscription_to_pop(
+                    self._on_stage_event, name="agent_worldbuilder_ui_stage_events"
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Could not subscribe to stage events, selection bounds will not update: {e}")
+        
+        scene_builder = getattr(self._http_api_interface, 'scene_builder', None)
+        if scene_builder is not None:
+            scene_builder.queue_manager.add_change_listener(self._on_queue_changed)
+            scene_builder.stage_observer.subscribe(self._on_stage_objects_changed, self._on_stage_replaced)
+    
+    def _unsubscribe_ui_events(self):
+        """Drop every UI event subscription."""
+        self._stage_event_subscription = None
+        scene_builder = getattr(self._http_api_interface, 'scene_builder', None)
+        if scene_builder is not None:
+            try:
+                scene_builder.queue_manager.remove_change_listener(self._on_queue_changed)
+                scene_builder.stage_observer.unsubscribe(self._on_stage_objects_changed, self._on_stage_replaced)
+            except Exception as e:
+                logger.debug(f"Error removing UI listeners: {e}")
+    
+    def _on_stage_event(self, event):
+        """Selection changes refresh the bounds; opening/closing a stage refreshes everything."""
+        import omni.usd
+        
+        if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
+            self._ui_refresh.mark(SELECTION)
+        elif event.type in (int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSED)):
+            self._ui_refresh.mark(*ALL_PARTS)
+    
+    def _on_queue_changed(self):
+        """Queue manager callback; may run on HTTP threads so it only flags a redraw."""
+        self._ui_refresh.mark(API, SCENE)
+    
+    def _on_stage_replaced(self, stage):
+        self._ui_refresh.mark(*ALL_PARTS)
+    
+    def _on_stage_objects_changed(self, resynced, changed):
+        """Flag the element count for /World child changes and bounds for edits under the selection."""
+        if any(path.count('/') <= 2 for path in resynced):
+            self._ui_refresh.mark(SCENE)
+        selected = self._selected_paths
+        if not selected:
+            return
+        for path in resynced + changed:
+            for selected_path in selected:
+                # Edits to a selected prim, its subtree or an ancestor transform move its bounds
+                if (path == selected_path or path == '/'
+                        or selected_path.startswith(path + '/') or path.startswith(selected_path + '/')):
+                    self._ui_refresh.mark(SELECTION)
+                    return
+    
     def _create_window(self):
         """Create the extension's UI window."""
         self._ensure_main_thread("UI window creation")
@@ -305,12 +371,12 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
                 
 
 
-    def _update_ui_stats(self):
-        """Update UI with current statistics."""
+    def _update_ui_stats(self, parts=ALL_PARTS):
+        """Update the given UI parts (API status, scene count, selection bounds)."""
         api_stats = {}
         
         # Update HTTP API status
-        if hasattr(self, '_http_api_interface') and self._http_api_interface:
+        if API in parts and self._http_api_interface:
             # Get stats through the proper API method (unified or fallback)
             api_stats = self._http_api_interface.get_stats()
             
@@ -330,11 +396,13 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
                 self._api_requests_label.text = "Requests: 0 | Errors: 0"
         
         # Get current scene element count from USD stage
-        scene_element_count = self._get_scene_element_count()
-        self._scene_elements_label.text = f"Scene Elements: {scene_element_count}"
+        if SCENE in parts:
+            scene_element_count = self._get_scene_element_count()
+            self._scene_elements_label.text = f"Scene Elements: {scene_element_count}"
         
         # Update selection bounds display
-        self._update_selection_bounds()
+        if SELECTION in parts:
+            self._update_selection_bounds()
 
     def _get_scene_element_count(self) -> int:
         """Get the current number of scene elements from the USD stage."""
@@ -374,12 +442,10 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
                 self._update_bounds_labels("Selection: No USD context", None)
                 return
             
+            # Only called after a selection event or an edit under the selection
             selection = usd_context.get_selection()
-            current_selection = selection.get_selected_prim_paths()
-            
-            # Check if selection changed to avoid unnecessary recalculation
-            if not self._bounds_calculator.has_selection_changed(current_selection):
-                return
+            current_selection = list(selection.get_selected_prim_paths())
+            self._selected_paths = current_selection
             
             # Handle no selection case
             if not current_selection:
@@ -392,7 +458,7 @@ class AgentWorldBuilderExtension(omni.ext.IExt):
                 self._update_bounds_labels("Selection: No stage", None)
                 return
             
-            # Calculate combined bounds using the dedicated calculator
+            # Calculate combined bounds using the shared per-stage BBoxCache
             bounds_data = self._bounds_calculator.calculate_selection_bounds(stage, current_selection)
             
             # Update UI labels
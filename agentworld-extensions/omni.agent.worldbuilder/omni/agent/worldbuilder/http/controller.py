@@ -104,6 +104,34 @@ class WorldBuilderController:
     def scene_status(self) -> Dict[str, Any]:
         return self._safe_call('scene_status', self._service.get_scene_status, default_error_code='SCENE_STATUS_FAILED')
 
+    def browse_scene(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call(
+            'browse_scene',
+            lambda: self._service.browse_scene(payload),
+            default_error_code='BROWSE_SCENE_FAILED'
+        )
+
+    def scene_changes(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call(
+            'scene_changes',
+            lambda: self._service.get_scene_changes(payload),
+            default_error_code='SCENE_CHANGES_FAILED'
+        )
+
+    def export_scene(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call(
+            'export_scene',
+            lambda: self._service.export_scene(payload),
+            default_error_code='SCENE_EXPORT_FAILED'
+        )
+
+    def import_scene(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call(
+            'import_scene',
+            lambda: self._service.import_scene(payload),
+            default_error_code='SCENE_IMPORT_FAILED'
+        )
+
     def list_elements(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         def handler():
             pagination = parse_pagination(payload)
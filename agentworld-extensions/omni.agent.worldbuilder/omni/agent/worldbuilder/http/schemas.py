@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Literal
 
 try:  # Optional Pydantic validation
     from pydantic import BaseModel, Field, ValidationError
@@ -43,6 +43,10 @@ if schemas_available:  # pragma: no branch
         color: conlist(float, min_length=3, max_length=3) = Field(default=[0.5, 0.5, 0.5])
         parent_path: str = Field(default="/World")
         metadata: Dict[str, Any] = Field(default_factory=dict)
+        material_mode: Literal['display_color', 'shared'] | None = None
+        roughness: float | None = Field(default=None, ge=0.0, le=1.0)
+        metallic: float | None = Field(default=None, ge=0.0, le=1.0)
+        authoring_backend: Literal['usd', 'sdf'] | None = None
 
     class BatchElement(BaseModel):
         name: str | None = None
@@ -52,6 +56,10 @@ if schemas_available:  # pragma: no branch
         scale: conlist(float, min_length=3, max_length=3) = Field(default=[1.0, 1.0, 1.0])
         color: conlist(float, min_length=3, max_length=3) = Field(default=[0.5, 0.5, 0.5])
         metadata: Dict[str, Any] = Field(default_factory=dict)
+        material_mode: Literal['display_color', 'shared'] | None = None
+        roughness: float | None = Field(default=None, ge=0.0, le=1.0)
+        metallic: float | None = Field(default=None, ge=0.0, le=1.0)
+        authoring_backend: Literal['usd', 'sdf'] | None = None
 
     class CreateBatchPayload(BaseModel):
         batch_name: str
@@ -67,6 +75,7 @@ if schemas_available:  # pragma: no branch
         parent_path: str | None = Field(default="/World")
         prim_path: str | None = None
         metadata: Dict[str, Any] = Field(default_factory=dict)
+        as_payload: bool = False
 
     class TransformAssetPayload(BaseModel):
         prim_path: str
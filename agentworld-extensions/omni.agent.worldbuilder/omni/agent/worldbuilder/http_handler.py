@@ -52,6 +52,10 @@ class WorldBuilderHTTPHandler(WorldHTTPHandler):
             'get_scene': self._handle_get_scene,
             'scene_contents': self._handle_get_scene,
             'list_elements': self._handle_list_elements,
+            'scene/browse': self._handle_browse_scene,
+            'scene/changes': self._handle_scene_changes,
+            'scene/export': self._handle_export_scene,
+            'scene/import': self._handle_import_scene,
             'scene_status': self._handle_scene_status,
             'query/objects_by_type': self._handle_query_by_type,
             'query/objects_in_bounds': self._handle_query_in_bounds,
@@ -153,6 +157,28 @@ class WorldBuilderHTTPHandler(WorldHTTPHandler):
         """Handle list elements request."""
         return self.controller.list_elements(request_data or {})
 
+    def _handle_browse_scene(self, method: str, request_data: dict):
+        """Handle paginated hierarchy browse request."""
+        return self.controller.browse_scene(request_data or {})
+
+    def _handle_scene_changes(self, method: str, request_data: dict):
+        """Handle scene delta request."""
+        return self.controller.scene_changes(request_data or {})
+
+    def _handle_export_scene(self, method: str, request_data: dict):
+        """Handle streamed scene export request."""
+        if method != 'GET':
+            request_logger.warning('method_not_allowed', extra={'route': 'scene/export', 'method': method})
+            return error_response('METHOD_NOT_ALLOWED', 'scene/export requires GET method', details={'method': method})
+        return self.controller.export_scene(request_data or {})
+
+    def _handle_import_scene(self, method: str, request_data: dict):
+        """Handle uploaded scene import request."""
+        if method != 'POST':
+            request_logger.warning('method_not_allowed', extra={'route': 'scene/import', 'method': method})
+            return error_response('METHOD_NOT_ALLOWED', 'scene/import requires POST method', details={'method': method})
+        return self.controller.import_scene(request_data or {})
+
     def _handle_scene_status(self, method: str = 'GET', request_data: dict | None = None):
         """Handle scene status request."""
         return self.controller.scene_status()
@@ -39,9 +39,13 @@ def build_openapi_spec(port: int) -> Dict[str, Any]:
             '/remove_element': {'post': {'summary': 'Remove element', 'responses': {'200': {'description': 'OK'}}}},
             '/clear_path': {'post': {'summary': 'Clear all elements at path', 'responses': {'200': {'description': 'OK'}}}},
             '/list_elements': {'get': {'summary': 'List elements at path', 'responses': {'200': {'description': 'OK'}}}},
+            '/scene/browse': {'get': {'summary': 'Browse hierarchy page by page (path, depth, limit, cursor, fields=bounds,transform,batch)', 'responses': {'200': {'description': 'OK'}}}},
+            '/scene/changes': {'get': {'summary': 'Prims added, removed and modified since stage revision N (since, epoch); resync_required when N was evicted', 'responses': {'200': {'description': 'OK'}}}},
+            '/scene/export': {'get': {'summary': 'Stream /World or a subtree as USDC/USDA over chunked HTTP (path, format, flatten)', 'responses': {'200': {'description': 'USD file'}}}},
+            '/scene/import': {'post': {'summary': 'Apply an application/octet-stream USD body as a sublayer or reference in one change block (mode, target_path)', 'responses': {'200': {'description': 'OK'}}}},
             '/batch_info': {'get': {'summary': 'Get batch info', 'responses': {'200': {'description': 'OK'}}}},
             '/request_status': {'get': {'summary': 'Get request processing status', 'responses': {'200': {'description': 'OK'}}}},
-            '/query/objects_by_type': {'get': {'summary': 'Query objects by type', 'responses': {'200': {'description': 'OK'}}}},
+            '/query/objects_by_type': {'get': {'summary': 'Query objects by type (match=auto|substring|prefix|category|type, page, page_size)', 'responses': {'200': {'description': 'OK'}}}},
             '/query/objects_in_bounds': {'get': {'summary': 'Query objects in bounds', 'responses': {'200': {'description': 'OK'}}}},
             '/query/objects_near_point': {'get': {'summary': 'Query objects near point', 'responses': {'200': {'description': 'OK'}}}},
             '/transform/calculate_bounds': {'get': {'summary': 'Calculate bounds of selection', 'responses': {'200': {'description': 'OK'}}}},
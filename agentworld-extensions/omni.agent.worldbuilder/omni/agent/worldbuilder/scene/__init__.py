@@ -5,9 +5,20 @@ Provides modular components for scene building operations:
 - scene_types: Foundation data types and enums
 - queue_manager: Thread-safe queue operations  
 - element_factory: USD element creation
+- material_library: Deduplicated, reference counted shared materials
 - asset_manager: Asset placement & transforms
+- layer_prefetch: Background layer prefetch & budgeted payload loading
 - batch_manager: Batch operations & hierarchy
+- batch_registry: Persistent, notice-reconciled batch registry
 - cleanup_operations: Removal & clearing operations
+- bulk_removal: Single-pass matching and change-blocked Sdf spec removal
+- stage_observer: USD change notice fan-out for scene caches
+- spatial_index: Loose octree index for spatial queries
+- type_index: Inverted name/type/category index for type queries
+- scene_snapshot: Subtree-invalidated cache for scene reads
+- change_journal: Stage revision counter and bounded change journal
+- hierarchy_browser: Cursor-paginated, depth-limited hierarchy browsing
+- scene_transfer: Streamed USDC/USDA scene export and single change block import
 - scene_inspector: Scene traversal & analysis
 - request_tracker: Status & statistics tracking
 """
\ No newline at end of file
@@ -35,13 +35,17 @@ except ImportError as e:
 class AssetManager:
     """Manager for USD asset placement, transformation, and lifecycle operations."""
     
-    def __init__(self, usd_context):
-        """Initialize asset manager with USD context."""
+    def __init__(self, usd_context, layer_prefetcher=None):
+        """Initialize asset manager with USD context and optional layer prefetcher."""
         self._usd_context = usd_context
+        self._layer_prefetcher = layer_prefetcher
     
     def place_asset(self, asset: AssetPlacement) -> Dict[str, Any]:
         """
         Place asset via USD reference safely on Isaac Sim's main thread.
+
+        With ``asset.as_payload`` the asset is authored as a payload that stays
+        unloaded until it is loaded explicitly.
         
         Args:
             asset: AssetPlacement with all placement parameters
@@ -69,6 +73,13 @@ class AssetManager:
             # Use the asset name as the container (e.g., 'test_mug' -> '/World/test_mug')
             container_path = asset.prim_path if asset.prim_path.startswith('/') else f"/World/{asset.name}"
 
+            # Layer opened by the prefetch worker; holding it keeps the registry entry alive
+            prefetched_layer = self._layer_prefetcher.acquire(asset.asset_path) if self._layer_prefetcher else None
+
+            if asset.as_payload:
+                # Exclude the path from the load set before the arc exists so nothing composes now
+                stage.Unload(container_path)
+
             # Define the container prim as an Xform (transformable container)
             container_prim = stage.DefinePrim(container_path, "Xform")
             if not container_prim:
@@ -77,11 +88,15 @@ class AssetManager:
                     'error': f"Failed to create container prim at path: {container_path}"
                 }
 
-            # Add USD reference to the container
-            references = container_prim.GetReferences()
-            references.AddReference(asset.asset_path)
+            arc = 'payload' if asset.as_payload else 'reference'
+            if asset.as_payload:
+                container_prim.GetPayloads().AddPayload(asset.asset_path)
+            else:
+                # Add USD reference to the container
+                references = container_prim.GetReferences()
+                references.AddReference(asset.asset_path)
 
-            logger.info(f"📦 Created USD reference container at {container_path}")
+            logger.info(f"📦 Created USD {arc} container at {container_path}")
             
             # Apply transforms to the container prim (not the referenced content)
             if any(asset.position) or any(asset.rotation) or any(v != 1.0 for v in asset.scale):
@@ -109,7 +124,7 @@ class AssetManager:
                     logger.warning(f"⚠️ Failed to apply transforms to asset reference: {transform_error}")
                     # Continue with asset placement even if transforms fail
             
-            logger.info(f"✅ Placed asset '{asset.name}' via USD reference at {container_path}")
+            logger.info(f"✅ Placed asset '{asset.name}' via USD {arc} at {container_path}")
 
             return {
                 'success': True,
@@ -119,7 +134,9 @@ class AssetManager:
                 'position': asset.position,
                 'rotation': asset.rotation,
                 'scale': asset.scale,
-                'message': f"Placed asset '{asset.name}' in USD scene via reference container"
+                'arc': arc,
+                'loaded': container_prim.IsLoaded(),
+                'message': f"Placed asset '{asset.name}' in USD scene via {arc} container"
             }
             
         except Exception as e:
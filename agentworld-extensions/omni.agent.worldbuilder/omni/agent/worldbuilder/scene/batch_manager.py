@@ -10,6 +10,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from pxr import Usd, UsdGeom, Gf
 
 from .scene_types import SceneElement, SceneBatch, PrimitiveType
+from .batch_registry import BatchRegistry, extract_batch_record, is_batch_prim
+from .material_library import material_field_errors
+from .element_factory import authoring_backend_errors
 from ..utils import sanitize_usd_name
 
 logger = logging.getLogger(__name__)
@@ -18,10 +21,11 @@ logger = logging.getLogger(__name__)
 class BatchManager:
     """Manager for USD batch operations, hierarchy management, and batch lifecycle."""
     
-    def __init__(self, usd_context, element_factory):
-        """Initialize batch manager with USD context and element factory."""
+    def __init__(self, usd_context, element_factory, registry: Optional[BatchRegistry] = None):
+        """Initialize batch manager with USD context, element factory and optional batch registry."""
         self._usd_context = usd_context
         self._element_factory = element_factory
+        self._registry = registry
         self._current_batches: Dict[str, SceneBatch] = {}
     
     def create_batch(self, batch_name: str, elements: List[Dict], 
@@ -68,7 +72,11 @@ class BatchManager:
                         rotation=tuple(elem_data.get('rotation', [0.0, 0.0, 0.0])),
                         scale=tuple(elem_data.get('scale', [1.0, 1.0, 1.0])),
                         color=tuple(elem_data.get('color', [0.5, 0.5, 0.5])),
-                        metadata=elem_data.get('metadata', {})
+                        metadata=elem_data.get('metadata', {}),
+                        material_mode=elem_data.get('material_mode'),
+                        roughness=elem_data.get('roughness'),
+                        metallic=elem_data.get('metallic'),
+                        authoring_backend=elem_data.get('authoring_backend'),
                     )
                     scene_elements.append(element)
                 except Exception as e:
@@ -116,43 +124,42 @@ class BatchManager:
             created_elements = []
             failed_elements = []
             
+            # Temporarily adjust element names to include batch path; the factory
+            # authors all sdf-backend elements of the batch in one change block
+            original_names = [element.name for element in scene_elements]
+            batch_prefix = sanitize_usd_name(batch_name)
             for element in scene_elements:
-                # Temporarily adjust element name to include batch path
-                original_name = element.name
-                element.name = f"{sanitize_usd_name(batch_name)}/{original_name}"
-                
-                try:
-                    # Use element factory to create the element
-                    result = self._element_factory.create_element(element)
-                    
-                    if result['success']:
-                        created_elements.append({
-                            'name': original_name,
-                            'type': element.primitive_type.value,
-                            'path': result['usd_path'],
-                            'position': element.position
-                        })
-                        logger.debug(f"✅ Created element '{original_name}' in batch '{batch_name}'")
-                    else:
-                        failed_elements.append({
-                            'name': original_name,
-                            'error': result.get('error', 'Unknown error')
-                        })
-                        logger.warning(f"⚠️ Failed to create element '{original_name}' in batch: {result.get('error')}")
-                
-                except Exception as e:
+                element.name = f"{batch_prefix}/{element.name}"
+            try:
+                results = self._element_factory.create_elements(scene_elements)
+            except Exception as e:
+                logger.error(f"❌ Exception creating elements in batch '{batch_name}': {e}")
+                results = [{'success': False, 'error': str(e)}] * len(scene_elements)
+            finally:
+                # Restore original names
+                for element, original_name in zip(scene_elements, original_names):
+                    element.name = original_name
+
+            for element, result in zip(scene_elements, results):
+                if result['success']:
+                    created_elements.append({
+                        'name': element.name,
+                        'type': element.primitive_type.value,
+                        'path': result['usd_path'],
+                        'position': element.position
+                    })
+                    logger.debug(f"✅ Created element '{element.name}' in batch '{batch_name}'")
+                else:
                     failed_elements.append({
-                        'name': original_name,
-                        'error': str(e)
+                        'name': element.name,
+                        'error': result.get('error', 'Unknown error')
                     })
-                    logger.error(f"❌ Exception creating element '{original_name}' in batch: {e}")
-                
-                finally:
-                    # Restore original name
-                    element.name = original_name
+                    logger.warning(f"⚠️ Failed to create element '{element.name}' in batch: {result.get('error')}")
             
             # USD stage metadata is now the single source of truth
             # No memory tracking needed - all batch info stored as USD metadata
+            if self._registry is not None:
+                self._registry.register(batch_path)
             
             logger.info(f"🎯 Created batch '{batch_name}' with {len(created_elements)} elements at {batch_path}")
             
@@ -191,10 +198,12 @@ class BatchManager:
             Batch information dictionary
         """
         try:
-            # First try stage discovery for persistent batches
-            discovered_batches = self.discover_batches_from_stage()
-            if batch_name in discovered_batches:
-                batch_info = discovered_batches[batch_name]
+            # First try the batch registry / stage discovery for persistent batches
+            if self._registry is not None:
+                batch_info = self._registry.get(batch_name)
+            else:
+                batch_info = self.discover_batches_from_stage().get(batch_name)
+            if batch_info is not None:
                 return {
                     'success': True,
                     'batch_name': batch_info['name'],
@@ -203,7 +212,7 @@ class BatchManager:
                     'created_at': batch_info['created_at'],
                     'element_names': batch_info['element_names'],
                     'child_elements': batch_info['child_elements'],
-                    'metadata': batch_info['metadata'],
+                    'metadata': self._discovery_metadata(),
                     'source': 'stage_discovery'
                 }
             
@@ -407,9 +416,15 @@ class BatchManager:
             # Validate element type
             try:
                 PrimitiveType(element_type)
-                valid_elements += 1
             except ValueError:
                 errors.append(f"Element {i} has invalid element_type: {element_type}")
+                continue
+
+            material_errors = material_field_errors(elem_data) + authoring_backend_errors(elem_data)
+            if material_errors:
+                errors.extend(f"Element {i} {message}" for message in material_errors)
+                continue
+            valid_elements += 1
         
         return {
             'valid': len(errors) == 0,
@@ -441,7 +456,17 @@ class BatchManager:
             logger.error(f"❌ Error adding batch metadata: {e}")
     
     def discover_batches_from_stage(self) -> Dict[str, Dict[str, Any]]:
-        """Discover all batches by examining USD stage hierarchy."""
+        """Discover all batches from the batch registry (or by examining the USD stage hierarchy)."""
+        if self._registry is not None:
+            try:
+                batches = self._registry.all()
+                for batch_info in batches.values():
+                    batch_info['metadata'] = self._discovery_metadata()
+                return batches
+            except Exception as e:
+                logger.error(f"❌ Error reading batch registry: {e}")
+                return {}
+
         try:
             stage = self._usd_context.get_stage()
             if not stage:
@@ -454,13 +479,10 @@ class BatchManager:
             
             # Traverse all children of /World looking for batch Xforms
             for child in world_prim.GetChildren():
-                if child.GetTypeName() == "Xform":
-                    # Check if this Xform has batch metadata
-                    is_batch_attr = child.GetAttribute("worldbuilder:is_batch")
-                    if is_batch_attr and is_batch_attr.Get():
-                        batch_info = self._extract_batch_info_from_prim(child)
-                        if batch_info:
-                            batches[batch_info['name']] = batch_info
+                if is_batch_prim(child):
+                    batch_info = self._extract_batch_info_from_prim(child)
+                    if batch_info:
+                        batches[batch_info['name']] = batch_info
             
             logger.debug(f"🔍 Discovered {len(batches)} batches from USD stage")
             return batches
@@ -472,41 +494,19 @@ class BatchManager:
     def _extract_batch_info_from_prim(self, batch_prim: Usd.Prim) -> Optional[Dict[str, Any]]:
         """Extract batch information from USD prim with metadata."""
         try:
-            # Get batch metadata attributes
-            batch_name = batch_prim.GetAttribute("worldbuilder:batch_name").Get()
-            created_at = batch_prim.GetAttribute("worldbuilder:batch_created_at").Get()
-            element_count = batch_prim.GetAttribute("worldbuilder:batch_element_count").Get()
-            element_names_attr = batch_prim.GetAttribute("worldbuilder:batch_element_names").Get()
-            
-            # Convert USD StringArray to Python list for JSON serialization
-            element_names = list(element_names_attr) if element_names_attr else []
-            
-            # Get child elements from USD hierarchy
-            child_elements = []
-            for child in batch_prim.GetChildren():
-                if child.IsValid() and child.GetTypeName() in ["Cube", "Sphere", "Cylinder", "Cone"]:
-                    child_elements.append({
-                        'name': child.GetName(),
-                        'type': child.GetTypeName(),
-                        'path': str(child.GetPath())
-                    })
-            
-            return {
-                'name': batch_name or batch_prim.GetName(),
-                'path': str(batch_prim.GetPath()),
-                'created_at': created_at or time.time(),
-                'element_count': element_count or len(child_elements),
-                'element_names': element_names or [e['name'] for e in child_elements],
-                'child_elements': child_elements,
-                'metadata': {
-                    'source': 'stage_discovery',
-                    'discovered_at': time.time()
-                }
-            }
-            
+            batch_info = extract_batch_record(batch_prim)
+            batch_info['metadata'] = self._discovery_metadata()
+            return batch_info
         except Exception as e:
             logger.error(f"❌ Error extracting batch info from {batch_prim.GetPath()}: {e}")
             return None
+
+    @staticmethod
+    def _discovery_metadata() -> Dict[str, Any]:
+        return {
+            'source': 'stage_discovery',
+            'discovered_at': time.time()
+        }
     
     def _set_batch_transform(self, xformable: UsdGeom.Xformable, 
                             position: Tuple[float, float, float],
@@ -0,0 +1,340 @@
+"""
+Persistent registry of WorldBuilder batches.
+
+Replaces the ``/World`` rescans previously done by every batch listing. The
+registry is updated explicitly on batch create/remove, reconciled from USD
+change notices (only ``/World/<batch>`` and its direct children are
+re-read), and persisted to the root layer's ``customLayerData`` so a reopened
+stage can be loaded without inspecting every ``/World`` child. Only mutations
+write the layer; listing batches never marks a clean stage dirty.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing
+    from .stage_observer import StageObserver
+
+logger = logging.getLogger(__name__)
+
+BATCH_ROOT = "/World"
+REGISTRY_LAYER_KEY = "worldbuilder:batch_registry"
+REGISTRY_FORMAT_VERSION = 1
+BATCH_ELEMENT_TYPES = ("Cube", "Sphere", "Cylinder", "Cone")
+
+
+def is_batch_prim(prim) -> bool:
+    """Return True for Xforms tagged with ``worldbuilder:is_batch``."""
+    if not prim or not prim.IsValid() or prim.GetTypeName() != "Xform":
+        return False
+    is_batch_attr = prim.GetAttribute("worldbuilder:is_batch")
+    return bool(is_batch_attr and is_batch_attr.Get())
+
+
+def list_child_elements(batch_prim) -> List[Dict[str, str]]:
+    """Return primitive children of a batch prim."""
+    return [
+        {'name': child.GetName(), 'type': str(child.GetTypeName()), 'path': str(child.GetPath())}
+        for child in batch_prim.GetChildren()
+        if child.IsValid() and child.GetTypeName() in BATCH_ELEMENT_TYPES
+    ]
+
+
+def extract_batch_record(batch_prim) -> Dict[str, Any]:
+    """Read batch metadata attributes and direct children from a batch prim."""
+    def _get(name):
+        attr = batch_prim.GetAttribute(name)
+        return attr.Get() if attr else None
+
+    child_elements = list_child_elements(batch_prim)
+    element_names = _get("worldbuilder:batch_element_names")
+    return {
+        'name': _get("worldbuilder:batch_name") or batch_prim.GetName(),
+        'path': str(batch_prim.GetPath()),
+        'created_at': _get("worldbuilder:batch_created_at") or time.time(),
+        'element_count': _get("worldbuilder:batch_element_count") or len(child_elements),
+        'element_names': list(element_names) if element_names else [e['name'] for e in child_elements],
+        'child_elements': child_elements,
+    }
+
+
+class BatchRegistry:
+    """Name -> batch record map kept in sync with the active stage."""
+
+    def __init__(self, observer: 'StageObserver'):
+        """Initialize registry; the stage is only read on first access."""
+        self._observer = observer
+        self._lock = threading.RLock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._names_by_path: Dict[str, str] = {}
+        self._built = False
+        self._needs_rescan = False
+        self._dirty_paths: Set[str] = set()
+        self._persisted: Optional[Dict[str, Any]] = None
+        self._stats = {
+            'full_scans': 0,
+            'layer_loads': 0,
+            'reconciled_batches': 0,
+            'persist_writes': 0,
+        }
+        observer.subscribe(self._on_objects_changed, self._on_stage_reset)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, batch_name: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the record for ``batch_name`` or None."""
+        stage = self._sync()
+        with self._lock:
+            record = self._records.get(batch_name)
+            return self._with_children(stage, record) if record is not None else None
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        """Return ``{batch_name: record}`` for every registered batch."""
+        stage = self._sync()
+        with self._lock:
+            return {name: self._with_children(stage, record) for name, record in self._records.items()}
+
+    def __len__(self) -> int:
+        self._sync()
+        with self._lock:
+            return len(self._records)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return registry size and maintenance counters."""
+        with self._lock:
+            return {
+                'built': self._built,
+                'batches': len(self._records),
+                'pending_dirty_batches': len(self._dirty_paths),
+                **self._stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Explicit updates (main thread)
+    # ------------------------------------------------------------------
+
+    def register(self, batch_path: str) -> Optional[Dict[str, Any]]:
+        """Record (or refresh) the batch at ``batch_path`` and persist the registry."""
+        stage = self._sync()
+        if not stage:
+            return None
+        with self._lock:
+            self._dirty_paths.discard(batch_path)
+            record = self._refresh_path(stage, batch_path)
+            self._persist(stage)
+            return dict(record) if record else None
+
+    def forget_subtree(self, path: str) -> int:
+        """Drop batches at or below ``path`` (after a removal) and persist the registry."""
+        stage = self._sync()
+        prefix = path.rstrip('/') + '/'
+        with self._lock:
+            doomed = [p for p in self._names_by_path if p == path or p.startswith(prefix)]
+            for batch_path in doomed:
+                self._drop_path(batch_path)
+                self._dirty_paths.discard(batch_path)
+            if doomed and stage:
+                self._persist(stage)
+            return len(doomed)
+
+    def rescan(self) -> int:
+        """Force a full ``/World`` scan, ignoring persisted data."""
+        stage = self._observer.current_stage()
+        if not stage:
+            return 0
+        with self._lock:
+            self._scan(stage)
+            self._persist(stage)
+            return len(self._records)
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _on_stage_reset(self, stage) -> None:
+        with self._lock:
+            self._records.clear()
+            self._names_by_path.clear()
+            self._dirty_paths.clear()
+            self._built = False
+            self._needs_rescan = False
+            self._persisted = None
+
+    def _on_objects_changed(self, resynced: List[str], changed: List[str]) -> None:
+        with self._lock:
+            if not self._built:
+                return
+            for path in resynced:
+                if path in ('/', BATCH_ROOT):
+                    # Layer reloads, sublayer swaps and /World resyncs can add or drop any batch
+                    self._needs_rescan = True
+                else:
+                    self._mark_dirty(path)
+            for path in changed:
+                self._mark_dirty(path)
+
+    def _mark_dirty(self, path: str) -> None:
+        if not path.startswith(BATCH_ROOT + '/'):
+            return
+        depth = path.count('/')
+        if depth == 2:
+            self._dirty_paths.add(path)
+        elif depth == 3:
+            parent = path.rsplit('/', 1)[0]
+            if parent in self._names_by_path:
+                self._dirty_paths.add(parent)
+
+    def _sync(self):
+        stage = self._observer.current_stage()
+        if not stage:
+            return None
+        with self._lock:
+            if not self._built:
+                if not self._load_from_layer(stage):
+                    self._scan(stage)
+            elif self._needs_rescan:
+                self._scan(stage)
+            elif self._dirty_paths:
+                paths = sorted(self._dirty_paths)
+                self._dirty_paths.clear()
+                for path in paths:
+                    self._refresh_path(stage, path)
+                self._stats['reconciled_batches'] += len(paths)
+            else:
+                return stage
+            # Reads persist only alongside unsaved edits (the ones being reconciled);
+            # writing customLayerData would otherwise mark a clean stage dirty
+            if stage.GetRootLayer().dirty:
+                self._persist(stage)
+        return stage
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _with_children(stage, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of ``record`` with ``child_elements`` always a list."""
+        if record.get('child_elements') is None and stage:
+            # Records loaded from the layer carry no children until first requested
+            prim = stage.GetPrimAtPath(record['path'])
+            record['child_elements'] = list_child_elements(prim) if prim and prim.IsValid() else []
+        return dict(record, child_elements=list(record.get('child_elements') or []))
+
+    def _refresh_path(self, stage, batch_path: str) -> Optional[Dict[str, Any]]:
+        self._drop_path(batch_path)
+        prim = stage.GetPrimAtPath(batch_path)
+        if not is_batch_prim(prim):
+            return None
+        record = extract_batch_record(prim)
+        self._add(record)
+        return record
+
+    def _add(self, record: Dict[str, Any]) -> None:
+        previous_path = self._records.get(record['name'], {}).get('path')
+        if previous_path and previous_path != record['path']:
+            self._names_by_path.pop(previous_path, None)
+        self._records[record['name']] = record
+        self._names_by_path[record['path']] = record['name']
+
+    def _drop_path(self, batch_path: str) -> None:
+        name = self._names_by_path.pop(batch_path, None)
+        if name is not None and self._records.get(name, {}).get('path') == batch_path:
+            del self._records[name]
+
+    def _scan(self, stage) -> None:
+        start = time.perf_counter()
+        self._records.clear()
+        self._names_by_path.clear()
+        world_prim = stage.GetPrimAtPath(BATCH_ROOT)
+        if world_prim and world_prim.IsValid():
+            for child in world_prim.GetChildren():
+                if is_batch_prim(child):
+                    self._add(extract_batch_record(child))
+        self._built = True
+        self._needs_rescan = False
+        self._dirty_paths.clear()
+        self._stats['full_scans'] += 1
+        logger.debug(f"🔍 Batch registry scanned {len(self._records)} batches in "
+                     f"{(time.perf_counter() - start) * 1000.0:.2f}ms")
+
+    def _world_child_count(self, stage) -> int:
+        world_prim = stage.GetPrimAtPath(BATCH_ROOT)
+        return len(world_prim.GetChildrenNames()) if world_prim and world_prim.IsValid() else 0
+
+    def _load_from_layer(self, stage) -> bool:
+        """Load persisted records; falls back to a scan when they look stale."""
+        try:
+            data = stage.GetRootLayer().customLayerData.get(REGISTRY_LAYER_KEY)
+        except Exception:
+            data = None
+        if not isinstance(data, dict) or data.get('version') != REGISTRY_FORMAT_VERSION:
+            return False
+        # A different /World child count means batches were added or removed elsewhere
+        if data.get('world_children') != self._world_child_count(stage):
+            return False
+
+        records = []
+        for name, entry in dict(data.get('batches') or {}).items():
+            path = entry.get('path')
+            if not path or not is_batch_prim(stage.GetPrimAtPath(path)):
+                return False
+            records.append({
+                'name': name,
+                'path': path,
+                'created_at': entry.get('created_at'),
+                'element_count': entry.get('element_count', 0),
+                'element_names': list(entry.get('element_names') or []),
+                'child_elements': None,
+            })
+
+        self._records.clear()
+        self._names_by_path.clear()
+        for record in records:
+            self._add(record)
+        self._built = True
+        self._needs_rescan = False
+        self._persisted = self._layer_payload(stage)
+        self._stats['layer_loads'] += 1
+        return True
+
+    def _layer_payload(self, stage) -> Dict[str, Any]:
+        from pxr import Vt
+
+        batches = {}
+        for name, record in self._records.items():
+            entry = {
+                'path': record['path'],
+                'created_at': float(record.get('created_at') or 0.0),
+                'element_count': int(record.get('element_count') or 0),
+            }
+            if record.get('element_names'):
+                # Plain Python lists are not serializable as layer dictionary values
+                entry['element_names'] = Vt.StringArray([str(n) for n in record['element_names']])
+            batches[name] = entry
+        return {
+            'version': REGISTRY_FORMAT_VERSION,
+            'world_children': self._world_child_count(stage),
+            'batches': batches,
+        }
+
+    def _persist(self, stage) -> None:
+        """Write the registry to the root layer when it differs from what is stored."""
+        payload = self._layer_payload(stage)
+        if payload == self._persisted:
+            return
+        try:
+            layer = stage.GetRootLayer()
+            if not layer.permissionToEdit:
+                return
+            custom_data = dict(layer.customLayerData)
+            custom_data[REGISTRY_LAYER_KEY] = payload
+            layer.customLayerData = custom_data
+            self._persisted = payload
+            self._stats['persist_writes'] += 1
+        except Exception as e:
+            logger.debug(f"Could not persist batch registry: {e}")
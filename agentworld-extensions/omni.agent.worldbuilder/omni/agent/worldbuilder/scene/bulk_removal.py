@@ -0,0 +1,145 @@
+"""
+Bulk prim removal for WorldBuilder cleanup operations.
+
+Targets are collected in one ``Usd.PrimRange`` traversal (subtrees of a match
+are pruned) and removed as Sdf spec edits on the edit target layer inside a
+single ``Sdf.ChangeBlock``, so the stage recomposes once instead of once per
+``stage.RemovePrim`` call. Removing most of a large flat parent rebuilds the
+layer in one pass rather than deleting child specs one by one.
+"""
+
+import fnmatch
+import logging
+import re
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List
+
+from .stage_observer import collapse_roots
+
+logger = logging.getLogger(__name__)
+
+NAME_MATCH_MODES = ('auto', 'substring', 'glob', 'regex')
+
+_GLOB_CHARS = frozenset('*?[')
+
+# Deleting one child spec copies the parent's whole child list, so removing k of
+# n children costs k * n; above this many child-list entries copied in total the
+# layer is rebuilt once without the doomed specs instead.
+_REBUILD_THRESHOLD = 2_000_000
+
+def compile_name_matcher(pattern: str, mode: str = 'auto') -> Callable[[str], bool]:
+    """
+    Compile a prim-name matcher once for the whole traversal.
+
+    Modes:
+        auto: glob when the pattern contains ``*``, ``?`` or ``[``, otherwise substring
+        substring: plain ``pattern in name``
+        glob: shell-style pattern matched against the full name
+        regex: Python regular expression searched within the name
+    """
+    if mode not in NAME_MATCH_MODES:
+        raise ValueError(f"match must be one of {', '.join(NAME_MATCH_MODES)}")
+    if mode == 'auto':
+        mode = 'glob' if _GLOB_CHARS & set(pattern) else 'substring'
+    if mode == 'substring':
+        return lambda name: pattern in name
+    if mode == 'glob':
+        return re.compile(fnmatch.translate(pattern)).match
+    try:
+        return re.compile(pattern).search
+    except re.error as exc:
+        raise ValueError(f"Invalid regular expression '{pattern}': {exc}") from exc
+
+
+def collect_removal_targets(root_prim, predicate: Callable[[Any], bool]) -> List[str]:
+    """Return paths of descendants of ``root_prim`` matching ``predicate``, outermost matches only."""
+    from pxr import Usd
+
+    targets: List[str] = []
+    iterator = iter(Usd.PrimRange(root_prim))
+    for prim in iterator:
+        if prim == root_prim:
+            continue
+        if predicate(prim):
+            targets.append(str(prim.GetPath()))
+            # Descendants go away with their ancestor
+            iterator.PruneChildren()
+    return targets
+
+
+def remove_prim_specs(stage, paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    Delete the edit-target prim specs for ``paths`` in one change block.
+
+    Paths without a spec in the edit target layer (e.g. prims contributed only by
+    references or weaker sublayers) are reported as skipped, matching what
+    ``stage.RemovePrim`` can remove.
+    """
+    from pxr import Sdf
+
+    start = time.perf_counter()
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
+
+    removed: List[str] = []
+    skipped: List[str] = []
+    by_parent: Dict[str, List[str]] = defaultdict(list)
+    for path in collapse_roots(paths):
+        spec_path = edit_target.MapToSpecPath(Sdf.Path(path))
+        spec = layer.GetPrimAtPath(spec_path) if not spec_path.isEmpty else None
+        if not spec:
+            skipped.append(path)
+            continue
+        by_parent[str(spec_path.GetParentPath())].append(spec.name)
+        removed.append(path)
+
+    with Sdf.ChangeBlock():
+        partial: Dict[str, Any] = {}
+        work = 0
+        for parent_path, names in by_parent.items():
+            parent_spec = layer.GetPrimAtPath(parent_path) if parent_path != '/' else layer.pseudoRoot
+            doomed = set(names)
+            children = parent_spec.nameChildren
+            if doomed.issuperset(children.keys()):
+                # One edit, however many children the parent had
+                children.clear()
+                continue
+            partial[parent_path] = (children, doomed)
+            work += len(doomed) * len(children)
+        if work > _REBUILD_THRESHOLD:
+            _rebuild_without_children(layer, {path: doomed for path, (_, doomed) in partial.items()})
+        else:
+            for children, doomed in partial.values():
+                for name in doomed:
+                    del children[name]
+
+    return {
+        'removed': removed,
+        'skipped': skipped,
+        'elapsed_ms': round((time.perf_counter() - start) * 1000.0, 3),
+    }
+
+
+def _rebuild_without_children(layer, doomed_by_parent: Dict[str, set]) -> None:
+    """
+    Replace ``layer``'s content with a copy lacking the doomed child specs.
+
+    The copy writes each surviving child list once, so the cost is linear in the
+    layer size. ``TransferContent`` diffs old and new content, so only the doomed
+    prims are resynced and surviving siblings are left untouched.
+    """
+    from pxr import Sdf
+
+    def should_copy_children(field, src_layer, src_path, *_):
+        doomed = doomed_by_parent.get(str(src_path)) if field == 'primChildren' else None
+        if not doomed:
+            return True
+        keep = [name for name in src_layer.GetPrimAtPath(src_path).nameChildren.keys() if name not in doomed]
+        return True, keep, keep
+
+    scratch = Sdf.Layer.CreateAnonymous('bulk_removal')
+    if not Sdf.CopySpec(layer, Sdf.Path.absoluteRootPath, scratch, Sdf.Path.absoluteRootPath,
+                        lambda *_: True, should_copy_children):
+        raise RuntimeError(f"Could not rebuild layer {layer.identifier} for bulk removal")
+    layer.TransferContent(scratch)
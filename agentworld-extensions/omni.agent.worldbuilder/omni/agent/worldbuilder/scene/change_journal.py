@@ -0,0 +1,305 @@
+"""
+Stage revision counter and bounded change journal for WorldBuilder.
+
+Every ``Usd.Notice.ObjectsChanged`` delivered by the :class:`StageObserver`
+bumps a monotonic revision and appends the affected prim paths (classified as
+added, removed or modified, with the changed fields) to an in-memory journal.
+The journal also tracks which prim paths exist, so a spec re-authored over an
+existing prim is not mistaken for an addition.
+Clients that keep a local scene model ask for the changes since the revision
+they last saw; once that revision has been evicted the answer is "resync
+required" and they fall back to a full ``get_scene``. A single edit can deliver
+many notices, so the journal is bounded by the prim paths it holds rather than
+by the number of revisions.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from .stage_observer import SortedPathSet, collapse_roots, is_bookkeeping_change
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing
+    from .stage_observer import StageObserver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_RECORDS = 0  # no revision cap; max_paths bounds the journal
+DEFAULT_JOURNAL_PATHS = 50000
+
+ADDED = 'added'
+REMOVED = 'removed'
+MODIFIED = 'modified'
+
+# (prim_path, kind, changed_fields, subtree_resynced)
+Change = Tuple[str, str, Tuple[str, ...], bool]
+
+
+def summarize_notice(notice, stage, known: Optional[Callable[[str], bool]] = None) -> List[Change]:
+    """
+    Reduce an ObjectsChanged notice to per-prim changes.
+
+    Prim resyncs are classified against the stage at notice time: a prim that
+    no longer exists was removed, one whose spec was just created (``specifier``
+    authored, or no fields as for renames and ``over`` creation) was added, and
+    anything else is a modification of the whole subtree. ``known`` (prim
+    existence before the notice) overrides the field heuristic: a prim that
+    already existed is a subtree modification even when its spec was recreated.
+    Property paths and info-only changes are folded into a modification of
+    their owning prim.
+    """
+    changes: Dict[str, List[Any]] = {}
+
+    def _record(path: str, kind: str, fields: Iterable[str], subtree: bool) -> None:
+        entry = changes.get(path)
+        if entry is None:
+            changes[path] = [kind, set(fields), subtree]
+            return
+        if kind != MODIFIED:
+            entry[0] = kind
+        entry[1].update(fields)
+        entry[2] = entry[2] or subtree
+
+    for path in notice.GetResyncedPaths():
+        if path.IsPropertyPath():
+            _record(str(path.GetPrimPath()), MODIFIED, (path.name,), False)
+            continue
+        fields = [str(f) for f in notice.GetChangedFields(path)]
+        prim_path = str(path)
+        if path.IsAbsoluteRootPath():
+            _record(prim_path, MODIFIED, fields, True)
+        elif not stage.GetPrimAtPath(path):
+            _record(prim_path, REMOVED, (), False)
+        elif known is not None and known(prim_path):
+            _record(prim_path, MODIFIED, fields, True)
+        elif not fields or 'specifier' in fields:
+            _record(prim_path, ADDED, (), False)
+        else:
+            _record(prim_path, MODIFIED, fields, True)
+
+    for path in notice.GetChangedInfoOnlyPaths():
+        if is_bookkeeping_change(notice, path):
+            continue
+        if path.IsPropertyPath():
+            _record(str(path.GetPrimPath()), MODIFIED, (path.name,), False)
+        else:
+            _record(str(path), MODIFIED, (str(f) for f in notice.GetChangedFields(path)), False)
+
+    return [(path, kind, tuple(sorted(fields)), subtree) for path, (kind, fields, subtree) in changes.items()]
+
+
+def merge_changes(changes: Iterable[Change], exists: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+    """
+    Fold an ordered sequence of changes into the net delta.
+
+    The first kind seen for a path decides how it is reported; ``exists``
+    (current stage lookup) resolves transient prims: added-then-removed prims
+    are dropped and removed-then-recreated prims become subtree modifications.
+    Entries below an added or removed prim are implied by it and omitted.
+    """
+    merged: Dict[str, List[Any]] = {}
+    for path, kind, fields, subtree in changes:
+        entry = merged.get(path)
+        if entry is None:
+            merged[path] = [kind, kind, set(fields), subtree]
+        else:
+            entry[1] = kind
+            entry[2].update(fields)
+            entry[3] = entry[3] or subtree or kind != MODIFIED
+
+    added: List[str] = []
+    removed: List[str] = []
+    modified: Dict[str, Dict[str, Any]] = {}
+    for path, (first, last, fields, subtree) in merged.items():
+        present = exists(path) if exists is not None else last != REMOVED
+        if first == ADDED:
+            if present:
+                added.append(path)
+        elif not present:
+            removed.append(path)
+        else:
+            modified[path] = {'path': path, 'fields': sorted(fields), 'subtree': bool(subtree or first == REMOVED)}
+
+    roots = collapse_roots(added + removed)
+    covered = set(roots)
+
+    def _implied(path: str) -> bool:
+        parent = path.rsplit('/', 1)[0] or '/'
+        while parent != '/':
+            if parent in covered:
+                return True
+            parent = parent.rsplit('/', 1)[0] or '/'
+        return False
+
+    return {
+        ADDED: sorted(p for p in added if p in covered),
+        REMOVED: sorted(p for p in removed if p in covered),
+        MODIFIED: [modified[p] for p in sorted(modified) if not _implied(p)],
+    }
+
+
+class ChangeJournal:
+    """Monotonic stage revision plus a bounded log of per-revision changes."""
+
+    def __init__(self, observer: 'StageObserver', max_records: int = DEFAULT_JOURNAL_RECORDS,
+                 max_paths: int = DEFAULT_JOURNAL_PATHS):
+        """
+        Args:
+            observer: Shared stage observer delivering ObjectsChanged notices
+            max_records: Revisions kept before the oldest are evicted (0 for no limit)
+            max_paths: Total prim paths kept across all retained revisions
+        """
+        self._observer = observer
+        self._max_records = max(0, int(max_records or 0))
+        self._max_paths = max(1, int(max_paths))
+        self._lock = threading.Lock()
+        self._records: Deque[Tuple[int, float, List[Change]]] = deque()
+        self._path_count = 0
+        self._revision = 0
+        # Oldest ``since`` that can still be answered from the journal
+        self._floor = 0
+        self._epoch = uuid.uuid4().hex[:12]
+        # Prim paths present on the bound stage; None when it could not be read
+        self._known: Optional[SortedPathSet] = None
+        self._stats = {'notices': 0, 'evicted_records': 0, 'resets': 0, 'resync_responses': 0}
+        observer.subscribe(None, self._on_stage_reset, self._on_notice)
+
+    @property
+    def revision(self) -> int:
+        """Current stage revision (binds to the active stage first)."""
+        self._observer.current_stage()
+        with self._lock:
+            return self._revision
+
+    @property
+    def epoch(self) -> str:
+        """Identifier of this journal instance; revisions from another epoch are meaningless."""
+        return self._epoch
+
+    def changes_since(self, since: int, epoch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return the net changes after revision ``since`` (call on the main thread).
+
+        ``resync_required`` is set instead when ``since`` predates the journal,
+        is ahead of the current revision, or belongs to another epoch.
+        """
+        stage = self._observer.current_stage()
+        with self._lock:
+            revision, floor = self._revision, self._floor
+            response: Dict[str, Any] = {
+                'success': True,
+                'since': since,
+                'revision': revision,
+                'oldest_revision': floor,
+                'epoch': self._epoch,
+            }
+            reason = None
+            if epoch and epoch != self._epoch:
+                reason = 'epoch mismatch (journal was restarted)'
+            elif since > revision:
+                reason = 'since is ahead of the current revision'
+            elif since < floor:
+                reason = 'since has been evicted from the change journal'
+            if reason:
+                self._stats['resync_responses'] += 1
+                response.update({'resync_required': True, 'reason': reason})
+                return response
+            window = [change for rev, _, changes in self._records if rev > since for change in changes]
+
+        exists = (lambda path: bool(stage.GetPrimAtPath(path))) if stage else None
+        response.update({'resync_required': False, **merge_changes(window, exists)})
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return journal size, bounds and counters."""
+        with self._lock:
+            return {
+                'revision': self._revision,
+                'oldest_revision': self._floor,
+                'records': len(self._records),
+                'paths': self._path_count,
+                'max_records': self._max_records,
+                'max_paths': self._max_paths,
+                **self._stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Notice handling
+    # ------------------------------------------------------------------
+
+    def _on_stage_reset(self, stage) -> None:
+        with self._lock:
+            # A different stage shares no history with the old one
+            self._revision += 1
+            self._floor = self._revision
+            self._records.clear()
+            self._path_count = 0
+            self._stats['resets'] += 1
+        paths = _collect_prim_paths(stage, ['/']) if stage else None
+        self._known = SortedPathSet(paths) if paths is not None else None
+
+    def _on_notice(self, notice, stage) -> None:
+        known = self._known
+        try:
+            changes = summarize_notice(notice, stage, known=known.__contains__ if known is not None else None)
+        except Exception as e:
+            logger.debug(f"Could not summarize ObjectsChanged notice: {e}")
+            changes = None
+        self._update_known(stage, changes)
+        with self._lock:
+            self._revision += 1
+            self._stats['notices'] += 1
+            if changes is None:
+                # Unreadable notice: nothing before it can be replayed reliably
+                self._records.clear()
+                self._path_count = 0
+                self._floor = self._revision
+                return
+            if not changes:
+                return
+            self._records.append((self._revision, time.time(), changes))
+            self._path_count += len(changes)
+            self._evict()
+
+    def _update_known(self, stage, changes: Optional[List[Change]]) -> None:
+        if self._known is None:
+            return
+        roots = ['/'] if changes is None else collapse_roots(
+            path for path, kind, _, subtree in changes if kind != MODIFIED or subtree)
+        if not roots:
+            return
+        paths = _collect_prim_paths(stage, roots)
+        if paths is None or '/' in roots:
+            self._known = SortedPathSet(paths) if paths is not None else None
+            return
+        for root in roots:
+            self._known.pop_subtree(root)
+        self._known.update(paths)
+
+    def _evict(self) -> None:
+        while self._records and (self._path_count > self._max_paths
+                                 or 0 < self._max_records < len(self._records)):
+            revision, _, changes = self._records.popleft()
+            self._path_count -= len(changes)
+            self._floor = revision
+            self._stats['evicted_records'] += 1
+
+
+def _collect_prim_paths(stage, roots: Iterable[str]) -> Optional[List[str]]:
+    """Prim paths at and below ``roots`` on ``stage``, or None if the stage cannot be traversed."""
+    try:
+        from pxr import Sdf, Usd
+
+        paths = []
+        for root in roots:
+            prim = stage.GetPrimAtPath(Sdf.Path(root))
+            if not prim:
+                continue
+            paths.extend(str(p.GetPath()) for p in Usd.PrimRange(prim) if not p.IsPseudoRoot())
+        return paths
+    except Exception as e:
+        logger.debug(f"Could not collect prim paths for the change journal: {e}")
+        return None
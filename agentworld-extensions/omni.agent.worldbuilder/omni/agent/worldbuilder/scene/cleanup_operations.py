@@ -8,6 +8,8 @@ import logging
 from typing import Dict, Any, List
 from pxr import Usd
 
+from .bulk_removal import collect_removal_targets, compile_name_matcher, remove_prim_specs
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,21 +100,24 @@ class CleanupOperations:
             
             # If it's a batch/group, remove all children
             if path != "/World":  # Safety check - don't remove the entire world
-                stage.RemovePrim(path)
+                result = remove_prim_specs(stage, [path])
                 removed_count += 1  # Include the parent prim itself
             else:
                 # If clearing /World, remove all its children but keep /World itself
-                for child in children:
-                    stage.RemovePrim(child.GetPath())
+                result = remove_prim_specs(stage, [str(child.GetPath()) for child in children])
             
-            logger.info(f"✅ Cleared {removed_count} elements from {path}")
+            logger.info(f"✅ Cleared {removed_count} elements from {path} in {result['elapsed_ms']:.1f}ms")
             
-            return {
+            response = {
                 'success': True,
                 'path': path,
                 'removed_count': removed_count,
+                'elapsed_ms': result['elapsed_ms'],
                 'message': f"Cleared {removed_count} elements from {path}"
             }
+            if result['skipped']:
+                response['skipped_paths'] = result['skipped']
+            return response
             
         except Exception as e:
             logger.error(f"❌ Error clearing path {path}: {e}")
@@ -148,23 +153,13 @@ class CleanupOperations:
                     'error': f"Parent path '{parent_path}' not found or invalid."
                 }
             
-            # Find and remove all prims of the specified type
-            removed_paths = []
-            
-            def _traverse_and_remove(prim):
-                # Check children first (depth-first to avoid iterator invalidation)
-                children_to_check = list(prim.GetChildren())
-                for child in children_to_check:
-                    _traverse_and_remove(child)
-                
-                # Check current prim
-                if prim.GetTypeName() == prim_type and prim != parent_prim:
-                    removed_paths.append(str(prim.GetPath()))
-                    stage.RemovePrim(prim.GetPath())
-            
-            _traverse_and_remove(parent_prim)
+            # Collect matches in one traversal, then remove them in a single change block
+            targets = collect_removal_targets(parent_prim, lambda prim: prim.GetTypeName() == prim_type)
+            result = remove_prim_specs(stage, targets)
+            removed_paths = result['removed']
             
-            logger.info(f"✅ Removed {len(removed_paths)} elements of type '{prim_type}' from {parent_path}")
+            logger.info(f"✅ Removed {len(removed_paths)} elements of type '{prim_type}' from {parent_path} "
+                        f"in {result['elapsed_ms']:.1f}ms")
             
             return {
                 'success': True,
@@ -172,6 +167,8 @@ class CleanupOperations:
                 'parent_path': parent_path,
                 'removed_count': len(removed_paths),
                 'removed_paths': removed_paths,
+                'skipped_paths': result['skipped'],
+                'elapsed_ms': result['elapsed_ms'],
                 'message': f"Removed {len(removed_paths)} elements of type '{prim_type}'"
             }
             
@@ -184,13 +181,15 @@ class CleanupOperations:
                 'parent_path': parent_path
             }
     
-    def clear_by_pattern(self, name_pattern: str, parent_path: str = "/World") -> Dict[str, Any]:
+    def clear_by_pattern(self, name_pattern: str, parent_path: str = "/World", match: str = "auto") -> Dict[str, Any]:
         """
         Clear all elements whose names match a pattern.
         
         Args:
-            name_pattern: Name pattern to match (simple string matching)
+            name_pattern: Name pattern to match
             parent_path: Parent path to search within
+            match: 'auto' (glob if the pattern has wildcards, else substring),
+                'substring', 'glob' or 'regex'
             
         Returns:
             Result dictionary with clearing details
@@ -210,31 +209,24 @@ class CleanupOperations:
                     'error': f"Parent path '{parent_path}' not found or invalid."
                 }
             
-            # Find and remove all prims matching the pattern
-            removed_paths = []
-            
-            def _traverse_and_remove(prim):
-                # Check children first (depth-first to avoid iterator invalidation)
-                children_to_check = list(prim.GetChildren())
-                for child in children_to_check:
-                    _traverse_and_remove(child)
-                
-                # Check current prim name
-                prim_name = prim.GetName()
-                if name_pattern in prim_name and prim != parent_prim:
-                    removed_paths.append(str(prim.GetPath()))
-                    stage.RemovePrim(prim.GetPath())
-            
-            _traverse_and_remove(parent_prim)
+            # Compile the matcher once, collect in one traversal, remove in one change block
+            matches_name = compile_name_matcher(name_pattern, match)
+            targets = collect_removal_targets(parent_prim, lambda prim: bool(matches_name(prim.GetName())))
+            result = remove_prim_specs(stage, targets)
+            removed_paths = result['removed']
             
-            logger.info(f"✅ Removed {len(removed_paths)} elements matching pattern '{name_pattern}' from {parent_path}")
+            logger.info(f"✅ Removed {len(removed_paths)} elements matching pattern '{name_pattern}' from {parent_path} "
+                        f"in {result['elapsed_ms']:.1f}ms")
             
             return {
                 'success': True,
                 'name_pattern': name_pattern,
+                'match': match,
                 'parent_path': parent_path,
                 'removed_count': len(removed_paths),
                 'removed_paths': removed_paths,
+                'skipped_paths': result['skipped'],
+                'elapsed_ms': result['elapsed_ms'],
                 'message': f"Removed {len(removed_paths)} elements matching pattern '{name_pattern}'"
             }
             
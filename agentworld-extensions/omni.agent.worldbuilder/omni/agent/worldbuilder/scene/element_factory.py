@@ -2,24 +2,61 @@
 USD element creation factory for WorldBuilder scene operations.
 
 Provides factory pattern for creating different primitive types with proper USD handling.
+
+Two authoring backends produce identical composed prims. ``usd`` goes through
+the schema API (``UsdGeom.Cube.Define``, ``AddTranslateOp`` ...), which
+recomposes and sends a notice per call. ``sdf`` writes the prim spec, its
+schema attributes, xformOps and ``xformOpOrder`` straight onto the edit target
+layer inside one ``Sdf.ChangeBlock`` per element, or per batch with
+:meth:`ElementFactory.create_elements`.
 """
 
 import logging
 import time
-from typing import Dict, Any, Optional, Tuple
-from pxr import Usd, UsdGeom, Gf
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from pxr import Usd, UsdGeom, Gf, Sdf
 
 from .scene_types import SceneElement, PrimitiveType
+from .material_library import MATERIAL_MODES
 
 logger = logging.getLogger(__name__)
 
+AUTHORING_BACKENDS = ('usd', 'sdf')
+
+# Schema type and default attribute values authored for each primitive
+_PLANE_POINTS = [(-0.5, 0, -0.5), (0.5, 0, -0.5), (0.5, 0, 0.5), (-0.5, 0, 0.5)]
+_PRIMITIVE_SPECS = {
+    PrimitiveType.CUBE: ('Cube', (('size', 'Double', 1.0),)),
+    PrimitiveType.SPHERE: ('Sphere', (('radius', 'Double', 0.5),)),
+    PrimitiveType.CYLINDER: ('Cylinder', (('radius', 'Double', 0.5), ('height', 'Double', 1.0))),
+    PrimitiveType.CONE: ('Cone', (('radius', 'Double', 0.5), ('height', 'Double', 1.0))),
+    PrimitiveType.PLANE: ('Mesh', (
+        ('points', 'Point3fArray', _PLANE_POINTS),
+        ('faceVertexIndices', 'IntArray', [0, 1, 2, 3]),
+        ('faceVertexCounts', 'IntArray', [4]),
+    )),
+}
+_XFORM_OP_ORDER = ['xformOp:translate', 'xformOp:rotateXYZ', 'xformOp:scale']
+
+
+def authoring_backend_errors(data: Dict[str, Any]) -> List[str]:
+    """Validate an optional ``authoring_backend`` in an element payload."""
+    backend = data.get('authoring_backend')
+    if backend is not None and backend not in AUTHORING_BACKENDS:
+        return [f"authoring_backend must be one of {', '.join(AUTHORING_BACKENDS)}"]
+    return []
+
 
 class ElementFactory:
     """Factory for creating USD primitive elements with proper transforms and materials."""
     
-    def __init__(self, usd_context):
-        """Initialize element factory with USD context."""
+    def __init__(self, usd_context, material_library=None, material_mode: str = 'display_color',
+                 authoring_backend: str = 'usd'):
+        """Initialize element factory with USD context, optional shared material library and default backend."""
         self._usd_context = usd_context
+        self._material_library = material_library
+        self._material_mode = material_mode if material_mode in MATERIAL_MODES else 'display_color'
+        self._authoring_backend = authoring_backend if authoring_backend in AUTHORING_BACKENDS else 'usd'
         
         # Factory registry for primitive creators
         self._primitive_creators = {
@@ -40,6 +77,8 @@ class ElementFactory:
         Returns:
             Result dictionary with creation details
         """
+        if (element.authoring_backend or self._authoring_backend) == 'sdf':
+            return self.create_elements([element])[0]
         try:
             # Get USD stage
             stage = self._usd_context.get_stage()
@@ -67,17 +106,27 @@ class ElementFactory:
             else:
                 logger.warning(f"❌ Geometry object is not Xformable - cannot set transform")
             
-            # Set color - pass the geometry object for color setting
-            self._set_color(prim, element.color)
-            
-            return {
+            result = {
                 'success': True,
                 'element_name': element.name,
                 'element_type': element.primitive_type.value,
                 'usd_path': element_path,
                 'position': element.position,
+                'authoring_backend': 'usd',
                 'message': f"Created {element.name} in USD stage"
             }
+
+            if self._uses_shared_material(element):
+                # displayColor stays as the viewport fallback, matched to the shared shader
+                self._set_color(prim, self._material_library.quantized_color(element.color))
+                result['material_path'] = self._material_library.bind(
+                    prim.GetPrim(), element.color, element.roughness, element.metallic
+                )
+            else:
+                # Set color - pass the geometry object for color setting
+                self._set_color(prim, element.color)
+            
+            return result
             
         except Exception as e:
             logger.error(f"❌ Error in element creation: {e}")
@@ -87,6 +136,120 @@ class ElementFactory:
                 'element_name': element.name
             }
     
+    def create_elements(self, elements: Sequence[SceneElement]) -> List[Dict[str, Any]]:
+        """
+        Create several elements, authoring every ``sdf``-backend element in one change block.
+
+        Elements resolved to the ``usd`` backend go through :meth:`create_element`.
+        Shared materials are bound after the change block since material
+        creation needs the composed stage. Returns one result per element, in order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(elements)
+        sdf_rows = []
+        for row, element in enumerate(elements):
+            if (element.authoring_backend or self._authoring_backend) == 'sdf':
+                sdf_rows.append(row)
+            else:
+                results[row] = self.create_element(element)
+        if not sdf_rows:
+            return results
+
+        stage = self._usd_context.get_stage()
+        if not stage:
+            for row in sdf_rows:
+                results[row] = {
+                    'success': False,
+                    'error': "No USD stage available. Please create or open a stage first."
+                }
+            return results
+
+        edit_target = stage.GetEditTarget()
+        layer = edit_target.GetLayer()
+        undefined_ancestors: Dict[str, bool] = {}
+        with Sdf.ChangeBlock():
+            for row in sdf_rows:
+                element = elements[row]
+                element_path = f"{element.parent_path}/{element.name}"
+                try:
+                    color = element.color
+                    if self._uses_shared_material(element):
+                        color = self._material_library.quantized_color(element.color)
+                    self._author_element_spec(stage, layer, edit_target, element_path, element, color,
+                                              undefined_ancestors)
+                    results[row] = {
+                        'success': True,
+                        'element_name': element.name,
+                        'element_type': element.primitive_type.value,
+                        'usd_path': element_path,
+                        'position': element.position,
+                        'authoring_backend': 'sdf',
+                        'message': f"Created {element.name} in USD stage"
+                    }
+                except Exception as e:
+                    logger.error(f"❌ Error authoring element specs for {element_path}: {e}")
+                    results[row] = {'success': False, 'error': str(e), 'element_name': element.name}
+
+        for row in sdf_rows:
+            element = elements[row]
+            if not results[row]['success'] or not self._uses_shared_material(element):
+                continue
+            prim = stage.GetPrimAtPath(results[row]['usd_path'])
+            results[row]['material_path'] = self._material_library.bind(
+                prim, element.color, element.roughness, element.metallic
+            )
+        return results
+
+    def _author_element_spec(self, stage: Usd.Stage, layer: Sdf.Layer, edit_target: Usd.EditTarget,
+                             element_path: str, element: SceneElement, color: Tuple[float, float, float],
+                             undefined_ancestors: Dict[str, bool]) -> None:
+        """Write the same specs ``Define`` + attribute ``Set`` calls would author, without recomposing."""
+        spec_info = _PRIMITIVE_SPECS.get(element.primitive_type)
+        if spec_info is None:
+            raise ValueError(f"Unsupported primitive type: {element.primitive_type}")
+        type_name, attributes = spec_info
+        path = Sdf.Path(element_path)
+        if not path.IsPrimPath():
+            raise ValueError(f"Invalid prim path: {element_path}")
+
+        prim_spec = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(path))
+        if not prim_spec:
+            raise ValueError(f"Could not create prim spec at {element_path}")
+        # Like UsdStage::DefinePrim, ancestors that are not defined yet become typeless defs
+        for ancestor in path.GetPrefixes()[:-1]:
+            key = str(ancestor)
+            if key not in undefined_ancestors:
+                prim = stage.GetPrimAtPath(ancestor)
+                undefined_ancestors[key] = not (prim and prim.IsDefined())
+            if undefined_ancestors[key]:
+                layer.GetPrimAtPath(edit_target.MapToSpecPath(ancestor)).specifier = Sdf.SpecifierDef
+        prim_spec.specifier = Sdf.SpecifierDef
+        prim_spec.typeName = type_name
+
+        for name, value_type, value in attributes:
+            self._set_attribute_spec(prim_spec, name, getattr(Sdf.ValueTypeNames, value_type), value)
+        self._set_attribute_spec(prim_spec, 'xformOp:translate', Sdf.ValueTypeNames.Double3,
+                                 Gf.Vec3d(*element.position))
+        self._set_attribute_spec(prim_spec, 'xformOp:rotateXYZ', Sdf.ValueTypeNames.Float3,
+                                 Gf.Vec3f(*element.rotation))
+        self._set_attribute_spec(prim_spec, 'xformOp:scale', Sdf.ValueTypeNames.Float3,
+                                 Gf.Vec3f(*element.scale))
+        self._set_attribute_spec(prim_spec, 'xformOpOrder', Sdf.ValueTypeNames.TokenArray,
+                                 _XFORM_OP_ORDER, Sdf.VariabilityUniform)
+        self._set_attribute_spec(prim_spec, 'primvars:displayColor', Sdf.ValueTypeNames.Color3fArray,
+                                 [Gf.Vec3f(*color)])
+
+    @staticmethod
+    def _set_attribute_spec(prim_spec: Sdf.PrimSpec, name: str, type_name: Sdf.ValueTypeName, value,
+                            variability: Sdf.Variability = Sdf.VariabilityVarying) -> None:
+        attr_spec = prim_spec.attributes.get(name)
+        if attr_spec is None:
+            attr_spec = Sdf.AttributeSpec(prim_spec, name, type_name, variability)
+        attr_spec.default = value
+
+    def _uses_shared_material(self, element: SceneElement) -> bool:
+        material_mode = element.material_mode or self._material_mode
+        return material_mode == 'shared' and self._material_library is not None
+
     def _create_primitive(self, stage: Usd.Stage, path: str, prim_type: PrimitiveType) -> Optional[UsdGeom.Gprim]:
         """Create primitive based on type using factory pattern."""
         try:
@@ -205,6 +368,15 @@ class ElementFactory:
         # Validate color values
         if any(c < 0.0 or c > 1.0 for c in element.color):
             errors.append("Color values must be between 0.0 and 1.0")
+
+        # Validate material parameters
+        if element.material_mode and element.material_mode not in MATERIAL_MODES:
+            errors.append(f"material_mode must be one of {', '.join(MATERIAL_MODES)}")
+        for label, value in (('roughness', element.roughness), ('metallic', element.metallic)):
+            if value is not None and not 0.0 <= value <= 1.0:
+                errors.append(f"{label} must be between 0.0 and 1.0")
+        if element.authoring_backend and element.authoring_backend not in AUTHORING_BACKENDS:
+            errors.append(f"authoring_backend must be one of {', '.join(AUTHORING_BACKENDS)}")
         
         # Validate scale values
         if any(s <= 0.0 for s in element.scale):
@@ -0,0 +1,233 @@
+"""
+Lazy, cursor-paginated hierarchy browsing for WorldBuilder.
+
+Unlike ``get_scene_contents`` (full recursion) this walks only the window of
+children requested, reports child counts from child names without expanding
+them, and attaches bounds/transform/batch fields only when asked for. Cursors
+are opaque tokens that encode the parent path, the resume offset and the last
+child name returned so a page survives sibling insertions/removals.
+"""
+
+import base64
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from agentworld_core.bounds import get_bounds_service
+
+logger = logging.getLogger(__name__)
+
+BROWSE_FIELDS = ('bounds', 'transform', 'batch')
+DEFAULT_BROWSE_LIMIT = 100
+MAX_BROWSE_LIMIT = 1000
+MAX_BROWSE_DEPTH = 8
+# Upper bound on nodes materialized by a single browse call across all levels
+MAX_BROWSE_NODES = 5000
+
+
+class CursorError(ValueError):
+    """Raised when a browse cursor cannot be decoded."""
+
+
+def encode_cursor(path: str, offset: int, last_name: str = '') -> str:
+    """Encode a resume position below ``path`` as an opaque URL-safe token."""
+    raw = json.dumps({'p': path, 'o': int(offset), 'n': last_name}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int, str]:
+    """Return ``(path, offset, last_name)`` for a cursor produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        path, offset, last_name = data['p'], int(data['o']), data.get('n', '')
+    except Exception as exc:
+        raise CursorError('cursor is malformed') from exc
+    if not isinstance(path, str) or not path.startswith('/') or offset < 0 or not isinstance(last_name, str):
+        raise CursorError('cursor is malformed')
+    return path, offset, last_name
+
+
+def read_batch_metadata(prim) -> Dict[str, Any]:
+    """Return WorldBuilder batch attributes for a batch Xform, or an empty dict."""
+    if prim.GetTypeName() != "Xform":
+        return {}
+    is_batch_attr = prim.GetAttribute("worldbuilder:is_batch")
+    if not (is_batch_attr and is_batch_attr.Get()):
+        return {}
+    metadata: Dict[str, Any] = {'is_batch': True}
+    for key, attr_name in (
+        ('batch_name', "worldbuilder:batch_name"),
+        ('batch_created_at', "worldbuilder:batch_created_at"),
+        ('batch_element_count', "worldbuilder:batch_element_count"),
+    ):
+        attr = prim.GetAttribute(attr_name)
+        if attr:
+            metadata[key] = attr.Get()
+    return metadata
+
+
+def resume_offset(names: Sequence[str], offset: int, last_name: str) -> int:
+    """Map a cursor onto the current child list, re-anchoring on ``last_name`` if siblings moved."""
+    if not last_name:
+        return min(offset, len(names))
+    if 0 < offset <= len(names) and names[offset - 1] == last_name:
+        return offset
+    try:
+        return list(names).index(last_name) + 1
+    except ValueError:
+        # Anchor was removed; fall back to the positional offset
+        return min(offset, len(names))
+
+
+class _BrowseContext:
+    __slots__ = ('stage', 'fields', 'limit', 'nodes', 'xform_cache')
+
+    def __init__(self, stage, fields: Iterable[str], limit: int):
+        self.stage = stage
+        self.fields = frozenset(fields)
+        self.limit = limit
+        self.nodes = 0
+        self.xform_cache = None
+
+    @property
+    def exhausted(self) -> bool:
+        return self.nodes >= MAX_BROWSE_NODES
+
+
+class HierarchyBrowser:
+    """Depth-limited, paginated view over the USD prim hierarchy."""
+
+    def __init__(self, usd_context):
+        """Initialize browser with USD context."""
+        self._usd_context = usd_context
+
+    def browse(
+        self,
+        path: Optional[str] = None,
+        *,
+        depth: int = 1,
+        limit: int = DEFAULT_BROWSE_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Sequence[str] = (),
+    ) -> Dict[str, Any]:
+        """
+        Return one page of children below ``path``.
+
+        Args:
+            path: Parent prim path (defaults to the cursor's path, then /World)
+            depth: Levels to expand below ``path`` (1 = direct children only)
+            limit: Maximum children returned per expanded level
+            cursor: Opaque ``next_cursor``/``children_cursor`` from a previous page
+            fields: Optional extras per node: bounds, transform, batch
+        """
+        stage = self._usd_context.get_stage()
+        if not stage:
+            return {'success': False, 'error': "No USD stage available"}
+
+        offset, last_name = 0, ''
+        if cursor:
+            cursor_path, offset, last_name = decode_cursor(cursor)
+            if path and path != cursor_path:
+                raise CursorError(f"cursor belongs to '{cursor_path}', not '{path}'")
+            path = cursor_path
+        path = path or "/World"
+
+        root_prim = stage.GetPrimAtPath(path)
+        if not root_prim or not root_prim.IsValid():
+            return {'success': False, 'error': f"Path '{path}' not found in scene"}
+
+        depth = max(1, min(int(depth), MAX_BROWSE_DEPTH))
+        limit = max(1, min(int(limit), MAX_BROWSE_LIMIT))
+        context = _BrowseContext(stage, fields, limit)
+
+        names = [str(name) for name in root_prim.GetChildrenNames()]
+        start = resume_offset(names, offset, last_name)
+        children, next_cursor = self._page(root_prim, names, start, depth, context)
+
+        return {
+            'success': True,
+            'path': path,
+            'depth': depth,
+            'limit': limit,
+            'fields': sorted(context.fields),
+            'child_count': len(names),
+            'offset': start,
+            'children': children,
+            'returned': len(children),
+            'node_count': context.nodes,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _page(self, prim, names: List[str], start: int, depth: int, context: _BrowseContext):
+        parent_path = str(prim.GetPath())
+        nodes: List[Dict[str, Any]] = []
+        index = start
+        end = min(len(names), start + context.limit)
+        while index < end and not context.exhausted:
+            child = prim.GetChild(names[index])
+            index += 1
+            if child and child.IsValid():
+                nodes.append(self._node(child, depth - 1, context))
+
+        next_cursor = encode_cursor(parent_path, index, names[index - 1]) if index < len(names) else None
+        return nodes, next_cursor
+
+    def _node(self, prim, depth: int, context: _BrowseContext) -> Dict[str, Any]:
+        context.nodes += 1
+        child_names = [str(name) for name in prim.GetChildrenNames()]
+        path = str(prim.GetPath())
+        node: Dict[str, Any] = {
+            'name': prim.GetName(),
+            'path': path,
+            'type': str(prim.GetTypeName()),
+            'active': prim.IsActive(),
+            'child_count': len(child_names),
+        }
+        self._add_fields(node, prim, context)
+
+        if depth > 0 and child_names:
+            if context.exhausted:
+                node['children_cursor'] = encode_cursor(path, 0)
+            else:
+                children, next_cursor = self._page(prim, child_names, 0, depth, context)
+                node['children'] = children
+                if next_cursor:
+                    node['children_cursor'] = next_cursor
+        return node
+
+    def _add_fields(self, node: Dict[str, Any], prim, context: _BrowseContext) -> None:
+        if not context.fields:
+            return
+        from pxr import Gf, UsdGeom
+
+        if 'bounds' in context.fields:
+            try:
+                node['bounds'] = get_bounds_service().compute_world_bounds(context.stage, prim)
+            except Exception:
+                node['bounds'] = None
+
+        if 'transform' in context.fields and prim.IsA(UsdGeom.Xformable):
+            try:
+                if context.xform_cache is None:
+                    context.xform_cache = UsdGeom.XformCache()
+                local = UsdGeom.Xformable(prim).GetLocalTransformation()
+                world = context.xform_cache.GetLocalToWorldTransform(prim)
+                translation = local.ExtractTranslation()
+                world_translation = world.ExtractTranslation()
+                scale = Gf.Transform(local).GetScale()
+                node['transform'] = {
+                    'position': [float(translation[0]), float(translation[1]), float(translation[2])],
+                    'world_position': [float(world_translation[0]), float(world_translation[1]), float(world_translation[2])],
+                    'scale': [float(scale[0]), float(scale[1]), float(scale[2])],
+                }
+            except Exception:
+                node['transform'] = None
+
+        if 'batch' in context.fields:
+            node.update(read_batch_metadata(prim))
@@ -0,0 +1,240 @@
+"""
+Background layer prefetch and budgeted payload loading for asset placement.
+
+``place_asset`` used to open and parse the referenced layer inside the
+main-thread ``AddReference`` call. :class:`LayerPrefetcher` opens layers with
+``Sdf.Layer.FindOrOpen`` on worker threads as soon as a placement is queued
+and holds them in a bounded LRU so the registry still has them when the main
+thread composes the reference. :class:`PayloadLoader` loads assets placed as
+unloaded payloads a few at a time, within a per-update millisecond budget.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAYER_CACHE_SIZE = 50
+DEFAULT_PREFETCH_WORKERS = 2
+DEFAULT_PAYLOAD_BUDGET_MS = 4.0
+
+
+def _open_layer(asset_path: str):
+    from pxr import Sdf
+
+    layer = Sdf.Layer.FindOrOpen(asset_path)
+    if not layer:
+        raise IOError(f"Could not open layer: {asset_path}")
+    return layer
+
+
+class _Entry:
+    __slots__ = ('future', 'started')
+
+    def __init__(self, future: Future):
+        self.future = future
+        self.started = time.monotonic()
+
+
+class LayerPrefetcher:
+    """Open USD layers off the main thread and keep the most recent ones alive."""
+
+    def __init__(
+        self,
+        max_layers: int = DEFAULT_LAYER_CACHE_SIZE,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+        ready_timeout: float = 30.0,
+        open_layer: Callable[[str], Any] = _open_layer,
+    ):
+        """
+        Args:
+            max_layers: Layers held open at once (least recently used are released)
+            max_workers: Worker threads opening layers
+            ready_timeout: Seconds after which a still-opening layer stops deferring placement
+            open_layer: Layer opener, ``Sdf.Layer.FindOrOpen`` by default
+        """
+        self._max_layers = max(1, int(max_layers))
+        self._max_workers = max(1, int(max_workers))
+        self._ready_timeout = float(ready_timeout)
+        self._open_layer = open_layer
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {
+            'requests': 0,
+            'hits': 0,
+            'misses': 0,
+            'opened': 0,
+            'failures': 0,
+            'evictions': 0,
+            'open_ms_total': 0.0,
+        }
+
+    def prefetch(self, asset_path: str) -> Future:
+        """Start opening ``asset_path`` unless it is already cached or in flight."""
+        with self._lock:
+            self._stats['requests'] += 1
+            entry = self._entries.get(asset_path)
+            if entry is not None:
+                self._entries.move_to_end(asset_path)
+                return entry.future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix='worldbuilder-prefetch'
+                )
+            entry = _Entry(self._executor.submit(self._load, asset_path))
+            self._entries[asset_path] = entry
+            while len(self._entries) > self._max_layers:
+                # Drops our reference only; a stage still using the layer keeps it open
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+            return entry.future
+
+    def is_ready(self, asset_path: str) -> bool:
+        """True when using ``asset_path`` on the main thread will not wait on the worker."""
+        with self._lock:
+            entry = self._entries.get(asset_path)
+        if entry is None or entry.future.done():
+            return True
+        # Never hold a placement back longer than the configured loading timeout
+        return time.monotonic() - entry.started >= self._ready_timeout
+
+    def acquire(self, asset_path: str):
+        """Return the prefetched layer if it is open, recording a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(asset_path)
+            if entry is not None:
+                self._entries.move_to_end(asset_path)
+            hit = entry is not None and entry.future.done() and entry.future.exception() is None
+            self._stats['hits' if hit else 'misses'] += 1
+        return entry.future.result() if hit else None
+
+    def release(self, asset_path: str) -> None:
+        """Forget a cached layer (e.g. after the file changed on disk)."""
+        with self._lock:
+            self._entries.pop(asset_path, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache occupancy and hit/miss counters."""
+        with self._lock:
+            pending = sum(1 for entry in self._entries.values() if not entry.future.done())
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'open_ms_total': round(self._stats['open_ms_total'], 3),
+                'cached_layers': len(self._entries) - pending,
+                'pending': pending,
+                'max_layers': self._max_layers,
+                'hit_rate': round(self._stats['hits'] / lookups, 4) if lookups else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the workers and release every cached layer."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._entries.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load(self, asset_path: str):
+        start = time.perf_counter()
+        try:
+            layer = self._open_layer(asset_path)
+        except Exception as e:
+            with self._lock:
+                self._stats['failures'] += 1
+                entry = self._entries.get(asset_path)
+                if entry is not None and entry.future.running():
+                    # Do not pin failures; the main thread reports the real error
+                    self._entries.pop(asset_path, None)
+            logger.debug(f"Layer prefetch failed for {asset_path}: {e}")
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        with self._lock:
+            self._stats['opened'] += 1
+            self._stats['open_ms_total'] += elapsed_ms
+        logger.debug(f"📦 Prefetched layer {asset_path} in {elapsed_ms:.2f}ms")
+        return layer
+
+
+class PayloadLoader:
+    """Load unloaded payload prims within a per-update time budget."""
+
+    def __init__(self, budget_ms: float = DEFAULT_PAYLOAD_BUDGET_MS,
+                 is_ready: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            budget_ms: Milliseconds of ``stage.Load`` work allowed per :meth:`step`
+            is_ready: Optional ``asset_path -> bool`` gate (e.g. prefetch finished)
+        """
+        self._budget_ms = float(budget_ms)
+        self._is_ready = is_ready
+        self._lock = threading.Lock()
+        self._pending: 'OrderedDict[str, str]' = OrderedDict()
+        self._stats = {'queued': 0, 'loaded': 0, 'failed': 0, 'deferred_steps': 0}
+
+    def enqueue(self, prim_path: str, asset_path: str) -> None:
+        """Schedule ``prim_path`` (payload of ``asset_path``) for loading."""
+        with self._lock:
+            self._pending[prim_path] = asset_path
+            self._stats['queued'] += 1
+
+    def discard_subtree(self, path: str) -> int:
+        """Drop pending loads at or below ``path`` (after a removal)."""
+        prefix = path.rstrip('/') + '/'
+        with self._lock:
+            doomed = [p for p in self._pending if p == path or p.startswith(prefix)]
+            for prim_path in doomed:
+                del self._pending[prim_path]
+            return len(doomed)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def step(self, stage) -> List[str]:
+        """
+        Load pending payloads until the budget is spent; call on the main thread.
+
+        At least one ready payload is loaded per step so progress never stalls
+        behind a single asset larger than the budget.
+        """
+        if stage is None:
+            return []
+        with self._lock:
+            if not self._pending:
+                return []
+            candidates = list(self._pending.items())
+
+        loaded: List[str] = []
+        start = time.perf_counter()
+        for prim_path, asset_path in candidates:
+            if loaded and (time.perf_counter() - start) * 1000.0 >= self._budget_ms:
+                break
+            if self._is_ready is not None and not self._is_ready(asset_path):
+                continue
+            with self._lock:
+                if self._pending.pop(prim_path, None) is None:
+                    continue
+            try:
+                prim = stage.GetPrimAtPath(prim_path)
+                if prim and prim.IsValid():
+                    stage.Load(prim_path)
+                    loaded.append(prim_path)
+                    self._stats['loaded'] += 1
+            except Exception as e:
+                self._stats['failed'] += 1
+                logger.warning(f"⚠️ Failed to load payload at {prim_path}: {e}")
+
+        if not loaded:
+            self._stats['deferred_steps'] += 1
+        return loaded
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pending count, budget and load counters."""
+        with self._lock:
+            return {**self._stats, 'pending': len(self._pending), 'budget_ms': self._budget_ms}
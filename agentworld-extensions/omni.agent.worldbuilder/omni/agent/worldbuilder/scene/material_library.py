@@ -0,0 +1,256 @@
+"""
+Shared UsdPreviewSurface library for colored WorldBuilder elements.
+
+In ``shared`` material mode elements are bound to one material per quantized
+(color, roughness, metallic) key under ``/World/Looks`` instead of getting a
+material each, so thousands of elements compile a handful of shaders. Bindings
+are reference counted; change notices mark removed or rebound prims and the
+next main-thread :meth:`MaterialLibrary.collect` releases them and deletes
+materials nobody uses any more.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .bulk_removal import remove_prim_specs
+from .stage_observer import SortedPathSet, collapse_roots
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing
+    from .stage_observer import StageObserver
+
+logger = logging.getLogger(__name__)
+
+LOOKS_ROOT = "/World/Looks"
+MATERIAL_MODES = ('display_color', 'shared')
+MATERIAL_KEY_ATTR = "worldbuilder:material_key"
+DEFAULT_QUANTIZATION_STEPS = 32
+DEFAULT_ROUGHNESS = 0.5
+DEFAULT_METALLIC = 0.0
+
+MaterialKey = Tuple[int, int, int, int, int]
+
+
+def quantize_material(color, roughness: float, metallic: float,
+                      steps: int = DEFAULT_QUANTIZATION_STEPS) -> MaterialKey:
+    """Snap color/roughness/metallic (0-1) onto ``steps`` levels per channel."""
+    def _q(value: float) -> int:
+        return int(round(min(1.0, max(0.0, float(value))) * steps))
+    return (_q(color[0]), _q(color[1]), _q(color[2]), _q(roughness), _q(metallic))
+
+
+def material_field_errors(data: Dict[str, Any]) -> List[str]:
+    """Validate optional ``material_mode``/``roughness``/``metallic`` in an element payload."""
+    errors = []
+    mode = data.get('material_mode')
+    if mode is not None and mode not in MATERIAL_MODES:
+        errors.append(f"material_mode must be one of {', '.join(MATERIAL_MODES)}")
+    for field_name in ('roughness', 'metallic'):
+        value = data.get(field_name)
+        if value is None:
+            continue
+        try:
+            if not 0.0 <= float(value) <= 1.0:
+                errors.append(f"{field_name} must be between 0.0 and 1.0")
+        except (TypeError, ValueError):
+            errors.append(f"{field_name} must be a number")
+    return errors
+
+
+def material_name(key: MaterialKey) -> str:
+    """Deterministic prim name for a material key, e.g. ``Mat_10_20_1f_r10_m00``."""
+    r, g, b, rough, metal = key
+    return f"Mat_{r:02x}_{g:02x}_{b:02x}_r{rough:02x}_m{metal:02x}"
+
+
+class MaterialLibrary:
+    """Deduplicated, reference counted preview materials for one stage."""
+
+    def __init__(self, observer: 'StageObserver', steps: int = DEFAULT_QUANTIZATION_STEPS):
+        """Initialize library; existing materials and bindings are read on first use."""
+        self._observer = observer
+        self._steps = max(1, int(steps))
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._refcounts: Dict[str, int] = {}
+        self._bindings: Dict[str, str] = {}  # bound prim path -> material path
+        self._bound_paths = SortedPathSet()
+        self._dirty_roots: Set[str] = set()
+        self._stats = {'materials_created': 0, 'materials_collected': 0, 'bindings_released': 0}
+        observer.subscribe(self._on_objects_changed, self._on_stage_reset)
+
+    # ------------------------------------------------------------------
+    # Main-thread API
+    # ------------------------------------------------------------------
+
+    def bind(self, prim, color, roughness: Optional[float] = None,
+             metallic: Optional[float] = None) -> Optional[str]:
+        """Bind ``prim`` to the shared material for its quantized appearance and return its path."""
+        from pxr import UsdShade
+
+        stage = self._observer.current_stage()
+        if not stage:
+            return None
+        with self._lock:
+            self._ensure_loaded(stage)
+            self._collect(stage)
+            key = quantize_material(
+                color,
+                DEFAULT_ROUGHNESS if roughness is None else roughness,
+                DEFAULT_METALLIC if metallic is None else metallic,
+                self._steps,
+            )
+            material = self._get_or_create(stage, key)
+            prim_path = str(prim.GetPath())
+            self._release(prim_path)
+            UsdShade.MaterialBindingAPI.Apply(prim).Bind(material)
+            material_path = str(material.GetPath())
+            self._bindings[prim_path] = material_path
+            self._bound_paths.add(prim_path)
+            self._refcounts[material_path] = self._refcounts.get(material_path, 0) + 1
+            return material_path
+
+    def quantized_color(self, color) -> Tuple[float, float, float]:
+        """Color as it will be rendered by the shared material (for matching displayColor)."""
+        r, g, b = quantize_material(color, 0.0, 0.0, self._steps)[:3]
+        return (r / self._steps, g / self._steps, b / self._steps)
+
+    def collect(self) -> int:
+        """Release bindings of removed/rebound prims and delete unused materials."""
+        if not self._dirty_roots:
+            return 0
+        stage = self._observer.current_stage()
+        if not stage:
+            return 0
+        with self._lock:
+            return self._collect(stage)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return material and binding counts."""
+        with self._lock:
+            bindings = len(self._bindings)
+            materials = len(self._refcounts)
+            return {
+                'loaded': self._loaded,
+                'materials': materials,
+                'bindings': bindings,
+                'bindings_per_material': round(bindings / materials, 2) if materials else 0.0,
+                'pending_checks': len(self._dirty_roots),
+                **self._stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _on_stage_reset(self, stage) -> None:
+        with self._lock:
+            self._loaded = False
+            self._refcounts.clear()
+            self._bindings.clear()
+            self._bound_paths = SortedPathSet()
+            self._dirty_roots.clear()
+
+    def _on_objects_changed(self, resynced, changed) -> None:
+        with self._lock:
+            if not self._bindings:
+                return
+            for path in resynced:
+                if self._bound_paths.subtree(path):
+                    self._dirty_roots.add(path)
+            for path in changed:
+                # Rebinding authors material:binding on the bound prim itself
+                if path in self._bindings:
+                    self._dirty_roots.add(path)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _collect(self, stage) -> int:
+        from pxr import UsdShade
+
+        released = 0
+        roots = collapse_roots(self._dirty_roots)
+        self._dirty_roots.clear()
+        for root in roots:
+            for prim_path in self._bound_paths.subtree(root):
+                prim = stage.GetPrimAtPath(prim_path)
+                if prim and prim.IsValid():
+                    targets = UsdShade.MaterialBindingAPI(prim).GetDirectBindingRel().GetTargets()
+                    if [str(t) for t in targets] == [self._bindings[prim_path]]:
+                        continue
+                self._release(prim_path)
+                released += 1
+
+        unused = [path for path, count in self._refcounts.items() if count <= 0]
+        if unused:
+            for material_path in unused:
+                del self._refcounts[material_path]
+            remove_prim_specs(stage, unused)
+            self._stats['materials_collected'] += len(unused)
+            logger.debug(f"🎨 Collected {len(unused)} unused shared materials")
+        return released
+
+    def _release(self, prim_path: str) -> None:
+        material_path = self._bindings.pop(prim_path, None)
+        if material_path is None:
+            return
+        self._bound_paths.discard(prim_path)
+        if material_path in self._refcounts:
+            self._refcounts[material_path] -= 1
+        self._stats['bindings_released'] += 1
+
+    def _get_or_create(self, stage, key: MaterialKey):
+        from pxr import Gf, Sdf, UsdGeom, UsdShade
+
+        path = f"{LOOKS_ROOT}/{material_name(key)}"
+        material = UsdShade.Material.Get(stage, path)
+        if material and material.GetPrim().IsValid():
+            self._refcounts.setdefault(path, 0)
+            return material
+
+        if not stage.GetPrimAtPath(LOOKS_ROOT):
+            UsdGeom.Scope.Define(stage, LOOKS_ROOT)
+        steps = float(self._steps)
+        r, g, b, rough, metal = key
+        material = UsdShade.Material.Define(stage, path)
+        shader = UsdShade.Shader.Define(stage, f"{path}/PreviewSurface")
+        shader.CreateIdAttr("UsdPreviewSurface")
+        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set(
+            Gf.Vec3f(r / steps, g / steps, b / steps))
+        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(rough / steps)
+        shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(metal / steps)
+        material.CreateSurfaceOutput().ConnectToSource(shader.ConnectableAPI(), "surface")
+        material.GetPrim().CreateAttribute(MATERIAL_KEY_ATTR, Sdf.ValueTypeNames.String).Set(
+            ",".join(str(v) for v in key))
+        self._refcounts[path] = 0
+        self._stats['materials_created'] += 1
+        return material
+
+    def _ensure_loaded(self, stage) -> None:
+        """Rebuild refcounts from an existing stage (after open/reset) in one traversal."""
+        if self._loaded:
+            return
+        from pxr import Usd, UsdShade
+
+        self._loaded = True
+        looks = stage.GetPrimAtPath(LOOKS_ROOT)
+        if not looks or not looks.IsValid():
+            return
+        for child in looks.GetChildren():
+            if child.HasAttribute(MATERIAL_KEY_ATTR):
+                self._refcounts[str(child.GetPath())] = 0
+        if not self._refcounts:
+            return
+
+        world = stage.GetPrimAtPath("/World")
+        for prim in Usd.PrimRange(world):
+            if not prim.HasRelationship("material:binding"):
+                continue
+            targets = UsdShade.MaterialBindingAPI(prim).GetDirectBindingRel().GetTargets()
+            if len(targets) == 1 and str(targets[0]) in self._refcounts:
+                prim_path = str(prim.GetPath())
+                self._bindings[prim_path] = str(targets[0])
+                self._bound_paths.add(prim_path)
+                self._refcounts[str(targets[0])] += 1
@@ -62,8 +62,30 @@ class WorldBuilderQueueManager:
             'completed_requests': 0
         }
         
+        # Called (without arguments) whenever a request is queued or completed
+        self._change_listeners: List[Callable[[], None]] = []
+        
         logger.info("Queue Manager initialized with thread-safe processing")
     
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback for queue changes; it may run on HTTP threads and must be cheap."""
+        with self._lock:
+            if callback not in self._change_listeners:
+                self._change_listeners.append(callback)
+    
+    def remove_change_listener(self, callback: Callable[[], None]) -> None:
+        """Unregister a callback added with :meth:`add_change_listener`."""
+        with self._lock:
+            if callback in self._change_listeners:
+                self._change_listeners.remove(callback)
+    
+    def _notify_changed(self) -> None:
+        for callback in list(self._change_listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Queue change listener failed: {e}")
+    
     def generate_request_id(self, request_type: str) -> str:
         """Generate unique request ID with thread safety."""
         with self._lock:
@@ -100,6 +122,7 @@ class WorldBuilderQueueManager:
             else:
                 logger.error(f"❌ Failed {error_context}: {result.get('error')}")
             
+            self._notify_changed()
             return result
                 
         except Exception as e:
@@ -110,6 +133,7 @@ class WorldBuilderQueueManager:
                 'result': error_result,
                 'completed_time': time.time()
             })
+            self._notify_changed()
             return error_result
     
     def add_element_request(self, element: SceneElement) -> Dict[str, Any]:
@@ -136,6 +160,7 @@ class WorldBuilderQueueManager:
                 
                 self._element_queue.append(request_data)
                 self._stats['queued_elements'] += 1
+                self._notify_changed()
                 
                 logger.info(f"Queued element '{element.name}' for creation (ID: {request_id})")
                 return {
@@ -174,6 +199,7 @@ class WorldBuilderQueueManager:
                 
                 self._asset_queue.append(request_data)
                 self._stats['queued_assets'] += 1
+                self._notify_changed()
                 
                 action = "placement" if request_type == 'asset' else "transformation"
                 logger.info(f"Queued asset '{asset.name}' for {action} (ID: {request_id})")
@@ -211,6 +237,7 @@ class WorldBuilderQueueManager:
                 
                 self._asset_queue.append(request_data)  # Reuse asset queue for transforms
                 self._stats['queued_assets'] += 1
+                self._notify_changed()
                 
                 logger.info(f"Queued transform for '{prim_path}' (ID: {request_id})")
                 return {
@@ -246,6 +273,7 @@ class WorldBuilderQueueManager:
                 
                 self._removal_queue.append(request_data)
                 self._stats['queued_removals'] += 1
+                self._notify_changed()
                 
                 target = kwargs.get('element_path') or kwargs.get('path', 'unknown')
                 logger.info(f"Queued {removal_type} for '{target}' (ID: {request_id})")
@@ -280,6 +308,7 @@ class WorldBuilderQueueManager:
                 
                 self._batch_queue.append(request_data)
                 self._stats['queued_batches'] += 1
+                self._notify_changed()
                 
                 logger.info(f"Queued batch '{batch_name}' with {len(elements)} elements (ID: {request_id})")
                 return {
@@ -293,7 +322,8 @@ class WorldBuilderQueueManager:
                 return {'success': False, 'error': str(e)}
     
     def process_queues(self, element_processor: Callable, batch_processor: Callable,
-                      asset_processor: Callable, removal_processor: Callable) -> Dict[str, Any]:
+                      asset_processor: Callable, removal_processor: Callable,
+                      asset_ready: Optional[Callable[[AssetPlacement], bool]] = None) -> Dict[str, Any]:
         """
         Process all queues with provided processor functions. Thread-safe operation.
         
@@ -302,11 +332,21 @@ class WorldBuilderQueueManager:
             batch_processor: Function to process batch creation
             asset_processor: Function to process asset operations
             removal_processor: Function to process removal operations
+            asset_ready: Optional check; while it returns False for the next placement
+                the asset queue is left for a later cycle (order is preserved)
             
         Returns:
             Processing statistics
         """
         with self._lock:
+            if not (self._sync_queue or self._element_queue or self._batch_queue
+                    or self._asset_queue or self._removal_queue):
+                # Idle update: nothing to do, keep the per-frame cost to one check
+                return {
+                    'processed_count': 0,
+                    'queue_lengths': {'elements': 0, 'batches': 0, 'assets': 0, 'removals': 0},
+                    'completed_requests': len(self._completed_requests)
+                }
             processed_count = 0
             config = self._config
             if config is None:
@@ -391,7 +431,10 @@ class WorldBuilderQueueManager:
                 
                 # Process asset queue
                 while self._asset_queue and processed_count < max_operations_per_update:
-                    request = self._asset_queue.pop(0)
+                    request = self._asset_queue[0]
+                    if request['type'] == 'asset' and asset_ready and not asset_ready(request['asset']):
+                        break
+                    self._asset_queue.pop(0)
                     request_id = request['request_id']
                     request_type = request['type']
                     
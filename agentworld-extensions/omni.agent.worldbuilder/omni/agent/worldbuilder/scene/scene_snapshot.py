@@ -0,0 +1,214 @@
+"""
+Invalidation-driven snapshot cache for WorldBuilder scene reads.
+
+Scene listings (get_scene, list_elements, scene statistics) are cached per
+stage together with the prim subtrees they were computed from. USD change
+notices drop only the snapshots whose subtrees were touched, so repeated reads
+between edits are served from memory. Dependencies are indexed by root path,
+so a notice costs a few lookups per changed path rather than a scan of every
+cached snapshot.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+
+from .stage_observer import SortedPathSet
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing
+    from .stage_observer import StageObserver
+
+logger = logging.getLogger(__name__)
+
+# (root path, max depth below root or None for the whole subtree)
+Dependency = Tuple[str, Optional[int]]
+
+
+@dataclass
+class _Snapshot:
+    value: Dict[str, Any]
+    dependencies: Tuple[Dependency, ...]
+    revision: int
+
+
+def path_affects(changed_path: str, dependency: Dependency) -> bool:
+    """Return True when a change at ``changed_path`` can alter data read from ``dependency``."""
+    root, depth = dependency
+    if changed_path == '/' or changed_path == root or root.startswith(changed_path.rstrip('/') + '/'):
+        return True  # the root itself or one of its ancestors changed
+    if not changed_path.startswith(root.rstrip('/') + '/'):
+        return False
+    if depth is None:
+        return True
+    root_depth = 0 if root == '/' else root.count('/')
+    return changed_path.count('/') - root_depth <= depth
+
+
+def _path_depth(path: str) -> int:
+    return 0 if path == '/' else path.count('/')
+
+
+def _ancestors(path: str) -> Iterator[str]:
+    """Yield the proper ancestors of ``path``, nearest first, ending with ``/``."""
+    while path != '/':
+        path = path[:path.rfind('/')] or '/'
+        yield path
+
+
+class _DependencyIndex:
+    """Snapshot keys by dependency root, with the deepest level each key reads below it."""
+
+    def __init__(self):
+        self._roots = SortedPathSet()
+        self._keys: Dict[str, Dict[Hashable, Optional[int]]] = {}
+
+    def add(self, key: Hashable, dependencies: Sequence[Dependency]) -> None:
+        for root, depth in dependencies:
+            keys = self._keys.get(root)
+            if keys is None:
+                keys = self._keys[root] = {}
+                self._roots.add(root)
+            if key in keys:
+                current = keys[key]
+                depth = None if current is None or depth is None else max(current, depth)
+            keys[key] = depth
+
+    def remove(self, key: Hashable, dependencies: Sequence[Dependency]) -> None:
+        for root, _ in dependencies:
+            keys = self._keys.get(root)
+            if keys is None:
+                continue
+            keys.pop(key, None)
+            if not keys:
+                del self._keys[root]
+                self._roots.discard(root)
+
+    def clear(self) -> None:
+        self._roots = SortedPathSet()
+        self._keys.clear()
+
+    def affected(self, changed_path: str) -> Set[Hashable]:
+        """Keys whose dependencies :func:`path_affects` reports for ``changed_path``."""
+        # Roots at or below the changed path are always affected
+        stale = {key for root in self._roots.subtree(changed_path) for key in self._keys[root]}
+        changed_depth = _path_depth(changed_path)
+        for root in _ancestors(changed_path):
+            keys = self._keys.get(root)
+            if not keys:
+                continue
+            below = changed_depth - _path_depth(root)
+            stale.update(key for key, depth in keys.items() if depth is None or below <= depth)
+        return stale
+
+
+class SceneSnapshotCache:
+    """LRU cache of scene read results keyed per stage and invalidated by subtree."""
+
+    def __init__(self, observer: 'StageObserver', max_entries: int = 64):
+        """Initialize cache and subscribe to stage change notices."""
+        self._observer = observer
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Hashable, _Snapshot]" = OrderedDict()
+        self._index = _DependencyIndex()
+        self._max_entries = max(1, int(max_entries))
+        self._revision = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+            'evictions': 0,
+        }
+        observer.subscribe(self._on_objects_changed, self._on_stage_reset)
+
+    @property
+    def revision(self) -> int:
+        """Number of change notices observed on the current stage."""
+        with self._lock:
+            return self._revision
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        dependencies: Sequence[Dependency],
+        compute: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for ``key`` or compute and cache it.
+
+        Only successful results are cached. A shallow copy is returned so callers
+        may add top-level keys without touching the snapshot.
+        """
+        if not self._observer.current_stage():
+            return compute()
+
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return dict(snapshot.value)
+            self._stats['misses'] += 1
+            revision = self._revision
+
+        value = compute()
+        if not isinstance(value, dict) or not value.get('success', False):
+            return value
+
+        with self._lock:
+            # Discard results computed while the stage changed underneath us
+            if revision == self._revision:
+                self._discard(key)
+                snapshot = _Snapshot(value, tuple(dependencies), revision)
+                self._entries[key] = snapshot
+                self._index.add(key, snapshot.dependencies)
+                while len(self._entries) > self._max_entries:
+                    self._discard(next(iter(self._entries)))
+                    self._stats['evictions'] += 1
+        return dict(value)
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, hit rate and current entry count."""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'revision': self._revision,
+                'hit_rate': round(self._stats['hits'] / lookups, 4) if lookups else 0.0,
+            }
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _discard(self, key: Hashable) -> bool:
+        snapshot = self._entries.pop(key, None)
+        if snapshot is None:
+            return False
+        self._index.remove(key, snapshot.dependencies)
+        return True
+
+    def _on_stage_reset(self, stage) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+            self._revision = 0
+
+    def _on_objects_changed(self, resynced: List[str], changed: List[str]) -> None:
+        paths = list(resynced) + list(changed)
+        if not paths:
+            return
+        with self._lock:
+            self._revision += 1
+            stale = set()
+            for path in set(paths):
+                stale.update(self._index.affected(path))
+            self._stats['invalidations'] += sum(self._discard(key) for key in stale)
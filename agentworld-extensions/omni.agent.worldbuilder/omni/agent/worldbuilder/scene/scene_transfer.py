@@ -0,0 +1,287 @@
+"""
+Whole-scene export and import for moving scenes between WorldBuilder instances.
+
+Replaying element and batch calls costs one API request (and one stage edit)
+per prim. :class:`SceneTransfer` instead snapshots ``/World`` (or a subtree)
+into a detached ``Sdf.Layer`` on the main thread, flattened or as authored,
+and the HTTP thread serializes it to USDC/USDA and streams the file in
+chunks. Uploaded scenes are spooled to disk and opened off the main thread;
+the main thread then only inserts a sublayer or authors a reference inside
+one ``Sdf.ChangeBlock``, so the stage recomposes once.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('usdc', 'usda')
+IMPORT_MODES = ('sublayer', 'reference')
+EXPORT_ROOT_KEY = 'worldbuilder:export_root'
+DEFAULT_TRANSFER_CHUNK_SIZE = 1024 * 1024
+DEFAULT_IMPORT_TARGET = "/World/Imported"
+
+_SIGNATURES = ((b'PXR-USDC', 'usdc'), (b'#usda', 'usda'))
+
+
+def detect_format(header: bytes) -> Optional[str]:
+    """Return ``'usdc'``/``'usda'`` for a file starting with ``header``, else None."""
+    for signature, fmt in _SIGNATURES:
+        if header.startswith(signature):
+            return fmt
+    return None
+
+
+def default_import_dir() -> str:
+    """Directory holding imported scene layers when ``scene_import_dir`` is unset."""
+    return os.path.join(tempfile.gettempdir(), 'worldbuilder_imports')
+
+
+def write_layer(layer, fmt: str, directory: Optional[str] = None) -> str:
+    """Serialize a detached layer to a temporary ``.usdc``/``.usda`` file and return its path."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    handle, path = tempfile.mkstemp(prefix='worldbuilder_export_', suffix=f'.{fmt}', dir=directory)
+    os.close(handle)
+    if not layer.Export(path):
+        os.unlink(path)
+        raise IOError(f"Could not write {fmt} export")
+    return path
+
+
+class FileChunks:
+    """
+    Iterator over a file in ``chunk_size`` pieces that deletes it when closed.
+
+    Unlike a generator's ``finally``, :meth:`close` also removes the file when
+    iteration never started (e.g. the client disconnected before the first
+    chunk); being garbage collected closes it too.
+    """
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE, remove: bool = True):
+        self.path = path
+        self._chunk_size = max(1, int(chunk_size))
+        self._remove = remove
+        self._handle: Optional[BinaryIO] = None
+        self._closed = False
+
+    def __iter__(self) -> 'FileChunks':
+        return self
+
+    def __next__(self) -> bytes:
+        if self._closed:
+            raise StopIteration
+        if self._handle is None:
+            self._handle = open(self.path, 'rb')
+        chunk = self._handle.read(self._chunk_size)
+        if not chunk:
+            self.close()
+            raise StopIteration
+        return chunk
+
+    def close(self):
+        """Close the file and delete it; safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._remove:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def __del__(self):
+        self.close()
+
+
+def iter_file_chunks(path: str, chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+                     remove: bool = True) -> Iterator[bytes]:
+    """Yield ``path`` in ``chunk_size`` pieces, deleting it afterwards (also when abandoned)."""
+    return FileChunks(path, chunk_size, remove)
+
+
+def store_upload(source: BinaryIO, directory: str,
+                 chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE) -> Tuple[str, str, int, str]:
+    """
+    Copy an uploaded USD file into ``directory`` under a content-addressed name.
+
+    The file must start with a USDC or USDA signature. Uploading the same
+    bytes twice reuses the stored file (and therefore the same layer).
+    Returns ``(path, sha256, size, format)``.
+    """
+    header = source.read(16)
+    fmt = detect_format(header)
+    if fmt is None:
+        raise ValueError("upload is not a USDC or USDA file")
+
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256(header)
+    size = len(header)
+    handle, partial = tempfile.mkstemp(prefix='.upload_', dir=directory)
+    try:
+        with os.fdopen(handle, 'wb') as target:
+            target.write(header)
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                target.write(chunk)
+                size += len(chunk)
+        sha256 = digest.hexdigest()
+        path = os.path.join(directory, f'scene_{sha256[:16]}.{fmt}')
+        if os.path.exists(path):
+            os.unlink(partial)
+        else:
+            os.replace(partial, path)
+        return path, sha256, size, fmt
+    except BaseException:
+        if os.path.exists(partial):
+            os.unlink(partial)
+        raise
+
+
+def open_layer(path: str):
+    """Open (or find) a stored scene layer; safe off the main thread."""
+    from pxr import Sdf, Tf
+
+    try:
+        layer = Sdf.Layer.FindOrOpen(path)
+    except Tf.ErrorException as exc:
+        raise ValueError(f"could not parse USD layer: {os.path.basename(path)}") from exc
+    if not layer:
+        raise ValueError(f"could not parse USD layer: {os.path.basename(path)}")
+    return layer
+
+
+class SceneTransfer:
+    """Build export layers from and apply imported layers to the active stage."""
+
+    def __init__(self, usd_context):
+        """Initialize with the USD context whose stage is exported/imported."""
+        self._usd_context = usd_context
+        self._stats = {'exports': 0, 'imports': 0, 'export_ms_total': 0.0, 'import_ms_total': 0.0}
+
+    def build_export_layer(self, root_path: str = "/World", flatten: bool = True) -> Dict[str, Any]:
+        """
+        Copy ``root_path`` into a detached anonymous layer (main thread).
+
+        ``flatten`` composes every layer, reference and variant under the
+        root into plain specs, on a stage masked to that subtree so the rest
+        of the scene is never flattened; otherwise the root layer's specs are copied as authored and
+        composition arcs point at their original assets. Ancestors of the root
+        are recreated as empty ``def`` prims so paths are unchanged. The
+        exported root is recorded in custom layer data for reference imports.
+        """
+        from pxr import Sdf, Usd
+
+        stage = self._usd_context.get_stage()
+        if not stage:
+            return {'success': False, 'error': "No USD stage available"}
+        root_prim = stage.GetPrimAtPath(root_path)
+        if not root_prim or not root_prim.IsValid():
+            return {'success': False, 'error': f"Path '{root_path}' not found in scene"}
+
+        start = time.perf_counter()
+        if flatten:
+            masked = Usd.Stage.OpenMasked(
+                stage.GetRootLayer(), stage.GetSessionLayer(), stage.GetPathResolverContext(),
+                Usd.StagePopulationMask([root_path]), Usd.Stage.LoadNone,
+            )
+            masked.SetLoadRules(stage.GetLoadRules())
+            source = masked.Flatten()
+        else:
+            source = stage.GetRootLayer()
+        source_path = Sdf.Path(root_path)
+        if not source.GetPrimAtPath(source_path):
+            return {'success': False, 'error': f"Path '{root_path}' has no specs in the root layer; export with flatten"}
+
+        layer = Sdf.Layer.CreateAnonymous('worldbuilder_export.usda')
+        for key in ('upAxis', 'metersPerUnit', 'timeCodesPerSecond', 'startTimeCode', 'endTimeCode'):
+            if source.pseudoRoot.HasInfo(key):
+                layer.pseudoRoot.SetInfo(key, source.pseudoRoot.GetInfo(key))
+        for ancestor in source_path.GetPrefixes()[:-1]:
+            spec = Sdf.CreatePrimInLayer(layer, ancestor)
+            spec.specifier = Sdf.SpecifierDef
+            source_spec = source.GetPrimAtPath(ancestor)
+            if source_spec and source_spec.typeName:
+                spec.typeName = source_spec.typeName
+        if not Sdf.CopySpec(source, source_path, layer, source_path):
+            return {'success': False, 'error': f"Could not copy '{root_path}' into the export layer"}
+        layer.defaultPrim = source_path.GetPrefixes()[0].name
+        layer.customLayerData = {EXPORT_ROOT_KEY: root_path}
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self._stats['exports'] += 1
+        self._stats['export_ms_total'] += elapsed_ms
+        logger.info(f"📦 Built export layer for {root_path} (flatten={flatten}) in {elapsed_ms:.1f}ms")
+        return {'success': True, 'layer': layer, 'root_path': root_path, 'flatten': bool(flatten),
+                'snapshot_ms': round(elapsed_ms, 3)}
+
+    def apply_import(self, layer, mode: str = 'sublayer',
+                     target_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Attach an opened scene layer to the active stage in one change block (main thread).
+
+        ``sublayer`` inserts the layer as the strongest sublayer of the root
+        layer, so its prims keep their paths. ``reference`` defines
+        ``target_path`` (missing ancestors included) as an Xform referencing the
+        layer's exported root, or its default prim.
+        """
+        from pxr import Sdf
+
+        stage = self._usd_context.get_stage()
+        if not stage:
+            return {'success': False, 'error': "No USD stage available"}
+        if mode not in IMPORT_MODES:
+            return {'success': False, 'error': f"mode must be one of {', '.join(IMPORT_MODES)}"}
+
+        start = time.perf_counter()
+        root_layer = stage.GetRootLayer()
+        result: Dict[str, Any] = {'success': True, 'mode': mode, 'layer': layer.identifier}
+        if mode == 'sublayer':
+            if layer.identifier in root_layer.subLayerPaths:
+                return {'success': False, 'error': "Scene layer is already a sublayer of the stage"}
+            with Sdf.ChangeBlock():
+                root_layer.subLayerPaths.insert(0, layer.identifier)
+        else:
+            target_path = target_path or DEFAULT_IMPORT_TARGET
+            if stage.GetPrimAtPath(target_path):
+                return {'success': False, 'error': f"Path '{target_path}' already exists"}
+            source_root = (layer.customLayerData or {}).get(EXPORT_ROOT_KEY)
+            if not source_root and layer.defaultPrim:
+                source_root = f"/{layer.defaultPrim}"
+            if not source_root or not layer.GetPrimAtPath(source_root):
+                return {'success': False, 'error': "Scene layer has no default prim to reference"}
+
+            edit_target = stage.GetEditTarget()
+            target_layer = edit_target.GetLayer()
+            target = Sdf.Path(target_path)
+            missing = [path for path in target.GetPrefixes()[:-1] if not stage.GetPrimAtPath(path)]
+            with Sdf.ChangeBlock():
+                for path in missing:
+                    Sdf.CreatePrimInLayer(target_layer, edit_target.MapToSpecPath(path)).specifier = Sdf.SpecifierDef
+                spec = Sdf.CreatePrimInLayer(target_layer, edit_target.MapToSpecPath(target))
+                spec.specifier = Sdf.SpecifierDef
+                spec.typeName = 'Xform'
+                spec.referenceList.Prepend(Sdf.Reference(layer.identifier, Sdf.Path(source_root)))
+            result.update({'target_path': target_path, 'source_root': source_root})
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self._stats['imports'] += 1
+        self._stats['import_ms_total'] += elapsed_ms
+        result['apply_ms'] = round(elapsed_ms, 3)
+        logger.info(f"📥 Imported scene layer as {mode} in {elapsed_ms:.1f}ms")
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return export/import counters."""
+        return dict(self._stats)
+
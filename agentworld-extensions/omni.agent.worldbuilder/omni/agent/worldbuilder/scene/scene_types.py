@@ -4,7 +4,7 @@ Foundation data types and enums for WorldBuilder scene operations.
 Provides core data structures used across all scene building modules.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -29,6 +29,10 @@ class SceneElement:
     color: Tuple[float, float, float] = (0.5, 0.5, 0.5)  # RGB 0-1
     parent_path: str = "/World"  # USD parent path for hierarchical placement
     metadata: Dict[str, Any] = field(default_factory=dict)
+    material_mode: Optional[str] = None  # 'display_color' or 'shared'; None uses the configured default
+    roughness: Optional[float] = None  # Shared material inputs (0-1)
+    metallic: Optional[float] = None
+    authoring_backend: Optional[str] = None  # 'usd' or 'sdf'; None uses the configured default
 
 
 @dataclass
@@ -52,6 +56,7 @@ class AssetPlacement:
     rotation: Tuple[float, float, float] = (0.0, 0.0, 0.0)  # Euler angles in degrees
     scale: Tuple[float, float, float] = (1.0, 1.0, 1.0)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    as_payload: bool = False  # Author an unloaded payload instead of a reference
 
 
 @dataclass 
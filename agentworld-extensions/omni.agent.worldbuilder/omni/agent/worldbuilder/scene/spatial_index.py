@@ -0,0 +1,427 @@
+"""
+Incrementally maintained spatial index for WorldBuilder spatial queries.
+
+A loose octree over world-space AABBs of geometric prims, built lazily the first
+time a stage is queried and kept current from USD change notices: only the prim
+subtrees reported as resynced or changed are re-indexed before the next query.
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from agentworld_core.bounds import get_bounds_service
+
+from .stage_observer import SortedPathSet, collapse_roots
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing
+    from .stage_observer import StageObserver
+
+logger = logging.getLogger(__name__)
+
+Vec3 = Tuple[float, float, float]
+
+
+@dataclass
+class SpatialEntry:
+    """Cached spatial record for one geometric prim."""
+
+    path: str
+    name: str
+    type_name: str
+    position: Vec3
+    bounds_min: Optional[Vec3] = None
+    bounds_max: Optional[Vec3] = None
+
+    @property
+    def box(self) -> Tuple[Vec3, Vec3]:
+        """AABB enclosing both the world bound and the pivot position."""
+        px, py, pz = self.position
+        if self.bounds_min is None or self.bounds_max is None:
+            return self.position, self.position
+        return (
+            (min(px, self.bounds_min[0]), min(py, self.bounds_min[1]), min(pz, self.bounds_min[2])),
+            (max(px, self.bounds_max[0]), max(py, self.bounds_max[1]), max(pz, self.bounds_max[2])),
+        )
+
+    def to_object_info(self) -> Dict[str, object]:
+        """Return the query-result shape used by the HTTP API."""
+        bounds = None
+        if self.bounds_min is not None and self.bounds_max is not None:
+            bounds = {'min': list(self.bounds_min), 'max': list(self.bounds_max)}
+        return {
+            'path': self.path,
+            'name': self.name,
+            'type': self.type_name,
+            'position': list(self.position),
+            'bounds': bounds,
+        }
+
+
+class _OctreeNode:
+    __slots__ = ('center', 'half', 'depth', 'children', 'items')
+
+    def __init__(self, center: Vec3, half: float, depth: int):
+        self.center = center
+        self.half = half
+        self.depth = depth
+        self.children: Optional[List[Optional['_OctreeNode']]] = None
+        self.items: Dict[str, Tuple[Vec3, Vec3]] = {}
+
+
+class LooseOctree:
+    """
+    Loose octree (looseness factor 2) storing AABBs keyed by an id.
+
+    Each box lives in the deepest node whose cell contains its center and whose
+    half-size is at least the box's largest half-extent, so insert/remove never
+    split or merge nodes and a box is stored exactly once.
+    """
+
+    def __init__(self, center: Vec3 = (0.0, 0.0, 0.0), half_size: float = 64.0, max_depth: int = 10):
+        self._max_depth = max(0, int(max_depth))
+        self._root = _OctreeNode(tuple(float(c) for c in center), max(float(half_size), 1e-6), 0)
+        self._node_of: Dict[str, _OctreeNode] = {}
+
+    def __len__(self) -> int:
+        return len(self._node_of)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._node_of
+
+    def clear(self, center: Optional[Vec3] = None, half_size: Optional[float] = None) -> None:
+        """Drop every box, optionally re-centering the root cell."""
+        root = self._root
+        self._root = _OctreeNode(
+            tuple(float(c) for c in center) if center is not None else root.center,
+            max(float(half_size), 1e-6) if half_size is not None else root.half,
+            0,
+        )
+        self._node_of.clear()
+
+    def insert(self, key: str, box_min: Vec3, box_max: Vec3) -> None:
+        """Insert or replace the box stored under ``key``."""
+        if key in self._node_of:
+            self.remove(key)
+        box = (tuple(float(v) for v in box_min), tuple(float(v) for v in box_max))
+        center, radius = _center_radius(box)
+        if not self._fits_root(center, radius):
+            self._grow_to_fit(center, radius)
+
+        node = self._root
+        while node.depth < self._max_depth and radius <= node.half * 0.5:
+            index = _child_index(node.center, center)
+            if node.children is None:
+                node.children = [None] * 8
+            child = node.children[index]
+            if child is None:
+                child = _OctreeNode(_child_center(node.center, node.half, index), node.half * 0.5, node.depth + 1)
+                node.children[index] = child
+            node = child
+
+        node.items[key] = box
+        self._node_of[key] = node
+
+    def remove(self, key: str) -> bool:
+        """Remove ``key``; returns False if it was not stored."""
+        node = self._node_of.pop(key, None)
+        if node is None:
+            return False
+        node.items.pop(key, None)
+        return True
+
+    def query(self, box_min: Vec3, box_max: Vec3) -> List[str]:
+        """Return keys whose boxes intersect the query box (inclusive)."""
+        results: List[str] = []
+        qmin_x, qmin_y, qmin_z = box_min
+        qmax_x, qmax_y, qmax_z = box_max
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            loose = node.half * 2.0
+            cx, cy, cz = node.center
+            if (cx + loose < qmin_x or cx - loose > qmax_x or
+                    cy + loose < qmin_y or cy - loose > qmax_y or
+                    cz + loose < qmin_z or cz - loose > qmax_z):
+                continue
+            for key, (bmin, bmax) in node.items.items():
+                if (bmax[0] >= qmin_x and bmin[0] <= qmax_x and
+                        bmax[1] >= qmin_y and bmin[1] <= qmax_y and
+                        bmax[2] >= qmin_z and bmin[2] <= qmax_z):
+                    results.append(key)
+            if node.children:
+                stack.extend(child for child in node.children if child is not None)
+        return results
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _fits_root(self, center: Vec3, radius: float) -> bool:
+        root = self._root
+        return radius <= root.half and all(abs(center[i] - root.center[i]) <= root.half for i in range(3))
+
+    def _grow_to_fit(self, center: Vec3, radius: float) -> None:
+        """Double the root cell until the box fits, then re-insert existing boxes."""
+        half = self._root.half
+        root_center = self._root.center
+        while radius > half or any(abs(center[i] - root_center[i]) > half for i in range(3)):
+            half *= 2.0
+        entries = [(key, node.items[key]) for key, node in self._node_of.items()]
+        self.clear(root_center, half)
+        for key, (bmin, bmax) in entries:
+            self.insert(key, bmin, bmax)
+
+
+def _center_radius(box: Tuple[Vec3, Vec3]) -> Tuple[Vec3, float]:
+    bmin, bmax = box
+    center = ((bmin[0] + bmax[0]) * 0.5, (bmin[1] + bmax[1]) * 0.5, (bmin[2] + bmax[2]) * 0.5)
+    radius = max(bmax[0] - bmin[0], bmax[1] - bmin[1], bmax[2] - bmin[2]) * 0.5
+    return center, radius
+
+
+def _child_index(node_center: Vec3, point: Vec3) -> int:
+    return ((point[0] >= node_center[0]) << 0) | ((point[1] >= node_center[1]) << 1) | ((point[2] >= node_center[2]) << 2)
+
+
+def _child_center(node_center: Vec3, half: float, index: int) -> Vec3:
+    offset = half * 0.5
+    return (
+        node_center[0] + (offset if index & 1 else -offset),
+        node_center[1] + (offset if index & 2 else -offset),
+        node_center[2] + (offset if index & 4 else -offset),
+    )
+
+
+def _is_finite_box(box: Tuple[Vec3, Vec3]) -> bool:
+    return all(math.isfinite(v) for corner in box for v in corner)
+
+
+class StageSpatialIndex:
+    """Spatial index over the geometric prims (UsdGeom.Gprim) of the active stage."""
+
+    def __init__(self, observer: 'StageObserver', max_depth: int = 10):
+        """Initialize index; the stage is only traversed on the first query."""
+        self._observer = observer
+        self._lock = threading.RLock()
+        self._octree = LooseOctree(max_depth=max_depth)
+        self._entries: Dict[str, SpatialEntry] = {}
+        self._paths = SortedPathSet()
+        self._built = False
+        self._dirty_roots: Set[str] = set()
+        self._stats = {
+            'full_builds': 0,
+            'incremental_updates': 0,
+            'last_build_ms': 0.0,
+        }
+        observer.subscribe(self._on_objects_changed, self._on_stage_reset)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query_box(self, box_min: Vec3, box_max: Vec3) -> List[SpatialEntry]:
+        """Return entries whose position lies inside the box, ordered by path."""
+        stage = self._sync()
+        if not stage:
+            return []
+        with self._lock:
+            matches = []
+            for path in self._octree.query(box_min, box_max):
+                entry = self._entries[path]
+                x, y, z = entry.position
+                if (box_min[0] <= x <= box_max[0] and
+                        box_min[1] <= y <= box_max[1] and
+                        box_min[2] <= z <= box_max[2]):
+                    matches.append(entry)
+        matches.sort(key=lambda entry: entry.path)
+        return matches
+
+    def query_radius(self, point: Vec3, radius: float) -> List[Tuple[SpatialEntry, float]]:
+        """Return (entry, distance) for positions within ``radius`` of ``point``, nearest first."""
+        stage = self._sync()
+        if not stage:
+            return []
+        px, py, pz = point
+        with self._lock:
+            matches = []
+            candidates = self._octree.query((px - radius, py - radius, pz - radius), (px + radius, py + radius, pz + radius))
+            for path in candidates:
+                entry = self._entries[path]
+                x, y, z = entry.position
+                distance = math.sqrt((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2)
+                if distance <= radius:
+                    matches.append((entry, distance))
+        matches.sort(key=lambda item: (item[1], item[0].path))
+        return matches
+
+    def query_column(self, x: float, z: float, radius: float) -> List[Tuple[SpatialEntry, float]]:
+        """Return (entry, horizontal distance) for positions within ``radius`` in the XZ plane."""
+        stage = self._sync()
+        if not stage:
+            return []
+        with self._lock:
+            matches = []
+            candidates = self._octree.query((x - radius, -math.inf, z - radius), (x + radius, math.inf, z + radius))
+            for path in candidates:
+                entry = self._entries[path]
+                distance = math.sqrt((entry.position[0] - x) ** 2 + (entry.position[2] - z) ** 2)
+                if distance <= radius:
+                    matches.append((entry, distance))
+        matches.sort(key=lambda item: (item[1], item[0].path))
+        return matches
+
+    def get(self, path: str) -> Optional[SpatialEntry]:
+        """Return the cached entry for an indexed prim path."""
+        stage = self._sync()
+        if not stage:
+            return None
+        with self._lock:
+            return self._entries.get(path)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Return index size and maintenance counters."""
+        with self._lock:
+            return {
+                'built': self._built,
+                'entries': len(self._entries),
+                'pending_dirty_roots': len(self._dirty_roots),
+                **self._stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _on_stage_reset(self, stage) -> None:
+        with self._lock:
+            self._built = False
+            self._dirty_roots.clear()
+            self._entries.clear()
+            self._paths = SortedPathSet()
+            self._octree.clear()
+
+    def _on_objects_changed(self, resynced: List[str], changed: List[str]) -> None:
+        with self._lock:
+            if not self._built:
+                return
+            self._dirty_roots.update(resynced)
+            self._dirty_roots.update(changed)
+
+    def _sync(self):
+        """Bring the index up to date with the current stage and return it."""
+        stage = self._observer.current_stage()
+        if not stage:
+            return None
+        with self._lock:
+            if not self._built:
+                self._rebuild(stage)
+            elif self._dirty_roots:
+                roots = collapse_roots(self._dirty_roots)
+                self._dirty_roots.clear()
+                if '/' in roots:
+                    self._rebuild(stage)
+                else:
+                    self._update_subtrees(stage, roots)
+        return stage
+
+    def _rebuild(self, stage) -> None:
+        start = time.perf_counter()
+        entries = list(_collect_entries(stage, [stage.GetPseudoRoot()]))
+
+        self._entries = {entry.path: entry for entry in entries}
+        self._paths = SortedPathSet(self._entries)
+        center, half = _enclosing_cell(entry.box for entry in entries)
+        self._octree.clear(center, half)
+        for entry in entries:
+            self._insert(entry)
+
+        self._built = True
+        self._dirty_roots.clear()
+        self._stats['full_builds'] += 1
+        self._stats['last_build_ms'] = round((time.perf_counter() - start) * 1000.0, 3)
+        logger.debug(f"🔍 Spatial index built: {len(entries)} prims in {self._stats['last_build_ms']}ms")
+
+    def _update_subtrees(self, stage, roots: List[str]) -> None:
+        from pxr import Sdf
+
+        for root in roots:
+            for path in self._paths.pop_subtree(root):
+                self._entries.pop(path, None)
+                self._octree.remove(path)
+
+        prims = []
+        for root in roots:
+            prim = stage.GetPrimAtPath(Sdf.Path(root))
+            if prim and prim.IsValid():
+                prims.append(prim)
+
+        for entry in _collect_entries(stage, prims):
+            self._entries[entry.path] = entry
+            self._paths.add(entry.path)
+            self._insert(entry)
+        self._stats['incremental_updates'] += 1
+
+    def _insert(self, entry: SpatialEntry) -> None:
+        box = entry.box
+        if _is_finite_box(box):
+            self._octree.insert(entry.path, box[0], box[1])
+
+
+def _enclosing_cell(boxes: Iterable[Tuple[Vec3, Vec3]]) -> Tuple[Vec3, float]:
+    lo = [math.inf, math.inf, math.inf]
+    hi = [-math.inf, -math.inf, -math.inf]
+    for bmin, bmax in boxes:
+        if not _is_finite_box((bmin, bmax)):
+            continue
+        for i in range(3):
+            lo[i] = min(lo[i], bmin[i])
+            hi[i] = max(hi[i], bmax[i])
+    if lo[0] == math.inf:
+        return (0.0, 0.0, 0.0), 64.0
+    center = tuple((lo[i] + hi[i]) * 0.5 for i in range(3))
+    half = max(max(hi[i] - lo[i] for i in range(3)) * 0.5, 1.0)
+    return center, half
+
+
+def _collect_entries(stage, roots) -> Iterable[SpatialEntry]:
+    """Yield entries for every Gprim under the given prims using shared caches."""
+    from pxr import Usd, UsdGeom
+
+    time_code = Usd.TimeCode.Default()
+    xform_cache = UsdGeom.XformCache(time_code)
+    bbox_cache = get_bounds_service().get_bbox_cache(stage, time_code)
+
+    for root in roots:
+        for prim in Usd.PrimRange(root):
+            if not prim.IsA(UsdGeom.Gprim):
+                continue
+            try:
+                translation = xform_cache.GetLocalToWorldTransform(prim).ExtractTranslation()
+                position = (float(translation[0]), float(translation[1]), float(translation[2]))
+            except Exception as e:
+                logger.debug(f"Skipping {prim.GetPath()} in spatial index: {e}")
+                continue
+
+            bounds_min = bounds_max = None
+            try:
+                bound = bbox_cache.ComputeWorldBound(prim)
+                if not bound.GetRange().IsEmpty():
+                    aligned = bound.ComputeAlignedRange()
+                    min_point, max_point = aligned.GetMin(), aligned.GetMax()
+                    bounds_min = (float(min_point[0]), float(min_point[1]), float(min_point[2]))
+                    bounds_max = (float(max_point[0]), float(max_point[1]), float(max_point[2]))
+            except Exception:
+                pass
+
+            yield SpatialEntry(
+                path=str(prim.GetPath()),
+                name=prim.GetName(),
+                type_name=str(prim.GetTypeName()),
+                position=position,
+                bounds_min=bounds_min,
+                bounds_max=bounds_max,
+            )
@@ -0,0 +1,246 @@
+"""
+USD change notice fan-out for WorldBuilder scene caches.
+
+Registers a single Usd.Notice.ObjectsChanged listener against the active stage and
+forwards the affected prim paths to subscribed caches so they can invalidate
+incrementally instead of re-traversing the stage on every query.
+"""
+
+import bisect
+import logging
+import threading
+from typing import Any, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ChangeCallback = Callable[[List[str], List[str]], None]
+ResetCallback = Callable[[Any], None]
+NoticeCallback = Callable[[Any, Any], None]
+
+# Layer metadata fields that carry bookkeeping only (e.g. the persisted batch
+# registry); edits to them on the pseudo-root are not forwarded to caches
+_BOOKKEEPING_FIELDS = frozenset({'customLayerData'})
+
+
+class StageObserver:
+    """Bind lazily to the current USD stage and broadcast change notices."""
+
+    def __init__(self, usd_context):
+        """Initialize observer with USD context; no listener is registered until first use."""
+        self._usd_context = usd_context
+        self._lock = threading.RLock()
+        self._stage = None
+        self._listener = None
+        self._change_callbacks: List[ChangeCallback] = []
+        self._reset_callbacks: List[ResetCallback] = []
+        self._notice_callbacks: List[NoticeCallback] = []
+
+    def subscribe(self, on_change: Optional[ChangeCallback], on_reset: Optional[ResetCallback] = None,
+                  on_notice: Optional[NoticeCallback] = None) -> None:
+        """
+        Register cache callbacks.
+
+        Args:
+            on_change: Called with (resynced_prim_paths, changed_prim_paths) for each notice
+            on_reset: Called with the new stage (or None) when the active stage is replaced
+            on_notice: Called with (notice, stage) for subscribers that need changed fields;
+                bookkeeping-only notices are filtered out as for ``on_change``
+        """
+        with self._lock:
+            if on_change is not None:
+                self._change_callbacks.append(on_change)
+            if on_reset is not None:
+                self._reset_callbacks.append(on_reset)
+            if on_notice is not None:
+                self._notice_callbacks.append(on_notice)
+
+    def unsubscribe(self, on_change: Optional[ChangeCallback] = None, on_reset: Optional[ResetCallback] = None,
+                    on_notice: Optional[NoticeCallback] = None) -> None:
+        """Remove callbacks registered with :meth:`subscribe`."""
+        with self._lock:
+            for callbacks, callback in ((self._change_callbacks, on_change),
+                                        (self._reset_callbacks, on_reset),
+                                        (self._notice_callbacks, on_notice)):
+                if callback is not None and callback in callbacks:
+                    callbacks.remove(callback)
+
+    def current_stage(self):
+        """Return the active stage, re-binding the notice listener if the stage changed."""
+        stage = self._usd_context.get_stage()
+        with self._lock:
+            if self._same_stage(stage):
+                return stage
+            self._revoke_listener()
+            self._stage = stage
+            if stage:
+                self._register_listener(stage)
+            reset_callbacks = list(self._reset_callbacks)
+
+        for callback in reset_callbacks:
+            try:
+                callback(stage)
+            except Exception as e:
+                logger.debug(f"Stage reset callback failed: {e}")
+        return stage
+
+    def shutdown(self) -> None:
+        """Revoke the notice listener and drop subscribers."""
+        with self._lock:
+            self._revoke_listener()
+            self._stage = None
+            self._change_callbacks.clear()
+            self._reset_callbacks.clear()
+            self._notice_callbacks.clear()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _same_stage(self, stage) -> bool:
+        if stage is None or self._stage is None:
+            return stage is None and self._stage is None
+        try:
+            return stage == self._stage
+        except Exception:
+            # Expired stage handles raise on comparison
+            return False
+
+    def _register_listener(self, stage) -> None:
+        try:
+            from pxr import Tf, Usd
+
+            self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+        except Exception as e:
+            self._listener = None
+            logger.warning(f"⚠️ Could not register USD change listener: {e}")
+
+    def _revoke_listener(self) -> None:
+        if self._listener is not None:
+            try:
+                self._listener.Revoke()
+            except Exception:
+                pass
+            self._listener = None
+
+    def _on_objects_changed(self, notice, sender) -> None:
+        """Reduce notice paths to owning prim paths and forward them to subscribers.
+
+        Only prim-level resyncs are reported as resynced (hierarchy, names and
+        types may have changed); property resyncs such as a newly authored
+        xformOp are reported as changed on their owning prim.
+        """
+        try:
+            resynced_paths = list(notice.GetResyncedPaths())
+            resynced = _prim_paths(p for p in resynced_paths if not p.IsPropertyPath())
+            changed_info = [p for p in notice.GetChangedInfoOnlyPaths() if not is_bookkeeping_change(notice, p)]
+            changed = _prim_paths([p for p in resynced_paths if p.IsPropertyPath()] + changed_info)
+        except Exception as e:
+            logger.debug(f"Could not read ObjectsChanged notice: {e}")
+            return
+        if not resynced and not changed:
+            return
+
+        with self._lock:
+            callbacks = list(self._change_callbacks)
+            notice_callbacks = list(self._notice_callbacks)
+        for callback in callbacks:
+            try:
+                callback(resynced, changed)
+            except Exception as e:
+                logger.debug(f"Stage change callback failed: {e}")
+        for notice_callback in notice_callbacks:
+            try:
+                notice_callback(notice, sender)
+            except Exception as e:
+                logger.debug(f"Stage notice callback failed: {e}")
+
+
+def is_bookkeeping_change(notice, path) -> bool:
+    """True for pseudo-root changes that only touch bookkeeping layer metadata."""
+    if not path.IsAbsoluteRootPath():
+        return False
+    try:
+        fields = set(notice.GetChangedFields(path))
+    except Exception:
+        return False
+    return bool(fields) and fields <= _BOOKKEEPING_FIELDS
+
+
+def _prim_paths(paths) -> List[str]:
+    """Collapse property paths onto their prims and de-duplicate, preserving order."""
+    seen = {}
+    for path in paths:
+        seen.setdefault(str(path.GetPrimPath()), None)
+    return list(seen)
+
+
+def collapse_roots(paths: Iterable[str]) -> List[str]:
+    """Drop paths that are already covered by an ancestor in the set."""
+    roots: List[str] = []
+    for path in sorted(paths):
+        if roots and (roots[-1] == '/' or path == roots[-1] or path.startswith(roots[-1] + '/')):
+            continue
+        roots.append(path)
+    return roots
+
+
+class SortedPathSet:
+    """Sorted prim-path list with O(log n) lookup of a path and its descendants.
+
+    Descendants of ``/A`` are exactly the entries in ``["/A/", "/A0")`` because
+    ``'0'`` is the character after ``'/'``; siblings such as ``/A_x`` sort
+    outside that range.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._paths: List[str] = sorted(set(paths))
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __contains__(self, path: str) -> bool:
+        index = bisect.bisect_left(self._paths, path)
+        return index < len(self._paths) and self._paths[index] == path
+
+    def add(self, path: str) -> None:
+        index = bisect.bisect_left(self._paths, path)
+        if index == len(self._paths) or self._paths[index] != path:
+            self._paths.insert(index, path)
+
+    def update(self, paths: Iterable[str]) -> None:
+        """Add many paths; large batches are merged in one sort instead of per-path inserts."""
+        new = set(paths)
+        if len(new) <= 32:
+            for path in new:
+                self.add(path)
+            return
+        self._paths = sorted(new.union(self._paths))
+
+    def discard(self, path: str) -> None:
+        index = bisect.bisect_left(self._paths, path)
+        if index < len(self._paths) and self._paths[index] == path:
+            del self._paths[index]
+
+    def subtree(self, root: str) -> List[str]:
+        """Return ``root`` (if present) and all of its descendants."""
+        lo, hi = self._descendant_range(root)
+        index = bisect.bisect_left(self._paths, root)
+        own = [root] if index < len(self._paths) and self._paths[index] == root else []
+        return own + self._paths[lo:hi]
+
+    def pop_subtree(self, root: str) -> List[str]:
+        """Remove and return ``root`` (if present) and all of its descendants."""
+        removed = self.subtree(root)
+        lo, hi = self._descendant_range(root)
+        del self._paths[lo:hi]
+        self.discard(root)
+        return removed
+
+    def _descendant_range(self, root: str):
+        prefix = root.rstrip('/') + '/'
+        lo = bisect.bisect_left(self._paths, prefix)
+        hi = bisect.bisect_left(self._paths, prefix[:-1] + '0')
+        return lo, hi
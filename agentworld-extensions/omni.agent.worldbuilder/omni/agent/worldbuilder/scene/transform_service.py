@@ -0,0 +1,275 @@
+"""
+Vectorized transform and bounds access for WorldBuilder spatial helpers.
+
+Alignment, bounds and query helpers used to read transforms prim by prim
+(``ComputeLocalToWorldTransform`` plus a fresh bound per call) and write each
+result back as its own queued transform. :func:`read_transforms` resolves a
+whole path set through one ``UsdGeom.XformCache`` and the shared BBoxCache into
+NumPy arrays, the alignment and bounds math runs on those arrays, and
+:func:`write_world_positions` authors every new translation in one
+``Sdf.ChangeBlock``.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from agentworld_core.bounds import get_bounds_service
+
+logger = logging.getLogger(__name__)
+
+AXES = ('x', 'y', 'z')
+ALIGNMENTS = ('min', 'max', 'center')
+
+
+@dataclass
+class TransformSnapshot:
+    """World transforms and bounds of a path set, one row per resolved prim."""
+
+    paths: List[str]
+    names: List[str]
+    type_names: List[str]
+    matrices: np.ndarray      # (N, 4, 4) local-to-world, row-vector convention
+    positions: np.ndarray     # (N, 3) world translation
+    rotations: np.ndarray     # (N, 3) XYZ Euler angles in degrees
+    scales: np.ndarray        # (N, 3)
+    bounds_min: np.ndarray    # (N, 3) world AABB min, position when the prim has no extent
+    bounds_max: np.ndarray    # (N, 3)
+    has_bounds: np.ndarray    # (N,) bool
+    missing: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def combined_bounds(self) -> Optional[Dict[str, Any]]:
+        """Union AABB of every row as ``{'min', 'max', 'center', 'size', 'volume'}``."""
+        if not len(self.paths):
+            return None
+        return bounds_dict(self.bounds_min.min(axis=0), self.bounds_max.max(axis=0))
+
+    def object_info(self, index: int) -> Dict[str, Any]:
+        """Return the query-result shape used by the HTTP API for one row."""
+        bounds = None
+        if self.has_bounds[index]:
+            bounds = {'min': self.bounds_min[index].tolist(), 'max': self.bounds_max[index].tolist()}
+        return {
+            'path': self.paths[index],
+            'name': self.names[index],
+            'type': self.type_names[index],
+            'position': self.positions[index].tolist(),
+            'bounds': bounds,
+        }
+
+
+def bounds_dict(min_point, max_point) -> Dict[str, Any]:
+    """Bounds response dict for one AABB given as array-likes."""
+    min_point = np.asarray(min_point, dtype=np.float64)
+    max_point = np.asarray(max_point, dtype=np.float64)
+    size = max_point - min_point
+    return {
+        'min': min_point.tolist(),
+        'max': max_point.tolist(),
+        'center': ((min_point + max_point) * 0.5).tolist(),
+        'size': size.tolist(),
+        'volume': float(np.prod(size)),
+    }
+
+
+def decompose_matrices(matrices: np.ndarray):
+    """
+    Split ``(N, 4, 4)`` affine matrices into translations, XYZ Euler rotations and scales.
+
+    Matrices follow USD's row-vector convention, so a ``rotateXYZ`` op is
+    ``Rx @ Ry @ Rz`` and the translation is the last row. Shear is ignored.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    translations = matrices[:, 3, :3].copy()
+    basis = matrices[:, :3, :3]
+    scales = np.linalg.norm(basis, axis=2)
+    rot = basis / np.where(scales > 0.0, scales, 1.0)[:, :, None]
+    # Mirrored bases: fold the reflection into the X scale so rot stays proper
+    flip = np.linalg.det(rot) < 0.0
+    scales[flip, 0] *= -1.0
+    rot[flip, 0, :] *= -1.0
+
+    sy = np.clip(-rot[:, 0, 2], -1.0, 1.0)
+    ry = np.arcsin(sy)
+    gimbal = np.abs(sy) > 1.0 - 1e-9
+    rx = np.where(gimbal, 0.0, np.arctan2(rot[:, 1, 2], rot[:, 2, 2]))
+    rz = np.where(gimbal, np.arctan2(-rot[:, 1, 0], rot[:, 1, 1]), np.arctan2(rot[:, 0, 1], rot[:, 0, 0]))
+    rotations = np.degrees(np.stack([rx, ry, rz], axis=1))
+    return translations, rotations, scales
+
+
+def aligned_positions(positions: np.ndarray, bounds_min: np.ndarray, bounds_max: np.ndarray,
+                      axis: str, alignment: str = 'center', spacing: Optional[float] = None) -> np.ndarray:
+    """
+    Return new positions with every row aligned to the first one along ``axis``.
+
+    ``min``/``max``/``center`` line up that side (or the middle) of each
+    object's bounds with the reference object's; ``spacing`` then offsets row
+    ``i`` by ``i * spacing`` along the axis to distribute the objects.
+    """
+    if axis not in AXES:
+        raise ValueError("axis must be 'x', 'y', or 'z'")
+    if alignment not in ALIGNMENTS:
+        raise ValueError(f"alignment must be one of {', '.join(ALIGNMENTS)}")
+    i = AXES.index(axis)
+    if alignment == 'min':
+        anchors = bounds_min[:, i]
+    elif alignment == 'max':
+        anchors = bounds_max[:, i]
+    else:
+        anchors = (bounds_min[:, i] + bounds_max[:, i]) * 0.5
+
+    new_positions = np.array(positions, dtype=np.float64, copy=True)
+    new_positions[:, i] += anchors[0] - anchors
+    if spacing is not None:
+        new_positions[:, i] += float(spacing) * np.arange(len(new_positions))
+    return new_positions
+
+
+def read_transforms(stage, paths: Sequence[str], with_bounds: bool = True, time_code=None) -> TransformSnapshot:
+    """Resolve ``paths`` through one XformCache and the shared BBoxCache (main thread)."""
+    from pxr import Usd, UsdGeom
+
+    if time_code is None:
+        time_code = Usd.TimeCode.Default()
+    xform_cache = UsdGeom.XformCache(time_code)
+    bbox_cache = get_bounds_service().get_bbox_cache(stage, time_code) if with_bounds else None
+
+    prims, missing = [], []
+    for path in paths:
+        prim = stage.GetPrimAtPath(path)
+        if prim and prim.IsValid():
+            prims.append(prim)
+        else:
+            missing.append(path)
+
+    count = len(prims)
+    matrices = np.empty((count, 4, 4), dtype=np.float64)
+    ranges = np.full((count, 2, 3), np.nan, dtype=np.float64)
+    for row, prim in enumerate(prims):
+        matrices[row] = xform_cache.GetLocalToWorldTransform(prim)
+        if bbox_cache is None:
+            continue
+        aligned = bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange()
+        if not aligned.IsEmpty():
+            ranges[row, 0] = aligned.GetMin()
+            ranges[row, 1] = aligned.GetMax()
+
+    positions, rotations, scales = decompose_matrices(matrices)
+    has_bounds = np.isfinite(ranges).all(axis=(1, 2)) & (np.abs(ranges) < 1e30).all(axis=(1, 2))
+    bounds_min = np.where(has_bounds[:, None], ranges[:, 0], positions)
+    bounds_max = np.where(has_bounds[:, None], ranges[:, 1], positions)
+
+    return TransformSnapshot(
+        paths=[str(prim.GetPath()) for prim in prims],
+        names=[prim.GetName() for prim in prims],
+        type_names=[str(prim.GetTypeName()) for prim in prims],
+        matrices=matrices,
+        positions=positions,
+        rotations=rotations,
+        scales=scales,
+        bounds_min=bounds_min,
+        bounds_max=bounds_max,
+        has_bounds=has_bounds,
+        missing=missing,
+    )
+
+
+def write_world_positions(stage, snapshot: TransformSnapshot, new_positions: np.ndarray) -> Dict[str, Any]:
+    """
+    Move each snapshot row so its world translation becomes ``new_positions[row]``.
+
+    The world-space offsets are mapped into each prim's parent space in one
+    batched solve and added to the prim's leading translate op (one is
+    prepended when the stack does not start with a translate), keeping its
+    rotation, scale and pivot ops intact. All values are authored as Sdf specs
+    on the edit target inside a single change block, so the stage recomposes
+    once. Animated translate ops are reported as failed.
+    Returns ``{'moved': [...], 'failed': {path: reason}, 'elapsed_ms': float}``.
+    """
+    from pxr import Sdf, Usd, UsdGeom
+
+    start = time.perf_counter()
+    new_positions = np.asarray(new_positions, dtype=np.float64).reshape(-1, 3)
+    deltas = new_positions - snapshot.positions
+    rows = np.flatnonzero(np.any(np.abs(deltas) > 1e-9, axis=1))
+
+    moved: List[str] = []
+    failed: Dict[str, str] = {}
+    if not len(rows):
+        return {'moved': moved, 'failed': failed, 'elapsed_ms': 0.0}
+
+    time_code = Usd.TimeCode.Default()
+    xform_cache = UsdGeom.XformCache(time_code)
+    parents = np.empty((len(rows), 3, 3), dtype=np.float64)
+    xformables = []
+    for slot, row in enumerate(rows):
+        prim = stage.GetPrimAtPath(snapshot.paths[row])
+        xformable = UsdGeom.Xformable(prim)
+        xformables.append(xformable)
+        if xformable and xformable.GetResetXformStack():
+            parents[slot] = np.eye(3)
+        else:
+            parents[slot] = np.asarray(xform_cache.GetParentToWorldTransform(prim))[:3, :3]
+    # world_delta = local_delta @ parent_basis  ->  solve for every row at once
+    local_deltas = np.linalg.solve(np.transpose(parents, (0, 2, 1)), deltas[rows][:, :, None])[:, :, 0]
+
+    writes = []
+    for slot, row in enumerate(rows):
+        path = snapshot.paths[row]
+        xformable = xformables[slot]
+        if not xformable:
+            failed[path] = 'prim is not transformable'
+            continue
+        ops = xformable.GetOrderedXformOps()
+        lead = ops[0] if ops else None
+        if lead is not None and lead.GetOpType() == UsdGeom.XformOp.TypeTranslate and not lead.IsInverseOp():
+            attr = lead.GetAttr()
+            if attr.GetNumTimeSamples() > 0:
+                failed[path] = 'translate op is animated'
+                continue
+            current = attr.Get(time_code)
+            value = (np.asarray(current, dtype=np.float64) if current is not None else np.zeros(3)) + local_deltas[slot]
+            writes.append((path, attr.GetName(), attr.GetTypeName(), value, None))
+        else:
+            # Prepend a translate op; the rest of the stack keeps its order and values
+            names = [op.GetOpName() for op in ops]
+            op_name = 'xformOp:translate' if 'xformOp:translate' not in names else 'xformOp:translate:worldbuilder'
+            order = [op_name] + names
+            if xformable.GetResetXformStack():
+                order.insert(0, '!resetXformStack!')
+            writes.append((path, op_name, Sdf.ValueTypeNames.Double3, local_deltas[slot], order))
+
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
+    with Sdf.ChangeBlock():
+        for path, attr_name, type_name, value, order in writes:
+            try:
+                prim_spec = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(Sdf.Path(path)))
+                _author_default(prim_spec, attr_name, type_name, type_name.type.pythonClass(*value.tolist()))
+                if order is not None:
+                    _author_default(prim_spec, 'xformOpOrder', Sdf.ValueTypeNames.TokenArray, order,
+                                    Sdf.VariabilityUniform)
+                moved.append(path)
+            except Exception as e:
+                failed[path] = str(e)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    logger.debug(f"📐 Wrote {len(moved)} world positions in one change block in {elapsed_ms:.2f}ms")
+    return {'moved': moved, 'failed': failed, 'elapsed_ms': round(elapsed_ms, 3)}
+
+
+def _author_default(prim_spec, name: str, type_name, value, variability=None) -> None:
+    from pxr import Sdf
+
+    spec = prim_spec.attributes.get(name)
+    if spec is None:
+        spec = Sdf.AttributeSpec(prim_spec, name, type_name,
+                                 variability if variability is not None else Sdf.VariabilityVarying)
+    spec.default = value
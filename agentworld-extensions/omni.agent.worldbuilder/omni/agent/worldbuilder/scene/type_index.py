@@ -0,0 +1,309 @@
+"""
+Inverted index for WorldBuilder object-type queries.
+
+Maps lower-cased prim type names, prim names (via trigrams over the distinct
+strings) and semantic categories to prim paths. The index is built lazily on
+the first query and kept current from USD resync notices, so
+``query/objects_by_type`` no longer lowercases and scans every prim per call.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .stage_observer import SortedPathSet, collapse_roots
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing
+    from .stage_observer import StageObserver
+
+logger = logging.getLogger(__name__)
+
+# Semantic categories matched against prim names and type names
+SEMANTIC_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    'furniture': ('chair', 'table', 'desk', 'sofa', 'bed', 'cabinet', 'shelf'),
+    'lighting': ('lamp', 'light', 'fixture', 'bulb', 'chandelier'),
+    'decoration': ('plant', 'vase', 'picture', 'art', 'frame', 'ornament'),
+    'architecture': ('wall', 'door', 'window', 'column', 'beam', 'floor', 'ceiling'),
+    'vehicle': ('car', 'truck', 'bike', 'motorcycle', 'boat', 'plane'),
+    'primitive': ('cube', 'sphere', 'cylinder', 'cone', 'plane', 'mesh'),
+}
+
+MATCH_MODES = ('auto', 'substring', 'prefix', 'category', 'type')
+
+_GRAM = 3
+
+
+def matches_semantic_category(name: str, type_name: str, category: str) -> bool:
+    """Return True when a lower-cased name/type contains one of the category keywords."""
+    keywords = SEMANTIC_CATEGORIES.get(category)
+    if not keywords:
+        return False
+    return any(keyword in name or keyword in type_name for keyword in keywords)
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+class TokenIndex:
+    """
+    Inverted index from name/type tokens and semantic categories to paths.
+
+    Trigrams are kept over the *distinct* lower-cased strings rather than paths:
+    type names repeat heavily, so candidate verification stays proportional to
+    the vocabulary that shares the query's trigrams, not to the prim count.
+    """
+
+    def __init__(self):
+        self._records: Dict[str, Tuple[str, str]] = {}
+        self._by_string: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._grams: Dict[str, Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_category: Dict[str, Set[str]] = {category: set() for category in SEMANTIC_CATEGORIES}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._records
+
+    def add(self, path: str, name: str, type_name: str) -> None:
+        """Index a prim; re-adding a path replaces its previous tokens."""
+        if path in self._records:
+            self.remove(path)
+        name = (name or '').lower()
+        type_name = (type_name or '').lower()
+        self._records[path] = (name, type_name)
+
+        for text in {name, type_name}:
+            if text:
+                self._add_string(text, path)
+        self._by_type.setdefault(type_name, set()).add(path)
+        for category in SEMANTIC_CATEGORIES:
+            if matches_semantic_category(name, type_name, category):
+                self._by_category[category].add(path)
+
+    def remove(self, path: str) -> bool:
+        """Drop a prim from the index; returns False if it was not indexed."""
+        record = self._records.pop(path, None)
+        if record is None:
+            return False
+        name, type_name = record
+        for text in {name, type_name}:
+            if text:
+                self._remove_string(text, path)
+        paths = self._by_type.get(type_name)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del self._by_type[type_name]
+        for paths in self._by_category.values():
+            paths.discard(path)
+        return True
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def search(self, text: str, mode: str = 'auto') -> Set[str]:
+        """
+        Return the set of paths matching ``text``.
+
+        Modes:
+            auto: substring of name or type, plus semantic category members
+            substring: substring of name or type
+            prefix: name or type starts with ``text``
+            category: members of a semantic category
+            type: exact (case-insensitive) USD type name
+        """
+        if mode not in MATCH_MODES:
+            raise ValueError(f"match must be one of {', '.join(MATCH_MODES)}")
+        query = (text or '').lower()
+        if not query:
+            return set()
+
+        if mode == 'type':
+            return set(self._by_type.get(query, ()))
+        if mode == 'category':
+            return set(self._by_category.get(query, ()))
+        if mode == 'prefix':
+            return self._paths_for(self._prefix_strings(query))
+
+        matches = self._paths_for(self._substring_strings(query))
+        if mode == 'auto':
+            matches |= self._by_category.get(query, set())
+        return matches
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _add_string(self, text: str, path: str) -> None:
+        paths = self._by_string.get(text)
+        if paths is None:
+            paths = self._by_string[text] = set()
+            bisect.insort(self._vocabulary, text)
+            for gram in _grams(text):
+                self._grams.setdefault(gram, set()).add(text)
+        paths.add(path)
+
+    def _remove_string(self, text: str, path: str) -> None:
+        paths = self._by_string.get(text)
+        if paths is None:
+            return
+        paths.discard(path)
+        if paths:
+            return
+        del self._by_string[text]
+        index = bisect.bisect_left(self._vocabulary, text)
+        if index < len(self._vocabulary) and self._vocabulary[index] == text:
+            del self._vocabulary[index]
+        for gram in _grams(text):
+            strings = self._grams.get(gram)
+            if strings is not None:
+                strings.discard(text)
+                if not strings:
+                    del self._grams[gram]
+
+    def _prefix_strings(self, query: str) -> Iterable[str]:
+        start = bisect.bisect_left(self._vocabulary, query)
+        for index in range(start, len(self._vocabulary)):
+            text = self._vocabulary[index]
+            if not text.startswith(query):
+                break
+            yield text
+
+    def _substring_strings(self, query: str) -> Iterable[str]:
+        if len(query) < _GRAM:
+            # Too short for trigrams; scan the (deduplicated) vocabulary instead
+            return [text for text in self._by_string if query in text]
+        candidates: Optional[Set[str]] = None
+        for gram in sorted(_grams(query), key=lambda g: len(self._grams.get(g, ()))):
+            strings = self._grams.get(gram)
+            if not strings:
+                return []
+            candidates = set(strings) if candidates is None else candidates & strings
+            if not candidates:
+                return []
+        return [text for text in candidates or () if query in text]
+
+    def _paths_for(self, strings: Iterable[str]) -> Set[str]:
+        paths: Set[str] = set()
+        for text in strings:
+            paths |= self._by_string.get(text, set())
+        return paths
+
+
+class StageTypeIndex:
+    """TokenIndex bound to the active stage and maintained from resync notices."""
+
+    def __init__(self, observer: 'StageObserver'):
+        """Initialize index; the stage is only traversed on the first query."""
+        self._observer = observer
+        self._lock = threading.RLock()
+        self._index = TokenIndex()
+        self._paths = SortedPathSet()
+        self._built = False
+        self._dirty_roots: Set[str] = set()
+        self._stats = {
+            'full_builds': 0,
+            'incremental_updates': 0,
+            'last_build_ms': 0.0,
+        }
+        observer.subscribe(self._on_objects_changed, self._on_stage_reset)
+
+    def query(self, text: str, mode: str = 'auto') -> List[str]:
+        """Return matching prim paths in stable (sorted) order."""
+        stage = self._sync()
+        if not stage:
+            return []
+        with self._lock:
+            return sorted(self._index.search(text, mode))
+
+    def get_stats(self) -> Dict[str, object]:
+        """Return index size and maintenance counters."""
+        with self._lock:
+            return {
+                'built': self._built,
+                'entries': len(self._index),
+                'pending_dirty_roots': len(self._dirty_roots),
+                **self._stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _on_stage_reset(self, stage) -> None:
+        with self._lock:
+            self._built = False
+            self._dirty_roots.clear()
+            self._index.clear()
+            self._paths = SortedPathSet()
+
+    def _on_objects_changed(self, resynced: List[str], changed: List[str]) -> None:
+        # Names and type names only change through resyncs; value edits are ignored
+        if not resynced:
+            return
+        with self._lock:
+            if self._built:
+                self._dirty_roots.update(resynced)
+
+    def _sync(self):
+        stage = self._observer.current_stage()
+        if not stage:
+            return None
+        with self._lock:
+            if not self._built:
+                self._rebuild(stage)
+            elif self._dirty_roots:
+                roots = collapse_roots(self._dirty_roots)
+                self._dirty_roots.clear()
+                if '/' in roots:
+                    self._rebuild(stage)
+                else:
+                    self._update_subtrees(stage, roots)
+        return stage
+
+    def _rebuild(self, stage) -> None:
+        start = time.perf_counter()
+        self._index.clear()
+        paths = []
+        for path, name, type_name in _collect_prims(stage, [stage.GetPseudoRoot()]):
+            self._index.add(path, name, type_name)
+            paths.append(path)
+        self._paths = SortedPathSet(paths)
+        self._built = True
+        self._dirty_roots.clear()
+        self._stats['full_builds'] += 1
+        self._stats['last_build_ms'] = round((time.perf_counter() - start) * 1000.0, 3)
+        logger.debug(f"🔍 Type index built: {len(paths)} prims in {self._stats['last_build_ms']}ms")
+
+    def _update_subtrees(self, stage, roots: List[str]) -> None:
+        from pxr import Sdf
+
+        prims = []
+        for root in roots:
+            for path in self._paths.pop_subtree(root):
+                self._index.remove(path)
+            prim = stage.GetPrimAtPath(Sdf.Path(root))
+            if prim and prim.IsValid():
+                prims.append(prim)
+
+        for path, name, type_name in _collect_prims(stage, prims):
+            self._index.add(path, name, type_name)
+            self._paths.add(path)
+        self._stats['incremental_updates'] += 1
+
+
+def _collect_prims(stage, roots) -> Iterable[Tuple[str, str, str]]:
+    """Yield (path, name, type name) for prims visited by the default traversal."""
+    from pxr import Usd
+
+    for root in roots:
+        for prim in Usd.PrimRange(root):
+            if prim.IsPseudoRoot():
+                continue
+            yield str(prim.GetPath()), prim.GetName(), str(prim.GetTypeName())
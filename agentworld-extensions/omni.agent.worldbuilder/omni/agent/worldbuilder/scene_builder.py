@@ -19,6 +19,8 @@ import omni.usd
 import omni.kit.app
 from pxr import Usd, UsdGeom, Gf, Sdf
 
+from agentworld_core.bounds import get_bounds_service
+
 from .scene.scene_types import (
     PrimitiveType, 
     SceneElement, 
@@ -33,6 +35,22 @@ from .scene.element_factory import ElementFactory
 from .scene.asset_manager import AssetManager
 from .scene.cleanup_operations import CleanupOperations
 from .scene.batch_manager import BatchManager
+from .scene.stage_observer import StageObserver
+from .scene.spatial_index import StageSpatialIndex
+from .scene.type_index import StageTypeIndex
+from .scene.scene_snapshot import SceneSnapshotCache
+from .scene.batch_registry import BatchRegistry
+from .scene.material_library import DEFAULT_QUANTIZATION_STEPS, MaterialLibrary
+from .scene.change_journal import DEFAULT_JOURNAL_PATHS, DEFAULT_JOURNAL_RECORDS, ChangeJournal
+from .scene.layer_prefetch import (
+    DEFAULT_LAYER_CACHE_SIZE,
+    DEFAULT_PAYLOAD_BUDGET_MS,
+    DEFAULT_PREFETCH_WORKERS,
+    LayerPrefetcher,
+    PayloadLoader,
+)
+from .scene.hierarchy_browser import HierarchyBrowser, decode_cursor, read_batch_metadata
+from .scene.scene_transfer import SceneTransfer
 
 logger = logging.getLogger(__name__)
 
@@ -57,15 +75,92 @@ class SceneBuilder:
         self._config = config
         self._usd_context = omni.usd.get_context()
         
+        # Change-notice driven caches (bound lazily to the active stage)
+        self._stage_observer = StageObserver(self._usd_context)
+        self._spatial_index = StageSpatialIndex(self._stage_observer)
+        self._type_index = StageTypeIndex(self._stage_observer)
+        self._snapshot_cache = SceneSnapshotCache(self._stage_observer)
+        self._batch_registry = BatchRegistry(self._stage_observer)
+        self._change_journal = ChangeJournal(
+            self._stage_observer,
+            max_records=self._config_value('change_journal_size', DEFAULT_JOURNAL_RECORDS),
+            max_paths=self._config_value('change_journal_max_paths', DEFAULT_JOURNAL_PATHS),
+        )
+
+        self._material_library = MaterialLibrary(
+            self._stage_observer,
+            steps=self._config_value('material_quantization_steps', DEFAULT_QUANTIZATION_STEPS),
+        )
+
+        # Asset layers are opened off the main thread; payload assets load within a frame budget
+        self._layer_prefetcher = LayerPrefetcher(
+            max_layers=self._config_value('asset_cache_size', DEFAULT_LAYER_CACHE_SIZE),
+            max_workers=self._config_value('asset_prefetch_workers', DEFAULT_PREFETCH_WORKERS),
+            ready_timeout=self._config_value('asset_loading_timeout', 30.0),
+        )
+        self._payload_loader = PayloadLoader(
+            budget_ms=self._config_value('payload_load_budget_ms', DEFAULT_PAYLOAD_BUDGET_MS),
+            is_ready=self._layer_prefetcher.is_ready,
+        )
+
         # Initialize modular components
         self._queue_manager = WorldBuilderQueueManager(config=self._config)
-        self._element_factory = ElementFactory(self._usd_context)
-        self._asset_manager = AssetManager(self._usd_context)
+        self._element_factory = ElementFactory(
+            self._usd_context,
+            self._material_library,
+            self._config_value('material_mode', 'display_color'),
+            self._config_value('authoring_backend', 'usd'),
+        )
+        self._asset_manager = AssetManager(self._usd_context, self._layer_prefetcher)
         self._cleanup_operations = CleanupOperations(self._usd_context)
-        self._batch_manager = BatchManager(self._usd_context, self._element_factory)
+        self._batch_manager = BatchManager(self._usd_context, self._element_factory, self._batch_registry)
+        self._hierarchy_browser = HierarchyBrowser(self._usd_context)
+        self._scene_transfer = SceneTransfer(self._usd_context)
         
         logger.info("🏗️ Scene Builder initialized with modular architecture")
     
+    def _config_value(self, key: str, default):
+        return self._config.get(key, default) if self._config else default
+
+    @property
+    def spatial_index(self) -> StageSpatialIndex:
+        """Spatial index over geometric prims of the active stage."""
+        return self._spatial_index
+
+    @property
+    def type_index(self) -> StageTypeIndex:
+        """Inverted name/type/category index over prims of the active stage."""
+        return self._type_index
+
+    @property
+    def stage_observer(self) -> StageObserver:
+        """Shared ObjectsChanged fan-out for the active stage."""
+        return self._stage_observer
+
+    @property
+    def queue_manager(self) -> WorldBuilderQueueManager:
+        """Request queue drained by :meth:`process_queued_requests`."""
+        return self._queue_manager
+
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """Hit/miss and maintenance counters for the scene read caches."""
+        return {
+            'snapshot': self._snapshot_cache.get_stats(),
+            'spatial_index': self._spatial_index.get_stats(),
+            'type_index': self._type_index.get_stats(),
+            'batch_registry': self._batch_registry.get_stats(),
+            'layer_prefetch': self._layer_prefetcher.get_stats(),
+            'payload_loader': self._payload_loader.get_stats(),
+            'change_journal': self._change_journal.get_stats(),
+            'material_library': self._material_library.get_stats(),
+        }
+
+    def shutdown(self) -> None:
+        """Release USD change listeners held by scene caches."""
+        self._snapshot_cache.clear()
+        self._stage_observer.shutdown()
+        self._layer_prefetcher.shutdown()
+
     # =============================================================================
     # PUBLIC API METHODS - Queue-based operations
     # =============================================================================
@@ -81,8 +176,12 @@ class SceneBuilder:
         """
         Queue an asset for placement on Isaac Sim's main thread via USD reference.
         Returns immediately - actual USD reference creation happens asynchronously.
+        The asset layer starts opening on a prefetch worker right away.
         """
-        return self._queue_manager.add_asset_request(asset, 'asset')
+        result = self._queue_manager.add_asset_request(asset, 'asset')
+        if result.get('success'):
+            self._layer_prefetcher.prefetch(asset.asset_path)
+        return result
 
     def remove_element_from_stage(self, element_path: str) -> Dict[str, Any]:
         """
@@ -124,13 +223,25 @@ class SceneBuilder:
         """
         Process queued requests on Isaac Sim's main thread using modular queue manager.
         This should be called regularly from the main thread (e.g., via timer).
+        Asset placements wait for their layer prefetch, and deferred payloads
+        are loaded within ``payload_load_budget_ms`` per call.
         """
-        return self._queue_manager.process_queues(
+        # Keep the notice listener bound so the change journal counts every revision
+        self._stage_observer.current_stage()
+        result = self._queue_manager.process_queues(
             element_processor=self._element_factory.create_element,
             batch_processor=self._create_batch_on_main_thread,
             asset_processor=self._process_asset_request,
-            removal_processor=self._process_removal_request
+            removal_processor=self._process_removal_request,
+            asset_ready=lambda asset: asset.as_payload or self._layer_prefetcher.is_ready(asset.asset_path),
         )
+        # Release shared materials of prims removed since the last update
+        self._material_library.collect()
+        if len(self._payload_loader):
+            loaded = self._payload_loader.step(self._usd_context.get_stage())
+            if loaded:
+                result['payloads_loaded'] = len(loaded)
+        return result
     
     # =============================================================================
     # PROCESSOR METHODS - Used by queue manager
@@ -139,7 +250,10 @@ class SceneBuilder:
     def _process_asset_request(self, request_type: str, request_data) -> Dict[str, Any]:
         """Process asset-related requests for the queue manager using modular managers."""
         if request_type == 'place':
-            return self._asset_manager.place_asset(request_data)
+            result = self._asset_manager.place_asset(request_data)
+            if result.get('success') and request_data.as_payload:
+                self._payload_loader.enqueue(result['prim_path'], request_data.asset_path)
+            return result
         elif request_type == 'transform':
             return self._asset_manager.transform_asset(
                 request_data['prim_path'], 
@@ -154,12 +268,19 @@ class SceneBuilder:
         """Process removal requests for the queue manager using modular cleanup operations."""
         request_type = request_data['type']
         if request_type == 'remove_element':
-            return self._cleanup_operations.remove_element(request_data['element_path'])
+            removed_path = request_data['element_path']
+            result = self._cleanup_operations.remove_element(removed_path)
         elif request_type == 'clear_path':
-            return self._cleanup_operations.clear_path(request_data['path'])
+            removed_path = request_data['path']
+            result = self._cleanup_operations.clear_path(removed_path)
         else:
             return {'success': False, 'error': f"Unknown removal type: {request_type}"}
 
+        if result.get('success'):
+            self._batch_registry.forget_subtree(removed_path)
+            self._payload_loader.discard_subtree(removed_path)
+        return result
+
     def _create_batch_on_main_thread(self, batch_name: str, elements: List[Dict], 
                                      batch_transform: Optional[Dict[str, Tuple[float, float, float]]] = None) -> Dict[str, Any]:
         """
@@ -200,7 +321,47 @@ class SceneBuilder:
         """
         Get comprehensive scene contents using traversal.
         This method should be called from main thread for USD stage access.
+
+        Results are served from the snapshot cache until a change notice touches
+        the inspected subtree (or, with metadata, the batch roots under /World).
+        """
+        dependencies = [(path, None)]
+        if include_metadata:
+            dependencies.append(("/World", 2))
+        result = self._snapshot_cache.get_or_compute(
+            ('scene', path, bool(include_metadata)),
+            dependencies,
+            lambda: self._compute_scene_contents(path, include_metadata),
+        )
+        if result.get('success'):
+            # Starting point for scene/changes polling
+            result['revision'] = self._change_journal.revision
+            result['epoch'] = self._change_journal.epoch
+        return result
+
+    def get_scene_changes(self, since: int, epoch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return prims added, removed and modified after stage revision ``since``.
+        This method should be called from main thread for USD stage access.
+        """
+        return self._change_journal.changes_since(since, epoch)
+
+    def build_export_layer(self, root_path: str = "/World", flatten: bool = True) -> Dict[str, Any]:
+        """
+        Snapshot ``root_path`` into a detached layer for scene/export.
+        This method should be called from main thread for USD stage access.
+        """
+        return self._scene_transfer.build_export_layer(root_path, flatten)
+
+    def import_scene_layer(self, layer, mode: str = 'sublayer', target_path: Optional[str] = None) -> Dict[str, Any]:
         """
+        Attach an uploaded scene layer as a sublayer or reference in one change block.
+        This method should be called from main thread for USD stage access.
+        """
+        return self._scene_transfer.apply_import(layer, mode, target_path)
+
+    def _compute_scene_contents(self, path: str, include_metadata: bool) -> Dict[str, Any]:
+        """Traverse the stage below ``path`` and build the scene contents payload."""
         try:
             # Get USD stage
             stage = self._usd_context.get_stage()
@@ -273,32 +434,19 @@ class SceneBuilder:
         }
         
         # Check if this Xform is a batch by looking for WorldBuilder metadata
-        if prim.GetTypeName() == "Xform":
-            is_batch_attr = prim.GetAttribute("worldbuilder:is_batch")
-            if is_batch_attr and is_batch_attr.Get():
-                prim_data['is_batch'] = True
-                batch_name_attr = prim.GetAttribute("worldbuilder:batch_name")
-                if batch_name_attr:
-                    prim_data['batch_name'] = batch_name_attr.Get()
-                created_at_attr = prim.GetAttribute("worldbuilder:batch_created_at") 
-                if created_at_attr:
-                    prim_data['batch_created_at'] = created_at_attr.Get()
-                element_count_attr = prim.GetAttribute("worldbuilder:batch_element_count")
-                if element_count_attr:
-                    prim_data['batch_element_count'] = element_count_attr.Get()
+        prim_data.update(read_batch_metadata(prim))
         
         # Add geometric info for geometric prims
         if prim.IsA(UsdGeom.Gprim):
             try:
-                gprim = UsdGeom.Gprim(prim)
-                # Get bounding box if possible
-                bbox = gprim.ComputeWorldBound(Usd.TimeCode.Default(), UsdGeom.Tokens.default_)
-                if bbox:
+                # Shared per-stage BBoxCache reuses extents across the whole traversal
+                world_range = get_bounds_service().compute_world_range(prim.GetStage(), prim)
+                if world_range:
                     prim_data['bounds'] = {
-                        'min': list(bbox.GetRange().GetMin()),
-                        'max': list(bbox.GetRange().GetMax())
+                        'min': list(world_range[0]),
+                        'max': list(world_range[1])
                     }
-            except:
+            except Exception:
                 pass  # Bounds calculation can fail, that's ok
         
         # Recursively inspect children
@@ -332,8 +480,54 @@ class SceneBuilder:
         
         return stats
 
+    def browse_hierarchy(
+        self,
+        path: Optional[str] = None,
+        *,
+        depth: int = 1,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Tuple[str, ...] = (),
+    ) -> Dict[str, Any]:
+        """
+        Page through the hierarchy below ``path`` without materializing the whole scene.
+
+        Pages are cached like other scene reads. Each entry reports its
+        ``child_count``, so a page depends on one level below ``depth``;
+        requesting bounds makes it depend on the full subtree since
+        descendant edits change parent extents.
+        """
+        fields = tuple(sorted(set(fields)))
+        root = path or (decode_cursor(cursor)[0] if cursor else "/World")
+        return self._snapshot_cache.get_or_compute(
+            ('browse', path, depth, limit, cursor, fields),
+            [(root, None if 'bounds' in fields else max(1, int(depth)) + 1)],
+            lambda: self._hierarchy_browser.browse(path, depth=depth, limit=limit, cursor=cursor, fields=fields),
+        )
+
+    def get_scene_statistics(self, path: str = "/World") -> Dict[str, Any]:
+        """Return child prim statistics for ``path`` (cached until its children change)."""
+        def _compute():
+            stage = self._usd_context.get_stage()
+            if not stage:
+                return {'success': False, 'error': "No USD stage available"}
+            root_prim = stage.GetPrimAtPath(path)
+            if not root_prim.IsValid():
+                return {'success': False, 'error': f"Path '{path}' not found in scene"}
+            return {'success': True, 'path': path, 'statistics': self._generate_scene_statistics(root_prim)}
+
+        return self._snapshot_cache.get_or_compute(('statistics', path), [(path, 1)], _compute)
+
     def list_elements_in_scene(self, filter_type: str = "", *, start: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
         """List all elements in the scene with optional type filtering."""
+        return self._snapshot_cache.get_or_compute(
+            ('elements', filter_type, start, limit),
+            [("/World", 1)],
+            lambda: self._compute_elements_in_scene(filter_type, start, limit),
+        )
+
+    def _compute_elements_in_scene(self, filter_type: str, start: int, limit: Optional[int]) -> Dict[str, Any]:
+        """Collect the direct children of /World for ``list_elements_in_scene``."""
         try:
             stage = self._usd_context.get_stage()
             if not stage:
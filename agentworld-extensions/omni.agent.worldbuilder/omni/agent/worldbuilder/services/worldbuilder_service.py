@@ -4,11 +4,33 @@ from __future__ import annotations
 
 from datetime import datetime
 import json
+import os
 from typing import Any, Dict, Optional, TYPE_CHECKING
 import time
 
 from ..scene_builder import SceneElement, AssetPlacement, PrimitiveType
-from ..utils import collect_metrics, count_world_children, ensure_vector3
+from ..scene.type_index import MATCH_MODES
+from ..scene.material_library import material_field_errors
+from ..scene.element_factory import authoring_backend_errors
+from ..scene.scene_transfer import (
+    DEFAULT_TRANSFER_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    IMPORT_MODES,
+    default_import_dir,
+    iter_file_chunks,
+    open_layer,
+    store_upload,
+    write_layer,
+)
+from ..scene.hierarchy_browser import (
+    BROWSE_FIELDS,
+    DEFAULT_BROWSE_LIMIT,
+    MAX_BROWSE_DEPTH,
+    MAX_BROWSE_LIMIT,
+    CursorError,
+    decode_cursor,
+)
+from ..utils import collect_metrics, count_world_children, ensure_vector3, first_value, parse_flag
 from ..errors import error_response
 
 if TYPE_CHECKING:  # pragma: no cover - only used for typing
@@ -50,9 +72,14 @@ class WorldBuilderService:
             return stats_provider()
         return dict(getattr(self._api, '_api_stats', {}))
 
-    def _execute_on_main_thread(self, func, *, error_code: str) -> Dict[str, Any]:
+    def _config_value(self, key: str, default):
+        return self._config.get(key, default) if self._config else default
+
+    def _execute_on_main_thread(self, func, *, error_code: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         queue_manager = getattr(self._scene_builder, '_queue_manager', None)
         if queue_manager and hasattr(queue_manager, 'run_sync_operation'):
+            if timeout is not None:
+                return queue_manager.run_sync_operation(func, error_code=error_code, timeout=timeout)
             return queue_manager.run_sync_operation(func, error_code=error_code)
 
         runner = getattr(self._api, 'run_on_main_thread', None)
@@ -117,8 +144,20 @@ class WorldBuilderService:
                 'metrics': collect_metrics(self._stats, scene_counter=self._scene_object_count),
             }
         metrics = collect_metrics(self._stats, scene_counter=self._scene_object_count)
+        cache_stats = self._scene_cache_stats()
+        if cache_stats:
+            metrics['scene_cache'] = cache_stats
         return {'success': True, 'metrics': metrics}
 
+    def _scene_cache_stats(self) -> Dict[str, Any]:
+        provider = getattr(self._scene_builder, 'get_cache_statistics', None)
+        if not callable(provider):
+            return {}
+        try:
+            return provider()
+        except Exception:
+            return {}
+
     def get_prometheus_metrics(self) -> str:
         startup_error = getattr(self._api, '_startup_error', None)
         metrics = collect_metrics(self._stats, scene_counter=self._scene_object_count)
@@ -142,11 +181,38 @@ class WorldBuilderService:
             '# TYPE worldbuilder_objects_queried counter',
             f"worldbuilder_objects_queried {metrics.get('objects_queried', 0)}",
         ]
+        snapshot = self._scene_cache_stats().get('snapshot')
+        if snapshot:
+            lines.extend([
+                '# HELP worldbuilder_scene_cache_hits_total Scene reads served from the snapshot cache',
+                '# TYPE worldbuilder_scene_cache_hits_total counter',
+                f"worldbuilder_scene_cache_hits_total {snapshot.get('hits', 0)}",
+                '# HELP worldbuilder_scene_cache_misses_total Scene reads that traversed the stage',
+                '# TYPE worldbuilder_scene_cache_misses_total counter',
+                f"worldbuilder_scene_cache_misses_total {snapshot.get('misses', 0)}",
+                '# HELP worldbuilder_scene_cache_invalidations_total Snapshots dropped by USD change notices',
+                '# TYPE worldbuilder_scene_cache_invalidations_total counter',
+                f"worldbuilder_scene_cache_invalidations_total {snapshot.get('invalidations', 0)}",
+            ])
         return '\n'.join(lines)
 
     # ------------------------------------------------------------------
     # Mutations
     def add_element(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        material_errors = material_field_errors(payload)
+        if material_errors:
+            return error_response(
+                'VALIDATION_ERROR',
+                '; '.join(material_errors),
+                details={'parameters': ['material_mode', 'roughness', 'metallic']}
+            )
+        backend_errors = authoring_backend_errors(payload)
+        if backend_errors:
+            return error_response(
+                'VALIDATION_ERROR',
+                '; '.join(backend_errors),
+                details={'parameter': 'authoring_backend'}
+            )
         element = SceneElement(
             name=payload.get('name', f"element_{int(time.time())}"),  # type: ignore[name-defined]
             primitive_type=PrimitiveType(payload.get('element_type', 'cube')),
@@ -155,7 +221,11 @@ class WorldBuilderService:
             scale=tuple(payload.get('scale', [1.0, 1.0, 1.0])),
             color=tuple(payload.get('color', [0.5, 0.5, 0.5])),
             parent_path=payload.get('parent_path', '/World'),
-            metadata=payload.get('metadata', {})
+            metadata=payload.get('metadata', {}),
+            material_mode=payload.get('material_mode'),
+            roughness=payload.get('roughness'),
+            metallic=payload.get('metallic'),
+            authoring_backend=payload.get('authoring_backend'),
         )
         response = self._scene_builder.add_element_to_stage(element)
         if response.get('success'):
@@ -183,7 +253,8 @@ class WorldBuilderService:
             position=tuple(payload.get('position', [0.0, 0.0, 0.0])),
             rotation=tuple(payload.get('rotation', [0.0, 0.0, 0.0])),
             scale=tuple(payload.get('scale', [1.0, 1.0, 1.0])),
-            metadata=payload.get('metadata', {})
+            metadata=payload.get('metadata', {}),
+            as_payload=bool(payload.get('as_payload', False)),
         )
         return self._scene_builder.place_asset_in_stage(asset)
 
@@ -241,10 +312,16 @@ class WorldBuilderService:
                 return error_response('STAGE_UNAVAILABLE', "'/World' prim not found")
 
             stats = self._scene_builder.get_statistics()
+            world_stats = {}
+            scene_statistics = getattr(self._scene_builder, 'get_scene_statistics', None)
+            if callable(scene_statistics):
+                world_result = scene_statistics('/World')
+                if world_result.get('success'):
+                    world_stats = world_result.get('statistics', {})
             scene_info = {
                 'has_stage': True,
-                'prim_count': stats.get('total_prims', 0),
-                'asset_count': stats.get('geometric_prims', 0),
+                'prim_count': world_stats.get('total_prims', stats.get('total_prims', 0)),
+                'asset_count': world_stats.get('geometric_prims', stats.get('geometric_prims', 0)),
                 'queue_status': stats.get('queue_status', {}),
                 'batch_statistics': stats.get('batch_statistics', {}),
             }
@@ -252,6 +329,164 @@ class WorldBuilderService:
 
         return self._execute_on_main_thread(_compute_status, error_code='SCENE_STATUS_FAILED')
 
+    def get_scene_changes(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        since = first_value(payload.get('since'))
+        if since is None or since == '':
+            return error_response(
+                'MISSING_PARAMETER',
+                'since is required (use the revision returned by get_scene or a previous scene/changes call)',
+                details={'parameter': 'since'}
+            )
+        try:
+            since = int(since)
+        except (TypeError, ValueError):
+            return error_response('VALIDATION_ERROR', 'since must be an integer', details={'parameter': 'since'})
+        if since < 0:
+            return error_response('VALIDATION_ERROR', 'since must be >= 0', details={'since': since})
+        epoch = first_value(payload.get('epoch')) or None
+
+        return self._execute_on_main_thread(
+            lambda: self._scene_builder.get_scene_changes(since, epoch),
+            error_code='SCENE_CHANGES_FAILED'
+        )
+
+    def export_scene(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        path = first_value(payload.get('path'), '/World')
+        fmt = str(first_value(payload.get('format'), 'usdc')).lower()
+        if not isinstance(path, str) or not path.startswith('/') or path == '/':
+            return error_response('VALIDATION_ERROR', 'path must be an absolute prim path', details={'path': path})
+        if fmt not in EXPORT_FORMATS:
+            return error_response(
+                'VALIDATION_ERROR',
+                f"format must be one of {', '.join(EXPORT_FORMATS)}",
+                details={'parameter': 'format', 'received': fmt}
+            )
+        flatten = parse_flag(payload.get('flatten'), default=True)
+
+        snapshot = self._execute_on_main_thread(
+            lambda: self._scene_builder.build_export_layer(path, flatten),
+            error_code='SCENE_EXPORT_FAILED',
+            timeout=float(self._config_value('scene_transfer_timeout', 120.0)),
+        )
+        if not snapshot.get('success'):
+            return snapshot
+
+        # Serializing the detached layer does not touch the stage, so it stays off the main thread
+        export_path = write_layer(snapshot['layer'], fmt)
+        filename = f"{path.rstrip('/').rsplit('/', 1)[-1]}.{fmt}"
+        return {
+            'success': True,
+            '_stream': iter_file_chunks(
+                export_path,
+                int(self._config_value('scene_transfer_chunk_size', DEFAULT_TRANSFER_CHUNK_SIZE)),
+            ),
+            '_content_type': 'application/octet-stream',
+            '_headers': {
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'X-WorldBuilder-Export-Root': path,
+                'X-WorldBuilder-Export-Bytes': os.path.getsize(export_path),
+                'X-WorldBuilder-Flatten': 'true' if flatten else 'false',
+            },
+        }
+
+    def import_scene(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        upload = payload.get('_upload')
+        if upload is None or not payload.get('_upload_size'):
+            return error_response(
+                'MISSING_PARAMETER',
+                'scene/import expects the USD file as an application/octet-stream request body',
+                details={'parameter': 'body'}
+            )
+        mode = str(first_value(payload.get('mode'), 'sublayer')).lower()
+        if mode not in IMPORT_MODES:
+            return error_response(
+                'VALIDATION_ERROR',
+                f"mode must be one of {', '.join(IMPORT_MODES)}",
+                details={'parameter': 'mode', 'received': mode}
+            )
+        target_path = first_value(payload.get('target_path')) or None
+        if target_path is not None and (not target_path.startswith('/') or target_path == '/'):
+            return error_response(
+                'VALIDATION_ERROR',
+                'target_path must be an absolute prim path',
+                details={'target_path': target_path}
+            )
+
+        # Spool to the import directory and parse the layer before touching the main thread
+        directory = self._config_value('scene_import_dir', '') or default_import_dir()
+        try:
+            stored_path, sha256, size, fmt = store_upload(upload, directory)
+        except ValueError as exc:
+            return error_response('VALIDATION_ERROR', str(exc), details={'parameter': 'body'})
+        try:
+            layer = open_layer(stored_path)
+        except ValueError as exc:
+            # Content-addressed: keeping the file would make re-uploads of the same bytes fail forever
+            try:
+                os.unlink(stored_path)
+            except OSError:
+                pass
+            return error_response('VALIDATION_ERROR', str(exc), details={'parameter': 'body'})
+
+        result = self._execute_on_main_thread(
+            lambda: self._scene_builder.import_scene_layer(layer, mode, target_path),
+            error_code='SCENE_IMPORT_FAILED',
+            timeout=float(self._config_value('scene_transfer_timeout', 120.0)),
+        )
+        if result.get('success'):
+            result.update({'sha256': sha256, 'bytes': size, 'format': fmt})
+        return result
+
+    def browse_scene(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        path = first_value(payload.get('path'))
+        cursor = first_value(payload.get('cursor'))
+        try:
+            depth = int(first_value(payload.get('depth'), 1))
+            limit = int(first_value(payload.get('limit'), DEFAULT_BROWSE_LIMIT))
+        except (TypeError, ValueError):
+            return error_response(
+                'VALIDATION_ERROR',
+                'depth and limit must be integers',
+                details={'parameters': ['depth', 'limit']}
+            )
+        if not 1 <= depth <= MAX_BROWSE_DEPTH or not 1 <= limit <= MAX_BROWSE_LIMIT:
+            return error_response(
+                'VALIDATION_ERROR',
+                f'depth must be 1-{MAX_BROWSE_DEPTH} and limit 1-{MAX_BROWSE_LIMIT}',
+                details={'depth': depth, 'limit': limit}
+            )
+
+        fields = payload.get('fields') or []
+        if isinstance(fields, str):
+            fields = [fields]
+        fields = [name.strip() for value in fields for name in str(value).split(',') if name.strip()]
+        unknown = sorted(set(fields) - set(BROWSE_FIELDS))
+        if unknown:
+            return error_response(
+                'VALIDATION_ERROR',
+                f"fields must be drawn from {', '.join(BROWSE_FIELDS)}",
+                details={'parameter': 'fields', 'received': unknown}
+            )
+
+        if cursor:
+            try:
+                cursor_path = decode_cursor(str(cursor))[0]
+            except CursorError as exc:
+                return error_response('VALIDATION_ERROR', str(exc), details={'parameter': 'cursor'})
+            if path and path != cursor_path:
+                return error_response(
+                    'VALIDATION_ERROR',
+                    'cursor does not belong to the requested path',
+                    details={'path': path, 'cursor_path': cursor_path}
+                )
+
+        return self._execute_on_main_thread(
+            lambda: self._scene_builder.browse_hierarchy(
+                path, depth=depth, limit=limit, cursor=cursor, fields=tuple(fields)
+            ),
+            error_code='BROWSE_SCENE_FAILED'
+        )
+
     def list_elements(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         filter_type = payload.get('filter_type', '') if payload else ''
         page = max(1, int(payload.get('page', 1)))
@@ -325,9 +560,26 @@ class WorldBuilderService:
                 'type parameter is required',
                 details={'parameter': 'type'}
             )
+        match = str(first_value(payload.get('match'), 'auto')).lower()
+        if match not in MATCH_MODES:
+            return error_response(
+                'VALIDATION_ERROR',
+                f"match must be one of {', '.join(MATCH_MODES)}",
+                details={'parameter': 'match', 'received': match}
+            )
+        try:
+            page = max(1, int(first_value(payload.get('page'), 1)))
+            page_size = first_value(payload.get('page_size'))
+            page_size = max(1, int(page_size)) if page_size is not None else None
+        except (TypeError, ValueError):
+            return error_response(
+                'VALIDATION_ERROR',
+                'page and page_size must be integers',
+                details={'parameters': ['page', 'page_size']}
+            )
         if hasattr(self._api, '_query_objects_by_type'):
             normalized = self._execute_on_main_thread(
-                lambda: self._api._query_objects_by_type(object_type),
+                lambda: self._api._query_objects_by_type(object_type, match, page, page_size),
                 error_code='QUERY_OBJECTS_FAILED'
             )
             if isinstance(normalized, dict) and normalized.get('success', True) and 'query_type' not in normalized:
@@ -27,6 +27,10 @@ TOOL_CONTRACTS: List[ToolContract] = [
     ToolContract("get_scene", "get_scene", "GET", "worldbuilder_get_scene"),
     ToolContract("scene_status", "scene_status", "GET", "worldbuilder_scene_status"),
     ToolContract("list_elements", "list_elements", "GET", "worldbuilder_list_elements"),
+    ToolContract("browse_scene", "scene/browse", "GET", "worldbuilder_browse_scene"),
+    ToolContract("scene_changes", "scene/changes", "GET", "worldbuilder_get_scene_changes"),
+    ToolContract("export_scene", "scene/export", "GET", "worldbuilder_export_scene"),
+    ToolContract("import_scene", "scene/import", "POST", "worldbuilder_import_scene"),
     ToolContract("batch_info", "batch_info", "GET", "worldbuilder_batch_info"),
     ToolContract("request_status", "request_status", "GET", "worldbuilder_request_status"),
     ToolContract("query_objects_by_type", "query/objects_by_type", "GET", "worldbuilder_query_objects_by_type"),
@@ -0,0 +1,74 @@
+"""
+Event-driven, throttled redraw scheduling for the WorldBuilder window.
+
+Selection events, queue-manager callbacks and stage notices mark parts of the
+window dirty (from any thread); the per-frame update only asks
+:meth:`UIRefreshScheduler.due` which parts to redraw, so an idle editor pays a
+single attribute check per frame and busy scenes redraw at most once per
+``min_interval``.
+"""
+
+import threading
+import time
+from typing import Callable, FrozenSet
+
+API = 'api'
+SCENE = 'scene'
+SELECTION = 'selection'
+ALL_PARTS = frozenset({API, SCENE, SELECTION})
+
+DEFAULT_REFRESH_INTERVAL = 0.5
+# Request counters are bumped by the shared HTTP handler without a callback
+DEFAULT_API_HEARTBEAT = 2.0
+
+
+class UIRefreshScheduler:
+    """Collect dirty window parts and release them at a throttled rate."""
+
+    def __init__(self, min_interval: float = DEFAULT_REFRESH_INTERVAL,
+                 api_heartbeat: float = DEFAULT_API_HEARTBEAT,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            min_interval: Minimum seconds between two redraws
+            api_heartbeat: Seconds after which the API counters are redrawn without an event (0 disables)
+            clock: Monotonic time source
+        """
+        self._min_interval = max(0.0, float(min_interval))
+        self._api_heartbeat = max(0.0, float(api_heartbeat))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._last_redraw = float('-inf')
+        self._last_api_redraw = clock()
+        self._stats = {'marks': 0, 'redraws': 0, 'throttled': 0}
+
+    def mark(self, *parts: str) -> None:
+        """Flag ``parts`` (all parts when none given) for the next redraw; thread-safe."""
+        with self._lock:
+            self._dirty.update(parts or ALL_PARTS)
+            self._stats['marks'] += 1
+
+    def due(self) -> FrozenSet[str]:
+        """Return and clear the parts to redraw now (empty while idle or throttled)."""
+        now = self._clock()
+        if not self._dirty:
+            if not self._api_heartbeat or now - self._last_api_redraw < self._api_heartbeat:
+                return frozenset()
+            self.mark(API)
+        with self._lock:
+            if now - self._last_redraw < self._min_interval:
+                self._stats['throttled'] += 1
+                return frozenset()
+            parts = frozenset(self._dirty)
+            self._dirty.clear()
+            self._last_redraw = now
+            if API in parts:
+                self._last_api_redraw = now
+            self._stats['redraws'] += 1
+            return parts
+
+    def get_stats(self) -> dict:
+        """Return mark/redraw counters."""
+        with self._lock:
+            return {**self._stats, 'pending': sorted(self._dirty)}
@@ -41,6 +41,23 @@ def ensure_vector3(value: Any) -> List[float]:
     raise ValueError("Vector must contain exactly three values")
 
 
+def first_value(value: Any, default: Any = None) -> Any:
+    """Unwrap single-item lists produced by ``parse_qs`` for GET parameters."""
+    if isinstance(value, (list, tuple)):
+        return value[0] if value else default
+    return default if value is None else value
+
+
+def parse_flag(value: Any, default: bool = False) -> bool:
+    """Read a boolean from JSON or a query string value (``true``/``1``/``yes``/``on``)."""
+    value = first_value(value)
+    if value is None or value == '':
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
 def count_world_children(stage_getter: VectorProvider, world_path: str = "/World") -> int:
     """Count direct children beneath the provided world path."""
     try:
@@ -95,6 +112,7 @@ def collect_metrics(
 __all__ = [
     "sanitize_usd_name",
     "ensure_vector3",
+    "first_value",
     "count_world_children",
     "collect_metrics",
 ]
@@ -70,6 +70,7 @@ class WorldSurveyorConfig(WorldExtensionConfig if CONFIG_AVAILABLE else object):
         
         # Waypoint limits
         'max_waypoints': 100,
+        'import_chunk_size': 1000,  # Waypoints inserted per import transaction
         
         # Rate limiting
         'rate_limit_max_requests': 100,
@@ -103,9 +104,24 @@ class WorldSurveyorConfig(WorldExtensionConfig if CONFIG_AVAILABLE else object):
         
         # Waypoint visualization
         'auto_load_waypoints': True,       # Auto-load stored waypoints on startup
+        'marker_lod_enabled': True,        # Cull and thin markers against the active camera
+        'marker_max_visible': 20000,       # Nearest markers drawn at most (0 = no cap)
+        'marker_frustum_culling': True,
+        'marker_lod_distance': 50.0,       # Markers beyond this distance shrink and cluster
+        'marker_lod_min_size_scale': 0.25,
+        'marker_cluster_cell_size': 1.0,   # Cell size at marker_lod_distance (0 = no clustering)
+        'marker_camera_move_threshold': 0.5,    # World units the camera moves before markers update
+        'marker_camera_rotate_threshold': 2.0,  # Degrees the camera turns before markers update
         
         # Database
         'database_path': None,             # Database file path (None = use default)
+        'database_journal_mode': 'wal',    # WAL lets readers run alongside a writer
+        'database_synchronous': 'normal',  # NORMAL is durable across app crashes in WAL mode
+        'database_cache_size_kb': 16384,   # Page cache per connection
+        'database_mmap_size': 268435456,   # Bytes of the database file memory-mapped for reads
+        'database_temp_store': 'memory',
+        'database_busy_timeout_ms': 5000,
+        'database_statement_cache_size': 256,  # Prepared statements kept per connection
     }
     
     def __init__(self, config_file: str = None):
@@ -187,6 +203,10 @@ class WorldSurveyorConfig(WorldExtensionConfig if CONFIG_AVAILABLE else object):
     @property
     def max_waypoints(self) -> int:
         return self.get('max_waypoints', 100)
+
+    @property
+    def import_chunk_size(self) -> int:
+        return int(self.get('import_chunk_size', 1000))
     
     # Rate limiting properties
     @property
@@ -254,12 +274,72 @@ class WorldSurveyorConfig(WorldExtensionConfig if CONFIG_AVAILABLE else object):
     @property
     def auto_load_waypoints(self) -> bool:
         return self.get('auto_load_waypoints', True)
+
+    @property
+    def marker_lod_enabled(self) -> bool:
+        return self.get('marker_lod_enabled', True)
+
+    @property
+    def marker_max_visible(self) -> int:
+        return int(self.get('marker_max_visible', 20000))
+
+    @property
+    def marker_frustum_culling(self) -> bool:
+        return self.get('marker_frustum_culling', True)
+
+    @property
+    def marker_lod_distance(self) -> float:
+        return float(self.get('marker_lod_distance', 50.0))
+
+    @property
+    def marker_lod_min_size_scale(self) -> float:
+        return float(self.get('marker_lod_min_size_scale', 0.25))
+
+    @property
+    def marker_cluster_cell_size(self) -> float:
+        return float(self.get('marker_cluster_cell_size', 1.0))
+
+    @property
+    def marker_camera_move_threshold(self) -> float:
+        return float(self.get('marker_camera_move_threshold', 0.5))
+
+    @property
+    def marker_camera_rotate_threshold(self) -> float:
+        return float(self.get('marker_camera_rotate_threshold', 2.0))
     
     # Database properties
     @property
     def database_path(self):
         return self.get('database_path', None)
 
+    @property
+    def database_journal_mode(self) -> str:
+        return self.get('database_journal_mode', 'wal')
+
+    @property
+    def database_synchronous(self) -> str:
+        return self.get('database_synchronous', 'normal')
+
+    @property
+    def database_cache_size_kb(self) -> int:
+        return int(self.get('database_cache_size_kb', 16384))
+
+    @property
+    def database_mmap_size(self) -> int:
+        return int(self.get('database_mmap_size', 268435456))
+
+    @property
+    def database_temp_store(self) -> str:
+        return self.get('database_temp_store', 'memory')
+
+    @property
+    def database_busy_timeout_ms(self) -> int:
+        return int(self.get('database_busy_timeout_ms', 5000))
+
+    @property
+    def database_statement_cache_size(self) -> int:
+        return int(self.get('database_statement_cache_size', 256))
+
     # Waypoint Types Configuration
     def _load_waypoint_types(self) -> List[Dict]:
         """Load waypoint types from external JSON configuration file."""
@@ -191,6 +191,9 @@ class AgentWorldSurveyorExtension(omni.ext.IExt):
                 """Process queued camera operations on main thread"""
                 if self._http_api:
                     self._http_api.process_queued_operations()
+                # At most one debug_draw batch per frame for marker edits
+                if self._waypoint_manager:
+                    self._waypoint_manager.flush_markers()
                 # Update UI roughly every 1s (assuming ~100ms tick)
                 if hasattr(self, '_ui_update_counter'):
                     self._ui_update_counter += 1
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
 from agentworld_core.logging import module_logger
 
@@ -48,9 +48,18 @@ class WorldSurveyorController:
     def create_waypoint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._safe_call('create_waypoint', lambda: self._service.create_waypoint(payload), 'CREATE_WAYPOINT_FAILED')
 
+    def create_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call('create_waypoints', lambda: self._service.create_waypoints(payload), 'CREATE_WAYPOINTS_FAILED')
+
     def list_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._safe_call('list_waypoints', lambda: self._service.list_waypoints(payload), 'LIST_WAYPOINTS_FAILED')
 
+    def nearest_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call('nearest_waypoints', lambda: self._service.nearest_waypoints(payload), 'NEAREST_WAYPOINTS_FAILED')
+
+    def waypoints_in_bounds(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call('waypoints_in_bounds', lambda: self._service.waypoints_in_bounds(payload), 'WAYPOINTS_IN_BOUNDS_FAILED')
+
     def update_waypoint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._safe_call('update_waypoint', lambda: self._service.update_waypoint(payload), 'UPDATE_WAYPOINT_FAILED')
 
@@ -69,6 +78,9 @@ class WorldSurveyorController:
     def import_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._safe_call('import_waypoints', lambda: self._service.import_waypoints(payload), 'IMPORT_WAYPOINTS_FAILED')
 
+    def get_import_status(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._safe_call('get_import_status', lambda: self._service.get_import_status(payload), 'IMPORT_STATUS_FAILED')
+
     def goto_waypoint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._safe_call('goto_waypoint', lambda: self._service.goto_waypoint(payload), 'GOTO_WAYPOINT_FAILED')
 
@@ -94,8 +106,8 @@ class WorldSurveyorController:
     def clear_groups(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._safe_call('clear_groups', lambda: self._service.clear_groups(payload), 'CLEAR_GROUPS_FAILED')
 
-    def group_hierarchy(self) -> Dict[str, Any]:
-        return self._safe_call('group_hierarchy', self._service.group_hierarchy, 'GROUP_HIERARCHY_FAILED')
+    def group_hierarchy(self, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._safe_call('group_hierarchy', lambda: self._service.group_hierarchy(payload), 'GROUP_HIERARCHY_FAILED')
 
     def add_waypoint_to_groups(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._safe_call('add_waypoint_to_groups', lambda: self._service.add_waypoint_to_groups(payload), 'ADD_WAYPOINT_TO_GROUPS_FAILED')
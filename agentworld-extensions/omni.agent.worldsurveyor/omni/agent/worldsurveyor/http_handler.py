@@ -41,13 +41,17 @@ class WorldSurveyorHTTPHandler(WorldHTTPHandler):
             'waypoint_manager.html': self._handle_ui,
             'waypoints': self._route_waypoints_summary,
             'waypoints/create': self._route_create_waypoint,
+            'waypoints/create_bulk': self._route_create_waypoints,
             'waypoints/list': self._route_list_waypoints,
+            'waypoints/nearest': self._route_nearest_waypoints,
+            'waypoints/in_bounds': self._route_waypoints_in_bounds,
             'waypoints/update': self._route_update_waypoint,
             'waypoints/remove': self._route_remove_waypoint,
             'waypoints/remove_selected': self._route_remove_selected,
             'waypoints/clear': self._route_clear_waypoints,
             'waypoints/export': self._route_export_waypoints,
             'waypoints/import': self._route_import_waypoints,
+            'waypoints/import_status': self._route_import_status,
             'waypoints/goto': self._route_goto_waypoint,
             'groups': self._route_groups_summary,
             'groups/create': self._route_create_group,
@@ -79,10 +83,25 @@ class WorldSurveyorHTTPHandler(WorldHTTPHandler):
             raise MethodNotAllowed('waypoints/create requires POST', details={'method': method})
         return self.controller.create_waypoint(data or {})
 
+    def _route_create_waypoints(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        if method != 'POST':
+            raise MethodNotAllowed('waypoints/create_bulk requires POST', details={'method': method})
+        return self.controller.create_waypoints(data or {})
+
     def _route_list_waypoints(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if method != 'GET':
             raise MethodNotAllowed('waypoints/list requires GET', details={'method': method})
-        return self.controller.list_waypoints(self._normalize_query_params(data))
+        return self._conditional_read(self.controller.list_waypoints, self._normalize_query_params(data))
+
+    def _route_nearest_waypoints(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        if method != 'GET':
+            raise MethodNotAllowed('waypoints/nearest requires GET', details={'method': method})
+        return self.controller.nearest_waypoints(self._normalize_query_params(data))
+
+    def _route_waypoints_in_bounds(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        if method != 'GET':
+            raise MethodNotAllowed('waypoints/in_bounds requires GET', details={'method': method})
+        return self.controller.waypoints_in_bounds(self._normalize_query_params(data))
 
     def _route_update_waypoint(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if method != 'POST':
@@ -112,8 +131,16 @@ class WorldSurveyorHTTPHandler(WorldHTTPHandler):
     def _route_import_waypoints(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if method != 'POST':
             raise MethodNotAllowed('waypoints/import requires POST', details={'method': method})
+        if data and '_upload' in data:
+            # Streamed uploads carry their options in the query string
+            data = self._normalize_query_params(data)
         return self.controller.import_waypoints(data or {})
 
+    def _route_import_status(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        if method != 'GET':
+            raise MethodNotAllowed('waypoints/import_status requires GET', details={'method': method})
+        return self.controller.get_import_status(self._normalize_query_params(data))
+
     def _route_goto_waypoint(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if method != 'POST':
             raise MethodNotAllowed('waypoints/goto requires POST', details={'method': method})
@@ -157,7 +184,7 @@ class WorldSurveyorHTTPHandler(WorldHTTPHandler):
     def _route_group_hierarchy(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if method != 'GET':
             raise MethodNotAllowed('groups/hierarchy requires GET', details={'method': method})
-        return self.controller.group_hierarchy()
+        return self._conditional_read(self.controller.group_hierarchy, self._normalize_query_params(data))
 
     def _route_add_waypoint_to_groups(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
         if method != 'POST':
@@ -214,6 +241,25 @@ class WorldSurveyorHTTPHandler(WorldHTTPHandler):
                 normalized[key] = value
         return normalized
 
+    def _conditional_read(self, read, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve a versioned read with an ETag; a matching If-None-Match gets 304 without running the query."""
+        headers = getattr(self, 'headers', None)
+        if_none_match = headers.get('If-None-Match') if headers is not None else None
+        if if_none_match and not params.get('if_version'):
+            params = dict(params, if_version=if_none_match)
+        response = read(params)
+        version = response.get('version') if isinstance(response, dict) else None
+        if version:
+            response['_headers'] = {
+                'ETag': f'"{version}"',
+                # Browsers revalidate with If-None-Match instead of reusing a stale copy
+                'Cache-Control': 'no-cache',
+                'Access-Control-Expose-Headers': 'ETag',
+            }
+            if if_none_match and response.get('not_modified'):
+                response['_status_code'] = 304
+        return response
+
     def _handle_ui(self, method: str, data: Dict[str, Any]) -> Dict[str, Any]:
         static_path = Path(__file__).parent / 'static' / 'waypoint_manager.html'
         try:
@@ -0,0 +1,224 @@
+"""
+Incremental parsing of waypoint imports and import progress tracking.
+
+Import bodies are read a block at a time and turned into records without
+materializing the whole document. Three layouts are accepted:
+
+- an export document ``{"waypoints": [...], "groups": [...], ...}``
+- a JSON array of waypoint objects
+- NDJSON with one waypoint object per line; a line holding
+  ``{"groups": [...]}`` contributes a group hierarchy
+
+Records are ``('waypoint', dict)`` or ``('groups', list)`` tuples consumed by
+:meth:`WaypointDatabase.import_records`.
+"""
+
+import codecs
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+ImportRecord = Tuple[str, Any]
+
+IMPORT_MERGE_MODES = ('replace', 'merge')
+IMPORT_STATES = ('pending', 'running', 'completed', 'failed')
+DEFAULT_READ_SIZE = 64 * 1024
+# A single waypoint or group hierarchy larger than this is treated as malformed input
+MAX_RECORD_BYTES = 16 * 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\r\n'
+
+
+class ImportFormatError(ValueError):
+    """Raised when an import body is not a JSON document, array or NDJSON stream."""
+
+
+class ImportInProgress(RuntimeError):
+    """Raised when an import is requested while another one is still running."""
+
+
+class JsonRecordReader:
+    """Pull waypoint and group records out of a JSON or NDJSON stream."""
+
+    def __init__(self, source: IO, read_size: int = DEFAULT_READ_SIZE, max_record_bytes: int = MAX_RECORD_BYTES):
+        self._source = source
+        self._read_size = read_size
+        self._max_record_bytes = max_record_bytes
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self.bytes_read = 0
+
+    def records(self) -> Iterator[ImportRecord]:
+        """Yield records for every top-level value in the stream."""
+        while True:
+            char = self._peek()
+            if not char:
+                return
+            if char == '[':
+                self._pos += 1
+                for item in self._array_items():
+                    yield 'waypoint', item
+            elif char == '{':
+                yield from self._object_records()
+            else:
+                raise ImportFormatError(f"Unexpected {char!r} at top level; expected an object or array")
+
+    def _fill(self) -> bool:
+        """Append the next block of input to the buffer; False once the source is exhausted."""
+        if self._eof:
+            return False
+        chunk = self._source.read(self._read_size)
+        if isinstance(chunk, bytes):
+            self.bytes_read += len(chunk)
+            text = self._decoder.decode(chunk, final=not chunk)
+        else:
+            self.bytes_read += len(chunk or '')
+            text = chunk or ''
+        if not chunk:
+            self._eof = True
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += text
+        return bool(chunk)
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or '' at end of input."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise ImportFormatError(f"Expected {char!r} but found {found or 'end of input'!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode one complete JSON value at the current position."""
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._eof:
+                    raise ImportFormatError(f"Invalid JSON: {exc.msg}") from exc
+                value, end = None, None
+            # A number touching the end of the buffer may continue in the next block
+            if end is not None and (end < len(self._buffer) or self._eof):
+                self._pos = end
+                return value
+            if len(self._buffer) - self._pos > self._max_record_bytes:
+                raise ImportFormatError(f"Import record exceeds {self._max_record_bytes} bytes")
+            self._fill()
+
+    def _array_items(self) -> Iterator[Any]:
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            char = self._peek()
+            self._pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise ImportFormatError(f"Expected ',' or ']' in array but found {char or 'end of input'!r}")
+
+    def _object_records(self) -> Iterator[ImportRecord]:
+        """Stream the ``waypoints`` array of a document, or yield a lone waypoint object."""
+        self._expect('{')
+        fields: Dict[str, Any] = {}
+        is_document = False
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ImportFormatError("Object keys must be strings")
+            self._expect(':')
+            if key == 'waypoints' and self._peek() == '[':
+                is_document = True
+                self._pos += 1
+                for item in self._array_items():
+                    yield 'waypoint', item
+            else:
+                fields[key] = self._value()
+            char = self._peek()
+            self._pos += 1
+            if char == '}':
+                break
+            if char != ',':
+                raise ImportFormatError(f"Expected ',' or '}}' in object but found {char or 'end of input'!r}")
+
+        if is_document or 'groups' in fields:
+            if isinstance(fields.get('groups'), list) and fields['groups']:
+                yield 'groups', fields['groups']
+        else:
+            yield 'waypoint', fields
+
+
+def iter_document_records(data: Dict[str, Any]) -> Iterator[ImportRecord]:
+    """Records for an already parsed export document, groups first."""
+    if data.get('groups'):
+        yield 'groups', data['groups']
+    for waypoint in data.get('waypoints') or []:
+        yield 'waypoint', waypoint
+
+
+@dataclass
+class ImportStatus:
+    """Progress handle for one import, polled through ``waypoints/import_status``."""
+
+    merge_mode: str
+    import_id: str = field(default_factory=lambda: f"imp_{uuid.uuid4().hex[:8]}")
+    state: str = 'pending'
+    total_bytes: Optional[int] = None
+    bytes_read: int = 0
+    waypoints_imported: int = 0
+    groups_imported: int = 0
+    chunks_committed: int = 0
+    errors: int = 0
+    error_samples: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def record_row_error(self, message: str, limit: int = 10):
+        self.errors += 1
+        if len(self.error_samples) < limit:
+            self.error_samples.append(message)
+
+    def finish(self, error: Optional[Union[str, BaseException]] = None):
+        self.state = 'failed' if error else 'completed'
+        self.error = str(error) if error else None
+        self.finished_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        end = self.finished_at or time.time()
+        payload['elapsed_seconds'] = round(end - self.started_at, 3)
+        if self.total_bytes:
+            payload['progress'] = round(min(1.0, self.bytes_read / self.total_bytes), 4)
+        return payload
+
+
+__all__ = [
+    'IMPORT_MERGE_MODES',
+    'IMPORT_STATES',
+    'ImportFormatError',
+    'ImportInProgress',
+    'ImportStatus',
+    'JsonRecordReader',
+    'iter_document_records',
+]
@@ -0,0 +1,222 @@
+"""
+Preallocated marker arrays backing the waypoint debug-draw markers.
+
+Each waypoint owns one slot in parallel NumPy arrays (position, point size,
+visibility). The position and color tuples handed to debug_draw are kept in
+lists with the same slots, so a redraw copies references instead of
+converting arrays row by row. Removing a waypoint moves the last slot into
+the hole, so the live markers always occupy ``[0, len)``. debug_draw cannot erase
+single points, so the buffers track what the viewport already shows: slots
+appended since the last draw are pushed as a range, while edits to drawn slots
+mark the whole set for one redraw.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_MARKER_CAPACITY = 1024
+
+MarkerSelector = Callable[[np.ndarray, np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass
+class MarkerDraw:
+    """Points to push to debug_draw; ``full`` means clear the existing points first."""
+
+    full: bool
+    positions: List[Tuple[float, float, float]]
+    colors: List[Tuple[float, float, float, float]]
+    sizes: List[float]
+
+
+class MarkerBuffers:
+    """Marker attributes in preallocated arrays with stable slots per waypoint id."""
+
+    def __init__(self, capacity: int = DEFAULT_MARKER_CAPACITY):
+        capacity = max(1, int(capacity))
+        self._positions = np.zeros((capacity, 3), dtype=np.float32)
+        self._sizes = np.zeros(capacity, dtype=np.float32)
+        self._visible = np.zeros(capacity, dtype=bool)
+        self._ids: List[str] = []
+        self._points: List[Tuple[float, float, float]] = []
+        self._colors: List[Tuple[float, float, float, float]] = []
+        self._slots: Dict[str, int] = {}
+        # Slots below the watermark are on screen; needs_redraw means the screen is stale
+        self._drawn = 0
+        self.needs_redraw = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, waypoint_id: str) -> bool:
+        return waypoint_id in self._slots
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._sizes)
+
+    @property
+    def has_pending(self) -> bool:
+        return self.needs_redraw or self._drawn < len(self._ids)
+
+    def _reserve(self, count: int):
+        if count <= self.capacity:
+            return
+        capacity = max(count, self.capacity * 2)
+        for name in ('_positions', '_sizes', '_visible'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(self._ids)] = old[:len(self._ids)]
+            setattr(self, name, new)
+
+    def upsert(self, waypoint_id: str, position: Sequence[float], color: Sequence[float],
+               size: float, visible: bool = True):
+        """Add a marker, or update it in place when the waypoint already has a slot."""
+        position = tuple(position)
+        color = tuple(color)
+        slot = self._slots.get(waypoint_id)
+        if slot is None:
+            self._reserve(len(self._ids) + 1)
+            slot = len(self._ids)
+            self._ids.append(waypoint_id)
+            self._points.append(position)
+            self._colors.append(color)
+            self._slots[waypoint_id] = slot
+        elif (self._points[slot] == position and self._colors[slot] == color
+              and self._sizes[slot] == np.float32(size) and self._visible[slot] == visible):
+            return
+        else:
+            if slot < self._drawn:
+                self.needs_redraw = True
+            self._points[slot] = position
+            self._colors[slot] = color
+        self._positions[slot] = position
+        self._sizes[slot] = size
+        self._visible[slot] = visible
+
+    def extend(self, waypoint_ids: Sequence[str], positions: Sequence[Sequence[float]],
+               colors: Sequence[Sequence[float]], sizes: Sequence[float], visible: Sequence[bool]):
+        """Append markers for waypoints that have no slot yet in one array copy."""
+        start = len(self._ids)
+        end = start + len(waypoint_ids)
+        if end == start:
+            return
+        self._reserve(end)
+        self._points.extend(tuple(position) for position in positions)
+        self._colors.extend(tuple(color) for color in colors)
+        self._positions[start:end] = self._points[start:end]
+        self._sizes[start:end] = sizes
+        self._visible[start:end] = visible
+        for offset, waypoint_id in enumerate(waypoint_ids):
+            self._slots[waypoint_id] = start + offset
+        self._ids.extend(waypoint_ids)
+
+    def reset(self, entries: Iterable[Tuple[str, Sequence[float], Sequence[float], float, bool]]):
+        """Replace every marker with ``(id, position, color, size, visible)`` entries."""
+        self.clear()
+        rows = list(entries)
+        if rows:
+            ids, positions, colors, sizes, visible = zip(*rows)
+            self.extend(ids, positions, colors, sizes, visible)
+
+    def remove(self, waypoint_id: str) -> bool:
+        """Drop a marker by moving the last slot into its place."""
+        slot = self._slots.pop(waypoint_id, None)
+        if slot is None:
+            return False
+        last = len(self._ids) - 1
+        if slot < self._drawn:
+            self.needs_redraw = True
+        if slot != last:
+            moved = self._ids[last]
+            self._ids[slot] = moved
+            self._slots[moved] = slot
+            self._points[slot] = self._points[last]
+            self._colors[slot] = self._colors[last]
+            for array in (self._positions, self._sizes, self._visible):
+                array[slot] = array[last]
+        self._ids.pop()
+        self._points.pop()
+        self._colors.pop()
+        self._drawn = min(self._drawn, len(self._ids))
+        return True
+
+    def clear(self):
+        if self._drawn:
+            self.needs_redraw = True
+        self._ids.clear()
+        self._points.clear()
+        self._colors.clear()
+        self._slots.clear()
+        self._drawn = 0
+
+    def set_visible(self, waypoint_id: str, visible: bool):
+        slot = self._slots.get(waypoint_id)
+        if slot is None or self._visible[slot] == visible:
+            return
+        self._visible[slot] = visible
+        if slot < self._drawn:
+            self.needs_redraw = True
+
+    def apply_visibility(self, is_visible: Callable[[str], bool]):
+        """Recompute every slot's visibility, e.g. after entering or leaving selective mode."""
+        count = len(self._ids)
+        visible = np.fromiter((is_visible(waypoint_id) for waypoint_id in self._ids), dtype=bool, count=count)
+        if not np.array_equal(visible[:self._drawn], self._visible[:self._drawn]):
+            self.needs_redraw = True
+        self._visible[:count] = visible
+
+    def visible_count(self) -> int:
+        return int(np.count_nonzero(self._visible[:len(self._ids)]))
+
+    def invalidate(self):
+        """Force the next draw to repaint everything, e.g. after the points were cleared externally."""
+        self.needs_redraw = True
+
+    def take_pending(self, select: Optional[MarkerSelector] = None) -> Optional[MarkerDraw]:
+        """
+        Points that changed since the last call, or None when the screen is current.
+
+        ``select`` maps ``(positions, sizes, visible)`` of the live slots to the
+        slots to draw and their sizes; with a selector every draw is a repaint.
+        """
+        count = len(self._ids)
+        if not self.needs_redraw and self._drawn >= count:
+            return None
+        if select is not None:
+            self.needs_redraw = True
+            selected, sizes = select(self._positions[:count], self._sizes[:count], self._visible[:count])
+            slots = selected.tolist()
+            positions = [self._points[slot] for slot in slots]
+            colors = [self._colors[slot] for slot in slots]
+            sizes = sizes.tolist()
+        else:
+            start = 0 if self.needs_redraw else self._drawn
+            visible = self._visible[start:count]
+            if visible.all():
+                positions, colors = self._points[start:count], self._colors[start:count]
+            else:
+                slots = (np.flatnonzero(visible) + start).tolist()
+                positions = [self._points[slot] for slot in slots]
+                colors = [self._colors[slot] for slot in slots]
+            sizes = self._sizes[start:count][visible].tolist()
+        draw = MarkerDraw(full=self.needs_redraw, positions=positions, colors=colors, sizes=sizes)
+        self._drawn = count
+        self.needs_redraw = False
+        return draw
+
+    def get(self, waypoint_id: str) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...], float, bool]]:
+        """Stored (position, color, size, visible) for a waypoint."""
+        slot = self._slots.get(waypoint_id)
+        if slot is None:
+            return None
+        return self._points[slot], self._colors[slot], float(self._sizes[slot]), bool(self._visible[slot])
+
+
+__all__ = ['DEFAULT_MARKER_CAPACITY', 'MarkerBuffers', 'MarkerDraw', 'MarkerSelector']
@@ -0,0 +1,138 @@
+"""
+View-dependent selection of waypoint markers.
+
+Given the active camera, :func:`select_markers` culls markers outside the
+view frustum, shrinks markers beyond ``lod_distance`` and merges distant
+markers that share a grid cell (cells double in size each time the distance
+doubles), then keeps the ``max_visible`` nearest. Matrices use the USD
+row-vector convention: ``clip = [x, y, z, 1] @ view @ projection``.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+import numpy as np
+
+# Markers slightly outside the frustum stay drawn so their points do not pop at the edges
+FRUSTUM_MARGIN = 0.05
+_CELL_HASH_MULTIPLIER = np.int64(1_000_003)
+
+
+@dataclass
+class MarkerLodSettings:
+    """Marker LOD configuration, read from the ``marker_*`` config keys."""
+
+    enabled: bool = True
+    max_visible: int = 20000
+    frustum_culling: bool = True
+    lod_distance: float = 50.0
+    min_size_scale: float = 0.25
+    cluster_cell_size: float = 1.0
+    camera_move_threshold: float = 0.5
+    camera_rotate_threshold: float = 2.0
+
+    @classmethod
+    def from_config(cls, config) -> 'MarkerLodSettings':
+        return cls(
+            enabled=bool(config.marker_lod_enabled),
+            max_visible=max(0, int(config.marker_max_visible)),
+            frustum_culling=bool(config.marker_frustum_culling),
+            lod_distance=max(0.0, float(config.marker_lod_distance)),
+            min_size_scale=min(1.0, max(0.0, float(config.marker_lod_min_size_scale))),
+            cluster_cell_size=max(0.0, float(config.marker_cluster_cell_size)),
+            camera_move_threshold=max(0.0, float(config.marker_camera_move_threshold)),
+            camera_rotate_threshold=max(0.0, float(config.marker_camera_rotate_threshold)),
+        )
+
+
+@dataclass
+class CameraView:
+    """Camera position, viewing direction and world-to-clip matrix."""
+
+    position: np.ndarray
+    forward: np.ndarray
+    projection: np.ndarray
+    view_projection: np.ndarray
+
+    @classmethod
+    def from_matrices(cls, view: Any, projection: Any) -> 'CameraView':
+        """Build from world-to-camera and projection matrices (``Gf.Matrix4d`` or nested sequences)."""
+        view = _as_matrix(view)
+        projection = _as_matrix(projection)
+        camera_to_world = np.linalg.inv(view)
+        # Cameras look down their local -Z axis
+        forward = -camera_to_world[2, :3]
+        norm = np.linalg.norm(forward)
+        return cls(
+            position=camera_to_world[3, :3].copy(),
+            forward=forward / norm if norm else forward,
+            projection=projection,
+            view_projection=view @ projection,
+        )
+
+    def moved_from(self, other: 'CameraView', settings: MarkerLodSettings) -> bool:
+        """Whether this view differs from ``other`` by more than the configured thresholds."""
+        if np.linalg.norm(self.position - other.position) > settings.camera_move_threshold:
+            return True
+        cos_angle = float(np.clip(np.dot(self.forward, other.forward), -1.0, 1.0))
+        if math.degrees(math.acos(cos_angle)) > settings.camera_rotate_threshold:
+            return True
+        # Zoom and viewport resizes change the projection only
+        return not np.allclose(self.projection, other.projection, rtol=1e-3, atol=1e-6)
+
+
+def _as_matrix(matrix: Any) -> np.ndarray:
+    return np.array([[float(matrix[row][col]) for col in range(4)] for row in range(4)])
+
+
+def select_markers(
+    positions: np.ndarray,
+    sizes: np.ndarray,
+    candidates: np.ndarray,
+    view: CameraView,
+    settings: MarkerLodSettings,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Slots to draw for ``view`` and their point sizes, in slot order."""
+    slots = np.flatnonzero(candidates)
+    points = positions[slots].astype(np.float64)
+
+    if settings.frustum_culling and slots.size:
+        clip = points @ view.view_projection[:3] + view.view_projection[3]
+        w = clip[:, 3]
+        limit = w * (1.0 + FRUSTUM_MARGIN)
+        inside = (w > 0.0) & (np.abs(clip[:, 0]) <= limit) & (np.abs(clip[:, 1]) <= limit)
+        slots, points = slots[inside], points[inside]
+
+    distance = np.linalg.norm(points - view.position, axis=1)
+    scale = np.ones(slots.size)
+    if settings.lod_distance > 0.0 and slots.size:
+        far = distance > settings.lod_distance
+        scale[far] = np.maximum(settings.lod_distance / distance[far], settings.min_size_scale)
+        if settings.cluster_cell_size > 0.0 and far.any():
+            keep = _cluster_representatives(points[far], distance[far], settings)
+            retained = ~far
+            retained[np.flatnonzero(far)[keep]] = True
+            slots, distance, scale = slots[retained], distance[retained], scale[retained]
+
+    if settings.max_visible and slots.size > settings.max_visible:
+        nearest = np.sort(np.argpartition(distance, settings.max_visible - 1)[:settings.max_visible])
+        slots, scale = slots[nearest], scale[nearest]
+
+    return slots, sizes[slots] * scale
+
+
+def _cluster_representatives(points: np.ndarray, distance: np.ndarray, settings: MarkerLodSettings) -> np.ndarray:
+    """Index of one marker per occupied cell; cells double in size with each doubling of distance."""
+    band = np.floor(np.log2(distance / settings.lod_distance)).astype(np.int64)
+    cell = settings.cluster_cell_size * np.exp2(band)
+    coords = np.floor(points / cell[:, None]).astype(np.int64)
+    # One int64 key per cell; a rare hash collision only merges two distant markers
+    keys = band
+    for axis in range(3):
+        keys = keys * _CELL_HASH_MULTIPLIER + coords[:, axis]
+    _, first = np.unique(keys, return_index=True)
+    return first
+
+
+__all__ = ['CameraView', 'FRUSTUM_MARGIN', 'MarkerLodSettings', 'select_markers']
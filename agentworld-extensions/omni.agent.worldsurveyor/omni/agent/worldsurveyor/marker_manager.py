@@ -1,11 +1,22 @@
 """
 Visual marker management for waypoints in 3D scene.
+
+Marker attributes live in :class:`MarkerBuffers`. Edits only touch the
+buffers; :meth:`WaypointMarkerManager.flush` pushes the pending points to
+debug_draw once per frame from the extension's main-thread update tick.
+With marker LOD enabled the drawn set also depends on the camera
+(see :mod:`.marker_lod`) and is recomputed when the camera moves past the
+configured thresholds.
 """
 
 import logging
-from typing import Any, Dict, Tuple
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from isaacsim.util.debug_draw import _debug_draw
+from .config import get_config
+from .marker_buffers import MarkerBuffers
+from .marker_lod import CameraView, MarkerLodSettings, select_markers
 from .models import Waypoint
 from .ui.waypoint_types import get_waypoint_type_behavior, get_waypoint_type_color, get_waypoint_type_marker_size
 
@@ -16,7 +27,12 @@ class WaypointMarkerManager:
     """Manages visual debug markers for waypoints in 3D scene."""
     
     def __init__(self):
-        self._markers = {}  # waypoint_id -> marker info
+        self._buffers = MarkerBuffers()
+        self._buffer_lock = threading.Lock()  # Edits come from HTTP threads, draws from the main thread
+        self._styles: Dict[str, Tuple[Tuple[float, float, float, float], float]] = {}  # waypoint_type -> (color, size)
+        self._lod = MarkerLodSettings.from_config(get_config())
+        self._camera_view: Optional[CameraView] = None  # View the drawn markers were selected for
+        self._drawn_markers = 0
         self._debug_draw = None
         self._markers_visible = True
         self._hidden_markers = set()  # Track individually hidden markers
@@ -31,98 +47,111 @@ class WaypointMarkerManager:
             except Exception as e:
                 logger.debug(f"Could not get debug draw interface: {e}")
         return self._debug_draw
-    
-    def add_waypoint_marker(self, waypoint_id: str, position: Tuple[float, float, float], waypoint_type: str):
-        """Add a visual marker for a waypoint."""
-        debug_draw = self._get_debug_draw()
-        if not debug_draw:
-            return
-            
-        try:
-            # Get color from waypoint type configuration
-            rgb_color = get_waypoint_type_color(waypoint_type)
+
+    def _style(self, waypoint_type: str) -> Tuple[Tuple[float, float, float, float], float]:
+        """RGBA color and point size for a waypoint type, looked up once per type."""
+        style = self._styles.get(waypoint_type)
+        if style is None:
             # Convert RGB [0-1] to RGBA tuple for debug draw
+            rgb_color = get_waypoint_type_color(waypoint_type)
             color = (rgb_color[0], rgb_color[1], rgb_color[2], 1.0)
+            style = self._styles[waypoint_type] = (color, get_waypoint_type_marker_size(waypoint_type))
+        return style
 
-            # Draw points with configurable sizes
-            marker_size = get_waypoint_type_marker_size(waypoint_type)
-            debug_draw.draw_points([position], [color], [marker_size])
-                
-            # Store marker info
-            self._markers[waypoint_id] = {
-                'position': position,
-                'type': waypoint_type,
-                'color': color
-            }
-            
-            logger.info(f"Added debug marker for waypoint {waypoint_id} at {position}")
-            
-        except Exception as e:
-            logger.error(f"Failed to add waypoint marker: {e}")
+    def _marker_entry(self, waypoint_id: str, position: Tuple[float, float, float], waypoint_type: str):
+        color, size = self._style(waypoint_type)
+        return waypoint_id, position, color, size, self.is_individual_marker_visible(waypoint_id)
     
+    def add_waypoint_marker(self, waypoint_id: str, position: Tuple[float, float, float], waypoint_type: str):
+        """Add or move the visual marker for a waypoint; drawn on the next flush."""
+        with self._buffer_lock:
+            self._buffers.upsert(*self._marker_entry(waypoint_id, position, waypoint_type))
+    
+    def add_waypoint_markers(self, waypoints: List['Waypoint']):
+        """Add visual markers for several new waypoints; they are drawn as one appended range."""
+        entries = [self._marker_entry(wp.id, wp.position, wp.waypoint_type) for wp in waypoints]
+        with self._buffer_lock:
+            new_entries = [entry for entry in entries if entry[0] not in self._buffers]
+            for entry in entries:
+                if entry[0] in self._buffers:
+                    self._buffers.upsert(*entry)
+            if new_entries:
+                self._buffers.extend(*zip(*new_entries))
+
+    def update_waypoint_marker(self, waypoint: 'Waypoint'):
+        """Sync a marker with an edited waypoint; unchanged markers cause no redraw."""
+        self.add_waypoint_marker(waypoint.id, waypoint.position, waypoint.waypoint_type)
+
     def remove_waypoint_marker(self, waypoint_id: str):
-        """Remove a waypoint marker (markers auto-expire, so just remove from tracking)."""
-        if waypoint_id in self._markers:
-            del self._markers[waypoint_id]
-            logger.info(f"Removed marker tracking for waypoint {waypoint_id}")
+        """Remove a waypoint marker."""
+        self.remove_waypoint_markers([waypoint_id])
+
+    def remove_waypoint_markers(self, waypoint_ids: Iterable[str]):
+        """Remove several waypoint markers with one redraw on the next flush."""
+        with self._buffer_lock:
+            removed = sum(1 for waypoint_id in waypoint_ids if self._buffers.remove(waypoint_id))
+        if removed:
+            logger.debug(f"Removed {removed} waypoint markers")
+
+    def clear_markers(self):
+        """Remove every marker."""
+        with self._buffer_lock:
+            self._buffers.clear()
     
     def refresh_all_markers_batched(self, waypoints: Dict[str, 'Waypoint']):
-        """Refresh all waypoint markers with batched drawing for better performance."""
-        debug_draw = self._get_debug_draw()
-        if not debug_draw:
+        """Rebuild all markers from ``waypoints`` and repaint them on the next flush."""
+        self._styles.clear()  # Pick up edited waypoint type colors and sizes
+        entries = [self._marker_entry(wp_id, wp.position, wp.waypoint_type) for wp_id, wp in waypoints.items()]
+        with self._buffer_lock:
+            self._buffers.reset(entries)
+            self._buffers.invalidate()
+
+    @property
+    def lod_enabled(self) -> bool:
+        return self._lod.enabled
+
+    def update_camera(self, view: Optional[CameraView]):
+        """Reselect markers on the next flush if the camera moved past the LOD thresholds."""
+        if not self._lod.enabled or view is None:
             return
-            
-        # Clear existing debug points first
-        try:
-            debug_draw.clear_points()
-        except Exception as e:
-            logger.debug(f"Error clearing debug points: {e}")
-            
-        # Clear tracking and prepare batch data
-        self._markers.clear()
-        
-        if not self._markers_visible:
+        with self._buffer_lock:
+            if self._camera_view is None or view.moved_from(self._camera_view, self._lod):
+                self._camera_view = view
+                self._buffers.invalidate()
+
+    def _select_for_camera(self, positions, sizes, visible):
+        return select_markers(positions, sizes, visible, self._camera_view, self._lod)
+
+    def flush(self):
+        """Push pending marker changes to debug_draw in one batch; call once per frame on the main thread."""
+        with self._buffer_lock:
+            if not self._buffers.has_pending:
+                return
+            debug_draw = self._get_debug_draw()
+            if not debug_draw:
+                return
+            use_lod = self._lod.enabled and self._camera_view is not None and self._markers_visible
+            pending = self._buffers.take_pending(self._select_for_camera if use_lod else None)
+        if pending is None:
             return
-            
-        # Batch data for drawing
-        positions = []
-        colors = []
-        sizes = []
 
-        for waypoint_id, waypoint in waypoints.items():
-            should_show = False
+        try:
+            if pending.full:
+                debug_draw.clear_points()
+                self._drawn_markers = 0
+            if self._markers_visible and pending.positions:
+                debug_draw.draw_points(pending.positions, pending.colors, pending.sizes)
+                self._drawn_markers += len(pending.positions)
+            logger.debug(f"{'Redrew' if pending.full else 'Appended'} {len(pending.positions)} waypoint markers")
+        except Exception as e:
+            logger.error(f"Failed to draw batched markers: {e}")
 
-            if self._selective_mode:
-                should_show = waypoint_id in self._visible_markers
-            else:
-                should_show = waypoint_id not in self._hidden_markers
-
-            if should_show:
-                positions.append(waypoint.position)
-
-                # Get color from waypoint type configuration
-                rgb_color = get_waypoint_type_color(waypoint.waypoint_type)
-                color = (rgb_color[0], rgb_color[1], rgb_color[2], 1.0)
-                colors.append(color)
-
-                # Get size from waypoint type configuration
-                size = get_waypoint_type_marker_size(waypoint.waypoint_type)
-                sizes.append(size)
-                
-                # Store marker info for tracking
-                self._markers[waypoint_id] = {
-                    'position': waypoint.position,
-                    'type': waypoint.waypoint_type,
-                    'color': color
-                }
-        
-        # Single batched draw call for all markers
-        if positions:
-            try:
-                debug_draw.draw_points(positions, colors, sizes)
-                logger.info(f"Batched draw of {len(positions)} waypoint markers")
-            except Exception as e:
-                logger.error(f"Failed to draw batched markers: {e}")
+    def get_visible_marker_count(self) -> int:
+        """Number of markers currently shown."""
+        if not self._markers_visible:
+            return 0
+        with self._buffer_lock:
+            return self._buffers.visible_count()
     
     def set_markers_visible(self, visible: bool):
         """Show or hide all waypoint markers."""
@@ -130,24 +159,20 @@ class WaypointMarkerManager:
         
         # Reset to normal mode when using global show/hide
         if visible:
-            self.exit_selective_mode()
+            self._selective_mode = False
+            self._visible_markers.clear()
             # Also clear individually hidden markers when showing all
             self._hidden_markers.clear()
-        
-        debug_draw = self._get_debug_draw()
-        if not debug_draw:
+            with self._buffer_lock:
+                self._buffers.apply_visibility(self.is_individual_marker_visible)
+                self._buffers.invalidate()
+            logger.info("Waypoint markers shown - will redraw on the next frame")
             return
-            
-        if not visible:
-            # Clear all debug points when hiding
-            try:
-                debug_draw.clear_points()
-                logger.info("Waypoint markers hidden - all debug points cleared")
-            except Exception as e:
-                logger.error(f"Error hiding markers: {e}")
-        else:
-            # When showing, we need to refresh to redraw all visible markers
-            logger.info("Waypoint markers shown - will redraw when refresh is called")
+        
+        # The next flush clears the debug points without drawing new ones
+        with self._buffer_lock:
+            self._buffers.invalidate()
+        logger.info("Waypoint markers hidden - debug points cleared on the next frame")
     
     def are_markers_visible(self) -> bool:
         """Check if waypoint markers are currently visible."""
@@ -161,11 +186,26 @@ class WaypointMarkerManager:
         
         try:
             num_points = debug_draw.get_num_points()
+            with self._buffer_lock:
+                tracked = len(self._buffers)
+                visible = self._buffers.visible_count()
+                pending = self._buffers.has_pending
             return {
                 "available": True,
                 "num_points": num_points,
                 "markers_visible": self._markers_visible,
-                "tracked_markers": len(self._markers)
+                "tracked_markers": tracked,
+                "visible_markers": visible if self._markers_visible else 0,
+                "redraw_pending": pending,
+                "buffer_capacity": self._buffers.capacity,
+                "drawn_markers": self._drawn_markers,
+                "lod": {
+                    "enabled": self._lod.enabled,
+                    "camera_tracked": self._camera_view is not None,
+                    "max_visible": self._lod.max_visible,
+                    "frustum_culling": self._lod.frustum_culling,
+                    "lod_distance": self._lod.lod_distance,
+                },
             }
         except Exception as e:
             return {"available": False, "error": str(e)}
@@ -187,10 +227,9 @@ class WaypointMarkerManager:
                 # In normal mode, add to hidden set
                 self._hidden_markers.add(waypoint_id)
         
+        with self._buffer_lock:
+            self._buffers.set_visible(waypoint_id, self.is_individual_marker_visible(waypoint_id))
         logger.info(f"Individual marker visibility changed for {waypoint_id}: {'shown' if visible else 'hidden'}")
-        
-        # Note: Caller must call refresh_all_markers_batched() to apply the change
-        # This is a limitation of debug_draw - we have to redraw everything
     
     def is_individual_marker_visible(self, waypoint_id: str) -> bool:
         """Check if a specific waypoint marker is visible."""
@@ -207,10 +246,14 @@ class WaypointMarkerManager:
         """Enter selective mode where only specified waypoints are visible."""
         self._selective_mode = True
         self._visible_markers = visible_waypoint_ids.copy()
+        with self._buffer_lock:
+            self._buffers.apply_visibility(self.is_individual_marker_visible)
         logger.info(f"Entered selective mode with {len(visible_waypoint_ids)} visible markers")
     
     def exit_selective_mode(self):
         """Exit selective mode and return to normal show/hide behavior."""
         self._selective_mode = False
         self._visible_markers.clear()
+        with self._buffer_lock:
+            self._buffers.apply_visibility(self.is_individual_marker_visible)
         logger.info("Exited selective mode")
\ No newline at end of file
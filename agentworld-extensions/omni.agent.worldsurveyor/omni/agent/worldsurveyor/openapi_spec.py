@@ -33,12 +33,45 @@ def build_openapi_spec(port: int) -> Dict[str, Any]:
             '/markers/debug': {'get': {'summary': 'Debug draw status', 'responses': {'200': {'description': 'OK'}}}},
 
             '/waypoints/create': {'post': {'summary': 'Create waypoint', 'responses': {'200': {'description': 'OK'}}}},
+            '/waypoints/create_bulk': {'post': {'summary': 'Create waypoints in one transaction', 'responses': {'200': {'description': 'OK'}}}},
             '/waypoints/list': {
                 'get': {
                     'summary': 'List waypoints',
                     'parameters': [
                         {'name': 'waypoint_type', 'in': 'query', 'required': False, 'schema': {'type': 'string'}},
                         {'name': 'group_id', 'in': 'query', 'required': False, 'schema': {'type': 'string'}},
+                        {'name': 'limit', 'in': 'query', 'required': False, 'schema': {'type': 'integer', 'maximum': 10000}},
+                        {'name': 'cursor', 'in': 'query', 'required': False, 'schema': {'type': 'string'}, 'description': 'next_cursor of the previous page; survives deletion of its last waypoint'},
+                        {'name': 'after_id', 'in': 'query', 'required': False, 'schema': {'type': 'string'}, 'description': 'next_after_id of the previous page (fails if that waypoint was deleted)'},
+                        {'name': 'order_by', 'in': 'query', 'required': False, 'schema': {'type': 'string', 'enum': ['timestamp', 'name', 'id']}},
+                        {'name': 'order', 'in': 'query', 'required': False, 'schema': {'type': 'string', 'enum': ['asc', 'desc']}},
+                        {'name': 'fields', 'in': 'query', 'required': False, 'schema': {'type': 'string'}, 'description': 'Comma-separated projection, e.g. id,name,position'},
+                        {'name': 'if_version', 'in': 'query', 'required': False, 'schema': {'type': 'string'}, 'description': 'version of a previous response; returns not_modified while unchanged'},
+                        {'name': 'If-None-Match', 'in': 'header', 'required': False, 'schema': {'type': 'string'}, 'description': 'ETag of a previous response'},
+                    ],
+                    'responses': {'200': {'description': 'OK'}, '304': {'description': 'Not modified since the given ETag'}}
+                }
+            },
+            '/waypoints/nearest': {
+                'get': {
+                    'summary': 'Nearest waypoints to a point (R*Tree k-NN)',
+                    'parameters': [
+                        {'name': 'position', 'in': 'query', 'required': True, 'schema': {'type': 'string'}, 'description': 'x,y,z'},
+                        {'name': 'k', 'in': 'query', 'required': False, 'schema': {'type': 'integer', 'default': 10, 'maximum': 1000}},
+                        {'name': 'radius', 'in': 'query', 'required': False, 'schema': {'type': 'number'}},
+                        {'name': 'waypoint_type', 'in': 'query', 'required': False, 'schema': {'type': 'string'}},
+                    ],
+                    'responses': {'200': {'description': 'OK'}}
+                }
+            },
+            '/waypoints/in_bounds': {
+                'get': {
+                    'summary': 'Waypoints inside an axis-aligned box',
+                    'parameters': [
+                        {'name': 'min', 'in': 'query', 'required': True, 'schema': {'type': 'string'}, 'description': 'x,y,z'},
+                        {'name': 'max', 'in': 'query', 'required': True, 'schema': {'type': 'string'}, 'description': 'x,y,z'},
+                        {'name': 'waypoint_type', 'in': 'query', 'required': False, 'schema': {'type': 'string'}},
+                        {'name': 'limit', 'in': 'query', 'required': False, 'schema': {'type': 'integer', 'default': 1000, 'maximum': 10000}},
                     ],
                     'responses': {'200': {'description': 'OK'}}
                 }
@@ -55,7 +88,22 @@ def build_openapi_spec(port: int) -> Dict[str, Any]:
                     'responses': {'200': {'description': 'OK'}}
                 }
             },
-            '/waypoints/import': {'post': {'summary': 'Import waypoints', 'responses': {'200': {'description': 'OK'}}}},
+            '/waypoints/import': {
+                'post': {
+                    'summary': 'Import waypoints (JSON object, or a streamed JSON/NDJSON body)',
+                    'parameters': [
+                        {'name': 'merge_mode', 'in': 'query', 'required': False, 'schema': {'type': 'string', 'enum': ['replace', 'merge']}},
+                    ],
+                    'responses': {'200': {'description': 'OK'}}
+                }
+            },
+            '/waypoints/import_status': {
+                'get': {
+                    'summary': 'Get import progress',
+                    'parameters': [{'name': 'import_id', 'in': 'query', 'required': True, 'schema': {'type': 'string'}}],
+                    'responses': {'200': {'description': 'OK'}}
+                }
+            },
             '/waypoints/goto': {'post': {'summary': 'Goto waypoint', 'responses': {'200': {'description': 'OK'}}}},
 
             '/groups/create': {'post': {'summary': 'Create group', 'responses': {'200': {'description': 'OK'}}}},
@@ -74,7 +122,16 @@ def build_openapi_spec(port: int) -> Dict[str, Any]:
                 }
             },
             '/groups/remove': {'post': {'summary': 'Remove group', 'responses': {'200': {'description': 'OK'}}}},
-            '/groups/hierarchy': {'get': {'summary': 'Group hierarchy', 'responses': {'200': {'description': 'OK'}}}},
+            '/groups/hierarchy': {
+                'get': {
+                    'summary': 'Group hierarchy',
+                    'parameters': [
+                        {'name': 'if_version', 'in': 'query', 'required': False, 'schema': {'type': 'string'}, 'description': 'version of a previous response; returns not_modified while unchanged'},
+                        {'name': 'If-None-Match', 'in': 'header', 'required': False, 'schema': {'type': 'string'}, 'description': 'ETag of a previous response'},
+                    ],
+                    'responses': {'200': {'description': 'OK'}, '304': {'description': 'Not modified since the given ETag'}}
+                }
+            },
             '/groups/add_waypoint': {'post': {'summary': 'Add waypoint to groups', 'responses': {'200': {'description': 'OK'}}}},
             '/groups/remove_waypoint': {'post': {'summary': 'Remove waypoint from groups', 'responses': {'200': {'description': 'OK'}}}},
             '/groups/of_waypoint': {
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import base64
+import json
+import math
 from dataclasses import asdict
 from typing import Any, Dict, List, Optional
 
 from ..errors import error_response, ValidationFailure, MethodNotAllowed
 from ..config import get_config
+from ..import_stream import IMPORT_MERGE_MODES, ImportInProgress
+from ..waypoint_database import WAYPOINT_FIELDS, WAYPOINT_ORDER_FIELDS
+
+MAX_LIST_LIMIT = 10000
+MAX_NEAREST_RESULTS = 1000
+DEFAULT_BOUNDS_LIMIT = 1000
+MAX_BOUNDS_LIMIT = 10000
 
 
 def _asdict_waypoints(waypoints: List[Any]) -> List[Dict[str, Any]]:
@@ -26,6 +36,59 @@ def _asdict_waypoints(waypoints: List[Any]) -> List[Dict[str, Any]]:
     return result
 
 
+def _encode_list_cursor(order_by: str, descending: bool, last: Dict[str, Any]) -> str:
+    """Opaque resume token holding the sort value and id of the last listed waypoint."""
+    raw = json.dumps({"o": order_by, "d": descending, "k": last[order_by], "i": last["id"]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_list_cursor(cursor: Any, order_by: str, descending: bool) -> tuple:
+    """Return the ``(sort value, id)`` keyset bound of a ``next_cursor`` issued for this ordering."""
+    try:
+        padded = str(cursor) + "=" * (-len(str(cursor)) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        bound = (data["k"], data["i"])
+        issued_for = (data["o"], data["d"])
+    except Exception:
+        raise ValidationFailure("cursor is malformed", details={"parameter": "cursor"})
+    if not isinstance(bound[1], str) or not isinstance(bound[0], (str, int, float)):
+        raise ValidationFailure("cursor is malformed", details={"parameter": "cursor"})
+    if issued_for != (order_by, descending):
+        raise ValidationFailure(
+            "cursor was issued for a different order_by or order", details={"parameter": "cursor"}
+        )
+    return bound
+
+
+def _parse_vector(value: Any, parameter: str) -> tuple:
+    """Accept [x, y, z] from JSON or ``x,y,z`` / repeated values from a query string."""
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, (list, tuple)) or len(value) != 3:
+        raise ValidationFailure(f"{parameter} must be [x, y, z]", details={"parameter": parameter})
+    try:
+        vector = tuple(float(component) for component in value)
+    except (TypeError, ValueError):
+        raise ValidationFailure(f"{parameter} must be [x, y, z]", details={"parameter": parameter})
+    if not all(math.isfinite(component) for component in vector):
+        raise ValidationFailure(f"{parameter} must be finite", details={"parameter": parameter})
+    return vector
+
+
+def _parse_number(value: Any, parameter: str, cast=float, minimum=None, maximum=None):
+    try:
+        number = cast(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValidationFailure(f"{parameter} must be a number", details={"parameter": parameter})
+    if not math.isfinite(number):
+        raise ValidationFailure(f"{parameter} must be finite", details={"parameter": parameter})
+    if minimum is not None and number < minimum:
+        raise ValidationFailure(f"{parameter} must be at least {minimum}", details={"parameter": parameter, "minimum": minimum})
+    if maximum is not None and number > maximum:
+        raise ValidationFailure(f"{parameter} must be at most {maximum}", details={"parameter": parameter, "maximum": maximum})
+    return number
+
+
 class WorldSurveyorService:
     """Wrap WaypointManager operations for HTTP/MCP transports."""
 
@@ -108,6 +171,24 @@ class WorldSurveyorService:
             "waypoint_count": waypoint_count
         }
 
+    # ------------------------------------------------------------------
+    # Cache versions: read responses carry the manager's version tag, and a
+    # client that sends it back as ``if_version`` gets ``not_modified``
+    # instead of the payload while nothing has changed
+    def _cache_version(self) -> Optional[str]:
+        # Read before the query runs, so a racing write can only make the tag older than the data
+        return getattr(self._manager, "cache_tag", None)
+
+    def _is_current(self, payload: Dict[str, Any]) -> bool:
+        tag = payload.get("if_version")
+        return bool(tag) and hasattr(self._manager, "is_current") and self._manager.is_current(tag)
+
+    @staticmethod
+    def _with_version(response: Dict[str, Any], version: Optional[str]) -> Dict[str, Any]:
+        if version is not None:
+            response["version"] = version
+        return response
+
     # ------------------------------------------------------------------
     # Waypoint operations
     def get_waypoints_summary(self) -> Dict[str, Any]:
@@ -134,13 +215,136 @@ class WorldSurveyorService:
         )
         return {"success": True, "waypoint_id": waypoint_id}
 
+    def create_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._manager:
+            return error_response("MANAGER_UNAVAILABLE", "Waypoint manager unavailable")
+        items = payload.get("waypoints")
+        if not isinstance(items, list) or not items:
+            raise ValidationFailure("waypoints must be a non-empty list", details={"parameter": "waypoints"})
+        default_type = get_config().get_default_waypoint_type_id()
+        entries = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValidationFailure(f"waypoints[{index}] must be an object", details={"parameter": "waypoints", "index": index})
+            position = item.get("position")
+            if not isinstance(position, (list, tuple)) or len(position) != 3:
+                raise ValidationFailure(f"waypoints[{index}].position must be [x, y, z]", details={"parameter": "position", "index": index})
+            target = item.get("target")
+            if target is not None and (not isinstance(target, (list, tuple)) or len(target) != 3):
+                raise ValidationFailure(f"waypoints[{index}].target must be [x, y, z]", details={"parameter": "target", "index": index})
+            group_ids = item.get("group_ids")
+            if group_ids is not None and not isinstance(group_ids, list):
+                raise ValidationFailure(f"waypoints[{index}].group_ids must be a list", details={"parameter": "group_ids", "index": index})
+            entries.append({
+                "position": tuple(position),
+                "waypoint_type": item.get("waypoint_type", default_type),
+                "name": item.get("name"),
+                "target": tuple(target) if target else None,
+                "metadata": item.get("metadata", {}),
+                "group_ids": group_ids,
+            })
+        waypoint_ids = self._manager.create_waypoints(entries)
+        return {"success": True, "waypoint_ids": waypoint_ids, "count": len(waypoint_ids)}
+
     def list_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if not self._manager:
             return error_response("MANAGER_UNAVAILABLE", "Waypoint manager unavailable")
+        version = self._cache_version()
+        if self._is_current(payload):
+            return {"success": True, "not_modified": True, "version": version}
         waypoint_type = payload.get("waypoint_type")
         group_id = payload.get("group_id")
-        waypoints = self._manager.list_waypoints(waypoint_type, group_id)
-        return {"success": True, "waypoints": _asdict_waypoints(waypoints), "count": len(waypoints)}
+        after_id = payload.get("after_id") or None
+        limit = payload.get("limit")
+        if limit is not None:
+            limit = _parse_number(limit, "limit", int, 1, MAX_LIST_LIMIT)
+        order_by = payload.get("order_by") or "timestamp"
+        if order_by not in WAYPOINT_ORDER_FIELDS:
+            raise ValidationFailure(
+                f"order_by must be one of {', '.join(WAYPOINT_ORDER_FIELDS)}", details={"parameter": "order_by"}
+            )
+        order = str(payload.get("order") or "asc").lower()
+        if order not in ("asc", "desc"):
+            raise ValidationFailure("order must be asc or desc", details={"parameter": "order"})
+        descending = order == "desc"
+        cursor = payload.get("cursor")
+        after = _decode_list_cursor(cursor, order_by, descending) if cursor else None
+        fields = payload.get("fields")
+        if isinstance(fields, str):
+            fields = [name.strip() for name in fields.split(",") if name.strip()]
+        if fields is not None:
+            unknown = [name for name in fields if name not in WAYPOINT_FIELDS] if isinstance(fields, list) else [fields]
+            if unknown or not fields:
+                raise ValidationFailure(
+                    f"fields must be a subset of {', '.join(WAYPOINT_FIELDS)}",
+                    details={"parameter": "fields", "unknown": unknown},
+                )
+
+        # One extra row tells whether another page follows
+        options = dict(
+            waypoint_type=waypoint_type, group_id=group_id, after_id=None if after else after_id, after=after,
+            limit=limit + 1 if limit is not None else None, order_by=order_by, descending=descending,
+        )
+        try:
+            if fields is not None:
+                # The sort key feeds next_cursor even when it is not projected
+                projected = fields if order_by in fields else list(fields) + [order_by]
+                waypoints = self._manager.list_waypoint_fields(projected, **options)
+            else:
+                waypoints = _asdict_waypoints(self._manager.list_waypoints(**options))
+        except ValueError as exc:
+            # Raised for an unknown after_id
+            raise ValidationFailure(str(exc), details={"parameter": "after_id"})
+
+        has_more = limit is not None and len(waypoints) > limit
+        if has_more:
+            waypoints = waypoints[:limit]
+        next_cursor = _encode_list_cursor(order_by, descending, waypoints[-1]) if has_more else None
+        if fields is not None and order_by not in fields:
+            waypoints = [{name: value for name, value in row.items() if name != order_by} for row in waypoints]
+        return self._with_version({
+            "success": True,
+            "waypoints": waypoints,
+            "count": len(waypoints),
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+            "next_after_id": waypoints[-1]["id"] if has_more else None,
+        }, version)
+
+    def nearest_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._manager:
+            return error_response("MANAGER_UNAVAILABLE", "Waypoint manager unavailable")
+        position = _parse_vector(payload.get("position"), "position")
+        k = _parse_number(payload.get("k", 10), "k", int, 1, MAX_NEAREST_RESULTS)
+        radius = payload.get("radius")
+        if radius is not None:
+            radius = _parse_number(radius, "radius", float, 0.0)
+        results = self._manager.find_nearest_waypoints(position, k, radius, payload.get("waypoint_type"))
+        waypoints = _asdict_waypoints([waypoint for waypoint, _ in results])
+        for entry, (_, distance) in zip(waypoints, results):
+            entry["distance"] = distance
+        return {"success": True, "waypoints": waypoints, "count": len(waypoints)}
+
+    def waypoints_in_bounds(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._manager:
+            return error_response("MANAGER_UNAVAILABLE", "Waypoint manager unavailable")
+        min_corner = _parse_vector(payload.get("min"), "min")
+        max_corner = _parse_vector(payload.get("max"), "max")
+        if any(low > high for low, high in zip(min_corner, max_corner)):
+            raise ValidationFailure("min must not exceed max on any axis", details={"parameter": "min"})
+        limit = _parse_number(payload.get("limit", DEFAULT_BOUNDS_LIMIT), "limit", int, 1, MAX_BOUNDS_LIMIT)
+        # One extra row tells whether the result was cut off
+        waypoints = self._manager.find_waypoints_in_bounds(
+            min_corner, max_corner, payload.get("waypoint_type"), limit + 1
+        )
+        truncated = len(waypoints) > limit
+        waypoints = waypoints[:limit]
+        return {
+            "success": True,
+            "waypoints": _asdict_waypoints(waypoints),
+            "count": len(waypoints),
+            "truncated": truncated,
+        }
 
     def update_waypoint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         waypoint_id = payload.get("waypoint_id")
@@ -191,18 +395,51 @@ class WorldSurveyorService:
         return {"success": True, "export": data}
 
     def import_waypoints(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._manager:
+            return error_response('MANAGER_UNAVAILABLE', 'Waypoint manager unavailable')
         merge_mode = payload.get('merge_mode', 'replace')
-        data = payload.get('import_data') or payload.get('export') or payload
-        if not isinstance(data, dict):
-            raise ValidationFailure('import_data must be an object', details={'parameter': 'import_data'})
-        stats = self._manager.import_waypoints(data, merge_mode)
+        if merge_mode == 'append':
+            merge_mode = 'merge'  # older clients and docs
+        if merge_mode not in IMPORT_MERGE_MODES:
+            raise ValidationFailure(
+                f"merge_mode must be one of {', '.join(IMPORT_MERGE_MODES)}",
+                details={'parameter': 'merge_mode'}
+            )
+        try:
+            # Uploaded JSON/NDJSON bodies are parsed incrementally on a background thread
+            if payload.get('_upload') is not None:
+                if not payload.get('_upload_size'):
+                    raise ValidationFailure('import body is empty', details={'parameter': 'body'})
+                status = self._manager.start_import_stream(
+                    payload['_upload'], merge_mode, total_bytes=payload['_upload_size']
+                )
+                return {'success': True, 'import_id': status.import_id, 'import': status.to_dict()}
+
+            data = payload.get('import_data') or payload.get('data') or payload.get('export') or payload
+            if not isinstance(data, dict):
+                raise ValidationFailure('import_data must be an object', details={'parameter': 'import_data'})
+            stats = self._manager.import_waypoints(data, merge_mode)
+        except ImportInProgress as exc:
+            return error_response('IMPORT_IN_PROGRESS', str(exc))
         return {
             'success': True,
+            'import_id': stats.get('import_id'),
             'imported_waypoints': stats.get('waypoints_imported', 0),
             'imported_groups': stats.get('groups_imported', 0),
             'errors': stats.get('errors', 0),
         }
 
+    def get_import_status(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        import_id = payload.get('import_id')
+        if not import_id:
+            raise ValidationFailure('import_id is required', details={'parameter': 'import_id'})
+        if not self._manager:
+            return error_response('MANAGER_UNAVAILABLE', 'Waypoint manager unavailable')
+        status = self._manager.get_import_status(import_id)
+        if status is None:
+            return error_response('NOT_FOUND', f'Import {import_id} not found')
+        return {'success': True, 'import': status.to_dict()}
+
     def goto_waypoint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         waypoint_id = payload.get('waypoint_id')
         if not waypoint_id:
@@ -282,7 +519,10 @@ class WorldSurveyorService:
         count = self._manager.clear_groups()
         return {'success': True, 'groups_cleared': count}
 
-    def group_hierarchy(self) -> Dict[str, Any]:
+    def group_hierarchy(self, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        version = self._cache_version()
+        if self._is_current(payload or {}):
+            return {'success': True, 'not_modified': True, 'version': version}
         hierarchy = self._manager.get_group_hierarchy()
         hierarchy_list = hierarchy.get('hierarchy', []) if isinstance(hierarchy, dict) else hierarchy
         total_groups = hierarchy.get('total_groups') if isinstance(hierarchy, dict) else None
@@ -300,7 +540,7 @@ class WorldSurveyorService:
             calculated_total = len(hierarchy_list) if isinstance(hierarchy_list, list) else 0
             response['group_count'] = calculated_total
 
-        return response
+        return self._with_version(response, version)
 
     def add_waypoint_to_groups(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         waypoint_id = payload.get('waypoint_id')
@@ -22,13 +22,17 @@ TOOL_CONTRACTS: List[ToolContract] = [
     ToolContract("get_prometheus_metrics", "metrics.prom", "GET", "worldsurveyor_metrics_prometheus"),
     ToolContract("waypoints_summary", "waypoints", "GET", "worldsurveyor_waypoints_summary"),
     ToolContract("create_waypoint", "waypoints/create", "POST", "worldsurveyor_create_waypoint"),
+    ToolContract("create_waypoints", "waypoints/create_bulk", "POST", "worldsurveyor_create_waypoints"),
     ToolContract("list_waypoints", "waypoints/list", "GET", "worldsurveyor_list_waypoints"),
+    ToolContract("nearest_waypoints", "waypoints/nearest", "GET", "worldsurveyor_nearest_waypoints"),
+    ToolContract("waypoints_in_bounds", "waypoints/in_bounds", "GET", "worldsurveyor_waypoints_in_bounds"),
     ToolContract("update_waypoint", "waypoints/update", "POST", "worldsurveyor_update_waypoint"),
     ToolContract("remove_waypoint", "waypoints/remove", "POST", "worldsurveyor_remove_waypoint"),
     ToolContract("remove_selected_waypoints", "waypoints/remove_selected", "POST", "worldsurveyor_remove_selected_waypoints"),
     ToolContract("clear_waypoints", "waypoints/clear", "POST", "worldsurveyor_clear_waypoints"),
     ToolContract("export_waypoints", "waypoints/export", "GET", "worldsurveyor_export_waypoints"),
     ToolContract("import_waypoints", "waypoints/import", "POST", "worldsurveyor_import_waypoints"),
+    ToolContract("get_import_status", "waypoints/import_status", "GET", "worldsurveyor_get_import_status"),
     ToolContract("goto_waypoint", "waypoints/goto", "POST", "worldsurveyor_goto_waypoint"),
     ToolContract("create_group", "groups/create", "POST", "worldsurveyor_create_group"),
     ToolContract("list_groups", "groups/list", "GET", "worldsurveyor_list_groups"),
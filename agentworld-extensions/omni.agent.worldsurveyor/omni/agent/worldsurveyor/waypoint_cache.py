@@ -0,0 +1,141 @@
+"""
+Write-through waypoint cache owned by the WaypointManager.
+
+Mutations update the cached entries they touch and then bump ``version``.
+Reads served from SQLite are stored only if no mutation happened while they
+ran, and whole query results are memoized per version, so repeated listings
+of an unchanged store never reach the database. ``tag`` combines the session
+with the version and doubles as an HTTP entity tag.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from .models import Waypoint
+
+DEFAULT_RESULT_CACHE_SIZE = 64
+
+
+class WaypointCache:
+    """Waypoints by id plus per-version query results, guarded by the manager's lock."""
+
+    def __init__(self, epoch: str, lock: Optional[threading.RLock] = None,
+                 max_results: int = DEFAULT_RESULT_CACHE_SIZE):
+        self._epoch = epoch
+        self._lock = lock or threading.RLock()
+        self._max_results = max(0, int(max_results))
+        # Never rebound: legacy callers hold a reference to this dict
+        self.waypoints: Dict[str, Waypoint] = {}
+        self._results: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self.waypoints)
+
+    def __contains__(self, waypoint_id: str) -> bool:
+        return waypoint_id in self.waypoints
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def tag(self) -> str:
+        return f"{self._epoch}-{self._version}"
+
+    def matches(self, tag: Optional[str]) -> bool:
+        """Whether an ``If-None-Match`` style tag list names the current version."""
+        if not tag:
+            return False
+        current = self.tag
+        for candidate in str(tag).split(','):
+            candidate = candidate.strip()
+            if candidate.startswith('W/'):
+                candidate = candidate[2:]
+            if candidate == '*' or candidate.strip('"') == current:
+                return True
+        return False
+
+    def bump(self) -> int:
+        """Record a mutation; every memoized result becomes stale."""
+        with self._lock:
+            self._version += 1
+            self._results.clear()
+            return self._version
+
+    def get(self, waypoint_id: str) -> Optional[Waypoint]:
+        return self.waypoints.get(waypoint_id)
+
+    def put(self, waypoints: Iterable[Waypoint]):
+        """Write-through from a mutation that holds the lock."""
+        with self._lock:
+            for waypoint in waypoints:
+                self.waypoints[waypoint.id] = waypoint
+
+    def fill(self, waypoints: Iterable[Waypoint], version: int):
+        """Store waypoints read without the lock unless a mutation happened meanwhile."""
+        with self._lock:
+            if version != self._version:
+                return
+            for waypoint in waypoints:
+                self.waypoints[waypoint.id] = waypoint
+
+    def discard(self, waypoint_ids: Iterable[str]) -> int:
+        """Drop entries so the next read of them goes back to the database."""
+        with self._lock:
+            removed = 0
+            for waypoint_id in waypoint_ids:
+                if self.waypoints.pop(waypoint_id, None) is not None:
+                    removed += 1
+            return removed
+
+    def discard_group_members(self, group_ids: Optional[Iterable[str]] = None) -> int:
+        """Drop cached members of ``group_ids`` (any group when None); their embedded groups are stale."""
+        wanted = None if group_ids is None else set(group_ids)
+        with self._lock:
+            stale = [
+                waypoint.id for waypoint in self.waypoints.values()
+                if any(wanted is None or group.get('id') in wanted for group in waypoint.metadata.get('groups') or [])
+            ]
+            return self.discard(stale)
+
+    def replace(self, waypoints: Iterable[Waypoint]):
+        with self._lock:
+            self.waypoints.clear()
+            self.put(waypoints)
+
+    def clear(self):
+        with self._lock:
+            self.waypoints.clear()
+
+    def result(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Memoized ``load()`` for the current version.
+
+        Hits and the loader run without the lock, so reads never wait for a
+        mutation; a loaded result is kept only if the version did not move
+        while it ran. The oldest result is evicted first.
+        """
+        version = self._version
+        hit = self._results.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        value = load()
+        with self._lock:
+            if self._max_results and version == self._version:
+                self._results[key] = (version, value)
+                while len(self._results) > self._max_results:
+                    self._results.popitem(last=False)
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "version": self._version,
+            "tag": self.tag,
+            "waypoints": len(self.waypoints),
+            "results": len(self._results),
+        }
+
+
+__all__ = ['DEFAULT_RESULT_CACHE_SIZE', 'WaypointCache']
@@ -3,22 +3,235 @@ SQLite database layer for hierarchical waypoint and group management.
 
 Provides persistent storage with full CRUD operations, group hierarchies,
 and many-to-many waypoint-group relationships.
+
+Waypoint positions are mirrored into an SQLite R*Tree (``waypoints_rtree``)
+by triggers, so nearest-neighbour and bounding-box queries touch only the
+matching rows. Row counts (all waypoints, per type, per group and all groups)
+live in ``waypoint_counters``, also maintained by triggers, so limit checks,
+auto-naming and status reporting read one row instead of counting the table.
+
+The database runs in WAL mode by default. Every thread reads through its own
+connection without taking a Python lock, so list/get calls are not blocked by
+imports or other writes. Writers are serialized by ``_write_lock`` and commit
+once per outermost :meth:`WaypointDatabase._write_transaction`. Hot statements
+are module-level constants, so each connection's statement cache reuses their
+prepared form.
 """
 
 import json
 import logging
+import math
 import sqlite3
 import threading
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .config import get_config
+from .import_stream import ImportRecord, ImportStatus, iter_document_records
 from .models import Waypoint
 
 logger = logging.getLogger(__name__)
 
+JOURNAL_MODES = ('wal', 'delete', 'truncate', 'persist', 'memory')
+SYNCHRONOUS_MODES = ('off', 'normal', 'full', 'extra')
+TEMP_STORE_MODES = ('default', 'file', 'memory')
+
+_GROUP_EXISTS_SQL = "SELECT id FROM groups WHERE id = ?"
+_WAYPOINT_EXISTS_SQL = "SELECT id FROM waypoints WHERE id = ?"
+_SELECT_WAYPOINT_SQL = "SELECT * FROM waypoints WHERE id = ?"
+_SELECT_WAYPOINT_GROUPS_SQL = """
+    SELECT g.id, g.name FROM groups g
+    JOIN waypoint_groups wg ON g.id = wg.group_id
+    WHERE wg.waypoint_id = ?
+"""
+_INSERT_WAYPOINT_SQL = """
+    INSERT INTO waypoints
+    (id, name, position_x, position_y, position_z, target_x, target_y, target_z,
+     waypoint_type, timestamp, session_id, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_GROUP_SQL = """
+    INSERT INTO groups (id, name, description, parent_group_id, created_at, color)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_INSERT_MEMBERSHIP_SQL = "INSERT OR IGNORE INTO waypoint_groups (waypoint_id, group_id) VALUES (?, ?)"
+
+# Group ``?`` and all of its descendants. UNION (not UNION ALL) stops at cycles.
+_SUBTREE_CTE = """
+    WITH RECURSIVE subtree(id) AS (
+        SELECT id FROM groups WHERE id = ?
+        UNION
+        SELECT g.id FROM groups g JOIN subtree s ON g.parent_group_id = s.id
+    )
+"""
+# Every group with its direct and subtree waypoint counts in one statement
+_GROUP_TREE_SQL = """
+    WITH RECURSIVE closure(ancestor_id, group_id) AS (
+        SELECT id, id FROM groups
+        UNION
+        SELECT c.ancestor_id, g.id FROM closure c JOIN groups g ON g.parent_group_id = c.group_id
+    ),
+    direct_counts AS (
+        SELECT key AS group_id, count AS n FROM waypoint_counters WHERE scope = 'group'
+    ),
+    subtree_counts AS (
+        SELECT c.ancestor_id AS group_id, COUNT(DISTINCT wg.waypoint_id) AS n
+        FROM closure c JOIN waypoint_groups wg ON wg.group_id = c.group_id
+        GROUP BY c.ancestor_id
+    ),
+    descendant_counts AS (
+        SELECT ancestor_id AS group_id, COUNT(*) - 1 AS n FROM closure GROUP BY ancestor_id
+    )
+    SELECT g.*,
+           COALESCE(d.n, 0) AS waypoint_count,
+           COALESCE(s.n, 0) AS subtree_waypoint_count,
+           COALESCE(dc.n, 0) AS descendant_group_count
+    FROM groups g
+    LEFT JOIN direct_counts d ON d.group_id = g.id
+    LEFT JOIN subtree_counts s ON s.group_id = g.id
+    LEFT JOIN descendant_counts dc ON dc.group_id = g.id
+    ORDER BY g.name
+"""
+
+# The R*Tree is keyed by the waypoints rowid; points are stored as zero-size boxes
+_SPATIAL_INDEX_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS waypoints_rtree
+    USING rtree(id, min_x, max_x, min_y, max_y, min_z, max_z)
+"""
+_SPATIAL_TRIGGERS_SQL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS waypoints_rtree_insert AFTER INSERT ON waypoints BEGIN
+        INSERT OR REPLACE INTO waypoints_rtree VALUES (
+            new.rowid, new.position_x, new.position_x, new.position_y, new.position_y,
+            new.position_z, new.position_z);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS waypoints_rtree_update
+    AFTER UPDATE OF position_x, position_y, position_z ON waypoints BEGIN
+        UPDATE waypoints_rtree SET
+            min_x = new.position_x, max_x = new.position_x,
+            min_y = new.position_y, max_y = new.position_y,
+            min_z = new.position_z, max_z = new.position_z
+        WHERE id = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS waypoints_rtree_delete AFTER DELETE ON waypoints BEGIN
+        DELETE FROM waypoints_rtree WHERE id = old.rowid;
+    END
+    """,
+)
+_POPULATE_SPATIAL_INDEX_SQL = """
+    INSERT INTO waypoints_rtree
+    SELECT rowid, position_x, position_x, position_y, position_y, position_z, position_z FROM waypoints
+"""
+# Row counts kept by triggers. Scopes: 'waypoints' and 'groups' (key ''), 'type'
+# (key waypoint_type) and 'group' (key group id, direct members). Decrements are
+# plain UPDATEs so a cascade that runs after its counter row is gone is a no-op.
+_COUNTERS_SQL = """
+    CREATE TABLE IF NOT EXISTS waypoint_counters (
+        scope TEXT NOT NULL,
+        key TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (scope, key)
+    ) WITHOUT ROWID
+"""
+_INCREMENT_COUNTER_SQL = """
+        INSERT INTO waypoint_counters (scope, key, count) VALUES ({scope}, {key}, 1)
+        ON CONFLICT (scope, key) DO UPDATE SET count = count + 1;"""
+_DECREMENT_COUNTER_SQL = """
+        UPDATE waypoint_counters SET count = count - 1 WHERE scope = {scope} AND key = {key};"""
+_COUNTER_TRIGGERS_SQL = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS waypoints_count_insert AFTER INSERT ON waypoints BEGIN
+        {_INCREMENT_COUNTER_SQL.format(scope="'waypoints'", key="''")}
+        {_INCREMENT_COUNTER_SQL.format(scope="'type'", key="new.waypoint_type")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS waypoints_count_delete AFTER DELETE ON waypoints BEGIN
+        {_DECREMENT_COUNTER_SQL.format(scope="'waypoints'", key="''")}
+        {_DECREMENT_COUNTER_SQL.format(scope="'type'", key="old.waypoint_type")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS waypoints_count_retype AFTER UPDATE OF waypoint_type ON waypoints
+    WHEN new.waypoint_type IS NOT old.waypoint_type BEGIN
+        {_DECREMENT_COUNTER_SQL.format(scope="'type'", key="old.waypoint_type")}
+        {_INCREMENT_COUNTER_SQL.format(scope="'type'", key="new.waypoint_type")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS groups_count_insert AFTER INSERT ON groups BEGIN
+        {_INCREMENT_COUNTER_SQL.format(scope="'groups'", key="''")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS groups_count_delete AFTER DELETE ON groups BEGIN
+        {_DECREMENT_COUNTER_SQL.format(scope="'groups'", key="''")}
+        DELETE FROM waypoint_counters WHERE scope = 'group' AND key = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS waypoint_groups_count_insert AFTER INSERT ON waypoint_groups BEGIN
+        {_INCREMENT_COUNTER_SQL.format(scope="'group'", key="new.group_id")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS waypoint_groups_count_delete AFTER DELETE ON waypoint_groups BEGIN
+        {_DECREMENT_COUNTER_SQL.format(scope="'group'", key="old.group_id")}
+    END
+    """,
+)
+_POPULATE_COUNTERS_SQL = (
+    "DELETE FROM waypoint_counters",
+    "INSERT INTO waypoint_counters SELECT 'waypoints', '', COUNT(*) FROM waypoints",
+    "INSERT INTO waypoint_counters SELECT 'groups', '', COUNT(*) FROM groups",
+    "INSERT INTO waypoint_counters SELECT 'type', waypoint_type, COUNT(*) FROM waypoints GROUP BY waypoint_type",
+    "INSERT INTO waypoint_counters SELECT 'group', group_id, COUNT(*) FROM waypoint_groups GROUP BY group_id",
+)
+_SELECT_COUNTER_SQL = "SELECT count FROM waypoint_counters WHERE scope = ? AND key = ?"
+# Sort keys accepted by list_waypoints; ties break on id so keyset pages are stable
+WAYPOINT_ORDER_FIELDS = ('timestamp', 'name', 'id')
+# Columns behind each field of a projected waypoint listing; 'groups' comes from waypoint_groups
+_WAYPOINT_FIELD_COLUMNS = {
+    'id': ('id',),
+    'name': ('name',),
+    'position': ('position_x', 'position_y', 'position_z'),
+    'target': ('target_x', 'target_y', 'target_z'),
+    'waypoint_type': ('waypoint_type',),
+    'timestamp': ('timestamp',),
+    'session_id': ('session_id',),
+    'metadata': ('metadata',),
+    'groups': (),
+}
+WAYPOINT_FIELDS = tuple(_WAYPOINT_FIELD_COLUMNS)
+_SELECT_MEMBERSHIPS_SQL = """
+    SELECT wg.waypoint_id, g.id, g.name FROM waypoint_groups wg
+    JOIN groups g ON g.id = wg.group_id
+    WHERE wg.waypoint_id IN ({placeholders})
+"""
+_SELECT_ALL_MEMBERSHIPS_SQL = """
+    SELECT wg.waypoint_id, g.id, g.name FROM waypoint_groups wg
+    JOIN groups g ON g.id = wg.group_id
+"""
+# Nearest-neighbour search without a radius starts here and grows the box 4x per pass
+_NEAREST_INITIAL_RADIUS = 1.0
+_NEAREST_MAX_RADIUS = 1e12
+# Keeps IN (...) lists under SQLITE_MAX_VARIABLE_NUMBER on older builds
+_MAX_SQL_VARIABLES = 500
+_FULL_MEMBERSHIP_SCAN_THRESHOLD = 25000
+
+
+def _new_waypoint_id() -> str:
+    # 64 random bits: bulk creates and imports of 10^5 rows must not collide
+    return f"wp_{uuid.uuid4().hex[:16]}"
+
 
 class WaypointDatabase:
     """SQLite database manager for waypoints and groups with thread safety."""
@@ -38,35 +251,111 @@ class WaypointDatabase:
             data_dir.mkdir(exist_ok=True)  # Create data directory if it doesn't exist
             self._db_path = data_dir / "waypoint_data.db"
         
-        # Thread safety
-        self._lock = threading.RLock()
+        # Thread safety: readers use their own connection, writers share one lock
+        self._write_lock = threading.RLock()
         self._thread_local = threading.local()
+        self._journal_mode = None
+        self._spatial_index = False
         
         # Initialize database
         self._init_database()
         
         if self._config.debug_mode:
-            logger.info(f"Initialized waypoint database: {self._db_path}")
+            logger.info(f"Initialized waypoint database: {self._db_path} (journal_mode={self._journal_mode})")
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get thread-local database connection."""
+        """Get thread-local database connection with the configured pragmas applied."""
         if not hasattr(self._thread_local, 'connection'):
-            self._thread_local.connection = sqlite3.connect(
+            busy_timeout_ms = max(0, self._config.database_busy_timeout_ms)
+            connection = sqlite3.connect(
                 str(self._db_path),
-                check_same_thread=False
+                check_same_thread=False,
+                timeout=busy_timeout_ms / 1000.0,
+                cached_statements=max(16, self._config.database_statement_cache_size)
             )
-            self._thread_local.connection.row_factory = sqlite3.Row
+            connection.row_factory = sqlite3.Row
             # Ensure foreign key constraints are enforced
             try:
-                self._thread_local.connection.execute("PRAGMA foreign_keys = ON;")
+                connection.execute("PRAGMA foreign_keys = ON;")
             except Exception:
                 pass
+            self._apply_connection_pragmas(connection, busy_timeout_ms)
+            self._thread_local.connection = connection
         return self._thread_local.connection
+
+    def _apply_connection_pragmas(self, connection: sqlite3.Connection, busy_timeout_ms: int):
+        """Apply per-connection tuning pragmas; unknown config values fall back to SQLite defaults."""
+        pragmas = [f"PRAGMA busy_timeout = {busy_timeout_ms}"]
+        synchronous = str(self._config.database_synchronous).lower()
+        if synchronous in SYNCHRONOUS_MODES:
+            pragmas.append(f"PRAGMA synchronous = {synchronous.upper()}")
+        temp_store = str(self._config.database_temp_store).lower()
+        if temp_store in TEMP_STORE_MODES:
+            pragmas.append(f"PRAGMA temp_store = {temp_store.upper()}")
+        # Negative cache_size is in KiB rather than pages
+        pragmas.append(f"PRAGMA cache_size = -{max(0, self._config.database_cache_size_kb)}")
+        pragmas.append(f"PRAGMA mmap_size = {max(0, self._config.database_mmap_size)}")
+        for pragma in pragmas:
+            try:
+                connection.execute(pragma)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not apply '{pragma}': {e}")
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Serialize a write and commit it, or roll it back on error.
+
+        Nested calls on the same thread join the outermost transaction, which
+        alone commits or rolls back.
+        """
+        with self._write_lock:
+            conn = self._get_connection()
+            depth = getattr(self._thread_local, 'write_depth', 0)
+            self._thread_local.write_depth = depth + 1
+            try:
+                yield conn
+                if depth == 0:
+                    conn.commit()
+            except BaseException:
+                if depth == 0:
+                    conn.rollback()
+                raise
+            finally:
+                self._thread_local.write_depth = depth
+
+    @contextmanager
+    def _read_snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Run several reads against one consistent snapshot without blocking writers."""
+        conn = self._get_connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.commit()
+
+    @property
+    def journal_mode(self) -> Optional[str]:
+        """Journal mode reported by SQLite after initialization."""
+        return self._journal_mode
     
     def _init_database(self):
-        """Initialize database schema."""
-        with self._lock:
+        """Initialize database schema and journal mode."""
+        with self._write_lock:
             conn = self._get_connection()
+
+            # journal_mode is persistent in the file; in-memory databases report 'memory'
+            journal_mode = str(self._config.database_journal_mode).lower()
+            if journal_mode in JOURNAL_MODES:
+                try:
+                    self._journal_mode = conn.execute(f"PRAGMA journal_mode = {journal_mode.upper()}").fetchone()[0]
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not set journal_mode={journal_mode}: {e}")
+            if self._journal_mode is None:
+                self._journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
             
             # Create groups table
             conn.execute("""
@@ -113,7 +402,10 @@ class WaypointDatabase:
             # Create indexes for performance
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_type ON waypoints(waypoint_type)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_session ON waypoints(session_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_timestamp ON waypoints(timestamp)")
+            # (column, id) indexes serve keyset pagination without a sort
+            conn.execute("DROP INDEX IF EXISTS idx_waypoints_timestamp")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_timestamp_id ON waypoints(timestamp, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_name_id ON waypoints(name, id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_type_timestamp ON waypoints(waypoint_type, timestamp)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_session_timestamp ON waypoints(session_id, timestamp)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoints_position ON waypoints(position_x, position_y, position_z)")
@@ -122,8 +414,75 @@ class WaypointDatabase:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoint_groups_waypoint ON waypoint_groups(waypoint_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoint_groups_group ON waypoint_groups(group_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_waypoint_groups_composite ON waypoint_groups(group_id, waypoint_id)")
+            self._spatial_index = self._init_spatial_index(conn)
+            self._init_counters(conn)
             
             conn.commit()
+
+    def _init_spatial_index(self, conn: sqlite3.Connection) -> bool:
+        """Create the position R*Tree and its sync triggers; False if SQLite lacks the rtree module."""
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'waypoints_rtree'").fetchone()
+        try:
+            conn.execute(_SPATIAL_INDEX_SQL)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite R*Tree unavailable, spatial queries fall back to the position index: {e}")
+            return False
+        for trigger in _SPATIAL_TRIGGERS_SQL:
+            conn.execute(trigger)
+        if not exists:
+            # Databases created before the index existed are backfilled once
+            count = conn.execute(_POPULATE_SPATIAL_INDEX_SQL).rowcount
+            if count:
+                logger.info(f"Built spatial index for {count} existing waypoints")
+        return True
+
+    def _init_counters(self, conn: sqlite3.Connection):
+        """Create the counters table and triggers, backfilling it the first time."""
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'waypoint_counters'").fetchone()
+        conn.execute(_COUNTERS_SQL)
+        for trigger in _COUNTER_TRIGGERS_SQL:
+            conn.execute(trigger)
+        if not exists:
+            self._populate_counters(conn)
+
+    def _populate_counters(self, conn: sqlite3.Connection):
+        for statement in _POPULATE_COUNTERS_SQL:
+            conn.execute(statement)
+
+    def rebuild_counters(self) -> Dict[str, Any]:
+        """Recount every counter from the tables and return the result."""
+        with self._write_transaction() as conn:
+            self._populate_counters(conn)
+        return self.get_counters()
+
+    def _counter(self, conn: sqlite3.Connection, scope: str, key: str = '') -> int:
+        row = conn.execute(_SELECT_COUNTER_SQL, (scope, key)).fetchone()
+        return row[0] if row else 0
+
+    def count_waypoints(self, waypoint_type: Optional[str] = None) -> int:
+        """Number of stored waypoints, optionally of one type, read from the counters table."""
+        with self._read_snapshot() as conn:
+            return self._count_waypoints(conn, waypoint_type)
+
+    def get_counters(self) -> Dict[str, Any]:
+        """All counters: waypoint and group totals, waypoints per type and members per group."""
+        with self._read_snapshot() as conn:
+            rows = conn.execute("SELECT scope, key, count FROM waypoint_counters").fetchall()
+        counters: Dict[str, Any] = {"waypoints": 0, "groups": 0, "types": {}, "group_members": {}}
+        for scope, key, count in rows:
+            if scope == 'type':
+                if count:
+                    counters["types"][key] = count
+            elif scope == 'group':
+                counters["group_members"][key] = count
+            else:
+                counters[scope] = count
+        return counters
+
+    @property
+    def has_spatial_index(self) -> bool:
+        """Whether spatial queries are served by the R*Tree."""
+        return self._spatial_index
     
     # =====================================================================
     # GROUP MANAGEMENT
@@ -137,9 +496,8 @@ class WaypointDatabase:
         color: str = "#4A90E2"
     ) -> str:
         """Create a new group."""
-        with self._lock:
+        with self._write_transaction() as conn:
             group_id = f"grp_{uuid.uuid4().hex[:8]}"
-            conn = self._get_connection()
             
             # Validate parent group exists if specified
             if parent_group_id:
@@ -149,36 +507,28 @@ class WaypointDatabase:
                 if not parent:
                     raise ValueError(f"Parent group {parent_group_id} not found")
             
-            conn.execute("""
-                INSERT INTO groups (id, name, description, parent_group_id, created_at, color)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (group_id, name, description, parent_group_id, datetime.now().isoformat(), color))
+            conn.execute(_INSERT_GROUP_SQL, (group_id, name, description, parent_group_id, datetime.now().isoformat(), color))
             
-            conn.commit()
             logger.info(f"Created group {group_id}: {name}")
             return group_id
     
     def get_group(self, group_id: str) -> Optional[Dict[str, Any]]:
         """Get group by ID."""
-        with self._lock:
-            conn = self._get_connection()
-            row = conn.execute(
-                "SELECT * FROM groups WHERE id = ?", (group_id,)
-            ).fetchone()
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT * FROM groups WHERE id = ?", (group_id,)
+        ).fetchone()
 
-            if row:
-                return dict(row)
-            return None
+        if row:
+            return dict(row)
+        return None
 
     def update_group(self, group_id: str, **updates) -> bool:
         """Update group fields."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._write_transaction() as conn:
 
             # Check if group exists
-            existing = conn.execute(
-                "SELECT id FROM groups WHERE id = ?", (group_id,)
-            ).fetchone()
+            existing = conn.execute(_GROUP_EXISTS_SQL, (group_id,)).fetchone()
             if not existing:
                 return False
 
@@ -206,6 +556,9 @@ class WaypointDatabase:
                     ).fetchone()
                     if not parent:
                         raise ValueError(f"Parent group {updates['parent_group_id']} not found")
+                    # Re-parenting under itself or a descendant would detach the subtree into a cycle
+                    if updates['parent_group_id'] in self._get_subtree_group_ids(conn, group_id):
+                        raise ValueError(f"Group {updates['parent_group_id']} is {group_id} or one of its descendants")
 
                 update_fields.append("parent_group_id = ?")
                 values.append(updates['parent_group_id'])
@@ -217,102 +570,85 @@ class WaypointDatabase:
             query = f"UPDATE groups SET {', '.join(update_fields)} WHERE id = ?"
 
             conn.execute(query, values)
-            conn.commit()
             logger.info(f"Updated group {group_id} with fields: {list(updates.keys())}")
             return True
 
     def list_groups(self, parent_group_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """List groups, optionally filtered by parent."""
-        with self._lock:
-            conn = self._get_connection()
-            
-            if parent_group_id is None:
-                # Get top-level groups (no parent)
-                rows = conn.execute(
-                    "SELECT * FROM groups WHERE parent_group_id IS NULL ORDER BY name"
-                ).fetchall()
-            else:
-                # Get children of specific group
-                rows = conn.execute(
-                    "SELECT * FROM groups WHERE parent_group_id = ? ORDER BY name",
-                    (parent_group_id,)
-                ).fetchall()
-            
-            return [dict(row) for row in rows]
-    
+        conn = self._get_connection()
+        
+        if parent_group_id is None:
+            # Get top-level groups (no parent)
+            rows = conn.execute(
+                "SELECT * FROM groups WHERE parent_group_id IS NULL ORDER BY name"
+            ).fetchall()
+        else:
+            # Get children of specific group
+            rows = conn.execute(
+                "SELECT * FROM groups WHERE parent_group_id = ? ORDER BY name",
+                (parent_group_id,)
+            ).fetchall()
+        
+        return [dict(row) for row in rows]
+
     def get_group_hierarchy(self) -> Dict[str, Any]:
-        """Get complete group hierarchy as nested structure."""
-        with self._lock:
-            conn = self._get_connection()
-            
-            # Get all groups
-            all_groups = conn.execute("SELECT * FROM groups ORDER BY name").fetchall()
-            groups_by_id = {row['id']: dict(row) for row in all_groups}
-            
-            # Build hierarchy tree
-            def build_tree(parent_id: Optional[str] = None) -> List[Dict[str, Any]]:
-                children = []
-                for group_id, group in groups_by_id.items():
-                    if group['parent_group_id'] == parent_id:
-                        group_with_children = group.copy()
-                        group_with_children['children'] = build_tree(group_id)
-                        children.append(group_with_children)
-                return children
-            
-            return {
-                "hierarchy": build_tree(None),
-                "total_groups": len(groups_by_id)
-            }
-    
+        """
+        Get the complete group hierarchy as a nested structure.
+
+        Each group carries ``waypoint_count`` (direct members),
+        ``subtree_waypoint_count`` (distinct waypoints in the group and its
+        descendants) and ``descendant_group_count``, all from one query.
+        """
+        conn = self._get_connection()
+        rows = conn.execute(_GROUP_TREE_SQL).fetchall()
+
+        nodes = {row['id']: dict(row, children=[]) for row in rows}
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node['parent_group_id']) if node['parent_group_id'] else None
+            if parent is not None:
+                parent['children'].append(node)
+            elif not node['parent_group_id']:
+                roots.append(node)
+
+        return {
+            "hierarchy": roots,
+            "total_groups": len(nodes)
+        }
+
     def remove_group(self, group_id: str, cascade: bool = False) -> bool:
         """Remove group. If cascade=True, removes child groups and unassigns waypoints."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._write_transaction() as conn:
             
             # Check if group exists
-            group = conn.execute("SELECT id FROM groups WHERE id = ?", (group_id,)).fetchone()
+            group = conn.execute(_GROUP_EXISTS_SQL, (group_id,)).fetchone()
             if not group:
                 return False
             
             if cascade:
-                # Remove all child groups recursively
-                self._remove_group_cascade(conn, group_id)
-            else:
-                # Check for child groups
-                children = conn.execute(
-                    "SELECT id FROM groups WHERE parent_group_id = ?", (group_id,)
-                ).fetchall()
-                
-                if children:
-                    raise ValueError(f"Group {group_id} has {len(children)} child groups. Use cascade=True to remove them.")
+                # Remove the group and all of its descendants in one statement each
+                conn.execute(f"{_SUBTREE_CTE} DELETE FROM waypoint_groups WHERE group_id IN subtree", (group_id,))
+                removed = conn.execute(f"{_SUBTREE_CTE} DELETE FROM groups WHERE id IN subtree", (group_id,)).rowcount
+                logger.info(f"Removed group {group_id} and {removed - 1} descendant groups")
+                return True
+
+            # Check for child groups
+            children = conn.execute(
+                "SELECT id FROM groups WHERE parent_group_id = ?", (group_id,)
+            ).fetchall()
+            
+            if children:
+                raise ValueError(f"Group {group_id} has {len(children)} child groups. Use cascade=True to remove them.")
             
             # Remove waypoint-group associations
             conn.execute("DELETE FROM waypoint_groups WHERE group_id = ?", (group_id,))
             
             # Remove the group
             conn.execute("DELETE FROM groups WHERE id = ?", (group_id,))
-            conn.commit()
             
             logger.info(f"Removed group {group_id} (cascade={cascade})")
             return True
     
-    def _remove_group_cascade(self, conn: sqlite3.Connection, group_id: str):
-        """Recursively remove group and all children."""
-        # Get child groups
-        children = conn.execute(
-            "SELECT id FROM groups WHERE parent_group_id = ?", (group_id,)
-        ).fetchall()
-        
-        # Recursively remove children
-        for child in children:
-            self._remove_group_cascade(conn, child['id'])
-        
-        # Remove waypoint associations for this group
-        conn.execute("DELETE FROM waypoint_groups WHERE group_id = ?", (group_id,))
-        
-        # Remove the group itself
-        conn.execute("DELETE FROM groups WHERE id = ?", (group_id,))
-    
     # =====================================================================
     # WAYPOINT MANAGEMENT
     # =====================================================================
@@ -328,36 +664,27 @@ class WaypointDatabase:
         session_id: Optional[str] = None
     ) -> str:
         """Create waypoint with optional group assignments."""
-        with self._lock:
+        with self._write_transaction() as conn:
             # Use default waypoint type if none provided
             if waypoint_type is None:
                 waypoint_type = self._config.get_default_waypoint_type_id()
 
-            conn = self._get_connection()
 
             # Check waypoint limit
-            count = conn.execute("SELECT COUNT(*) as count FROM waypoints").fetchone()['count']
+            count = self._counter(conn, 'waypoints')
             if count >= self._config.max_waypoints:
                 raise ValueError(f"Maximum waypoints ({self._config.max_waypoints}) reached")
             
-            waypoint_id = f"wp_{uuid.uuid4().hex[:8]}"
+            waypoint_id = _new_waypoint_id()
             
             # Generate name based on database count (not in-memory cache)
             if not name:
                 # Get count of existing waypoints of this type for better numbering
-                existing_count = conn.execute(
-                    "SELECT COUNT(*) as count FROM waypoints WHERE waypoint_type = ?", 
-                    (waypoint_type,)
-                ).fetchone()['count']
+                existing_count = self._counter(conn, 'type', waypoint_type)
                 name = f"{waypoint_type.replace('_', ' ').title()} {existing_count + 1}"
             
             # Insert waypoint
-            conn.execute("""
-                INSERT INTO waypoints 
-                (id, name, position_x, position_y, position_z, target_x, target_y, target_z,
-                 waypoint_type, timestamp, session_id, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            conn.execute(_INSERT_WAYPOINT_SQL, (
                 waypoint_id, name,
                 position[0], position[1], position[2],
                 target[0] if target else None, 
@@ -371,145 +698,292 @@ class WaypointDatabase:
             if group_ids:
                 self._add_waypoint_to_groups(conn, waypoint_id, group_ids)
             
-            conn.commit()
             logger.info(f"Created waypoint {waypoint_id}: {name} at {position}")
             return waypoint_id
-    
+
+    def create_waypoints(self, entries: List[Dict[str, Any]], session_id: Optional[str] = None) -> List[str]:
+        """Create many waypoints in one transaction.
+
+        Each entry takes the keyword arguments of :meth:`create_waypoint`. The
+        limit check and name allocation run once for the whole batch, and rows
+        and group memberships are inserted with ``executemany``. Either every
+        waypoint is created or none is.
+        """
+        if not entries:
+            return []
+
+        for index, entry in enumerate(entries):
+            position = entry.get('position')
+            if position is None or len(position) != 3:
+                raise ValueError(f"Waypoint entry {index} needs a position [x, y, z]")
+
+        default_type = self._config.get_default_waypoint_type_id()
+        types = [entry.get('waypoint_type') or default_type for entry in entries]
+
+        with self._write_transaction() as conn:
+            count = self._counter(conn, 'waypoints')
+            if count + len(entries) > self._config.max_waypoints:
+                raise ValueError(
+                    f"Maximum waypoints ({self._config.max_waypoints}) reached: "
+                    f"{count} stored, {len(entries)} requested"
+                )
+
+            # Allocate auto-generated names from a single per-type count
+            unnamed_types = sorted({wtype for wtype, entry in zip(types, entries) if not entry.get('name')})
+            type_counts = {wtype: self._counter(conn, 'type', wtype) for wtype in unnamed_types}
+
+            requested_groups = sorted({gid for entry in entries for gid in entry.get('group_ids') or []})
+            known_groups: Set[str] = set()
+            if requested_groups:
+                placeholders = ','.join('?' * len(requested_groups))
+                known_groups = {row['id'] for row in conn.execute(
+                    f"SELECT id FROM groups WHERE id IN ({placeholders})", requested_groups
+                )}
+                for group_id in sorted(set(requested_groups) - known_groups):
+                    logger.warning(f"Group {group_id} not found, skipping")
+
+            timestamp = datetime.now().isoformat()
+            waypoint_ids: List[str] = []
+            rows_to_insert = []
+            memberships = []
+            for waypoint_type, entry in zip(types, entries):
+                waypoint_id = _new_waypoint_id()
+                name = entry.get('name')
+                if not name:
+                    type_counts[waypoint_type] = type_counts.get(waypoint_type, 0) + 1
+                    name = f"{waypoint_type.replace('_', ' ').title()} {type_counts[waypoint_type]}"
+                position = entry['position']
+                target = entry.get('target')
+                rows_to_insert.append((
+                    waypoint_id, name,
+                    position[0], position[1], position[2],
+                    target[0] if target else None,
+                    target[1] if target else None,
+                    target[2] if target else None,
+                    waypoint_type, timestamp,
+                    session_id, json.dumps(entry.get('metadata') or {})
+                ))
+                memberships.extend((waypoint_id, gid) for gid in entry.get('group_ids') or [] if gid in known_groups)
+                waypoint_ids.append(waypoint_id)
+
+            conn.executemany(_INSERT_WAYPOINT_SQL, rows_to_insert)
+            if memberships:
+                conn.executemany(_INSERT_MEMBERSHIP_SQL, memberships)
+
+            logger.info(f"Created {len(waypoint_ids)} waypoints ({len(memberships)} group memberships)")
+            return waypoint_ids
+
     def get_waypoint(self, waypoint_id: str) -> Optional[Waypoint]:
         """Get waypoint by ID with group information."""
-        with self._lock:
-            conn = self._get_connection()
-            row = conn.execute("SELECT * FROM waypoints WHERE id = ?", (waypoint_id,)).fetchone()
-            
-            if not row:
-                return None
-            
-            # Get group memberships
-            group_rows = conn.execute("""
-                SELECT g.id, g.name FROM groups g
-                JOIN waypoint_groups wg ON g.id = wg.group_id
-                WHERE wg.waypoint_id = ?
-            """, (waypoint_id,)).fetchall()
-            
-            groups = [{"id": g['id'], "name": g['name']} for g in group_rows]
-            
-            # Parse metadata and add groups
-            metadata = json.loads(row['metadata'] or '{}')
-            metadata['groups'] = groups
-            
-            return Waypoint(
-                id=row['id'],
-                name=row['name'],
-                position=(row['position_x'], row['position_y'], row['position_z']),
-                target=(row['target_x'], row['target_y'], row['target_z']),
-                waypoint_type=row['waypoint_type'],
-                timestamp=row['timestamp'],
-                session_id=row['session_id'] or "",
-                metadata=metadata
-            )
-    
+        conn = self._get_connection()
+        row = conn.execute(_SELECT_WAYPOINT_SQL, (waypoint_id,)).fetchone()
+        
+        if not row:
+            return None
+        
+        # Get group memberships
+        group_rows = conn.execute(_SELECT_WAYPOINT_GROUPS_SQL, (waypoint_id,)).fetchall()
+        
+        groups = [{"id": g['id'], "name": g['name']} for g in group_rows]
+        
+        # Parse metadata and add groups
+        metadata = json.loads(row['metadata'] or '{}')
+        metadata['groups'] = groups
+        
+        return Waypoint(
+            id=row['id'],
+            name=row['name'],
+            position=(row['position_x'], row['position_y'], row['position_z']),
+            target=(row['target_x'], row['target_y'], row['target_z']),
+            waypoint_type=row['waypoint_type'],
+            timestamp=row['timestamp'],
+            session_id=row['session_id'] or "",
+            metadata=metadata
+        )
+
+    def get_waypoints(self, waypoint_ids: List[str]) -> List[Waypoint]:
+        """Get several waypoints by ID in batched lookups; unknown IDs are skipped."""
+        waypoints: List[Waypoint] = []
+        with self._read_snapshot() as conn:
+            for start in range(0, len(waypoint_ids), _MAX_SQL_VARIABLES):
+                batch = waypoint_ids[start:start + _MAX_SQL_VARIABLES]
+                rows = conn.execute(
+                    f"SELECT * FROM waypoints WHERE id IN ({', '.join('?' * len(batch))})", batch
+                ).fetchall()
+                waypoints.extend(self._waypoints_from_rows(conn, rows))
+        return waypoints
+
     def list_waypoints(
         self,
         waypoint_type: Optional[str] = None,
         group_id: Optional[str] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        after_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        order_by: str = 'timestamp',
+        descending: bool = False,
+        after: Optional[Tuple[Any, str]] = None
     ) -> List[Waypoint]:
-        """List waypoints with optional filtering."""
-        with self._lock:
-            conn = self._get_connection()
-            
-            # Build query based on filters
-            query = "SELECT DISTINCT w.* FROM waypoints w"
-            params = []
-            conditions = []
-            
-            if group_id:
-                query += " JOIN waypoint_groups wg ON w.id = wg.waypoint_id"
-                conditions.append("wg.group_id = ?")
-                params.append(group_id)
-            
-            if waypoint_type:
-                conditions.append("w.waypoint_type = ?")
-                params.append(waypoint_type)
-            
-            if session_id:
-                conditions.append("w.session_id = ?")
-                params.append(session_id)
-            
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
-            
-            query += " ORDER BY w.timestamp"
-            
-            # Optimize to eliminate N+1 query - get all group info in single query
-            # Split query to properly place GROUP BY before ORDER BY
-            order_by_pos = query.rfind(" ORDER BY")
-            if order_by_pos != -1:
-                query_base = query[:order_by_pos]
-                order_clause = query[order_by_pos:]
+        """
+        List waypoints with optional filtering and keyset pagination.
+
+        Results are sorted by ``order_by`` then id. Pass the ``(sort value, id)``
+        of the last waypoint of a page as ``after`` to continue after it; each
+        page is an index range scan, however deep into the listing it starts,
+        and the bound stays valid if that waypoint is deleted meanwhile.
+        ``after_id`` looks the sort value up from an existing waypoint instead.
+        """
+        with self._read_snapshot() as conn:
+            rows = self._select_waypoint_rows(
+                conn, "w.*", waypoint_type, group_id, session_id, after_id, limit, order_by, descending, after
+            )
+            return self._waypoints_from_rows(conn, rows)
+
+    def list_waypoint_fields(
+        self,
+        fields: Iterable[str],
+        waypoint_type: Optional[str] = None,
+        group_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        after_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        order_by: str = 'timestamp',
+        descending: bool = False,
+        after: Optional[Tuple[Any, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Like :meth:`list_waypoints` but return plain dicts holding only ``fields`` (plus id).
+
+        Metadata is only decoded and group memberships only fetched when
+        they are requested; ``groups`` is returned as a top-level list.
+        """
+        fields = ['id'] + [name for name in dict.fromkeys(fields) if name != 'id']
+        unknown = [name for name in fields if name not in _WAYPOINT_FIELD_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown waypoint fields: {', '.join(unknown)}")
+        columns = ", ".join(f"w.{column}" for name in fields for column in _WAYPOINT_FIELD_COLUMNS[name])
+
+        with self._read_snapshot() as conn:
+            rows = self._select_waypoint_rows(
+                conn, columns, waypoint_type, group_id, session_id, after_id, limit, order_by, descending, after
+            )
+            memberships = self._group_memberships(conn, [row['id'] for row in rows]) if 'groups' in fields else {}
+
+        result = []
+        for row in rows:
+            item: Dict[str, Any] = {}
+            for name in fields:
+                if name == 'position':
+                    item[name] = (row['position_x'], row['position_y'], row['position_z'])
+                elif name == 'target':
+                    item[name] = (row['target_x'], row['target_y'], row['target_z'])
+                elif name == 'metadata':
+                    item[name] = json.loads(row['metadata'] or '{}')
+                elif name == 'groups':
+                    item[name] = memberships.get(row['id'], [])
+                elif name == 'session_id':
+                    item[name] = row['session_id'] or ""
+                else:
+                    item[name] = row[name]
+            result.append(item)
+        return result
+
+    def _select_waypoint_rows(
+        self,
+        conn: sqlite3.Connection,
+        columns: str,
+        waypoint_type: Optional[str],
+        group_id: Optional[str],
+        session_id: Optional[str],
+        after_id: Optional[str],
+        limit: Optional[int],
+        order_by: str,
+        descending: bool,
+        after: Optional[Tuple[Any, str]] = None
+    ) -> List[sqlite3.Row]:
+        """Fetch one page of waypoint rows; raises ValueError for an unknown sort key or cursor."""
+        order_by = order_by or 'timestamp'
+        if order_by not in WAYPOINT_ORDER_FIELDS:
+            raise ValueError(f"order_by must be one of {', '.join(WAYPOINT_ORDER_FIELDS)}")
+
+        conditions = []
+        params: List[Any] = []
+        if group_id:
+            conditions.append("w.id IN (SELECT waypoint_id FROM waypoint_groups WHERE group_id = ?)")
+            params.append(group_id)
+        if waypoint_type:
+            conditions.append("w.waypoint_type = ?")
+            params.append(waypoint_type)
+        if session_id:
+            conditions.append("w.session_id = ?")
+            params.append(session_id)
+
+        direction = "DESC" if descending else "ASC"
+        if after is None and after_id is not None:
+            if order_by == 'id':
+                after = (after_id, after_id)
             else:
-                query_base = query
-                order_clause = ""
-            
-            query_with_groups = query_base.replace("SELECT DISTINCT w.*", 
-                "SELECT DISTINCT w.*, GROUP_CONCAT(g.id || '|' || g.name) as group_info")
-            query_with_groups = query_with_groups.replace("FROM waypoints w", 
-                "FROM waypoints w LEFT JOIN waypoint_groups wg2 ON w.id = wg2.waypoint_id LEFT JOIN groups g ON wg2.group_id = g.id")
-            query_with_groups += " GROUP BY w.id" + order_clause
-            
-            rows = conn.execute(query_with_groups, params).fetchall()
-            waypoints = []
-            
-            for row in rows:
-                # Parse group info efficiently from concatenated result
-                groups = []
-                if row['group_info']:
-                    for group_str in row['group_info'].split(','):
-                        if '|' in group_str:
-                            g_id, g_name = group_str.split('|', 1)
-                            groups.append({"id": g_id, "name": g_name})
-                
-                metadata = json.loads(row['metadata'] or '{}')
-                metadata['groups'] = groups
-                
-                waypoint = Waypoint(
-                    id=row['id'],
-                    name=row['name'],
-                    position=(row['position_x'], row['position_y'], row['position_z']),
-                    target=(row['target_x'], row['target_y'], row['target_z']),
-                    waypoint_type=row['waypoint_type'],
-                    timestamp=row['timestamp'],
-                    session_id=row['session_id'] or "",
-                    metadata=metadata
-                )
-                waypoints.append(waypoint)
-            
-            return waypoints
-    
+                row = conn.execute(f"SELECT {order_by} FROM waypoints WHERE id = ?", (after_id,)).fetchone()
+                if row is None:
+                    raise ValueError(f"after_id {after_id} does not match an existing waypoint")
+                after = (row[0], after_id)
+        if after is not None:
+            comparison = "<" if descending else ">"
+            if order_by == 'id':
+                conditions.append(f"w.id {comparison} ?")
+                params.append(after[1])
+            else:
+                conditions.append(f"(w.{order_by}, w.id) {comparison} (?, ?)")
+                params.extend(after)
+
+        query = f"SELECT {columns} FROM waypoints w"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if order_by == 'id':
+            query += f" ORDER BY w.id {direction}"
+        else:
+            query += f" ORDER BY w.{order_by} {direction}, w.id {direction}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return conn.execute(query, params).fetchall()
+
     def remove_waypoint(self, waypoint_id: str) -> bool:
         """Remove waypoint and all group associations."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._write_transaction() as conn:
             
             # Check if waypoint exists
-            exists = conn.execute("SELECT id FROM waypoints WHERE id = ?", (waypoint_id,)).fetchone()
+            exists = conn.execute(_WAYPOINT_EXISTS_SQL, (waypoint_id,)).fetchone()
             if not exists:
                 return False
             
             # Remove group associations (CASCADE handles this automatically)
             conn.execute("DELETE FROM waypoints WHERE id = ?", (waypoint_id,))
-            conn.commit()
             
             logger.info(f"Removed waypoint {waypoint_id}")
             return True
     
+    def remove_waypoints(self, waypoint_ids: List[str]) -> List[str]:
+        """Remove several waypoints in one transaction and return the IDs that existed."""
+        removed: List[str] = []
+        with self._write_transaction() as conn:
+            for start in range(0, len(waypoint_ids), _MAX_SQL_VARIABLES):
+                batch = waypoint_ids[start:start + _MAX_SQL_VARIABLES]
+                placeholders = ', '.join('?' * len(batch))
+                existing = [row[0] for row in conn.execute(f"SELECT id FROM waypoints WHERE id IN ({placeholders})", batch)]
+                if existing:
+                    conn.execute(f"DELETE FROM waypoints WHERE id IN ({', '.join('?' * len(existing))})", existing)
+                    removed.extend(existing)
+        if removed:
+            logger.info(f"Removed {len(removed)} waypoints")
+        return removed
+
     def update_waypoint(self, waypoint_id: str, **updates) -> bool:
         """Update waypoint fields."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._write_transaction() as conn:
             
             # Check if waypoint exists
-            exists = conn.execute("SELECT id FROM waypoints WHERE id = ?", (waypoint_id,)).fetchone()
+            exists = conn.execute(_WAYPOINT_EXISTS_SQL, (waypoint_id,)).fetchone()
             if not exists:
                 return False
             
@@ -544,7 +1018,6 @@ class WaypointDatabase:
                 query = f"UPDATE waypoints SET {', '.join(set_clauses)} WHERE id = ?"
                 params.append(waypoint_id)
                 conn.execute(query, params)
-                conn.commit()
                 
                 logger.info(f"Updated waypoint {waypoint_id}: {list(updates.keys())}")
             
@@ -556,8 +1029,7 @@ class WaypointDatabase:
     
     def add_waypoint_to_groups(self, waypoint_id: str, group_ids: List[str]) -> int:
         """Add waypoint to multiple groups."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._write_transaction() as conn:
             return self._add_waypoint_to_groups(conn, waypoint_id, group_ids)
     
     def _add_waypoint_to_groups(self, conn: sqlite3.Connection, waypoint_id: str, group_ids: List[str]) -> int:
@@ -566,37 +1038,23 @@ class WaypointDatabase:
         
         for group_id in group_ids:
             # Validate group exists
-            group = conn.execute("SELECT id FROM groups WHERE id = ?", (group_id,)).fetchone()
+            group = conn.execute(_GROUP_EXISTS_SQL, (group_id,)).fetchone()
             if not group:
                 logger.warning(f"Group {group_id} not found, skipping")
                 continue
             
-            # Check if association already exists
-            existing = conn.execute(
-                "SELECT 1 FROM waypoint_groups WHERE waypoint_id = ? AND group_id = ?",
-                (waypoint_id, group_id)
-            ).fetchone()
-            
-            if not existing:
-                conn.execute(
-                    "INSERT INTO waypoint_groups (waypoint_id, group_id) VALUES (?, ?)",
-                    (waypoint_id, group_id)
-                )
+            # Existing associations are ignored by the insert itself
+            if conn.execute(_INSERT_MEMBERSHIP_SQL, (waypoint_id, group_id)).rowcount > 0:
                 added_count += 1
         
         if added_count > 0:
-            try:
-                conn.commit()
-            except Exception:
-                pass
             logger.info(f"Added waypoint {waypoint_id} to {added_count} groups")
         
         return added_count
     
     def remove_waypoint_from_groups(self, waypoint_id: str, group_ids: List[str]) -> int:
         """Remove waypoint from multiple groups."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._write_transaction() as conn:
             removed_count = 0
             
             for group_id in group_ids:
@@ -608,126 +1066,228 @@ class WaypointDatabase:
                     removed_count += 1
             
             if removed_count > 0:
-                conn.commit()
                 logger.info(f"Removed waypoint {waypoint_id} from {removed_count} groups")
             
             return removed_count
     
     def get_waypoint_groups(self, waypoint_id: str) -> List[Dict[str, Any]]:
         """Get all groups that contain a waypoint."""
-        with self._lock:
-            conn = self._get_connection()
-            rows = conn.execute("""
-                SELECT g.* FROM groups g
-                JOIN waypoint_groups wg ON g.id = wg.group_id
-                WHERE wg.waypoint_id = ?
-                ORDER BY g.name
-            """, (waypoint_id,)).fetchall()
-            
-            return [dict(row) for row in rows]
-    
-    def get_group_waypoints(self, group_id: str, include_nested: bool = False) -> List[Waypoint]:
-        """Get all waypoints in a group, optionally including nested groups."""
-        with self._lock:
-            # Validate input
-            if not group_id or not isinstance(group_id, str):
-                raise ValueError("Invalid group_id provided")
-            
-            conn = self._get_connection()
-            
-            if include_nested:
-                # Get all descendant group IDs
-                group_ids = self._get_descendant_group_ids(group_id)
-                group_ids.add(group_id)  # Include the group itself
-                
-                # Validate group IDs collection (prevent excessive queries)
-                if not group_ids or len(group_ids) > 1000:
-                    raise ValueError("Invalid group_ids collection")
-                
-                # Single optimized query with JOIN (eliminates N+1 problem)
-                placeholders = ', '.join('?' * len(group_ids))
-                query = f"""
-                    SELECT DISTINCT w.id, w.name, w.position_x, w.position_y, w.position_z,
-                           w.target_x, w.target_y, w.target_z, w.waypoint_type,
-                           w.timestamp, w.session_id, w.metadata,
-                           GROUP_CONCAT(g.id || '|' || g.name) as group_info
-                    FROM waypoints w
-                    JOIN waypoint_groups wg ON w.id = wg.waypoint_id
-                    LEFT JOIN waypoint_groups wg2 ON w.id = wg2.waypoint_id
-                    LEFT JOIN groups g ON wg2.group_id = g.id
-                    WHERE wg.group_id IN ({placeholders})
-                    GROUP BY w.id
-                    ORDER BY w.timestamp
-                """
-                params = list(group_ids)
-            else:
-                # Single optimized query for direct members only
-                query = """
-                    SELECT DISTINCT w.id, w.name, w.position_x, w.position_y, w.position_z,
-                           w.target_x, w.target_y, w.target_z, w.waypoint_type,
-                           w.timestamp, w.session_id, w.metadata,
-                           GROUP_CONCAT(g.id || '|' || g.name) as group_info
-                    FROM waypoints w
-                    JOIN waypoint_groups wg ON w.id = wg.waypoint_id
-                    LEFT JOIN waypoint_groups wg2 ON w.id = wg2.waypoint_id
-                    LEFT JOIN groups g ON wg2.group_id = g.id
-                    WHERE wg.group_id = ?
-                    GROUP BY w.id
-                    ORDER BY w.timestamp
-                """
-                params = [group_id]
-            
-            rows = conn.execute(query, params).fetchall()
-            waypoints = []
-            
-            for row in rows:
-                # Parse group info efficiently
-                groups = []
-                if row['group_info']:
-                    for group_str in row['group_info'].split(','):
-                        if '|' in group_str:
-                            g_id, g_name = group_str.split('|', 1)
-                            groups.append({"id": g_id, "name": g_name})
-                
-                # Parse metadata efficiently
-                try:
-                    metadata = json.loads(row['metadata'] or '{}')
-                except (json.JSONDecodeError, TypeError):
-                    metadata = {}
-                metadata['groups'] = groups
-                
-                # Create waypoint object directly (bypass get_waypoint call)
-                waypoint = Waypoint(
-                    id=row['id'],
-                    name=row['name'],
-                    position=(row['position_x'], row['position_y'], row['position_z']),
-                    target=(row['target_x'], row['target_y'], row['target_z']),
-                    waypoint_type=row['waypoint_type'],
-                    timestamp=row['timestamp'],
-                    session_id=row['session_id'] or "",
-                    metadata=metadata
-                )
-                waypoints.append(waypoint)
-            
-            return waypoints
-    
-    def _get_descendant_group_ids(self, group_id: str) -> Set[str]:
-        """Get all descendant group IDs recursively."""
         conn = self._get_connection()
-        descendants = set()
+        rows = conn.execute("""
+            SELECT g.* FROM groups g
+            JOIN waypoint_groups wg ON g.id = wg.group_id
+            WHERE wg.waypoint_id = ?
+            ORDER BY g.name
+        """, (waypoint_id,)).fetchall()
         
-        # Get direct children
-        children = conn.execute(
-            "SELECT id FROM groups WHERE parent_group_id = ?", (group_id,)
-        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_group_waypoints(self, group_id: str, include_nested: bool = False) -> List[Waypoint]:
+        """Get all waypoints in a group, optionally including nested groups."""
+        # Validate input
+        if not group_id or not isinstance(group_id, str):
+            raise ValueError("Invalid group_id provided")
         
-        for child in children:
-            child_id = child['id']
-            descendants.add(child_id)
-            # Recursively get descendants
-            descendants.update(self._get_descendant_group_ids(child_id))
+        conn = self._get_connection()
         
-        return descendants
+        if include_nested:
+            # Members of the group and every descendant, resolved in SQL
+            prefix = _SUBTREE_CTE
+            membership = "wg.group_id IN subtree"
+        else:
+            prefix = ""
+            membership = "wg.group_id = ?"
+        query = f"""
+            {prefix}
+            SELECT w.* FROM waypoints w
+            WHERE w.id IN (SELECT wg.waypoint_id FROM waypoint_groups wg WHERE {membership})
+            ORDER BY w.timestamp
+        """
+        rows = conn.execute(query, [group_id]).fetchall()
+        # Memberships come from their own query; names may contain ',' or '|'
+        return self._waypoints_from_rows(conn, rows)
+
+    def get_subtree_group_ids(self, group_id: str) -> Set[str]:
+        """The group and all of its descendants; empty when the group does not exist."""
+        return self._get_subtree_group_ids(self._get_connection(), group_id)
+
+    def _get_descendant_group_ids(self, group_id: str) -> Set[str]:
+        """Get all descendant group IDs with a single recursive query."""
+        subtree = self._get_subtree_group_ids(self._get_connection(), group_id)
+        subtree.discard(group_id)
+        return subtree
+
+    def _get_subtree_group_ids(self, conn: sqlite3.Connection, group_id: str) -> Set[str]:
+        """The group itself plus all of its descendants."""
+        return {row[0] for row in conn.execute(f"{_SUBTREE_CTE} SELECT id FROM subtree", (group_id,))}
+    
+    # =====================================================================
+    # SPATIAL QUERIES
+    # =====================================================================
+
+    def find_nearest_waypoints(
+        self,
+        position: Tuple[float, float, float],
+        k: int = 10,
+        radius: Optional[float] = None,
+        waypoint_type: Optional[str] = None
+    ) -> List[Tuple[Waypoint, float]]:
+        """
+        Return up to ``k`` waypoints closest to ``position`` with their distances.
+
+        With a ``radius`` only waypoints within that distance are considered.
+        Without one the search box grows until ``k`` waypoints are found or
+        every matching waypoint has been reached.
+        """
+        if k <= 0:
+            return []
+        with self._read_snapshot() as conn:
+            if radius is not None:
+                rows = self._nearest_rows(conn, position, k, radius, waypoint_type)
+            else:
+                rows = None
+                total = None
+                search_radius = _NEAREST_INITIAL_RADIUS
+                while search_radius <= _NEAREST_MAX_RADIUS:
+                    rows = self._nearest_rows(conn, position, k, search_radius, waypoint_type)
+                    if len(rows) >= k:
+                        break
+                    if total is None:
+                        total = self._count_waypoints(conn, waypoint_type)
+                    if len(rows) >= total:
+                        break
+                    search_radius *= 4
+                else:
+                    rows = self._nearest_rows(conn, position, k, None, waypoint_type)
+            waypoints = self._waypoints_from_rows(conn, rows)
+        return [(waypoint, math.sqrt(row['distance_sq'])) for waypoint, row in zip(waypoints, rows)]
+
+    def find_waypoints_in_bounds(
+        self,
+        min_corner: Tuple[float, float, float],
+        max_corner: Tuple[float, float, float],
+        waypoint_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Waypoint]:
+        """
+        Return waypoints inside the axis-aligned box.
+
+        Results come back in index order, so ``limit`` stops the scan early
+        instead of sorting every match first.
+        """
+        source, box, params = self._spatial_box(min_corner, max_corner)
+        query = f"SELECT w.* FROM {source} WHERE {box}"
+        if waypoint_type:
+            query += " AND w.waypoint_type = :waypoint_type"
+            params['waypoint_type'] = waypoint_type
+        if limit is not None:
+            query += " LIMIT :limit"
+            params['limit'] = limit
+        with self._read_snapshot() as conn:
+            rows = conn.execute(query, params).fetchall()
+            return self._waypoints_from_rows(conn, rows)
+
+    def _nearest_rows(
+        self,
+        conn: sqlite3.Connection,
+        position: Tuple[float, float, float],
+        k: int,
+        radius: Optional[float],
+        waypoint_type: Optional[str]
+    ) -> List[sqlite3.Row]:
+        x, y, z = position
+        if radius is None:
+            source, conditions, params = "waypoints w", [], {}
+        else:
+            source, box, params = self._spatial_box((x - radius, y - radius, z - radius),
+                                                    (x + radius, y + radius, z + radius))
+            # The box is a superset of the sphere; the exact distance check trims its corners
+            conditions = [box, "distance_sq <= :radius_sq"]
+            params['radius_sq'] = radius * radius
+        if waypoint_type:
+            conditions.append("w.waypoint_type = :waypoint_type")
+            params['waypoint_type'] = waypoint_type
+        params.update(x=x, y=y, z=z, k=k)
+        query = f"""
+            SELECT w.*, (w.position_x - :x) * (w.position_x - :x)
+                      + (w.position_y - :y) * (w.position_y - :y)
+                      + (w.position_z - :z) * (w.position_z - :z) AS distance_sq
+            FROM {source}
+        """
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY distance_sq, w.id LIMIT :k"
+        return conn.execute(query, params).fetchall()
+
+    def _spatial_box(
+        self,
+        min_corner: Tuple[float, float, float],
+        max_corner: Tuple[float, float, float]
+    ) -> Tuple[str, str, Dict[str, float]]:
+        """FROM source, WHERE clause and parameters selecting waypoints inside a box."""
+        params = {
+            'min_x': min_corner[0], 'min_y': min_corner[1], 'min_z': min_corner[2],
+            'max_x': max_corner[0], 'max_y': max_corner[1], 'max_z': max_corner[2],
+        }
+        exact = (
+            "w.position_x BETWEEN :min_x AND :max_x"
+            " AND w.position_y BETWEEN :min_y AND :max_y"
+            " AND w.position_z BETWEEN :min_z AND :max_z"
+        )
+        if not self._spatial_index:
+            return "waypoints w", exact, params
+        # R*Tree boxes are stored as rounded-out 32-bit floats, so re-check the real columns.
+        # CROSS JOIN keeps the R*Tree as the outer loop.
+        box = (
+            "r.max_x >= :min_x AND r.min_x <= :max_x"
+            " AND r.max_y >= :min_y AND r.min_y <= :max_y"
+            " AND r.max_z >= :min_z AND r.min_z <= :max_z"
+        )
+        return "waypoints_rtree r CROSS JOIN waypoints w ON w.rowid = r.id", f"{box} AND {exact}", params
+
+    def _count_waypoints(self, conn: sqlite3.Connection, waypoint_type: Optional[str] = None) -> int:
+        if waypoint_type:
+            return self._counter(conn, 'type', waypoint_type)
+        return self._counter(conn, 'waypoints')
+
+    def _group_memberships(self, conn: sqlite3.Connection, waypoint_ids: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Groups of each waypoint in ``waypoint_ids``, fetched in bulk."""
+        groups_by_waypoint: Dict[str, List[Dict[str, str]]] = {}
+        if len(waypoint_ids) > _FULL_MEMBERSHIP_SCAN_THRESHOLD:
+            # Near-complete listings: one pass over the membership table beats many IN (...) batches
+            wanted = set(waypoint_ids)
+            rows = conn.execute(_SELECT_ALL_MEMBERSHIPS_SQL)
+            batches = [[row for row in rows if row[0] in wanted]]
+        else:
+            batches = []
+            for start in range(0, len(waypoint_ids), _MAX_SQL_VARIABLES):
+                batch = waypoint_ids[start:start + _MAX_SQL_VARIABLES]
+                query = _SELECT_MEMBERSHIPS_SQL.format(placeholders=', '.join('?' * len(batch)))
+                batches.append(conn.execute(query, batch))
+        for batch in batches:
+            for waypoint_id, group_id, group_name in batch:
+                groups_by_waypoint.setdefault(waypoint_id, []).append({"id": group_id, "name": group_name})
+        return groups_by_waypoint
+
+    def _waypoints_from_rows(self, conn: sqlite3.Connection, rows: List[sqlite3.Row]) -> List[Waypoint]:
+        """Build waypoints for ``rows`` with their group memberships fetched in bulk."""
+        groups_by_waypoint = self._group_memberships(conn, [row['id'] for row in rows])
+
+        waypoints = []
+        for row in rows:
+            metadata = json.loads(row['metadata'] or '{}')
+            metadata['groups'] = groups_by_waypoint.get(row['id'], [])
+            waypoints.append(Waypoint(
+                id=row['id'],
+                name=row['name'],
+                position=(row['position_x'], row['position_y'], row['position_z']),
+                target=(row['target_x'], row['target_y'], row['target_z']),
+                waypoint_type=row['waypoint_type'],
+                timestamp=row['timestamp'],
+                session_id=row['session_id'] or "",
+                metadata=metadata
+            ))
+        return waypoints
     
     # =====================================================================
     # BULK OPERATIONS
@@ -735,22 +1295,18 @@ class WaypointDatabase:
     
     def clear_waypoints(self) -> int:
         """Clear all waypoints."""
-        with self._lock:
-            conn = self._get_connection()
-            count = conn.execute("SELECT COUNT(*) as count FROM waypoints").fetchone()['count']
+        with self._write_transaction() as conn:
+            count = self._counter(conn, 'waypoints')
             conn.execute("DELETE FROM waypoints")
-            conn.commit()
             
             logger.info(f"Cleared {count} waypoints")
             return count
     
     def clear_groups(self) -> int:
         """Clear all groups and their associations."""
-        with self._lock:
-            conn = self._get_connection()
-            count = conn.execute("SELECT COUNT(*) as count FROM groups").fetchone()['count']
+        with self._write_transaction() as conn:
+            count = self._counter(conn, 'groups')
             conn.execute("DELETE FROM groups")
-            conn.commit()
             
             logger.info(f"Cleared {count} groups")
             return count
@@ -761,14 +1317,14 @@ class WaypointDatabase:
     
     def export_to_json(self, include_groups: bool = True) -> Dict[str, Any]:
         """Export waypoints and optionally groups to JSON structure."""
-        with self._lock:
+        with self._read_snapshot():
             export_data = {
                 "version": "1.0",
                 "exported_at": datetime.now().isoformat(),
                 "waypoints": [],
                 "groups": [] if include_groups else None
             }
-            
+        
             # Export waypoints
             waypoints = self.list_waypoints()
             for wp in waypoints:
@@ -776,7 +1332,7 @@ class WaypointDatabase:
                 group_ids = []
                 if 'groups' in wp.metadata:
                     group_ids = [group['id'] for group in wp.metadata['groups']]
-                
+            
                 wp_data = {
                     "id": wp.id,
                     "name": wp.name,
@@ -788,114 +1344,237 @@ class WaypointDatabase:
                     "group_ids": group_ids
                 }
                 export_data["waypoints"].append(wp_data)
-            
+        
             # Export groups if requested
             if include_groups:
                 hierarchy = self.get_group_hierarchy()
                 export_data["groups"] = hierarchy["hierarchy"]
-            
+        
             return export_data
-    
+
     def import_from_json(self, data: Dict[str, Any], merge_mode: str = "replace") -> Dict[str, int]:
-        """Import waypoints and groups from JSON data."""
-        with self._lock:
-            conn = self._get_connection()
-            stats = {"waypoints_imported": 0, "groups_imported": 0, "errors": 0}
-            group_id_mapping = {}  # Maps old group IDs to new group IDs
-            
-            if merge_mode == "replace":
-                # Clear existing data
-                conn.execute("DELETE FROM waypoints")
-                conn.execute("DELETE FROM groups")
-            
-            # Import groups first (to establish hierarchy) and build ID mapping
-            if data.get("groups"):
-                group_id_mapping = self._import_groups_recursive(conn, data["groups"])
-                stats["groups_imported"] = len(group_id_mapping)
-                logger.info(f"Built group ID mapping: {group_id_mapping}")
-            
-            # Import waypoints with mapped group IDs
-            for wp_data in data.get("waypoints", []):
+        """Import waypoints and groups from a parsed export document."""
+        return self.import_records(iter_document_records(data), merge_mode)
+
+    def import_records(
+        self,
+        records: Iterable[ImportRecord],
+        merge_mode: str = "replace",
+        chunk_size: Optional[int] = None,
+        status: Optional[ImportStatus] = None,
+        on_commit: Optional[Callable[[List[str]], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Import ``('groups', list)`` and ``('waypoint', dict)`` records in chunks.
+
+        Waypoints are inserted with ``executemany`` and committed once per
+        ``chunk_size`` rows, so readers see progress and the write lock is
+        released between chunks. Invalid rows are skipped and counted. Group
+        memberships are resolved after the last chunk because export
+        documents list waypoints before groups. In ``replace`` mode the
+        previous rows stay visible until that final commit removes them.
+
+        ``on_commit`` is called with the IDs of each committed chunk and once
+        with no IDs after the final commit, so a cache in front of the
+        database can invalidate as rows land. Any other failure removes
+        everything the import already committed and re-raises. The outcome
+        is logged as a single summary line; the caller marks ``status``
+        finished.
+        """
+        chunk_size = max(1, int(chunk_size or self._config.import_chunk_size))
+        status = status or ImportStatus(merge_mode=merge_mode)
+        status.state = 'running'
+        replace = merge_mode == "replace"
+        default_type = self._config.get_default_waypoint_type_id()
+        started = time.perf_counter()
+
+        with self._read_snapshot() as conn:
+            # Rows at or below these rowids predate the import; replace mode drops them at the end
+            waypoint_watermark = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM waypoints").fetchone()[0]
+            group_watermark = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM groups").fetchone()[0]
+            # Waypoints that predate the import, for the replace-mode limit check
+            previous_count = self._counter(conn, 'waypoints')
+            type_counts: Dict[str, int] = {} if replace else {
+                row['key']: row['count'] for row in conn.execute(
+                    "SELECT key, count FROM waypoint_counters WHERE scope = 'type'"
+                )
+            }
+
+        timestamp = datetime.now().isoformat()
+        group_mapping: Dict[str, str] = {}
+        created_groups: List[str] = []
+        created_waypoints: List[str] = []
+        memberships: List[Tuple[str, str]] = []
+        pending: List[tuple] = []
+
+        def flush():
+            if not pending:
+                return
+            with self._write_transaction() as conn:
+                count = self._counter(conn, 'waypoints')
+                if replace:
+                    # The previous rows are deleted at the end, so only newer rows count
+                    count = max(0, count - previous_count)
+                if count + len(pending) > self._config.max_waypoints:
+                    raise ValueError(f"Maximum waypoints ({self._config.max_waypoints}) reached during import")
+                conn.executemany(_INSERT_WAYPOINT_SQL, pending)
+            committed = [row[0] for row in pending]
+            created_waypoints.extend(committed)
+            status.waypoints_imported += len(pending)
+            status.chunks_committed += 1
+            pending.clear()
+            if on_commit:
+                on_commit(committed)
+
+        try:
+            index = 0
+            for kind, payload in records:
+                if kind == 'groups':
+                    with self._write_transaction() as conn:
+                        self._import_groups_recursive(conn, payload, None, group_mapping, created_groups, status)
+                    status.groups_imported = len(created_groups)
+                    continue
+                index += 1
                 try:
-                    original_group_ids = wp_data.get("group_ids", [])
-                    # Map old group IDs to new group IDs
-                    mapped_group_ids = [group_id_mapping.get(old_id, old_id) for old_id in original_group_ids]
-                    
-                    logger.info(f"Importing waypoint {wp_data.get('name')} with original group_ids: {original_group_ids} -> mapped: {mapped_group_ids}")
-                    
-                    # Handle target data - convert null arrays to None
-                    target_data = wp_data.get("target")
-                    if target_data and any(x is not None for x in target_data):
-                        target = tuple(target_data)
-                    else:
-                        target = None
-                    
-                    waypoint_id = self.create_waypoint(
-                        position=tuple(wp_data["position"]),
-                        waypoint_type=wp_data["waypoint_type"],
-                        name=wp_data["name"],
-                        target=target,
-                        metadata=wp_data.get("metadata", {}),
-                        group_ids=mapped_group_ids
-                    )
-                    stats["waypoints_imported"] += 1
-                    logger.info(f"Successfully imported waypoint {waypoint_id}")
-                except Exception as e:
-                    logger.error(f"Failed to import waypoint {wp_data.get('name', 'unknown')}: {e}")
-                    stats["errors"] += 1
-            
-            conn.commit()
-            return stats
-    
-    def _import_groups_recursive(self, conn: sqlite3.Connection, groups: List[Dict], parent_id: Optional[str] = None, id_mapping: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Recursively import group hierarchy and return old_id -> new_id mapping."""
-        if id_mapping is None:
-            id_mapping = {}
-        
+                    row, group_ids = self._import_waypoint_row(payload, default_type, type_counts, timestamp)
+                except (KeyError, TypeError, ValueError) as e:
+                    status.record_row_error(f"waypoint {index}: {e}")
+                    continue
+                pending.append(row)
+                memberships.extend((row[0], group_id) for group_id in group_ids)
+                if len(pending) >= chunk_size:
+                    flush()
+            flush()
+
+            with self._write_transaction() as conn:
+                if replace:
+                    conn.execute("DELETE FROM waypoints WHERE rowid <= ?", (waypoint_watermark,))
+                    conn.execute("DELETE FROM groups WHERE rowid <= ?", (group_watermark,))
+                if memberships:
+                    valid_groups = set(created_groups) if replace else {row['id'] for row in conn.execute("SELECT id FROM groups")}
+                    resolved = ((waypoint_id, group_mapping.get(group_id, group_id)) for waypoint_id, group_id in memberships)
+                    conn.executemany(_INSERT_MEMBERSHIP_SQL, [pair for pair in resolved if pair[1] in valid_groups])
+            if on_commit:
+                on_commit([])
+        except BaseException as e:
+            self._discard_import(created_waypoints, created_groups)
+            logger.error(
+                f"Waypoint import {status.import_id} failed after {time.perf_counter() - started:.2f}s and was rolled back: {e}"
+            )
+            raise
+
+        logger.info(
+            f"Imported {status.waypoints_imported} waypoints and {status.groups_imported} groups "
+            f"({merge_mode}, {status.chunks_committed} chunks, {status.errors} rows skipped) "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return {
+            "waypoints_imported": status.waypoints_imported,
+            "groups_imported": status.groups_imported,
+            "errors": status.errors,
+            "chunks": status.chunks_committed,
+        }
+
+    def _import_waypoint_row(
+        self,
+        data: Dict[str, Any],
+        default_type: str,
+        type_counts: Dict[str, int],
+        timestamp: str,
+    ) -> Tuple[tuple, List[str]]:
+        """Validate one imported waypoint and build its insert row and requested group IDs."""
+        if not isinstance(data, dict):
+            raise ValueError("waypoint must be an object")
+        position = data["position"]
+        if not isinstance(position, (list, tuple)) or len(position) != 3:
+            raise ValueError("position must be [x, y, z]")
+        position = tuple(float(value) for value in position)
+
+        # Exports write a missing target as [null, null, null]
+        target = data.get("target")
+        if target and any(value is not None for value in target):
+            if len(target) != 3:
+                raise ValueError("target must be [x, y, z]")
+            target = tuple(float(value) for value in target)
+        else:
+            target = None
+
+        group_ids = data.get("group_ids") or []
+        if not isinstance(group_ids, list):
+            raise ValueError("group_ids must be a list")
+
+        # Group membership is rebuilt from group_ids, so drop the exported copy
+        metadata = {key: value for key, value in (data.get("metadata") or {}).items() if key != "groups"}
+
+        waypoint_type = data.get("waypoint_type") or default_type
+        name = data.get("name")
+        if not name:
+            type_counts[waypoint_type] = type_counts.get(waypoint_type, 0) + 1
+            name = f"{waypoint_type.replace('_', ' ').title()} {type_counts[waypoint_type]}"
+
+        row = (
+            _new_waypoint_id(), name,
+            position[0], position[1], position[2],
+            target[0] if target else None,
+            target[1] if target else None,
+            target[2] if target else None,
+            waypoint_type, timestamp,
+            None, json.dumps(metadata)
+        )
+        return row, group_ids
+
+    def _import_groups_recursive(
+        self,
+        conn: sqlite3.Connection,
+        groups: List[Dict],
+        parent_id: Optional[str],
+        id_mapping: Dict[str, str],
+        created: List[str],
+        status: ImportStatus,
+    ):
+        """Insert a group hierarchy, recording old_id -> new_id and creation order."""
         for group_data in groups:
-            try:
-                old_group_id = group_data["id"]  # Original ID from export
-                new_group_id = self.create_group(
-                    name=group_data["name"],
-                    description=group_data.get("description"),
-                    parent_group_id=parent_id,
-                    color=group_data.get("color", "#4A90E2")
-                )
-                
-                # Store the mapping
-                id_mapping[old_group_id] = new_group_id
-                logger.info(f"Group ID mapping: {old_group_id} -> {new_group_id}")
-                
-                # Import children (pass the mapped parent ID)
-                if group_data.get("children"):
-                    self._import_groups_recursive(
-                        conn, group_data["children"], new_group_id, id_mapping
-                    )
-                    
-            except Exception as e:
-                logger.error(f"Failed to import group {group_data.get('name', 'unknown')}: {e}")
-        
-        return id_mapping
-    
+            if not isinstance(group_data, dict) or not group_data.get("name"):
+                status.record_row_error("group: name is required")
+                continue
+            new_group_id = f"grp_{uuid.uuid4().hex[:8]}"
+            conn.execute(_INSERT_GROUP_SQL, (
+                new_group_id, group_data["name"], group_data.get("description"),
+                parent_id, datetime.now().isoformat(), group_data.get("color", "#4A90E2")
+            ))
+
+            created.append(new_group_id)
+            if group_data.get("id"):
+                id_mapping[group_data["id"]] = new_group_id
+            if group_data.get("children"):
+                self._import_groups_recursive(conn, group_data["children"], new_group_id, id_mapping, created, status)
+
+    def _discard_import(self, waypoint_ids: List[str], group_ids: List[str]):
+        """Delete rows committed by a failed import; groups go children first."""
+        if not waypoint_ids and not group_ids:
+            return
+        try:
+            with self._write_transaction() as conn:
+                conn.executemany("DELETE FROM waypoints WHERE id = ?", ((waypoint_id,) for waypoint_id in waypoint_ids))
+                conn.executemany("DELETE FROM groups WHERE id = ?", ((group_id,) for group_id in reversed(group_ids)))
+        except sqlite3.Error as e:
+            logger.error(f"Could not discard rows from failed import: {e}")
+
     # =====================================================================
     # STATISTICS AND UTILITIES
     # =====================================================================
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
-        with self._lock:
-            conn = self._get_connection()
-            
-            waypoint_count = conn.execute("SELECT COUNT(*) as count FROM waypoints").fetchone()['count']
-            group_count = conn.execute("SELECT COUNT(*) as count FROM groups").fetchone()['count']
-            
+        with self._read_snapshot() as conn:
+            waypoint_count = self._counter(conn, 'waypoints')
+            group_count = self._counter(conn, 'groups')
+        
             # Waypoint type breakdown
-            type_breakdown = conn.execute("""
-                SELECT waypoint_type, COUNT(*) as count 
-                FROM waypoints 
-                GROUP BY waypoint_type
-            """).fetchall()
-            
+            type_breakdown = conn.execute(
+                "SELECT key AS waypoint_type, count FROM waypoint_counters WHERE scope = 'type' AND count > 0"
+            ).fetchall()
+        
             # Group membership stats
             membership_stats = conn.execute("""
                 SELECT 
@@ -908,7 +1587,7 @@ class WaypointDatabase:
                     GROUP BY waypoint_id
                 )
             """).fetchone()
-            
+        
             return {
                 "database_path": str(self._db_path),
                 "total_waypoints": waypoint_count,
@@ -920,10 +1599,10 @@ class WaypointDatabase:
                     "avg_groups_per_waypoint": round(membership_stats['avg_groups_per_waypoint'] or 0, 2)
                 }
             }
-    
+
     def migrate_from_memory(self, waypoints: Dict[str, Waypoint]) -> int:
         """Migrate existing in-memory waypoints to database."""
-        with self._lock:
+        with self._write_transaction():
             migrated_count = 0
             
             for waypoint in waypoints.values():
@@ -951,9 +1630,11 @@ class WaypointDatabase:
             return migrated_count
     
     def close(self):
-        """Close database connections."""
+        """Close this thread's database connection, checkpointing the WAL first."""
         if hasattr(self._thread_local, 'connection'):
             try:
+                if str(self._journal_mode).lower() == 'wal':
+                    self._thread_local.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
                 self._thread_local.connection.close()
                 delattr(self._thread_local, 'connection')
                 logger.info("Database connection closed successfully")
@@ -3,34 +3,52 @@ Core waypoint storage and management with thread safety.
 """
 
 import logging
+import os
+import shutil
+import tempfile
 import threading
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
 
 import omni.kit.viewport.utility
 import omni.usd
 from pxr import Gf, UsdGeom
 
 from .config import get_config
+from .import_stream import ImportInProgress, ImportRecord, ImportStatus, JsonRecordReader, iter_document_records
 from .models import Waypoint
+from .marker_lod import CameraView
 from .marker_manager import WaypointMarkerManager
+from .waypoint_cache import WaypointCache
 from .waypoint_database import WaypointDatabase
 
 logger = logging.getLogger(__name__)
 
+# Finished import handles kept for waypoints/import_status, oldest evicted first
+MAX_TRACKED_IMPORTS = 20
+
 
 class WaypointManager:
     """Core waypoint storage and management with thread safety."""
     
     def __init__(self):
         self._config = get_config()
-        self._waypoints: Dict[str, Waypoint] = {}  # Keep for backward compatibility
         self._session_id = str(uuid.uuid4())[:8]
         self._marker_manager = WaypointMarkerManager()
         
-        # Thread safety lock for waypoint operations
+        # Held by mutations; reads take it only briefly to fill the cache
         self._lock = threading.RLock()
+        # Write-through cache whose version moves after every mutation; the session
+        # id keeps version tags from repeating across restarts
+        self._cache = WaypointCache(self._session_id, self._lock)
+        self._waypoints: Dict[str, Waypoint] = self._cache.waypoints  # Keep for backward compatibility
+
+        # One import at a time; progress handles stay queryable after they finish
+        self._import_lock = threading.Lock()
+        self._imports: "OrderedDict[str, ImportStatus]" = OrderedDict()
         
         # Initialize SQLite database backend
         self._database = WaypointDatabase()
@@ -48,7 +66,7 @@ class WaypointManager:
         group_ids: Optional[List[str]] = None
     ) -> str:
         """Create a new waypoint with thread safety and database persistence."""
-        with self._lock:
+        with self._mutating():
             # Use default waypoint type if none provided
             if waypoint_type is None:
                 waypoint_type = self._config.get_default_waypoint_type_id()
@@ -64,124 +82,205 @@ class WaypointManager:
                 session_id=self._session_id
             )
             
-            # Update in-memory cache for backward compatibility
+            # Write through to the cache
             waypoint = self._database.get_waypoint(waypoint_id)
             if waypoint:
-                self._waypoints[waypoint_id] = waypoint
+                self._cache.put([waypoint])
                 
                 # Add visual marker for the waypoint
                 self._marker_manager.add_waypoint_marker(waypoint_id, position, waypoint_type)
             
             return waypoint_id
-    
+
+    def create_waypoints(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """Create many waypoints in one database transaction and draw their markers once."""
+        with self._mutating():
+            waypoint_ids = self._database.create_waypoints(entries, session_id=self._session_id)
+            if not waypoint_ids:
+                return waypoint_ids
+
+            created = self._database.get_waypoints(waypoint_ids)
+            self._cache.put(created)
+            self._marker_manager.add_waypoint_markers(created)
+            return waypoint_ids
+
+    @property
+    def version(self) -> int:
+        """Cache version; moves after every mutation, including each committed import chunk."""
+        return self._cache.version
+
+    @property
+    def cache_tag(self) -> str:
+        """Opaque tag for the current version, used as the HTTP ETag of read responses."""
+        return self._cache.tag
+
+    def is_current(self, tag: Optional[str]) -> bool:
+        """Whether ``tag`` (an ``If-None-Match`` value) still names the current version."""
+        return self._cache.matches(tag)
+
     def get_waypoint(self, waypoint_id: str) -> Optional[Waypoint]:
-        """Get waypoint by ID with thread safety."""
-        with self._lock:
-            # Try database first, fallback to in-memory cache
-            waypoint = self._database.get_waypoint(waypoint_id)
-            if waypoint:
-                # Update cache
-                self._waypoints[waypoint_id] = waypoint
-                return waypoint
-            return self._waypoints.get(waypoint_id)
+        """Get waypoint by ID from the cache, reading through to the database on a miss."""
+        waypoint = self._cache.get(waypoint_id)
+        if waypoint is not None:
+            return waypoint
+        version = self._cache.version
+        waypoint = self._database.get_waypoint(waypoint_id)
+        if waypoint:
+            self._cache.fill([waypoint], version)
+        return waypoint
     
-    def list_waypoints(self, waypoint_type: Optional[str] = None, group_id: Optional[str] = None) -> List[Waypoint]:
-        """List waypoints with optional filtering and thread safety."""
-        with self._lock:
-            # Use database for listing with enhanced filtering
-            waypoints = self._database.list_waypoints(
+    def list_waypoints(self, waypoint_type: Optional[str] = None, group_id: Optional[str] = None,
+                       after_id: Optional[str] = None, limit: Optional[int] = None,
+                       order_by: str = 'timestamp', descending: bool = False,
+                       after: Optional[Tuple[Any, str]] = None) -> List[Waypoint]:
+        """List waypoints with optional filtering, keyset pagination and thread safety."""
+        return self._read_waypoints(
+            ('list', waypoint_type, group_id, after_id, limit, order_by, descending, after),
+            lambda: self._database.list_waypoints(
                 waypoint_type=waypoint_type,
                 group_id=group_id,
-                session_id=None  # Don't filter by session to get all waypoints
+                session_id=None,  # Don't filter by session to get all waypoints
+                after_id=after_id,
+                limit=limit,
+                order_by=order_by,
+                descending=descending,
+                after=after
             )
-            
-            # Update cache with retrieved waypoints
-            for wp in waypoints:
-                self._waypoints[wp.id] = wp
-            
-            return waypoints
+        )
+
+    def list_waypoint_fields(self, fields: List[str], waypoint_type: Optional[str] = None,
+                             group_id: Optional[str] = None, after_id: Optional[str] = None,
+                             limit: Optional[int] = None, order_by: str = 'timestamp',
+                             descending: bool = False,
+                             after: Optional[Tuple[Any, str]] = None) -> List[Dict[str, Any]]:
+        """Projected waypoint listing; partial rows are memoized per version but never cached as waypoints."""
+        return list(self._cache.result(
+            ('fields', tuple(fields), waypoint_type, group_id, after_id, limit, order_by, descending, after),
+            lambda: self._database.list_waypoint_fields(
+                fields, waypoint_type=waypoint_type, group_id=group_id, after_id=after_id,
+                limit=limit, order_by=order_by, descending=descending, after=after
+            )
+        ))
     
+    def find_nearest_waypoints(self, position: Tuple[float, float, float], k: int = 10,
+                               radius: Optional[float] = None,
+                               waypoint_type: Optional[str] = None) -> List[Tuple[Waypoint, float]]:
+        """Nearest waypoints to a point with their distances, served by the spatial index."""
+        def load():
+            version = self._cache.version
+            results = self._database.find_nearest_waypoints(position, k, radius, waypoint_type)
+            self._cache.fill([waypoint for waypoint, _ in results], version)
+            return results
+
+        return list(self._cache.result(('nearest', tuple(position), k, radius, waypoint_type), load))
+
+    def find_waypoints_in_bounds(self, min_corner: Tuple[float, float, float],
+                                 max_corner: Tuple[float, float, float],
+                                 waypoint_type: Optional[str] = None,
+                                 limit: Optional[int] = None) -> List[Waypoint]:
+        """Waypoints inside an axis-aligned box, served by the spatial index."""
+        return self._read_waypoints(
+            ('bounds', tuple(min_corner), tuple(max_corner), waypoint_type, limit),
+            lambda: self._database.find_waypoints_in_bounds(min_corner, max_corner, waypoint_type, limit)
+        )
+
     def get_waypoint_count(self) -> int:
         """Get the number of waypoints currently stored with thread safety."""
+        # Trigger-maintained counter; no table scan on status polls
+        return self._database.count_waypoints()
+
+    @contextmanager
+    def _mutating(self) -> Iterator[None]:
+        """Hold the lock for a mutation and bump the cache version when it ends."""
         with self._lock:
-            # Use database count for accuracy
-            stats = self._database.get_statistics()
-            return stats['total_waypoints']
+            try:
+                yield
+            finally:
+                self._cache.bump()
+
+    def _read_waypoints(self, key: Hashable, read: Callable[[], List[Waypoint]]) -> List[Waypoint]:
+        """Memoized database read for the current version; its waypoints also fill the entity cache."""
+        def load():
+            version = self._cache.version
+            waypoints = read()
+            self._cache.fill(waypoints, version)
+            return waypoints
+
+        return list(self._cache.result(key, load))
 
     def get_visible_marker_count(self) -> int:
         """Get the number of currently visible markers."""
-        return len(self._marker_manager._markers)
+        return self._marker_manager.get_visible_marker_count()
+
+    def flush_markers(self):
+        """Draw pending marker changes; called once per frame from the main thread."""
+        if self._marker_manager.lod_enabled:
+            self._marker_manager.update_camera(self._get_camera_view())
+        self._marker_manager.flush()
+
+    def _get_camera_view(self) -> Optional[CameraView]:
+        """View and projection of the active viewport, or None when there is none."""
+        try:
+            viewport_api = omni.kit.viewport.utility.get_active_viewport()
+            if not viewport_api:
+                return None
+            return CameraView.from_matrices(viewport_api.view, viewport_api.projection)
+        except Exception as e:
+            logger.debug(f"Could not read viewport camera for marker LOD: {e}")
+            return None
     
     def remove_waypoint(self, waypoint_id: str) -> bool:
         """Remove waypoint by ID with thread safety."""
-        with self._lock:
+        with self._mutating():
             # Remove from database
             removed = self._database.remove_waypoint(waypoint_id)
             
             if removed:
                 # Remove from in-memory cache
-                self._waypoints.pop(waypoint_id, None)
+                self._cache.discard([waypoint_id])
                 
-                # Remove from marker tracking
+                # Remove the marker; the next frame redraws the rest
                 self._marker_manager.remove_waypoint_marker(waypoint_id)
                 
-                # Force full refresh to sync debug markers with waypoint data
-                self._marker_manager.refresh_all_markers_batched(self._waypoints)
-                
                 return True
             return False
     
     def remove_waypoints(self, waypoint_ids: List[str]) -> int:
         """Remove multiple waypoints by IDs with thread safety."""
-        with self._lock:
-            removed_count = 0
-            removed_ids = []
+        with self._mutating():
+            # One transaction; only the rows that existed leave the cache and the viewport
+            removed_ids = self._database.remove_waypoints(list(waypoint_ids))
             
-            for waypoint_id in waypoint_ids:
-                # Remove from database
-                removed = self._database.remove_waypoint(waypoint_id)
-                
-                if removed:
-                    removed_count += 1
-                    removed_ids.append(waypoint_id)
-                    
-                    # Remove from in-memory cache
-                    self._waypoints.pop(waypoint_id, None)
-                    
-                    # Remove from marker tracking
-                    self._marker_manager.remove_waypoint_marker(waypoint_id)
+            if removed_ids:
+                self._cache.discard(removed_ids)
+                self._marker_manager.remove_waypoint_markers(removed_ids)
             
-            if removed_count > 0:
-                # Force full refresh to sync debug markers with waypoint data
-                self._marker_manager.refresh_all_markers_batched(self._waypoints)
-                logger.info(f"Removed {removed_count} waypoints: {removed_ids}")
-            
-            return removed_count
+            return len(removed_ids)
     
     def clear_waypoints(self) -> int:
         """Clear all waypoints with thread safety."""
-        with self._lock:
+        with self._mutating():
             # Clear from database
             count = self._database.clear_waypoints()
             
             # Clear in-memory cache
-            self._waypoints.clear()
+            self._cache.clear()
             
             # Clear all visual markers
-            self._marker_manager.refresh_all_markers_batched({})
+            self._marker_manager.clear_markers()
             
             logger.info(f"Cleared {count} waypoints")
             return count
     
     def refresh_waypoint_markers(self):
         """Refresh all waypoint visual markers with batched operations."""
-        with self._lock:
+        with self._mutating():
             # Get current waypoints from database to ensure markers are in sync
             current_waypoints = self._database.list_waypoints()
             waypoint_dict = {wp.id: wp for wp in current_waypoints}
             
-            # Update in-memory cache
-            self._waypoints.update(waypoint_dict)
+            # Resync the in-memory cache
+            self._cache.replace(current_waypoints)
             
             # Refresh markers using database data
             self._marker_manager.refresh_all_markers_batched(waypoint_dict)
@@ -190,10 +289,6 @@ class WaypointManager:
     def set_markers_visible(self, visible: bool):
         """Show or hide waypoint markers."""
         self._marker_manager.set_markers_visible(visible)
-        if visible:
-            # Refresh markers when showing with thread safety
-            with self._lock:
-                self._marker_manager.refresh_all_markers_batched(self._waypoints)
     
     def are_markers_visible(self) -> bool:
         """Check if waypoint markers are visible."""
@@ -201,17 +296,15 @@ class WaypointManager:
     
     def get_debug_status(self) -> Dict[str, Any]:
         """Get debug draw system status."""
-        return self._marker_manager.get_debug_draw_status()
+        return dict(self._marker_manager.get_debug_draw_status(), cache=self._cache.get_stats())
     
     def set_individual_marker_visible(self, waypoint_id: str, visible: bool):
         """Show or hide a specific waypoint marker with thread safety."""
         with self._lock:
-            if waypoint_id not in self._waypoints:
+            if self.get_waypoint(waypoint_id) is None:
                 raise ValueError(f"Waypoint {waypoint_id} not found")
             
             self._marker_manager.set_individual_marker_visible(waypoint_id, visible)
-            # Refresh to apply the change
-            self._marker_manager.refresh_all_markers_batched(self._waypoints)
     
     def is_individual_marker_visible(self, waypoint_id: str) -> bool:
         """Check if a specific waypoint marker is visible."""
@@ -225,18 +318,16 @@ class WaypointManager:
         """Set selective visibility mode - only show specified waypoints with thread safety."""
         with self._lock:
             self._marker_manager.enter_selective_mode(visible_waypoint_ids)
-            # Refresh to apply the selective visibility
-            self._marker_manager.refresh_all_markers_batched(self._waypoints)
     
     def update_waypoint(self, waypoint_id: str, **updates) -> bool:
         """Update waypoint fields like name, notes, metadata with thread safety."""
-        with self._lock:
+        with self._mutating():
             # Handle special metadata updates
             # Create a copy of items to avoid "dictionary changed size during iteration" error
             for field, value in list(updates.items()):
                 if field == 'notes':
                     # Update metadata in database
-                    waypoint = self._database.get_waypoint(waypoint_id)
+                    waypoint = self.get_waypoint(waypoint_id)
                     if waypoint:
                         metadata = waypoint.metadata.copy()
                         metadata['notes'] = value
@@ -246,10 +337,12 @@ class WaypointManager:
             updated = self._database.update_waypoint(waypoint_id, **updates)
             
             if updated:
-                # Update in-memory cache
+                # Write through to the cache
                 waypoint = self._database.get_waypoint(waypoint_id)
                 if waypoint:
-                    self._waypoints[waypoint_id] = waypoint
+                    self._cache.put([waypoint])
+                    # Moves and type changes redraw the marker; other edits leave it alone
+                    self._marker_manager.update_waypoint_marker(waypoint)
                 
                 logger.info(f"Updated waypoint {waypoint_id} with fields: {list(updates.keys())}")
                 return True
@@ -261,58 +354,178 @@ class WaypointManager:
     # =============================
     def create_group(self, name: str, description: Optional[str] = None,
                      parent_group_id: Optional[str] = None, color: str = "#4A90E2") -> str:
-        with self._lock:
+        with self._mutating():
             return self._database.create_group(name=name, description=description,
                                                parent_group_id=parent_group_id, color=color)
 
     def list_groups(self, parent_group_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        with self._lock:
-            return self._database.list_groups(parent_group_id)
+        return list(self._cache.result(('groups', parent_group_id), lambda: self._database.list_groups(parent_group_id)))
 
     def get_group(self, group_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return self._database.get_group(group_id)
+        return self._database.get_group(group_id)
 
     def get_group_hierarchy(self) -> Dict[str, Any]:
-        with self._lock:
-            return self._database.get_group_hierarchy()
+        return self._cache.result(('hierarchy',), self._database.get_group_hierarchy)
 
+    # Waypoints embed their groups' ids and names, so group changes drop or
+    # refresh only the cached members they affect
     def update_group(self, group_id: str, **updates) -> bool:
-        with self._lock:
-            return self._database.update_group(group_id, **updates)
+        with self._mutating():
+            updated = self._database.update_group(group_id, **updates)
+            if updated and 'name' in updates:
+                self._cache.discard_group_members([group_id])
+            return updated
 
     def remove_group(self, group_id: str, cascade: bool = False) -> bool:
-        with self._lock:
-            return self._database.remove_group(group_id, cascade)
+        with self._mutating():
+            removed_groups = self._database.get_subtree_group_ids(group_id) if cascade else {group_id}
+            removed = self._database.remove_group(group_id, cascade)
+            if removed:
+                self._cache.discard_group_members(removed_groups)
+            return removed
 
     def clear_groups(self) -> int:
-        with self._lock:
-            return self._database.clear_groups()
+        with self._mutating():
+            count = self._database.clear_groups()
+            self._cache.discard_group_members()
+            return count
 
     def add_waypoint_to_groups(self, waypoint_id: str, group_ids: List[str]) -> int:
-        with self._lock:
-            return self._database.add_waypoint_to_groups(waypoint_id, group_ids)
+        with self._mutating():
+            added = self._database.add_waypoint_to_groups(waypoint_id, group_ids)
+            if added:
+                self._refresh_cached([waypoint_id])
+            return added
 
     def remove_waypoint_from_groups(self, waypoint_id: str, group_ids: List[str]) -> int:
-        with self._lock:
-            return self._database.remove_waypoint_from_groups(waypoint_id, group_ids)
+        with self._mutating():
+            removed = self._database.remove_waypoint_from_groups(waypoint_id, group_ids)
+            if removed:
+                self._refresh_cached([waypoint_id])
+            return removed
+
+    def _refresh_cached(self, waypoint_ids: List[str]):
+        """Re-read waypoints whose stored rows changed under a mutation holding the lock."""
+        self._cache.discard(waypoint_ids)
+        self._cache.put(self._database.get_waypoints(waypoint_ids))
 
     def get_waypoint_groups(self, waypoint_id: str) -> List[Dict[str, Any]]:
-        with self._lock:
-            return self._database.get_waypoint_groups(waypoint_id)
+        return self._database.get_waypoint_groups(waypoint_id)
 
     def get_group_waypoints(self, group_id: str, include_nested: bool = False) -> List[Waypoint]:
-        with self._lock:
-            return self._database.get_group_waypoints(group_id, include_nested)
+        """Waypoints in a group (optionally nested), memoized per version like the other reads."""
+        return self._read_waypoints(
+            ('group', group_id, include_nested),
+            lambda: self._database.get_group_waypoints(group_id, include_nested)
+        )
 
     def export_waypoints(self, include_groups: bool = True) -> Dict[str, Any]:
-        with self._lock:
-            return self._database.export_to_json(include_groups)
+        return self._database.export_to_json(include_groups)
+
+    def import_waypoints(self, data: Dict[str, Any], merge_mode: str = "replace") -> Dict[str, Any]:
+        """Import a parsed export document in chunked transactions."""
+        status = self._begin_import(merge_mode)
+        stats = self._run_import(iter_document_records(data), status)
+        return dict(stats, import_id=status.import_id)
 
-    def import_waypoints(self, data: Dict[str, Any], merge_mode: str = "replace") -> Dict[str, int]:
+    def start_import_stream(self, source: BinaryIO, merge_mode: str = "replace",
+                            total_bytes: Optional[int] = None) -> ImportStatus:
+        """
+        Import a JSON or NDJSON body on a background thread and return its progress handle.
+
+        The body is copied to a temporary file first because request bodies
+        are closed as soon as the HTTP handler returns.
+        """
+        status = self._begin_import(merge_mode, total_bytes)
+        try:
+            fd, path = tempfile.mkstemp(prefix='waypoint_import_', suffix='.json')
+            with os.fdopen(fd, 'wb') as handle:
+                shutil.copyfileobj(source, handle, 1024 * 1024)
+        except BaseException as e:
+            status.finish(e)
+            self._import_lock.release()
+            raise
+
+        threading.Thread(
+            target=self._import_file, args=(path, status),
+            name=f"waypoint-import-{status.import_id}", daemon=True
+        ).start()
+        return status
+
+    def get_import_status(self, import_id: str) -> Optional[ImportStatus]:
+        return self._imports.get(import_id)
+
+    def _begin_import(self, merge_mode: str, total_bytes: Optional[int] = None) -> ImportStatus:
+        """Claim the import slot and register a progress handle; released by ``_run_import``."""
+        if not self._import_lock.acquire(blocking=False):
+            raise ImportInProgress("Another waypoint import is still running")
+        status = ImportStatus(merge_mode=merge_mode, total_bytes=total_bytes)
         with self._lock:
-            return self._database.import_from_json(data, merge_mode)
-    
+            self._imports[status.import_id] = status
+            while len(self._imports) > MAX_TRACKED_IMPORTS:
+                self._imports.popitem(last=False)
+        return status
+
+    def _run_import(self, records: Iterator[ImportRecord], status: ImportStatus) -> Dict[str, int]:
+        committed: List[str] = []
+
+        def on_commit(waypoint_ids: List[str]):
+            # Readers already see the chunk, so memoized listings must not outlive it
+            committed.extend(waypoint_ids)
+            self._cache.bump()
+
+        error = None
+        try:
+            return self._database.import_records(records, status.merge_mode, status=status, on_commit=on_commit)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            try:
+                with self._mutating():
+                    self._apply_import(committed, status.merge_mode, error is None)
+            finally:
+                # Report completion only once the next import can start
+                self._import_lock.release()
+                status.finish(error)
+
+    def _apply_import(self, committed: List[str], merge_mode: str, succeeded: bool):
+        """Bring the cache and markers in line with a finished import."""
+        if not succeeded:
+            # The database dropped the import's rows; reads may have cached some meanwhile
+            self._cache.discard(committed)
+        elif merge_mode == "replace":
+            # Every previous row is gone, so the cache and markers start over. The marker
+            # buffers are rebuilt from the freshly loaded cache under the lock; only the
+            # main thread's flush_markers draws them, so nothing touches debug_draw here
+            self._cache.replace(self._database.list_waypoints())
+            self._marker_manager.refresh_all_markers_batched(dict(self._cache.waypoints))
+        elif committed:
+            # Memberships were resolved after the last chunk, so read the rows back once
+            created = self._database.get_waypoints(committed)
+            self._cache.put(created)
+            self._marker_manager.add_waypoint_markers(created)
+
+    def _import_file(self, path: str, status: ImportStatus):
+        try:
+            self._run_import(self._read_import_file(path, status), status)
+        except Exception:
+            pass  # recorded on the status handle and logged by import_records
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _read_import_file(path: str, status: ImportStatus) -> Iterator[ImportRecord]:
+        with open(path, 'rb') as handle:
+            reader = JsonRecordReader(handle)
+            for record in reader.records():
+                status.bytes_read = reader.bytes_read
+                yield record
+            status.bytes_read = reader.bytes_read
+
     def get_camera_position_and_target(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
         """Get current viewport camera position and target point."""
         try:
@@ -377,8 +590,7 @@ class WaypointManager:
         """Migrate existing in-memory waypoints to database on first run."""
         try:
             # Check if database is empty and we have in-memory waypoints
-            stats = self._database.get_statistics()
-            if stats['total_waypoints'] == 0 and self._waypoints:
+            if self._waypoints and self._database.count_waypoints() == 0:
                 logger.info(f"Migrating {len(self._waypoints)} waypoints to database")
                 migrated = self._database.migrate_from_memory(self._waypoints)
                 logger.info(f"Successfully migrated {migrated} waypoints to database")
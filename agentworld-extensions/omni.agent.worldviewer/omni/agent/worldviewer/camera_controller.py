@@ -13,6 +13,8 @@ import omni.usd
 from omni.kit.viewport.utility import get_active_viewport_window
 from pxr import Gf, UsdGeom, Usd
 
+from agentworld_core.bounds import get_bounds_service
+
 
 logger = logging.getLogger(__name__)
 
@@ -426,17 +428,15 @@ class CameraController:
             
             # Method 4: Manual calculation fallback (original implementation)
             try:
-                # Get object's bounding box
-                bbox_cache = UsdGeom.BBoxCache(stage.GetTimeCode(), [UsdGeom.Tokens.default_])
-                bbox = bbox_cache.ComputeWorldBound(prim)
+                # Get object's bounding box from the shared per-stage BBoxCache
+                bounds = get_bounds_service().compute_world_bounds(stage, prim)
                 
-                if bbox.IsEmpty():
+                if not bounds:
                     return {'success': False, 'error': f'Object has no valid bounds: {object_path}'}
                 
                 # Calculate center and size
-                bbox_range = bbox.ComputeAlignedRange()
-                center = bbox_range.GetMidpoint()
-                size = bbox_range.GetSize()
+                center = bounds['center']
+                size = bounds['size']
                 max_extent = max(size[0], size[1], size[2])
                 
                 # Calculate camera distance
@@ -744,70 +744,19 @@ class CameraController:
     def _calculate_bounds(self, prim, stage) -> Dict:
         """Calculate bounding box for a prim and all its children."""
         try:
-            from pxr import UsdGeom, Gf, Usd
+            # Shared per-stage BBoxCache, invalidated by USD change notices
+            bounds = get_bounds_service().compute_world_bounds(stage, prim)
             
-            # Get bounding box using UsdGeom with correct constructor
-            try:
-                # Try USD 24.x+ API first
-                bbox_cache = UsdGeom.BBoxCache(
-                    Usd.TimeCode.Default(),
-                    [UsdGeom.Tokens.default_]
-                )
-            except TypeError:
-                try:
-                    # Fallback to older API
-                    bbox_cache = UsdGeom.BBoxCache(
-                        Usd.TimeCode.Default(),
-                        [UsdGeom.Tokens.default_],
-                        True
-                    )
-                except TypeError:
-                    # Use simplest constructor
-                    bbox_cache = UsdGeom.BBoxCache()
-            
-            # Calculate bounds for this prim and all children
-            bound = bbox_cache.ComputeWorldBound(prim)
-            
-            # Check if bound is valid - different methods for different USD versions
-            is_empty = False
-            try:
-                is_empty = bound.isEmpty()
-            except AttributeError:
-                try:
-                    # Try accessing the range directly
-                    bbox_range = bound.ComputeAlignedRange()
-                    min_point = bbox_range.GetMin()
-                    max_point = bbox_range.GetMax()
-                    # Check if all coordinates are the same (empty bounds)
-                    is_empty = (min_point == max_point)
-                except (AttributeError, RuntimeError, ValueError):
-                    is_empty = True
-            
-            if is_empty or not bound:
+            if not bounds:
                 # No geometry bounds found, try to estimate from children positions
                 return self._estimate_bounds_from_children(prim)
             
-            # Extract bounding box information
-            bbox_range = bound.ComputeAlignedRange()
-            min_point = bbox_range.GetMin()
-            max_point = bbox_range.GetMax()
-            
-            min_coords = [float(min_point[0]), float(min_point[1]), float(min_point[2])]
-            max_coords = [float(max_point[0]), float(max_point[1]), float(max_point[2])]
-            
-            # Calculate center
-            center = [
-                (min_coords[0] + max_coords[0]) / 2.0,
-                (min_coords[1] + max_coords[1]) / 2.0,
-                (min_coords[2] + max_coords[2]) / 2.0
-            ]
-            
             return {
                 'success': True,
                 'bounds': {
-                    'min': min_coords,
-                    'max': max_coords,
-                    'center': center
+                    'min': bounds['min'],
+                    'max': bounds['max'],
+                    'center': bounds['center']
                 }
             }
             
@@ -143,7 +143,11 @@ for package, paths in _PACKAGE_PATHS.items():
 
 _ensure_stub_module('omni.usd', _create_omni_usd_stub)
 _ensure_stub_module('omni.kit.app', _create_omni_kit_app_stub)
-_ensure_stub_module('pxr', _create_pxr_stub)
+try:
+    # Prefer usd-core when installed so scene tests exercise real USD
+    import pxr.Usd  # noqa: F401
+except ImportError:
+    _ensure_stub_module('pxr', _create_pxr_stub)
 
 
 def _create_omni_kit_viewport_utility_stub():
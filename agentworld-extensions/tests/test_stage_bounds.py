@@ -0,0 +1,45 @@
+import gc
+import weakref
+
+import pytest
+
+Usd = pytest.importorskip("pxr.Usd")
+from pxr import UsdGeom  # noqa: E402
+
+from agentworld_core.bounds import StageBoundsService
+
+
+def _stage_with_cube():
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Cube.Define(stage, "/World/box").GetSizeAttr().Set(2.0)
+    return stage
+
+
+def test_records_do_not_keep_stages_alive():
+    service = StageBoundsService(max_stages=4)
+    stage = _stage_with_cube()
+    assert service.compute_world_bounds(stage, "/World/box")["size"] == [2.0, 2.0, 2.0]
+
+    alive = weakref.ref(stage)
+    del stage
+    gc.collect()
+    assert alive() is None
+    assert service.release() == 1
+    assert service.get_stats()["stages"] == 0
+
+
+def test_stages_sharing_a_root_layer_are_tracked_and_released_separately():
+    service = StageBoundsService()
+    first = _stage_with_cube()
+    second = Usd.Stage.Open(first.GetRootLayer())
+    service.get_bbox_cache(first)
+    service.get_bbox_cache(second)
+    assert service.get_stats()["stages"] == 2
+
+    assert service.release(first) == 1
+    assert service.release(first) == 0
+    assert service.get_stats()["stages"] == 1
+
+    # Edits are still noticed for the stage that was kept
+    UsdGeom.Cube(second.GetPrimAtPath("/World/box")).GetSizeAttr().Set(4.0)
+    assert service.compute_world_bounds(second, "/World/box")["size"] == [4.0, 4.0, 4.0]
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+
+Usd = pytest.importorskip("pxr.Usd")
+from pxr import Sdf  # noqa: E402
+
+from omni.agent.worldbuilder.scene.batch_registry import REGISTRY_LAYER_KEY, BatchRegistry
+from omni.agent.worldbuilder.scene.stage_observer import StageObserver
+
+
+def _registry(stage):
+    return BatchRegistry(StageObserver(SimpleNamespace(get_stage=lambda: stage)))
+
+
+def _define_batch(stage, name):
+    batch = stage.DefinePrim(f"/World/{name}", "Xform")
+    batch.CreateAttribute("worldbuilder:is_batch", Sdf.ValueTypeNames.Bool).Set(True)
+    batch.CreateAttribute("worldbuilder:batch_name", Sdf.ValueTypeNames.String).Set(name)
+    stage.DefinePrim(f"/World/{name}/box", "Cube")
+
+
+def test_reads_leave_a_saved_stage_clean_and_always_list_children(tmp_path):
+    path = str(tmp_path / "scene.usda")
+    stage = Usd.Stage.CreateNew(path)
+    stage.DefinePrim("/World", "Xform")
+    _define_batch(stage, "shelf")
+    assert _registry(stage).register("/World/shelf")["name"] == "shelf"
+    stage.Save()
+
+    reopened = Usd.Stage.Open(path)
+    assert REGISTRY_LAYER_KEY in reopened.GetRootLayer().customLayerData
+    registry = _registry(reopened)
+    batches = registry.all()
+    assert batches["shelf"]["child_elements"] == [{"name": "box", "type": "Cube", "path": "/World/shelf/box"}]
+    assert registry.get("shelf")["child_elements"] == batches["shelf"]["child_elements"]
+    assert registry.get_stats()["layer_loads"] == 1
+    assert registry.get_stats()["persist_writes"] == 0
+    assert not reopened.GetRootLayer().dirty
+
+    # A stage without persisted data is scanned but still not written by reads
+    plain = Usd.Stage.CreateNew(str(tmp_path / "plain.usda"))
+    plain.DefinePrim("/World", "Xform")
+    _define_batch(plain, "crate")
+    plain.Save()
+    plain_registry = _registry(plain)
+    assert list(plain_registry.all()) == ["crate"]
+    assert not plain.GetRootLayer().dirty
+
+    plain_registry.forget_subtree("/World/crate")
+    assert REGISTRY_LAYER_KEY in plain.GetRootLayer().customLayerData
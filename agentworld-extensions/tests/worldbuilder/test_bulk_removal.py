@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from omni.agent.worldbuilder.scene.bulk_removal import compile_name_matcher, remove_prim_specs
+
+
+@pytest.fixture
+def stage():
+    pxr = pytest.importorskip("pxr.Usd")
+    stage = pxr.Stage.CreateInMemory()
+    stage.DefinePrim("/World", "Xform")
+    for index in range(100):
+        stage.DefinePrim(f"/World/c{index}/leaf", "Cube")
+    return stage
+
+
+def _record_resyncs(stage):
+    from pxr import Tf, Usd
+
+    resynced = []
+    listener = Tf.Notice.Register(
+        Usd.Notice.ObjectsChanged,
+        lambda notice, _sender: resynced.extend(str(path) for path in notice.GetResyncedPaths()),
+        stage,
+    )
+    return resynced, listener
+
+
+def test_auto_mode_uses_glob_only_with_wildcards():
+    substring = compile_name_matcher("chair")
+    assert substring("office_chair_2")
+    glob = compile_name_matcher("chair_*")
+    assert glob("chair_01")
+    assert not glob("office_chair_01")
+
+
+def test_regex_and_explicit_modes():
+    regex = compile_name_matcher(r"^cube_\d+$", "regex")
+    assert regex("cube_12")
+    assert not regex("cube_a")
+    assert compile_name_matcher("c?be", "glob")("cube")
+    # Explicit substring treats wildcard characters literally
+    assert not compile_name_matcher("c*", "substring")("cube")
+
+
+def test_invalid_mode_and_regex_rejected():
+    with pytest.raises(ValueError):
+        compile_name_matcher("x", "fuzzy")
+    with pytest.raises(ValueError):
+        compile_name_matcher("(", "regex")
+
+
+def test_remove_prim_specs_resyncs_only_removed_prims(stage):
+    resynced, _listener = _record_resyncs(stage)
+    doomed = [f"/World/c{index}" for index in range(99)]
+
+    result = remove_prim_specs(stage, doomed + ["/World/c0/leaf", "/World/missing"])
+
+    assert sorted(result["removed"]) == sorted(doomed)
+    assert result["skipped"] == ["/World/missing"]
+    assert [child.GetName() for child in stage.GetPrimAtPath("/World").GetChildren()] == ["c99"]
+    assert stage.GetPrimAtPath("/World/c99/leaf").IsValid()
+    assert sorted(resynced) == sorted(doomed)
+
+
+def test_remove_prim_specs_clears_parent_losing_every_child(stage):
+    resynced, _listener = _record_resyncs(stage)
+    result = remove_prim_specs(stage, [f"/World/c{index}" for index in range(100)])
+
+    assert len(result["removed"]) == 100
+    assert not stage.GetPrimAtPath("/World").GetChildren()
+    assert stage.GetPrimAtPath("/World").IsValid()
+    assert len(resynced) == 100
+
+
+def test_remove_prim_specs_scales_on_a_large_flat_parent():
+    Usd = pytest.importorskip("pxr.Usd")
+    from pxr import Sdf  # noqa: E402
+
+    layer = Sdf.Layer.CreateAnonymous("flat.usda")
+    layer.customLayerData = {"kept": True}
+    with Sdf.ChangeBlock():
+        world = Sdf.CreatePrimInLayer(layer, "/World")
+        world.specifier = Sdf.SpecifierDef
+        for index in range(20000):
+            Sdf.PrimSpec(world, f"c{index}", Sdf.SpecifierDef, "Cube")
+    stage = Usd.Stage.Open(layer)
+    resynced, _listener = _record_resyncs(stage)
+    doomed = [f"/World/c{index}" for index in range(20000) if index % 10]
+
+    start = time.perf_counter()
+    result = remove_prim_specs(stage, doomed)
+    # Deleting 18k of 20k child specs one at a time takes well over ten seconds
+    assert time.perf_counter() - start < 5.0
+
+    assert len(result["removed"]) == 18000
+    assert len(stage.GetPrimAtPath("/World").GetChildren()) == 2000
+    assert stage.GetPrimAtPath("/World/c10").GetTypeName() == "Cube"
+    assert layer.customLayerData == {"kept": True}
+    assert sorted(resynced) == sorted(doomed)
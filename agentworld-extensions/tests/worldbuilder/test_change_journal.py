@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+
+import pytest
+
+from omni.agent.worldbuilder.scene import change_journal
+from omni.agent.worldbuilder.scene.change_journal import ChangeJournal, merge_changes
+from omni.agent.worldbuilder.scene.element_factory import ElementFactory
+from omni.agent.worldbuilder.scene.scene_types import PrimitiveType, SceneElement
+from omni.agent.worldbuilder.scene.stage_observer import StageObserver
+
+
+class FakeObserver:
+    def __init__(self):
+        self.stage = object()
+        self.on_reset = None
+        self.on_notice = None
+
+    def subscribe(self, on_change, on_reset=None, on_notice=None):
+        self.on_reset = on_reset
+        self.on_notice = on_notice
+
+    def current_stage(self):
+        return None
+
+
+def test_merge_resolves_transient_and_implied_paths():
+    changes = [
+        ("/World/a", "added", (), False),
+        ("/World/a/child", "modified", ("size",), False),
+        ("/World/tmp", "added", (), False),
+        ("/World/tmp", "removed", (), False),
+        ("/World/b", "modified", ("xformOp:translate",), False),
+        ("/World/b", "modified", ("size",), False),
+        ("/World/c", "removed", (), False),
+        ("/World/c", "added", (), False),
+        ("/World/d", "removed", (), False),
+        ("/World/d/x", "removed", (), False),
+    ]
+    live = {"/World/a", "/World/a/child", "/World/b", "/World/c"}
+    delta = merge_changes(changes, exists=lambda path: path in live)
+
+    assert delta["added"] == ["/World/a"]
+    assert delta["removed"] == ["/World/d"]
+    assert delta["modified"] == [
+        {"path": "/World/b", "fields": ["size", "xformOp:translate"], "subtree": False},
+        {"path": "/World/c", "fields": [], "subtree": True},
+    ]
+
+
+def test_evicted_or_foreign_revisions_require_resync(monkeypatch):
+    observer = FakeObserver()
+    journal = ChangeJournal(observer, max_records=2)
+    monkeypatch.setattr(
+        change_journal,
+        "summarize_notice",
+        lambda notice, stage, known=None: [(notice, "modified", ("size",), False)],
+    )
+    for path in ("/World/a", "/World/b", "/World/c"):
+        observer.on_notice(path, None)
+
+    assert journal.get_stats()["revision"] == 3
+    assert journal.changes_since(0)["resync_required"]
+    assert journal.changes_since(4)["resync_required"]
+    assert journal.changes_since(1, epoch="other")["resync_required"]
+
+    delta = journal.changes_since(1)
+    assert not delta["resync_required"]
+    assert [entry["path"] for entry in delta["modified"]] == ["/World/b", "/World/c"]
+    assert journal.changes_since(3)["modified"] == []
+
+    observer.on_reset(object())
+    assert journal.changes_since(3)["resync_required"]
+    assert not journal.changes_since(4)["resync_required"]
+
+
+def test_recreated_specs_of_existing_prims_are_reported_as_modified():
+    Usd = pytest.importorskip("pxr.Usd")
+    from pxr import Sdf
+
+    stage = Usd.Stage.CreateInMemory()
+    for name in ("keep", "drop"):
+        stage.DefinePrim(f"/World/{name}/leaf", "Cube")
+    journal = ChangeJournal(StageObserver(SimpleNamespace(get_stage=lambda: stage)))
+    since = journal.revision
+
+    # Clear /World and copy the survivor back, as a spec-level rebuild does
+    layer = stage.GetRootLayer()
+    scratch = Sdf.Layer.CreateAnonymous(".usda")
+    Sdf.CopySpec(layer, "/World/keep", scratch, "/keep")
+    with Sdf.ChangeBlock():
+        layer.GetPrimAtPath("/World").nameChildren.clear()
+        Sdf.CopySpec(scratch, "/keep", layer, "/World/keep")
+    stage.DefinePrim("/World/new", "Cube")
+
+    delta = journal.changes_since(since)
+    assert delta["added"] == ["/World/new"]
+    assert delta["removed"] == ["/World/drop"]
+    assert [entry["path"] for entry in delta["modified"]] == ["/World/keep"]
+    assert delta["modified"][0]["subtree"] is True
+
+
+def test_many_element_creations_between_polls_stay_in_the_journal():
+    Usd = pytest.importorskip("pxr.Usd")
+
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/World", "Xform")
+    context = SimpleNamespace(get_stage=lambda: stage)
+    journal = ChangeJournal(StageObserver(context))
+    since = journal.revision
+
+    factory = ElementFactory(context, authoring_backend="usd")
+    for index in range(150):
+        element = SceneElement(name=f"cube_{index}", primitive_type=PrimitiveType.CUBE,
+                               position=(float(index), 0.0, 0.0), color=(0.5, 0.5, 0.5))
+        assert factory.create_element(element)["success"]
+
+    delta = journal.changes_since(since)
+    assert journal.revision - since > 1000  # well over the old revision cap
+    assert not delta["resync_required"]
+    assert delta["added"] == sorted(f"/World/cube_{index}" for index in range(150))
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import pytest
+
+Usd = pytest.importorskip("pxr.Usd")
+from pxr import UsdGeom  # noqa: E402
+
+from omni.agent.worldbuilder.scene.element_factory import ElementFactory
+from omni.agent.worldbuilder.scene.scene_types import PrimitiveType, SceneElement
+
+
+def _elements():
+    elements = [
+        SceneElement(
+            name=f"{primitive_type.value}_0", primitive_type=primitive_type,
+            position=(1.0, 2.0, 3.0), rotation=(0.0, 45.0, 0.0), scale=(2.0, 1.0, 0.5), color=(0.1, 0.2, 0.3),
+        )
+        for primitive_type in PrimitiveType
+    ]
+    # Parents that do not exist yet, and a prim that is already defined
+    elements.append(SceneElement(name="shelf", primitive_type=PrimitiveType.CUBE, parent_path="/World/Room/Wall"))
+    elements.append(SceneElement(name="existing", primitive_type=PrimitiveType.SPHERE, position=(5.0, 0.0, 0.0)))
+    return elements
+
+
+def _author(backend):
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/World", "Xform")
+    existing = UsdGeom.Cube.Define(stage, "/World/existing")
+    existing.GetSizeAttr().Set(3.0)
+    existing.AddTranslateOp().Set((1.0, 1.0, 1.0))
+    existing.AddRotateXOp().Set(90.0)
+    factory = ElementFactory(SimpleNamespace(get_stage=lambda: stage), authoring_backend=backend)
+    results = factory.create_elements(_elements())
+    assert all(result["success"] and result["authoring_backend"] == backend for result in results)
+    return stage
+
+
+def _snapshot(stage):
+    snapshot = {}
+    for prim in stage.TraverseAll():
+        attributes = {
+            attr.GetName(): (str(attr.GetTypeName()), str(attr.GetVariability()), attr.Get())
+            for attr in prim.GetAuthoredAttributes()
+        }
+        snapshot[str(prim.GetPath())] = (
+            str(prim.GetTypeName()), str(prim.GetSpecifier()), prim.IsDefined(), attributes,
+        )
+    return snapshot
+
+
+def test_sdf_backend_authors_the_same_prims_as_the_usd_backend():
+    usd_stage, sdf_stage = _author("usd"), _author("sdf")
+    expected, actual = _snapshot(usd_stage), _snapshot(sdf_stage)
+
+    assert set(actual) == set(expected)
+    for path, prim in expected.items():
+        assert actual[path] == prim, path
+    assert expected["/World/Room/Wall"][:3] == ("", "Sdf.SpecifierDef", True)
+    assert list(expected["/World/existing"][3]["xformOpOrder"][2]) == [
+        "xformOp:translate", "xformOp:rotateXYZ", "xformOp:scale",
+    ]
@@ -0,0 +1,69 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from omni.agent.worldbuilder.scene.hierarchy_browser import (
+    CursorError,
+    decode_cursor,
+    encode_cursor,
+    resume_offset,
+)
+
+
+def test_cursor_round_trip_is_opaque():
+    cursor = encode_cursor("/World/batch", 25, "cube_24")
+    assert "/" not in cursor
+    assert decode_cursor(cursor) == ("/World/batch", 25, "cube_24")
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor("World", 1)])
+def test_malformed_cursor_rejected(cursor):
+    with pytest.raises(CursorError):
+        decode_cursor(cursor)
+
+
+def test_resume_offset_reanchors_on_last_name():
+    names = ["a", "b", "c", "d", "e"]
+    assert resume_offset(names, 2, "b") == 2
+    # A sibling before the anchor was removed: resume right after "b" anyway
+    assert resume_offset(["a2", "b", "c", "d"], 3, "b") == 2
+    # Anchor itself removed: fall back to the positional offset
+    assert resume_offset(["a", "c", "d"], 2, "b") == 2
+    assert resume_offset(names, 10, "") == 5
+
+
+@pytest.fixture
+def builder(monkeypatch):
+    pytest.importorskip("pxr.Usd")
+    from pxr import Usd, UsdGeom
+
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Xform.Define(stage, "/World")
+    omni_usd = sys.modules["omni.usd"]
+    monkeypatch.setattr(omni_usd, "get_context", lambda *_args: SimpleNamespace(get_stage=lambda: stage), raising=False)
+    monkeypatch.setattr(sys.modules["omni"], "usd", omni_usd, raising=False)
+    from omni.agent.worldbuilder.scene_builder import SceneBuilder
+    return SceneBuilder(), stage
+
+
+def test_cached_pages_follow_edits_one_level_below_the_browsed_depth(builder):
+    from pxr import UsdGeom
+
+    scene_builder, stage = builder
+    UsdGeom.Xform.Define(stage, "/World/A")
+    first = scene_builder.browse_hierarchy("/World", depth=1)
+    assert [(node["name"], node["child_count"]) for node in first["children"]] == [("A", 0)]
+    assert scene_builder.browse_hierarchy("/World", depth=1) == first
+    hits = scene_builder._snapshot_cache.get_stats()["hits"]
+
+    # A grandchild changes A's child_count although it lies below the browsed depth
+    UsdGeom.Xform.Define(stage, "/World/A/B")
+    second = scene_builder.browse_hierarchy("/World", depth=1)
+    assert second["children"][0]["child_count"] == 1
+    assert scene_builder._snapshot_cache.get_stats()["hits"] == hits
+
+    # Edits two levels down leave the page cached
+    UsdGeom.Xform.Define(stage, "/World/A/B/C")
+    assert scene_builder.browse_hierarchy("/World", depth=1) == second
+    assert scene_builder._snapshot_cache.get_stats()["hits"] == hits + 1
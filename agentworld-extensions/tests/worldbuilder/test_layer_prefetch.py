@@ -0,0 +1,80 @@
+import threading
+
+from omni.agent.worldbuilder.scene.layer_prefetch import LayerPrefetcher, PayloadLoader
+
+
+def test_prefetch_dedupes_and_evicts_least_recent():
+    opened = []
+    prefetcher = LayerPrefetcher(max_layers=2, open_layer=lambda path: opened.append(path) or path)
+    try:
+        prefetcher.prefetch("/a.usd").result(timeout=5)
+        prefetcher.prefetch("/a.usd").result(timeout=5)
+        prefetcher.prefetch("/b.usd").result(timeout=5)
+        prefetcher.prefetch("/c.usd").result(timeout=5)
+        assert opened == ["/a.usd", "/b.usd", "/c.usd"]
+
+        assert prefetcher.acquire("/c.usd") == "/c.usd"
+        assert prefetcher.acquire("/a.usd") is None  # evicted
+        stats = prefetcher.get_stats()
+        assert (stats['hits'], stats['misses'], stats['evictions'], stats['cached_layers']) == (1, 1, 1, 2)
+    finally:
+        prefetcher.shutdown()
+
+
+def test_pending_layer_is_not_ready_and_failures_are_not_cached():
+    gate = threading.Event()
+
+    def opener(path):
+        gate.wait(timeout=5)
+        if path.endswith("bad.usd"):
+            raise IOError("cannot open")
+        return path
+
+    prefetcher = LayerPrefetcher(open_layer=opener)
+    try:
+        future = prefetcher.prefetch("/slow.usd")
+        bad = prefetcher.prefetch("/bad.usd")
+        assert not prefetcher.is_ready("/slow.usd")
+        assert prefetcher.is_ready("/unknown.usd")
+        gate.set()
+        future.result(timeout=5)
+        assert bad.exception(timeout=5) is not None
+        assert prefetcher.is_ready("/slow.usd")
+        assert prefetcher.acquire("/bad.usd") is None
+        assert prefetcher.get_stats()['failures'] == 1
+    finally:
+        prefetcher.shutdown()
+
+
+class FakePrim:
+    def IsValid(self):
+        return True
+
+
+class FakeStage:
+    def __init__(self):
+        self.loaded = []
+
+    def GetPrimAtPath(self, path):
+        return FakePrim()
+
+    def Load(self, path):
+        self.loaded.append(path)
+
+
+def test_payload_loader_gates_on_readiness_and_makes_progress():
+    ready = {"/a.usd": True, "/b.usd": False}
+    loader = PayloadLoader(budget_ms=0.0, is_ready=lambda asset: ready[asset])
+    loader.enqueue("/World/b", "/b.usd")
+    loader.enqueue("/World/a1", "/a.usd")
+    loader.enqueue("/World/a2", "/a.usd")
+    stage = FakeStage()
+
+    # Zero budget still loads one ready payload per step, skipping the unready one
+    assert loader.step(stage) == ["/World/a1"]
+    assert loader.step(stage) == ["/World/a2"]
+    assert loader.step(stage) == []
+    ready["/b.usd"] = True
+    assert loader.step(stage) == ["/World/b"]
+    assert len(loader) == 0
+    assert loader.discard_subtree("/World") == 0
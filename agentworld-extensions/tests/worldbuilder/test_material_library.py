@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pytest
+
+from omni.agent.worldbuilder.scene.cleanup_operations import CleanupOperations
+from omni.agent.worldbuilder.scene.element_factory import ElementFactory
+from omni.agent.worldbuilder.scene.material_library import (
+    MaterialLibrary,
+    material_field_errors,
+    material_name,
+    quantize_material,
+)
+from omni.agent.worldbuilder.scene.scene_types import PrimitiveType, SceneElement
+from omni.agent.worldbuilder.scene.stage_observer import StageObserver
+
+
+def test_nearby_appearances_share_a_key():
+    a = quantize_material((0.80, 0.20, 0.20), 0.5, 0.0)
+    b = quantize_material((0.805, 0.198, 0.19), 0.49, 0.0)
+    assert a == b
+    assert quantize_material((0.2, 0.8, 0.2), 0.5, 0.0) != a
+    # Out-of-range inputs are clamped rather than producing new keys
+    assert quantize_material((1.5, -1.0, 0.0), 0.5, 0.0)[:2] == (32, 0)
+
+
+def test_material_name_is_deterministic_and_usd_safe():
+    name = material_name(quantize_material((1.0, 0.5, 0.0), 0.5, 1.0))
+    assert name == "Mat_20_10_00_r10_m20"
+    assert name.replace("_", "").isalnum()
+
+
+def test_material_field_errors():
+    assert material_field_errors({}) == []
+    assert material_field_errors({"material_mode": "shared", "roughness": 0.3, "metallic": 1}) == []
+    errors = material_field_errors({"material_mode": "pbr", "roughness": 2, "metallic": "x"})
+    assert len(errors) == 3
+
+
+def test_shared_materials_are_refcounted_and_collected_on_removal():
+    Usd = pytest.importorskip("pxr.Usd")
+
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/World", "Xform")
+    context = SimpleNamespace(get_stage=lambda: stage)
+    library = MaterialLibrary(StageObserver(context))
+    factory = ElementFactory(context, material_library=library, material_mode="shared")
+    cleanup = CleanupOperations(context)
+
+    def create(name, color):
+        element = SceneElement(name=name, primitive_type=PrimitiveType.CUBE, color=color)
+        return factory.create_element(element)["material_path"]
+
+    red = create("a", (0.8, 0.2, 0.2))
+    assert create("b", (0.805, 0.198, 0.2)) == red
+    blue = create("c", (0.2, 0.2, 0.8))
+    assert red != blue
+    assert (library.get_stats()["materials"], library.get_stats()["bindings"]) == (2, 3)
+
+    assert cleanup.remove_element("/World/a")["success"]
+    library.collect()
+    assert stage.GetPrimAtPath(red).IsValid()
+
+    assert cleanup.remove_element("/World/b")["success"]
+    library.collect()
+    assert not stage.GetPrimAtPath(red)
+    assert stage.GetPrimAtPath(blue).IsValid()
+
+    # Clearing a subtree releases its bindings too
+    assert cleanup.clear_path("/World/c")["success"]
+    library.collect()
+    assert not stage.GetPrimAtPath(blue)
+    assert library.get_stats()["materials"] == library.get_stats()["bindings"] == 0
+    assert library.get_stats()["materials_collected"] == 2
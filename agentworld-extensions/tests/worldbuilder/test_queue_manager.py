@@ -99,3 +99,25 @@ def test_queue_manager_respects_config_fallback():
     )
 
     assert list(calls) == ["solo"]
+
+
+def test_change_listeners_fire_on_queue_and_completion(queue_manager):
+    calls = []
+    listener = lambda: calls.append(1)  # noqa: E731
+    queue_manager.add_change_listener(listener)
+
+    queue_manager.add_element_request(SceneElement(name="alpha", primitive_type=PrimitiveType.CUBE))
+    assert len(calls) == 1
+
+    queue_manager.process_queues(
+        lambda element: _success(),
+        lambda *args, **kwargs: _success(),
+        lambda *args, **kwargs: _success(),
+        lambda *args, **kwargs: _success(),
+    )
+    assert len(calls) == 2
+
+    queue_manager.remove_change_listener(listener)
+    idle = queue_manager.process_queues(None, None, None, None)
+    assert idle["processed_count"] == 0
+    assert len(calls) == 2
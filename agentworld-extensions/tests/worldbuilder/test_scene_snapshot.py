@@ -0,0 +1,104 @@
+import random
+
+from omni.agent.worldbuilder.scene.scene_snapshot import SceneSnapshotCache, path_affects
+
+
+class FakeObserver:
+    def __init__(self):
+        self.stage = object()
+        self.on_change = None
+        self.on_reset = None
+
+    def subscribe(self, on_change, on_reset=None):
+        self.on_change = on_change
+        self.on_reset = on_reset
+
+    def current_stage(self):
+        return self.stage
+
+
+def test_path_affects_respects_root_and_depth():
+    assert path_affects("/World", ("/World/batch", None))
+    assert path_affects("/", ("/World", 1))
+    assert path_affects("/World/batch/cube", ("/World/batch", None))
+    assert path_affects("/World/batch", ("/World", 1))
+    assert not path_affects("/World/batch/cube", ("/World", 1))
+    assert not path_affects("/World/batch_2", ("/World/batch", None))
+
+
+def test_cache_hits_until_dependent_subtree_changes():
+    observer = FakeObserver()
+    cache = SceneSnapshotCache(observer)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'success': True, 'elements': []}
+
+    cache.get_or_compute('elements', [("/World", 1)], compute)
+    cache.get_or_compute('elements', [("/World", 1)], compute)
+    assert len(calls) == 1
+
+    observer.on_change([], ["/World/batch/cube"])  # deeper than depth 1
+    cache.get_or_compute('elements', [("/World", 1)], compute)
+    assert len(calls) == 1
+
+    observer.on_change(["/World/cube"], [])
+    cache.get_or_compute('elements', [("/World", 1)], compute)
+    assert len(calls) == 2
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 2
+    assert stats['invalidations'] == 1
+
+
+def test_failures_are_not_cached_and_reset_clears():
+    observer = FakeObserver()
+    cache = SceneSnapshotCache(observer)
+    cache.get_or_compute('scene', [("/World", None)], lambda: {'success': False})
+    assert cache.get_stats()['entries'] == 0
+
+    cache.get_or_compute('scene', [("/World", None)], lambda: {'success': True})
+    observer.on_reset(object())
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_indexed_invalidation_matches_path_affects():
+    rng = random.Random(7)
+    names = ["World", "World_2", "batch", "cube", "a"]
+    paths = ["/"] + ["/" + "/".join(rng.choice(names) for _ in range(rng.randint(1, 4))) for _ in range(60)]
+    observer = FakeObserver()
+    cache = SceneSnapshotCache(observer, max_entries=1000)
+
+    for _ in range(30):
+        dependencies = {
+            key: [(rng.choice(paths), rng.choice([None, 0, 1, 2])) for _ in range(rng.randint(1, 3))]
+            for key in range(20)
+        }
+        for key, deps in dependencies.items():
+            cache.get_or_compute(key, deps, lambda: {'success': True})
+        changed = rng.sample(paths, 2)
+        expected = {
+            key for key, deps in dependencies.items()
+            if any(path_affects(path, dep) for dep in deps for path in changed)
+        }
+        before = cache.get_stats()['invalidations']
+        observer.on_change(changed[:1], changed[1:])
+        assert cache.get_stats()['invalidations'] - before == len(expected)
+        assert cache.get_stats()['entries'] == 20 - len(expected)
+        cache.clear()
+
+
+def test_evicted_snapshots_leave_the_dependency_index():
+    observer = FakeObserver()
+    cache = SceneSnapshotCache(observer, max_entries=1)
+    cache.get_or_compute('old', [("/World/old", None)], lambda: {'success': True})
+    cache.get_or_compute('new', [("/World/new", None)], lambda: {'success': True})
+    assert cache.get_stats()['evictions'] == 1
+
+    observer.on_change(["/World/old"], [])
+    assert cache.get_stats()['invalidations'] == 0
+    observer.on_change(["/World"], [])
+    stats = cache.get_stats()
+    assert (stats['invalidations'], stats['entries']) == (1, 0)
@@ -0,0 +1,70 @@
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from omni.agent.worldbuilder.scene.scene_transfer import (
+    EXPORT_ROOT_KEY,
+    SceneTransfer,
+    detect_format,
+    iter_file_chunks,
+    store_upload,
+)
+
+
+def test_store_upload_is_content_addressed_and_rejects_non_usd(tmp_path):
+    payload = b'#usda 1.0\n(\n    defaultPrim = "World"\n)\n\ndef Xform "World"\n{\n}\n'
+
+    path, sha256, size, fmt = store_upload(io.BytesIO(payload), str(tmp_path), chunk_size=8)
+    assert (size, fmt) == (len(payload), 'usda')
+    assert os.path.basename(path) == f'scene_{sha256[:16]}.usda'
+    with open(path, 'rb') as handle:
+        assert handle.read() == payload
+
+    # Same bytes reuse the stored file and leave no partial uploads behind
+    assert store_upload(io.BytesIO(payload), str(tmp_path))[0] == path
+    with pytest.raises(ValueError):
+        store_upload(io.BytesIO(b'PK\x03\x04 not a layer'), str(tmp_path))
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+    assert detect_format(b'PXR-USDC\x00\x00') == 'usdc'
+
+
+def test_iter_file_chunks_removes_file_even_when_abandoned(tmp_path):
+    export = tmp_path / 'export.usdc'
+    export.write_bytes(b'x' * 10)
+    assert list(iter_file_chunks(str(export), chunk_size=4)) == [b'xxxx', b'xxxx', b'xx']
+    assert not export.exists()
+
+    export.write_bytes(b'y' * 10)
+    chunks = iter_file_chunks(str(export), chunk_size=4)
+    next(chunks)
+    chunks.close()
+    assert not export.exists()
+
+    # Closed before the first chunk, e.g. the client went away while headers were sent
+    export.write_bytes(b'z' * 10)
+    iter_file_chunks(str(export)).close()
+    assert not export.exists()
+
+
+def test_flattened_export_covers_only_the_subtree():
+    Usd = pytest.importorskip("pxr.Usd")
+    from pxr import Sdf  # noqa: E402
+
+    asset = Sdf.Layer.CreateAnonymous('asset.usda')
+    Sdf.CreatePrimInLayer(asset, '/Asset/part').specifier = Sdf.SpecifierDef
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim('/World/a', 'Xform').GetReferences().AddReference(asset.identifier, '/Asset')
+    stage.DefinePrim('/World/b', 'Cube')
+    stage.DefinePrim('/Other')
+    with Usd.EditContext(stage, stage.GetSessionLayer()):
+        stage.DefinePrim('/World/a/session_only')
+
+    snapshot = SceneTransfer(SimpleNamespace(get_stage=lambda: stage)).build_export_layer('/World/a')
+    layer = snapshot['layer']
+    assert layer.GetPrimAtPath('/World/a/part') and layer.GetPrimAtPath('/World/a/session_only')
+    assert not layer.GetPrimAtPath('/World/b') and not layer.GetPrimAtPath('/Other')
+    assert not layer.GetPrimAtPath('/World/a').referenceList.prependedItems
+    assert (layer.defaultPrim, layer.customLayerData[EXPORT_ROOT_KEY]) == ('World', '/World/a')
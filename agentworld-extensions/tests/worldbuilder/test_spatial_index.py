@@ -0,0 +1,51 @@
+import random
+
+from omni.agent.worldbuilder.scene.spatial_index import LooseOctree
+
+
+def _brute_force(boxes, qmin, qmax):
+    return sorted(
+        key
+        for key, (bmin, bmax) in boxes.items()
+        if all(bmax[i] >= qmin[i] and bmin[i] <= qmax[i] for i in range(3))
+    )
+
+
+def test_octree_query_matches_brute_force_after_updates():
+    rng = random.Random(7)
+    octree = LooseOctree(half_size=8.0, max_depth=6)
+    boxes = {}
+
+    for i in range(300):
+        center = [rng.uniform(-50, 50) for _ in range(3)]
+        size = rng.uniform(0.1, 6.0)
+        bmin = tuple(c - size for c in center)
+        bmax = tuple(c + size for c in center)
+        boxes[f"/World/obj_{i}"] = (bmin, bmax)
+        octree.insert(f"/World/obj_{i}", bmin, bmax)
+
+    for i in range(0, 300, 3):
+        octree.remove(f"/World/obj_{i}")
+        boxes.pop(f"/World/obj_{i}")
+
+    # Re-inserting an existing key replaces its box (moves well outside the root cell)
+    boxes["/World/obj_1"] = ((400.0, 0.0, 400.0), (401.0, 1.0, 401.0))
+    octree.insert("/World/obj_1", *boxes["/World/obj_1"])
+
+    assert len(octree) == len(boxes)
+    for qmin, qmax in [
+        ((-10, -10, -10), (10, 10, 10)),
+        ((0, -100, 0), (60, 100, 60)),
+        ((399, 0, 399), (402, 2, 402)),
+        ((-1000, -1000, -1000), (1000, 1000, 1000)),
+    ]:
+        assert sorted(octree.query(qmin, qmax)) == _brute_force(boxes, qmin, qmax)
+
+
+def test_octree_remove_unknown_key_is_noop():
+    octree = LooseOctree()
+    octree.insert("/World/a", (0, 0, 0), (1, 1, 1))
+
+    assert octree.remove("/World/missing") is False
+    assert octree.remove("/World/a") is True
+    assert octree.query((-5, -5, -5), (5, 5, 5)) == []
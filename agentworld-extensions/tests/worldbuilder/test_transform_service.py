@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import pytest
+
+from omni.agent.worldbuilder.scene.transform_service import (
+    aligned_positions,
+    bounds_dict,
+    decompose_matrices,
+)
+
+
+def _rot_x(deg):
+    c, s = math.cos(math.radians(deg)), math.sin(math.radians(deg))
+    return np.array([[1, 0, 0], [0, c, s], [0, -s, c]])
+
+
+def _rot_y(deg):
+    c, s = math.cos(math.radians(deg)), math.sin(math.radians(deg))
+    return np.array([[c, 0, -s], [0, 1, 0], [s, 0, c]])
+
+
+def _rot_z(deg):
+    c, s = math.cos(math.radians(deg)), math.sin(math.radians(deg))
+    return np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]])
+
+
+def test_decompose_matrices_recovers_trs():
+    # Row-vector convention: scale, then rotateXYZ (Rx @ Ry @ Rz), then translate
+    matrix = np.eye(4)
+    matrix[:3, :3] = np.diag([2.0, 3.0, 4.0]) @ _rot_x(10) @ _rot_y(20) @ _rot_z(30)
+    matrix[3, :3] = [1.0, 2.0, 3.0]
+
+    translations, rotations, scales = decompose_matrices(np.stack([matrix, np.eye(4)]))
+
+    assert translations[0] == pytest.approx([1.0, 2.0, 3.0])
+    assert rotations[0] == pytest.approx([10.0, 20.0, 30.0])
+    assert scales[0] == pytest.approx([2.0, 3.0, 4.0])
+    assert rotations[1] == pytest.approx([0.0, 0.0, 0.0])
+    assert scales[1] == pytest.approx([1.0, 1.0, 1.0])
+
+
+def test_aligned_positions_uses_bounds_side_and_spacing():
+    positions = np.array([[0.0, 0.0, 0.0], [5.0, 2.0, 0.0], [9.0, -1.0, 0.0]])
+    half = np.array([[0.5, 0.5, 0.5], [1.0, 1.0, 1.0], [2.0, 2.0, 2.0]])
+
+    low = aligned_positions(positions, positions - half, positions + half, 'y', 'min')
+    assert (low - half)[:, 1] == pytest.approx([-0.5, -0.5, -0.5])
+    assert low[:, 0] == pytest.approx(positions[:, 0])
+
+    spaced = aligned_positions(positions, positions - half, positions + half, 'y', 'center', spacing=2.0)
+    assert spaced[:, 1] == pytest.approx([0.0, 2.0, 4.0])
+
+    with pytest.raises(ValueError):
+        aligned_positions(positions, positions, positions, 'w')
+
+
+def test_bounds_dict_reports_center_size_and_volume():
+    bounds = bounds_dict([0.0, 0.0, 0.0], [2.0, 4.0, 1.0])
+
+    assert bounds['center'] == [1.0, 2.0, 0.5]
+    assert bounds['size'] == [2.0, 4.0, 1.0]
+    assert bounds['volume'] == 8.0
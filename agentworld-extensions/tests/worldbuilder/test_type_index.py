@@ -0,0 +1,43 @@
+import pytest
+
+from omni.agent.worldbuilder.scene.type_index import TokenIndex
+
+
+@pytest.fixture
+def index():
+    token_index = TokenIndex()
+    token_index.add("/World/office_chair", "office_chair", "Cube")
+    token_index.add("/World/desk_lamp", "desk_lamp", "Sphere")
+    token_index.add("/World/floor", "floor", "Mesh")
+    token_index.add("/World/batch", "batch", "Xform")
+    return token_index
+
+
+def test_auto_mode_combines_substring_and_category(index):
+    assert index.search("chair") == {"/World/office_chair"}
+    assert index.search("furniture") == {"/World/office_chair", "/World/desk_lamp"}
+    # Type-name substrings match too ("mesh" -> Mesh, short queries scan the vocabulary)
+    assert index.search("es") == {"/World/floor", "/World/desk_lamp"}
+
+
+def test_prefix_category_and_type_modes(index):
+    assert index.search("DESK", "prefix") == {"/World/desk_lamp"}
+    assert index.search("sph", "prefix") == {"/World/desk_lamp"}
+    assert index.search("lighting", "category") == {"/World/desk_lamp"}
+    assert index.search("xform", "type") == {"/World/batch"}
+    assert index.search("xfo", "type") == set()
+
+
+def test_remove_and_readd_update_postings(index):
+    index.remove("/World/office_chair")
+    assert index.search("chair") == set()
+    assert index.search("furniture", "category") == {"/World/desk_lamp"}
+
+    index.add("/World/desk_lamp", "ceiling_lamp", "Sphere")
+    assert index.search("desk") == set()
+    assert index.search("ceiling") == {"/World/desk_lamp"}
+
+
+def test_unknown_mode_rejected(index):
+    with pytest.raises(ValueError):
+        index.search("chair", "fuzzy")
@@ -0,0 +1,44 @@
+from omni.agent.worldbuilder.ui.refresh_scheduler import API, SCENE, SELECTION, UIRefreshScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_idle_scheduler_has_nothing_due():
+    clock = FakeClock()
+    scheduler = UIRefreshScheduler(min_interval=0.5, api_heartbeat=0, clock=clock)
+
+    for _ in range(100):
+        clock.now += 0.1
+        assert scheduler.due() == frozenset()
+
+
+def test_marks_are_coalesced_and_throttled():
+    clock = FakeClock()
+    scheduler = UIRefreshScheduler(min_interval=0.5, api_heartbeat=0, clock=clock)
+
+    scheduler.mark(SELECTION)
+    scheduler.mark(SCENE)
+    assert scheduler.due() == {SELECTION, SCENE}
+
+    scheduler.mark(SELECTION)
+    clock.now += 0.1
+    assert scheduler.due() == frozenset()  # throttled, still pending
+    clock.now += 0.5
+    assert scheduler.due() == {SELECTION}
+    assert scheduler.get_stats()['redraws'] == 2
+
+
+def test_api_heartbeat_refreshes_counters_without_events():
+    clock = FakeClock()
+    scheduler = UIRefreshScheduler(min_interval=0.5, api_heartbeat=2.0, clock=clock)
+
+    clock.now += 1.0
+    assert scheduler.due() == frozenset()
+    clock.now += 1.5
+    assert scheduler.due() == {API}
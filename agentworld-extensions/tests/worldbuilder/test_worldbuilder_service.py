@@ -1,3 +1,4 @@
+import io
 import time
 
 import pytest
@@ -85,6 +86,13 @@ def test_add_element_passes_through(service):
     assert service._scene_builder.added == ["cube_1"]
 
 
+def test_add_element_rejects_unknown_authoring_backend(service):
+    result = service.add_element({"name": "cube_1", "authoring_backend": "fast"})
+    assert result["error_code"] == "VALIDATION_ERROR"
+    assert result["details"] == {"parameter": "authoring_backend"}
+    assert service._scene_builder.added == []
+
+
 def test_startup_error_sets_failure_flags(service):
     service._api._startup_error = RuntimeError("socket busy")
 
@@ -95,3 +103,15 @@ def test_startup_error_sets_failure_flags(service):
     metrics_response = service.get_metrics()
     assert metrics_response["success"] is False
     assert metrics_response["metrics"]["requests_received"] == 3
+
+
+def test_import_scene_rejects_corrupt_layer_and_removes_it(tmp_path):
+    pytest.importorskip("pxr.Sdf")
+    service = WorldBuilderService(api_interface=FakeAPI(), config={"scene_import_dir": str(tmp_path)})
+    body = b'#usda 1.0\ndef Xform "World"\n{\n    def Cube "cut" (\n'
+
+    response = service.import_scene({"_upload": io.BytesIO(body), "_upload_size": len(body)})
+
+    assert response["success"] is False
+    assert response["error_code"] == "VALIDATION_ERROR"
+    assert list(tmp_path.iterdir()) == []
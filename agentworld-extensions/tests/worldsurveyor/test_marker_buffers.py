@@ -0,0 +1,32 @@
+from omni.agent.worldsurveyor.marker_buffers import MarkerBuffers
+
+RED = (1.0, 0.0, 0.0, 1.0)
+
+
+def test_appends_draw_as_ranges_and_edits_force_one_redraw():
+    buffers = MarkerBuffers(capacity=2)
+    buffers.extend(["a", "b", "c"], [(0, 0, 0), (1, 0, 0), (2, 0, 0)], [RED] * 3, [5.0] * 3, [True, False, True])
+    first = buffers.take_pending()
+    assert first.full is False and first.positions == [(0, 0, 0), (2, 0, 0)]
+    assert buffers.take_pending() is None
+
+    # New and not-yet-drawn markers are appended without repainting
+    buffers.upsert("d", (3, 0, 0), RED, 5.0)
+    buffers.upsert("d", (4, 0, 0), RED, 5.0)
+    assert buffers.take_pending().positions == [(4, 0, 0)]
+
+    # Unchanged upserts are free; removing a drawn marker swaps the last slot in and repaints
+    buffers.upsert("a", (0, 0, 0), RED, 5.0)
+    assert buffers.take_pending() is None
+    buffers.remove("a")
+    assert buffers.ids == ["d", "b", "c"] and buffers.capacity >= 4
+    redraw = buffers.take_pending()
+    assert redraw.full is True and redraw.positions == [(4, 0, 0), (2, 0, 0)]
+
+    buffers.set_visible("b", True)
+    buffers.apply_visibility(lambda waypoint_id: waypoint_id != "c")
+    assert buffers.take_pending().positions == [(4, 0, 0), (1, 0, 0)]
+    assert buffers.get("b") == ((1, 0, 0), RED, 5.0, True)
+
+    buffers.clear()
+    assert len(buffers) == 0 and buffers.take_pending().full is True
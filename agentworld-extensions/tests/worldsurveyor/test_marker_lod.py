@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from omni.agent.worldsurveyor.marker_lod import CameraView, MarkerLodSettings, select_markers
+
+
+def _view(position, near=0.1, far=1000.0):
+    # Camera looking down -Z with a 90 degree field of view, row-vector convention
+    view = np.eye(4)
+    view[3, :3] = -np.asarray(position, dtype=float)
+    projection = np.array([
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, (near + far) / (near - far), -1.0],
+        [0.0, 0.0, 2 * near * far / (near - far), 0.0],
+    ])
+    return CameraView.from_matrices(view, projection)
+
+
+def test_selection_culls_shrinks_clusters_and_caps():
+    positions = np.array([
+        [0, 0, -5],      # in view, near
+        [0, 0, 5],       # behind the camera
+        [50, 0, -5],     # outside the field of view
+        [0, 0, -40],     # beyond lod_distance: shrunk
+        [0.1, 0, -40],   # same far cell as the previous marker
+        [1, 1, -8],      # hidden by the caller
+    ], dtype=np.float32)
+    sizes = np.full(len(positions), 10.0, dtype=np.float32)
+    visible = np.array([True, True, True, True, True, False])
+    settings = MarkerLodSettings(lod_distance=20.0, min_size_scale=0.1, cluster_cell_size=1.0)
+
+    slots, drawn_sizes = select_markers(positions, sizes, visible, _view((0, 0, 0)), settings)
+    assert slots.tolist() == [0, 3]
+    assert drawn_sizes.tolist() == pytest.approx([10.0, 5.0])
+
+    settings.cluster_cell_size = 0.0
+    settings.max_visible = 2
+    visible[5] = True
+    slots, _ = select_markers(positions, sizes, visible, _view((0, 0, 0)), settings)
+    assert slots.tolist() == [0, 5]
+
+
+def test_camera_updates_only_past_thresholds():
+    settings = MarkerLodSettings(camera_move_threshold=0.5, camera_rotate_threshold=2.0)
+    base = _view((0, 0, 0))
+    assert not _view((0.2, 0, 0)).moved_from(base, settings)
+    assert _view((1.0, 0, 0)).moved_from(base, settings)
+
+    turned = np.eye(4)
+    angle = np.radians(5.0)
+    turned[0, 0] = turned[2, 2] = np.cos(angle)
+    turned[0, 2], turned[2, 0] = -np.sin(angle), np.sin(angle)
+    assert CameraView.from_matrices(turned, base.projection).moved_from(base, settings)
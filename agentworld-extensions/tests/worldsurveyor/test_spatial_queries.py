@@ -0,0 +1,72 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from omni.agent.worldsurveyor.errors import ValidationFailure
+from omni.agent.worldsurveyor.services.worldsurveyor_service import WorldSurveyorService
+from omni.agent.worldsurveyor.waypoint_database import WaypointDatabase
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    db = WaypointDatabase(str(tmp_path / "waypoints.db"))
+    monkeypatch.setattr(type(db._config), "max_waypoints", property(lambda self: 10000))
+    yield db
+    db.close()
+
+
+def _distance_sq(a, b):
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def test_nearest_and_bounds_match_brute_force_and_follow_writes(database):
+    assert database.has_spatial_index
+    rng = random.Random(7)
+    ids = database.create_waypoints([
+        {"position": (rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(0, 10)),
+         "waypoint_type": "camera_position" if i % 4 == 0 else "point_of_interest"}
+        for i in range(500)
+    ])
+    positions = {wp.id: wp.position for wp in database.list_waypoints()}
+
+    query = (3.0, -2.0, 5.0)
+    expected = sorted(positions, key=lambda wp_id: (_distance_sq(positions[wp_id], query), wp_id))[:7]
+    nearest = database.find_nearest_waypoints(query, k=7)
+    assert [wp.id for wp, _ in nearest] == expected
+    assert nearest[0][1] == pytest.approx(_distance_sq(positions[expected[0]], query) ** 0.5)
+
+    within = database.find_nearest_waypoints(query, k=500, radius=8.0)
+    assert {wp.id for wp, _ in within} == {
+        wp_id for wp_id, position in positions.items() if _distance_sq(position, query) <= 64.0
+    }
+    cameras = database.find_nearest_waypoints((500.0, 500.0, 500.0), k=3, waypoint_type="camera_position")
+    assert len(cameras) == 3 and all(wp.waypoint_type == "camera_position" for wp, _ in cameras)
+
+    in_box = database.find_waypoints_in_bounds((-10, -10, 0), (10, 10, 10))
+    assert {wp.id for wp in in_box} == {
+        wp_id for wp_id, (x, y, z) in positions.items() if -10 <= x <= 10 and -10 <= y <= 10 and 0 <= z <= 10
+    }
+
+    # Triggers keep the index in step with updates and deletes
+    database.update_waypoint(ids[0], position=(1000.0, 1000.0, 1000.0))
+    assert database.find_nearest_waypoints((999.0, 1000.0, 1000.0), k=1)[0][0].id == ids[0]
+    database.remove_waypoint(ids[0])
+    assert database.find_waypoints_in_bounds((900, 900, 900), (1100, 1100, 1100)) == []
+
+
+def test_service_parses_query_strings_and_reports_truncation(database):
+    database.create_waypoints([{"position": (float(i), 0.0, 0.0)} for i in range(5)])
+    service = WorldSurveyorService(SimpleNamespace(waypoint_manager=database))
+
+    result = service.nearest_waypoints({"position": "0.2,0,0", "k": "2"})
+    assert [wp["position"] for wp in result["waypoints"]] == [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)]
+    assert result["waypoints"][1]["distance"] == pytest.approx(0.8)
+
+    bounded = service.waypoints_in_bounds({"min": ["0", "-1", "-1"], "max": ["10", "1", "1"], "limit": "3"})
+    assert bounded["count"] == 3 and bounded["truncated"] is True
+
+    with pytest.raises(ValidationFailure):
+        service.nearest_waypoints({"position": "1,2"})
+    with pytest.raises(ValidationFailure):
+        service.waypoints_in_bounds({"min": "1,1,1", "max": "0,0,0"})
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+from omni.agent.worldsurveyor.models import Waypoint
+from omni.agent.worldsurveyor.services.worldsurveyor_service import WorldSurveyorService
+from omni.agent.worldsurveyor.waypoint_cache import WaypointCache
+
+
+def _waypoint(waypoint_id, groups=()):
+    return Waypoint(
+        id=waypoint_id, name=waypoint_id, position=(0.0, 0.0, 0.0), target=(0.0, 0.0, 0.0),
+        waypoint_type="point_of_interest", timestamp="", session_id="s",
+        metadata={"groups": [{"id": group_id, "name": group_id} for group_id in groups]},
+    )
+
+
+def test_results_are_memoized_per_version_and_racing_reads_are_dropped():
+    cache = WaypointCache("abc", max_results=2)
+    loads = []
+    load = lambda: loads.append(1) or ["rows"]
+    assert cache.result("list", load) == ["rows"] and cache.result("list", load) == ["rows"]
+    assert len(loads) == 1
+
+    assert cache.tag == "abc-0"
+    assert cache.matches('W/"abc-0"') and cache.matches('"x-9", "abc-0"') and not cache.matches('"abc-1"')
+    cache.bump()
+    assert not cache.matches('"abc-0"')
+    cache.result("list", load)
+    assert len(loads) == 2
+
+    # A load that overlaps a mutation is returned but neither memoized nor cached
+    def racing():
+        version = cache.version
+        cache.bump()
+        cache.fill([_waypoint("late")], version)
+        return ["stale"]
+
+    assert cache.result("other", racing) == ["stale"]
+    assert cache.result("other", lambda: ["fresh"]) == ["fresh"]
+    assert "late" not in cache
+
+    cache.result("a", lambda: 1), cache.result("b", lambda: 2), cache.result("c", lambda: 3)
+    assert cache.get_stats()["results"] == 2
+
+
+def test_group_changes_drop_only_affected_members():
+    cache = WaypointCache("abc")
+    legacy = cache.waypoints
+    cache.put([_waypoint("a", ["g1"]), _waypoint("b", ["g2"]), _waypoint("c")])
+    assert cache.discard_group_members(["g1"]) == 1
+    assert set(legacy) == {"b", "c"}
+    assert cache.discard_group_members() == 1
+    cache.replace([_waypoint("d")])
+    assert list(legacy) == ["d"]
+
+
+def test_service_reports_version_and_short_circuits_unchanged_reads():
+    cache = WaypointCache("abc")
+    calls = []
+
+    class Manager:
+        cache_tag = property(lambda self: cache.tag)
+        is_current = staticmethod(cache.matches)
+
+        def list_waypoints(self, **options):
+            calls.append(options)
+            return []
+
+        def get_group_hierarchy(self):
+            return {"hierarchy": [], "total_groups": 0}
+
+    service = WorldSurveyorService(SimpleNamespace(waypoint_manager=Manager()))
+
+    first = service.list_waypoints({})
+    assert first["version"] == "abc-0" and len(calls) == 1
+    assert service.list_waypoints({"if_version": first["version"]}) == {
+        "success": True, "not_modified": True, "version": "abc-0",
+    }
+    assert len(calls) == 1
+
+    cache.bump()
+    assert "waypoints" in service.list_waypoints({"if_version": first["version"]})
+    assert service.group_hierarchy({"if_version": '"abc-1"'})["not_modified"] is True
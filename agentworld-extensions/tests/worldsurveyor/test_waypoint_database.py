@@ -0,0 +1,135 @@
+import threading
+
+import pytest
+
+from omni.agent.worldsurveyor.waypoint_database import WaypointDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = WaypointDatabase(str(tmp_path / "waypoints.db"))
+    yield db
+    db.close()
+
+
+def test_wal_readers_do_not_wait_for_an_open_write(database):
+    assert database.journal_mode == "wal"
+    conn = database._get_connection()
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    existing = database.create_waypoint((0.0, 0.0, 0.0), "point_of_interest", name="existing")
+    seen = []
+    with database._write_transaction() as write_conn:
+        write_conn.execute("UPDATE waypoints SET name = 'pending' WHERE id = ?", (existing,))
+        reader = threading.Thread(target=lambda: seen.append(database.get_waypoint(existing).name))
+        reader.start()
+        reader.join(timeout=2.0)
+        assert not reader.is_alive()
+    # The reader saw the last committed snapshot, not the in-flight update
+    assert seen == ["existing"]
+    assert database.get_waypoint(existing).name == "pending"
+
+
+def test_write_transaction_rolls_back_and_nests(database):
+    with pytest.raises(RuntimeError):
+        with database._write_transaction():
+            database.create_waypoint((1.0, 2.0, 3.0), "point_of_interest")
+            database.create_group("inner")
+            raise RuntimeError("abort import")
+    assert database.list_waypoints() == []
+    assert database.list_groups() == []
+
+
+def test_create_waypoints_names_groups_and_limit_in_one_transaction(database, monkeypatch):
+    database.create_waypoint((0.0, 0.0, 0.0), "point_of_interest")
+    group_id = database.create_group("batch")
+
+    ids = database.create_waypoints([
+        {"position": (1.0, 0.0, 0.0), "waypoint_type": "point_of_interest", "group_ids": [group_id, "missing"]},
+        {"position": (2.0, 0.0, 0.0), "waypoint_type": "point_of_interest", "name": "named"},
+        {"position": (3.0, 0.0, 0.0), "waypoint_type": "camera_position", "target": (0.0, 0.0, 0.0)},
+    ])
+    names = [database.get_waypoint(waypoint_id).name for waypoint_id in ids]
+    assert names == ["Point Of Interest 2", "named", "Camera Position 1"]
+    assert [wp.id for wp in database.get_group_waypoints(group_id)] == ids[:1]
+
+    monkeypatch.setattr(type(database._config), "max_waypoints", property(lambda self: 5))
+    with pytest.raises(ValueError):
+        database.create_waypoints([{"position": (0.0, 0.0, 0.0)}] * 2)
+    assert len(database.list_waypoints()) == 4
+
+    with pytest.raises(ValueError, match="entry 1"):
+        database.create_waypoints([{"position": (0.0, 0.0, 0.0)}, {"name": "no position"}])
+    assert len(database.list_waypoints()) == 4
+
+
+def test_group_tree_counts_nested_listing_and_cascade_use_the_whole_subtree(database):
+    root = database.create_group("root")
+    child = database.create_group("child", parent_group_id=root)
+    leaf = database.create_group("leaf", parent_group_id=child)
+    ids = database.create_waypoints([
+        {"position": (0.0, 0.0, 0.0), "group_ids": [root]},
+        {"position": (1.0, 0.0, 0.0), "group_ids": [child, leaf]},
+        {"position": (2.0, 0.0, 0.0), "group_ids": [leaf]},
+    ])
+
+    (tree,) = database.get_group_hierarchy()["hierarchy"]
+    counts = []
+    node = tree
+    while node:
+        counts.append((node["name"], node["waypoint_count"], node["subtree_waypoint_count"], node["descendant_group_count"]))
+        node = node["children"][0] if node["children"] else None
+    assert counts == [("root", 1, 3, 2), ("child", 1, 2, 1), ("leaf", 2, 2, 0)]
+
+    assert database._get_descendant_group_ids(root) == {child, leaf}
+    assert {wp.id for wp in database.get_group_waypoints(child, include_nested=True)} == set(ids[1:])
+    with pytest.raises(ValueError):
+        database.update_group(root, parent_group_id=leaf)
+
+    assert database.remove_group(child, cascade=True)
+    assert [group["id"] for group in database.list_groups()] == [root]
+    assert database.get_waypoint(ids[1]).metadata["groups"] == []
+
+
+def test_counters_follow_inserts_retypes_and_cascading_deletes(database):
+    group = database.create_group("Route")
+    first = database.create_waypoint((0.0, 0.0, 0.0), "point_of_interest", group_ids=[group])
+    database.create_waypoints([
+        {"position": (1.0, 0.0, 0.0), "waypoint_type": "camera_position", "group_ids": [group]},
+        {"position": (2.0, 0.0, 0.0), "waypoint_type": "camera_position"},
+    ])
+    database.update_waypoint(first, waypoint_type="camera_position")
+    assert database.get_counters() == {
+        "waypoints": 3, "groups": 1, "types": {"camera_position": 3}, "group_members": {group: 2},
+    }
+    # Auto-naming numbers from the per-type counter
+    named = database.create_waypoint((3.0, 0.0, 0.0), "camera_position")
+    assert database.get_waypoint(named).name == "Camera Position 4"
+
+    database.remove_waypoint(first)
+    database.remove_group(group)
+    counters = database.get_counters()
+    assert (counters["waypoints"], counters["groups"], counters["group_members"]) == (3, 0, {})
+    assert database.count_waypoints("camera_position") == 3
+    assert database.rebuild_counters() == counters
+
+
+def test_bulk_reads_removes_and_import_commits_report_ids(database):
+    group = database.create_group("zone")
+    ids = database.create_waypoints([{"position": (float(i), 0.0, 0.0), "group_ids": [group]} for i in range(3)])
+    fetched = database.get_waypoints([ids[2], "missing", ids[0]])
+    assert {wp.id for wp in fetched} == {ids[0], ids[2]}
+    assert all(wp.metadata["groups"] == [{"id": group, "name": "zone"}] for wp in fetched)
+
+    assert set(database.remove_waypoints([ids[0], "missing", ids[1]])) == {ids[0], ids[1]}
+    assert database.count_waypoints() == 1
+
+    committed = []
+    database.import_records(
+        [("waypoint", {"position": [float(i), 1.0, 0.0]}) for i in range(5)],
+        merge_mode="merge", chunk_size=2, on_commit=committed.append,
+    )
+    # Three chunks, then the final membership commit
+    assert [len(chunk) for chunk in committed] == [2, 2, 1, 0]
+    assert len(database.get_waypoints([wp_id for chunk in committed for wp_id in chunk])) == 5
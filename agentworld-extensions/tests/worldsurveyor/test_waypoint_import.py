@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from omni.agent.worldsurveyor.import_stream import ImportFormatError, ImportStatus, JsonRecordReader
+from omni.agent.worldsurveyor.waypoint_database import WaypointDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = WaypointDatabase(str(tmp_path / "waypoints.db"))
+    yield db
+    db.close()
+
+
+def test_reader_streams_documents_arrays_and_ndjson():
+    document = b'{"version": "1.0", "waypoints": [{"position": [1.5, 2, 30]}], "groups": [{"id": "g1", "name": "G"}]}'
+    ndjson = b'{"position": [1, 2, 3]}\n{"groups": [{"id": "g1", "name": "G"}]}\n[{"position": [4, 5, 6]}]\n'
+    # Tiny reads split numbers and tokens across blocks
+    assert list(JsonRecordReader(io.BytesIO(document), read_size=3).records()) == [
+        ("waypoint", {"position": [1.5, 2, 30]}),
+        ("groups", [{"id": "g1", "name": "G"}]),
+    ]
+    assert list(JsonRecordReader(io.BytesIO(ndjson), read_size=5).records()) == [
+        ("waypoint", {"position": [1, 2, 3]}),
+        ("groups", [{"id": "g1", "name": "G"}]),
+        ("waypoint", {"position": [4, 5, 6]}),
+    ]
+    with pytest.raises(ImportFormatError):
+        list(JsonRecordReader(io.BytesIO(b'[{"position": [1, 2, 3]} {"position": [4')).records())
+
+
+def test_import_commits_per_chunk_and_resolves_groups_after_waypoints(database):
+    lines = [json.dumps({"position": [i, 0, 0], "group_ids": ["g1"] if i % 2 else []}) for i in range(7)]
+    lines.append(json.dumps({"position": "bad"}))
+    lines.append(json.dumps({"groups": [{"id": "g1", "name": "Imported"}]}))
+    status = ImportStatus(merge_mode="merge")
+
+    stats = database.import_records(
+        JsonRecordReader(io.BytesIO("\n".join(lines).encode())).records(), "merge", chunk_size=3, status=status
+    )
+
+    assert stats == {"waypoints_imported": 7, "groups_imported": 1, "errors": 1, "chunks": 3}
+    assert status.error_samples == ["waypoint 8: position must be [x, y, z]"]
+    group = database.list_groups()[0]
+    assert len(database.get_group_waypoints(group["id"])) == 3
+
+
+def test_failed_replace_import_keeps_previous_data(database):
+    existing = database.create_waypoint((0.0, 0.0, 0.0), "point_of_interest", name="keep me")
+    body = b"\n".join(json.dumps({"position": [i, 0, 0]}).encode() for i in range(5)) + b'\n{"position": [1,'
+
+    with pytest.raises(ImportFormatError):
+        database.import_records(JsonRecordReader(io.BytesIO(body)).records(), "replace", chunk_size=2)
+
+    assert [wp.id for wp in database.list_waypoints()] == [existing]
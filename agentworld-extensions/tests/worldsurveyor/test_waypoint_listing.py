@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+
+from omni.agent.worldsurveyor.errors import ValidationFailure
+from omni.agent.worldsurveyor.services.worldsurveyor_service import WorldSurveyorService
+from omni.agent.worldsurveyor.waypoint_database import WaypointDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = WaypointDatabase(str(tmp_path / "waypoints.db"))
+    yield db
+    db.close()
+
+
+def test_keyset_pages_cover_every_ordering_without_gaps(database):
+    group_id = database.create_group("g")
+    database.create_waypoints([
+        {"position": (float(i), 0.0, 0.0), "name": f"wp {i % 4}", "group_ids": [group_id] if i % 2 else []}
+        for i in range(23)
+    ])
+    for order_by in ("timestamp", "name", "id"):
+        for descending in (False, True):
+            expected = [wp.id for wp in database.list_waypoints(order_by=order_by, descending=descending)]
+            pages, after_id = [], None
+            while True:
+                page = database.list_waypoints(after_id=after_id, limit=5, order_by=order_by, descending=descending)
+                pages.extend(wp.id for wp in page)
+                if len(page) < 5:
+                    break
+                after_id = page[-1].id
+            assert pages == expected
+
+    rows = database.list_waypoint_fields(["position", "groups"], group_id=group_id, limit=2)
+    assert [set(row) for row in rows] == [{"id", "position", "groups"}] * 2
+    assert rows[0]["groups"] == [{"id": group_id, "name": "g"}]
+
+
+def test_service_pages_with_cursor_and_validates_options(database):
+    database.create_waypoints([{"position": (float(i), 0.0, 0.0)} for i in range(5)])
+    service = WorldSurveyorService(SimpleNamespace(waypoint_manager=database))
+
+    first = service.list_waypoints({"limit": "3", "fields": "name"})
+    assert first["count"] == 3 and first["has_more"] is True
+    assert set(first["waypoints"][0]) == {"id", "name"}
+    rest = service.list_waypoints({"limit": "3", "after_id": first["next_after_id"]})
+    assert rest["count"] == 2 and rest["has_more"] is False and rest["next_after_id"] is None
+    assert "metadata" in rest["waypoints"][0]
+
+    for payload in ({"order_by": "position"}, {"fields": "id,secret"}, {"after_id": "wp_missing", "limit": "2"}):
+        with pytest.raises(ValidationFailure):
+            service.list_waypoints(payload)
+
+
+def test_cursor_pages_survive_deleting_the_last_listed_waypoint(database):
+    ids = database.create_waypoints([{"position": (float(i), 0.0, 0.0), "name": f"wp {i}"} for i in range(7)])
+    service = WorldSurveyorService(SimpleNamespace(waypoint_manager=database))
+
+    first = service.list_waypoints({"limit": "3", "order_by": "name", "fields": "id"})
+    assert [row["id"] for row in first["waypoints"]] == ids[:3]
+    assert set(first["waypoints"][0]) == {"id"}
+    database.remove_waypoint(ids[2])
+
+    rest = service.list_waypoints({"limit": "10", "order_by": "name", "cursor": first["next_cursor"]})
+    assert [row["id"] for row in rest["waypoints"]] == ids[3:]
+    assert rest["next_cursor"] is None
+
+    with pytest.raises(ValidationFailure):
+        service.list_waypoints({"order_by": "name", "order": "desc", "cursor": first["next_cursor"]})
+    with pytest.raises(ValidationFailure):
+        service.list_waypoints({"cursor": "not-a-cursor"})
+
+
+def test_group_waypoints_keep_group_names_with_separators(database):
+    group_id = database.create_group("north, east|gate")
+    other_id = database.create_group("b")
+    database.create_waypoints([{"position": (0.0, 0.0, 0.0), "group_ids": [group_id, other_id]}])
+
+    [waypoint] = database.get_group_waypoints(group_id)
+    assert sorted(group["name"] for group in waypoint.metadata["groups"]) == ["b", "north, east|gate"]
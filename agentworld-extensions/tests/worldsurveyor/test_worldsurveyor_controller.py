@@ -38,7 +38,7 @@ class DummyWaypointManager:
         self._group_membership.setdefault(waypoint_id, set()).update(group_ids or [])
         return waypoint_id
 
-    def list_waypoints(self, waypoint_type=None, group_id=None):
+    def list_waypoints(self, waypoint_type=None, group_id=None, **_options):
         values = list(self._waypoints.values())
         return [type('Waypoint', (), wp)() for wp in values]
 
@@ -34,6 +34,10 @@ def register_tools(mcp_instance: FastMCP):
     mcp_instance.tool()(scene.worldbuilder_get_scene)
     mcp_instance.tool()(scene.worldbuilder_scene_status)
     mcp_instance.tool()(scene.worldbuilder_list_elements)
+    mcp_instance.tool()(scene.worldbuilder_browse_scene)
+    mcp_instance.tool()(scene.worldbuilder_get_scene_changes)
+    mcp_instance.tool()(scene.worldbuilder_export_scene)
+    mcp_instance.tool()(scene.worldbuilder_import_scene)
 
     # Asset Management Tools
     mcp_instance.tool()(assets.worldbuilder_place_asset)
@@ -66,6 +70,10 @@ def register_tools(mcp_instance: FastMCP):
         "worldbuilder_get_scene",
         "worldbuilder_scene_status",
         "worldbuilder_list_elements",
+        "worldbuilder_browse_scene",
+        "worldbuilder_get_scene_changes",
+        "worldbuilder_export_scene",
+        "worldbuilder_import_scene",
 
         # Asset Management Tools
         "worldbuilder_place_asset",
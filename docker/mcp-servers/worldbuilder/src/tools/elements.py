@@ -21,7 +21,11 @@ async def worldbuilder_add_element(
     position: List[float],
     color: List[float] = None,
     scale: List[float] = None,
-    parent_path: str = "/World"
+    parent_path: str = "/World",
+    material_mode: str = "",
+    roughness: float = None,
+    metallic: float = None,
+    authoring_backend: str = ""
 ) -> Dict[str, Any]:
     """Add individual 3D elements (cubes, spheres, cylinders) to Isaac Sim scene.
 
@@ -32,6 +36,10 @@ async def worldbuilder_add_element(
         color: RGB color [r, g, b] values between 0-1 (exactly 3 items required)
         scale: XYZ scale [x, y, z] multipliers (exactly 3 items required)
         parent_path: USD parent path for hierarchical placement (optional, defaults to /World)
+        material_mode: 'display_color' or 'shared' (bind a deduplicated /World/Looks material)
+        roughness: Shared material roughness 0-1 (optional)
+        metallic: Shared material metallic 0-1 (optional)
+        authoring_backend: 'usd' or 'sdf' (write specs directly to the edit target layer; optional)
     """
     client = get_client()
 
@@ -46,6 +54,14 @@ async def worldbuilder_add_element(
         args["color"] = color
     if scale is not None:
         args["scale"] = scale
+    if material_mode:
+        args["material_mode"] = material_mode
+    if roughness is not None:
+        args["roughness"] = roughness
+    if metallic is not None:
+        args["metallic"] = metallic
+    if authoring_backend:
+        args["authoring_backend"] = authoring_backend
 
     timeout = config.get_timeout('add_element')
     result = await client.request('add_element', payload=args, timeout=timeout)
@@ -16,15 +16,29 @@ mcp: FastMCP = None
 
 
 
-async def worldbuilder_query_objects_by_type(object_type: str) -> Dict[str, Any]:
+async def worldbuilder_query_objects_by_type(
+    object_type: str,
+    match: str = "auto",
+    page: int = 1,
+    page_size: Optional[int] = None
+) -> Dict[str, Any]:
     """Query objects by semantic type (furniture, lighting, primitive, etc.).
 
     Args:
         object_type: Object type to search for (e.g. 'furniture', 'lighting', 'decoration', 'architecture', 'vehicle', 'primitive')
+        match: Match mode: 'auto' (name/type substring or category), 'substring', 'prefix', 'category' or 'type' (exact USD type)
+        page: Page number for pagination (1-based)
+        page_size: Results per page (defaults to the server's max query results)
     """
     client = get_client()
 
     args = {"type": object_type}
+    if match != "auto":
+        args["match"] = match
+    if page != 1:
+        args["page"] = page
+    if page_size is not None:
+        args["page_size"] = page_size
     timeout = config.get_timeout('query_objects')
     result = await client.request('query/objects_by_type', payload=args, timeout=timeout)
     return result
@@ -87,6 +87,26 @@ class WorldSurveyorClient:
             logger.exception('request_failed', extra={'endpoint': endpoint, 'error': str(exc)})
             return error_response(f'{endpoint.upper()}_FAILED', str(exc))
 
+    async def upload(self, endpoint: str, source: str, params: Dict[str, Any] = None, timeout: float = 300.0) -> Dict[str, Any]:
+        """POST the file at ``source`` as an application/octet-stream body (e.g. waypoints/import)."""
+        await self.initialize()
+
+        try:
+            negotiator = self.client.auth_negotiator
+            with open(source, 'rb') as handle:
+                async with await negotiator.authenticated_request(
+                    'POST', f"/{endpoint}", params=params, data=handle,
+                    headers={'Content-Type': 'application/octet-stream'}, timeout=timeout
+                ) as response:
+                    return normalize_transport_response(endpoint, await response.json(), default_error_code=f'{endpoint.upper()}_FAILED')
+
+        except asyncio.TimeoutError:
+            return error_response('REQUEST_TIMEOUT', 'Request timed out', details={'endpoint': endpoint})
+        except aiohttp.ClientError as exc:
+            return error_response('CONNECTION_ERROR', f'Connection error: {exc}', details={'endpoint': endpoint})
+        except OSError as exc:
+            return error_response('FILE_ERROR', str(exc), details={'path': source})
+
 
 # Global client instance
 _client: WorldSurveyorClient = None
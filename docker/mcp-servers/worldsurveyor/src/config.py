@@ -95,6 +95,7 @@ class WorldSurveyorConfig:
             'align_objects': 45.0,
             'clear_scene': 60.0,
             'clear_path': 45.0,
+            'import': 300.0,
         }
         return timeouts.get(operation, 30.0)
 
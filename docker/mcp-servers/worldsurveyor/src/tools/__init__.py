@@ -24,7 +24,10 @@ def register_tools(mcp_instance: FastMCP):
     # Manually register each tool function with FastMCP
     # Waypoint Management Tools
     mcp_instance.tool()(waypoints.worldsurveyor_create_waypoint)
+    mcp_instance.tool()(waypoints.worldsurveyor_create_waypoints)
     mcp_instance.tool()(waypoints.worldsurveyor_list_waypoints)
+    mcp_instance.tool()(waypoints.worldsurveyor_nearest_waypoints)
+    mcp_instance.tool()(waypoints.worldsurveyor_waypoints_in_bounds)
     mcp_instance.tool()(waypoints.worldsurveyor_remove_waypoint)
     mcp_instance.tool()(waypoints.worldsurveyor_update_waypoint)
     mcp_instance.tool()(waypoints.worldsurveyor_goto_waypoint)
@@ -51,6 +54,7 @@ def register_tools(mcp_instance: FastMCP):
     # Import/Export Tools
     mcp_instance.tool()(import_export.worldsurveyor_export_waypoints)
     mcp_instance.tool()(import_export.worldsurveyor_import_waypoints)
+    mcp_instance.tool()(import_export.worldsurveyor_get_import_status)
 
     # System Tools
     mcp_instance.tool()(system.worldsurveyor_health_check)
@@ -61,7 +65,10 @@ def register_tools(mcp_instance: FastMCP):
     return [
         # Waypoint Management Tools
         "worldsurveyor_create_waypoint",
+        "worldsurveyor_create_waypoints",
         "worldsurveyor_list_waypoints",
+        "worldsurveyor_nearest_waypoints",
+        "worldsurveyor_waypoints_in_bounds",
         "worldsurveyor_remove_waypoint",
         "worldsurveyor_update_waypoint",
         "worldsurveyor_goto_waypoint",
@@ -88,6 +95,7 @@ def register_tools(mcp_instance: FastMCP):
         # Import/Export Tools
         "worldsurveyor_export_waypoints",
         "worldsurveyor_import_waypoints",
+        "worldsurveyor_get_import_status",
 
         # System Tools
         "worldsurveyor_health_check",
@@ -42,27 +42,56 @@ async def worldsurveyor_export_waypoints(
 
 
 async def worldsurveyor_import_waypoints(
-    waypoint_data: Dict[str, Any],
+    waypoint_data: Optional[Dict[str, Any]] = None,
+    file_path: Optional[str] = None,
+    merge_mode: str = "replace",
     format_type: str = "json",
     merge_groups: bool = True,
-    overwrite_existing: bool = False
+    overwrite_existing: bool = False,
+    merge: Optional[bool] = None
 ) -> Dict[str, Any]:
-    """Import waypoints and groups from data.
+    """Import waypoints and groups from data or a local file.
+
+    Files are streamed to the extension and imported in the background; the
+    result carries an import_id for worldsurveyor_get_import_status.
 
     Args:
-        waypoint_data: Waypoint data to import
-        format_type: Data format (json, csv, xml)
+        waypoint_data: Export document to import inline
+        file_path: Local export document, JSON array or NDJSON file to stream
+        merge_mode: replace (default) swaps out existing data once the import completes; merge keeps it
+        format_type: Data format (json)
         merge_groups: Whether to merge with existing groups
         overwrite_existing: Whether to overwrite existing waypoints
+        merge: Shorthand for merge_mode="merge"
     """
     client = get_client()
 
+    if merge:
+        merge_mode = "merge"
+
+    if file_path:
+        timeout = config.get_timeout('import')
+        return await client.upload('waypoints/import', file_path, params={"merge_mode": merge_mode}, timeout=timeout)
+
     args = {
-        "data": waypoint_data,
+        "data": waypoint_data or {},
         "format": format_type,
+        "merge_mode": merge_mode,
         "merge_groups": merge_groups,
         "overwrite_existing": overwrite_existing
     }
 
     result = await client.request('waypoints/import', payload=args)
+    return result
+
+
+async def worldsurveyor_get_import_status(import_id: str) -> Dict[str, Any]:
+    """Get progress of a waypoint import started with worldsurveyor_import_waypoints.
+
+    Args:
+        import_id: ID returned when the import was started
+    """
+    client = get_client()
+
+    result = await client.request('waypoints/import_status', method="GET", params={"import_id": import_id})
     return result
\ No newline at end of file
@@ -49,21 +49,117 @@ async def worldsurveyor_create_waypoint(
     return result
 
 
-async def worldsurveyor_list_waypoints(waypoint_type: Optional[str] = None) -> Dict[str, Any]:
-    """List all waypoints with optional filtering by type.
+async def worldsurveyor_create_waypoints(waypoints: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create many waypoints in a single transaction.
+
+    Args:
+        waypoints: List of waypoint objects, each with position [x, y, z] and optional waypoint_type, name, target, metadata and group_ids
+    """
+    client = get_client()
+
+    args = {"waypoints": waypoints}
+    result = await client.request('waypoints/create_bulk', payload=args)
+    return result
+
+
+async def worldsurveyor_list_waypoints(
+    waypoint_type: Optional[str] = None,
+    group_id: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[str] = None,
+    order_by: Optional[str] = None,
+    order: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """List waypoints with optional filtering, paging and field projection.
 
     Args:
         waypoint_type: Optional filter by waypoint type (camera_position, directional_lighting, object_anchor, point_of_interest, selection_mark, lighting_position, audio_source, spawn_point)
+        group_id: Optional filter by group ID
+        limit: Optional page size (max 10000); the response carries has_more and next_cursor
+        after_id: Continue after this waypoint ID (next_after_id of the previous page); prefer cursor
+        order_by: Sort key: timestamp (default), name or id
+        order: asc (default) or desc
+        fields: Optional projection, e.g. ["id", "name", "position"]; metadata and groups are skipped unless listed
+        cursor: next_cursor of the previous page (same order_by and order); survives deletes between pages
     """
     client = get_client()
 
     params = {}
     if waypoint_type is not None:
         params["waypoint_type"] = waypoint_type
+    if group_id is not None:
+        params["group_id"] = group_id
+    if limit is not None:
+        params["limit"] = limit
+    if after_id is not None:
+        params["after_id"] = after_id
+    if cursor is not None:
+        params["cursor"] = cursor
+    if order_by is not None:
+        params["order_by"] = order_by
+    if order is not None:
+        params["order"] = order
+    if fields:
+        params["fields"] = ",".join(fields)
 
     result = await client.request('waypoints/list', method="GET", params=params)
     return result
 
+async def worldsurveyor_nearest_waypoints(
+    position: List[float],
+    k: int = 10,
+    radius: Optional[float] = None,
+    waypoint_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """Find the waypoints closest to a point using the spatial index.
+
+    Args:
+        position: 3D query point [x, y, z]
+        k: Maximum number of waypoints to return (1-1000)
+        radius: Optional search radius; only waypoints within this distance are returned
+        waypoint_type: Optional filter by waypoint type
+    """
+    client = get_client()
+
+    params = {"position": ",".join(str(v) for v in position), "k": k}
+    if radius is not None:
+        params["radius"] = radius
+    if waypoint_type is not None:
+        params["waypoint_type"] = waypoint_type
+
+    result = await client.request('waypoints/nearest', method="GET", params=params)
+    return result
+
+
+async def worldsurveyor_waypoints_in_bounds(
+    min: List[float],
+    max: List[float],
+    waypoint_type: Optional[str] = None,
+    limit: int = 1000
+) -> Dict[str, Any]:
+    """Find waypoints inside an axis-aligned bounding box using the spatial index.
+
+    Args:
+        min: Minimum corner [x, y, z]
+        max: Maximum corner [x, y, z]
+        waypoint_type: Optional filter by waypoint type
+        limit: Maximum number of waypoints to return (1-10000); the response reports truncated when more matched
+    """
+    client = get_client()
+
+    params = {
+        "min": ",".join(str(v) for v in min),
+        "max": ",".join(str(v) for v in max),
+        "limit": limit,
+    }
+    if waypoint_type is not None:
+        params["waypoint_type"] = waypoint_type
+
+    result = await client.request('waypoints/in_bounds', method="GET", params=params)
+    return result
+
 
 async def worldsurveyor_remove_waypoint(waypoint_id: str) -> Dict[str, Any]:
     """Remove a waypoint from the scene.
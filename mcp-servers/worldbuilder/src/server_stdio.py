@@ -35,7 +35,11 @@ def create_stdio_server():
                         "position": {"type": "array", "items": {"type": "number"}, "description": "XYZ position"},
                         "color": {"type": "array", "items": {"type": "number"}, "description": "RGB color"},
                         "scale": {"type": "array", "items": {"type": "number"}, "description": "XYZ scale"},
-                        "parent_path": {"type": "string", "description": "USD parent path"}
+                        "parent_path": {"type": "string", "description": "USD parent path"},
+                        "material_mode": {"type": "string", "enum": ["display_color", "shared"], "description": "Bind a deduplicated shared material instead of only displayColor"},
+                        "roughness": {"type": "number", "minimum": 0, "maximum": 1, "description": "Shared material roughness"},
+                        "metallic": {"type": "number", "minimum": 0, "maximum": 1, "description": "Shared material metallic"},
+                        "authoring_backend": {"type": "string", "enum": ["usd", "sdf"], "description": "Author through the USD schema API or write specs directly to the edit target layer"}
                     },
                     "required": ["element_type", "name", "position"]
                 }
@@ -112,6 +116,60 @@ def create_stdio_server():
                     "required": []
                 }
             ),
+            Tool(
+                name="worldbuilder_browse_scene",
+                description="Browse the scene hierarchy page by page with opaque cursors",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {"type": "string", "description": "Parent prim path to list children of", "default": "/World"},
+                        "depth": {"type": "integer", "description": "Levels to expand below path (1 = direct children only)", "minimum": 1, "maximum": 8, "default": 1},
+                        "limit": {"type": "integer", "description": "Maximum children returned per expanded level", "minimum": 1, "maximum": 1000, "default": 100},
+                        "cursor": {"type": "string", "description": "next_cursor/children_cursor from a previous response to continue paging"},
+                        "fields": {"type": "string", "description": "Comma-separated extras per node: bounds, transform, batch"}
+                    },
+                    "required": []
+                }
+            ),
+            Tool(
+                name="worldbuilder_get_scene_changes",
+                description="Get prims added, removed and modified since a stage revision (or resync_required)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "since": {"type": "integer", "description": "Revision from get_scene or the previous call's 'revision'", "minimum": 0},
+                        "epoch": {"type": "string", "description": "Epoch returned with that revision; a mismatch forces a resync"}
+                    },
+                    "required": ["since"]
+                }
+            ),
+            Tool(
+                name="worldbuilder_export_scene",
+                description="Export /World or a subtree to a local USDC/USDA file in one streamed transfer",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "output_path": {"type": "string", "description": "Local file to write the exported scene to"},
+                        "path": {"type": "string", "description": "Root prim to export", "default": "/World"},
+                        "format": {"type": "string", "enum": ["usdc", "usda"], "default": "usdc"},
+                        "flatten": {"type": "boolean", "description": "Compose references and layers into plain prims", "default": True}
+                    },
+                    "required": ["output_path"]
+                }
+            ),
+            Tool(
+                name="worldbuilder_import_scene",
+                description="Upload a local USDC/USDA scene and attach it as a sublayer or reference in one change block",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "file_path": {"type": "string", "description": "Local USD file, e.g. from worldbuilder_export_scene"},
+                        "mode": {"type": "string", "enum": ["sublayer", "reference"], "default": "sublayer"},
+                        "target_path": {"type": "string", "description": "Prim created for reference imports (default /World/Imported)"}
+                    },
+                    "required": ["file_path"]
+                }
+            ),
             Tool(
                 name="worldbuilder_scene_status",
                 description="Get scene health status and basic statistics",
@@ -144,7 +202,8 @@ def create_stdio_server():
                         "prim_path": {"type": "string", "description": "Target prim path in scene (e.g., '/World/my_asset')"},
                         "position": {"type": "array", "items": {"type": "number"}, "description": "XYZ position [x, y, z] in world coordinates (exactly 3 items required)"},
                         "rotation": {"type": "array", "items": {"type": "number"}, "description": "XYZ rotation [rx, ry, rz] in degrees (exactly 3 items required)"},
-                        "scale": {"type": "array", "items": {"type": "number"}, "description": "XYZ scale [x, y, z] multipliers (exactly 3 items required)"}
+                        "scale": {"type": "array", "items": {"type": "number"}, "description": "XYZ scale [x, y, z] multipliers (exactly 3 items required)"},
+                        "as_payload": {"type": "boolean", "description": "Place as an unloaded payload that loads in the background over later frames", "default": False}
                     },
                     "required": ["name", "asset_path"]
                 }
@@ -171,7 +230,10 @@ def create_stdio_server():
                 inputSchema={
                     "type": "object",
                     "properties": {
-                        "object_type": {"type": "string", "description": "Object type to search for (e.g. 'furniture', 'lighting', 'decoration', 'architecture', 'vehicle', 'primitive')"}
+                        "object_type": {"type": "string", "description": "Object type to search for (e.g. 'furniture', 'lighting', 'decoration', 'architecture', 'vehicle', 'primitive')"},
+                        "match": {"type": "string", "enum": ["auto", "substring", "prefix", "category", "type"], "default": "auto", "description": "Match mode: name/type substring or category (auto), substring, prefix, category, or exact USD type"},
+                        "page": {"type": "integer", "minimum": 1, "default": 1, "description": "Page number for pagination (1-based)"},
+                        "page_size": {"type": "integer", "minimum": 1, "description": "Results per page (defaults to the server's max query results)"}
                     },
                     "required": ["object_type"]
                 }
@@ -28,6 +28,10 @@ def get_tool_functions():
         "worldbuilder_get_scene": scene.worldbuilder_get_scene,
         "worldbuilder_scene_status": scene.worldbuilder_scene_status,
         "worldbuilder_list_elements": scene.worldbuilder_list_elements,
+        "worldbuilder_browse_scene": scene.worldbuilder_browse_scene,
+        "worldbuilder_get_scene_changes": scene.worldbuilder_get_scene_changes,
+        "worldbuilder_export_scene": scene.worldbuilder_export_scene,
+        "worldbuilder_import_scene": scene.worldbuilder_import_scene,
 
         # Spatial Analysis Tools
         "worldbuilder_query_objects_by_type": spatial.worldbuilder_query_objects_by_type,
@@ -22,7 +22,8 @@ async def worldbuilder_place_asset(
     prim_path: str = "",
     position: List[float] = None,
     rotation: List[float] = None,
-    scale: List[float] = None
+    scale: List[float] = None,
+    as_payload: bool = False
 ) -> Dict[str, Any]:
     """Place USD assets in Isaac Sim scene via reference.
 
@@ -33,6 +34,7 @@ async def worldbuilder_place_asset(
         position: XYZ position [x, y, z] in world coordinates (exactly 3 items required)
         rotation: XYZ rotation [rx, ry, rz] in degrees (exactly 3 items required)
         scale: XYZ scale [x, y, z] multipliers (exactly 3 items required)
+        as_payload: Place as an unloaded payload that loads in the background over later frames
     """
     client = get_client()
 
@@ -49,6 +51,8 @@ async def worldbuilder_place_asset(
         args["rotation"] = rotation
     if scale is not None:
         args["scale"] = scale
+    if as_payload:
+        args["as_payload"] = True
 
     timeout = config.get_timeout('place_asset')
     result = await client.request('place_asset', payload=args, timeout=timeout)
@@ -100,4 +100,101 @@ async def worldbuilder_list_elements(
         params["include_metadata"] = include_metadata
 
     result = await client.request('list_elements', method="GET", params=params)
-    return result
\ No newline at end of file
+    return result
+
+
+async def worldbuilder_browse_scene(
+    path: str = "/World",
+    depth: int = 1,
+    limit: int = 100,
+    cursor: str = "",
+    fields: str = ""
+) -> Dict[str, Any]:
+    """Browse the scene hierarchy one page at a time.
+
+    Args:
+        path: Parent prim path to list children of
+        depth: Levels to expand below path (1 = direct children only)
+        limit: Maximum children returned per expanded level
+        cursor: next_cursor/children_cursor from a previous response to continue paging
+        fields: Comma-separated extras per node: bounds, transform, batch
+    """
+    client = get_client()
+
+    params = {"depth": depth, "limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    else:
+        params["path"] = path
+    if fields:
+        params["fields"] = fields
+
+    timeout = config.get_timeout('query_objects')
+    result = await client.request('scene/browse', method="GET", params=params, timeout=timeout)
+    return result
+
+
+async def worldbuilder_get_scene_changes(
+    since: int,
+    epoch: str = ""
+) -> Dict[str, Any]:
+    """Get prims added, removed and modified since a stage revision.
+
+    Args:
+        since: Revision from get_scene or the previous call's 'revision'
+        epoch: Epoch returned with that revision; a mismatch forces a resync
+    """
+    client = get_client()
+
+    params = {"since": since}
+    if epoch:
+        params["epoch"] = epoch
+
+    timeout = config.get_timeout('query_objects')
+    result = await client.request('scene/changes', method="GET", params=params, timeout=timeout)
+    return result
+
+
+async def worldbuilder_export_scene(
+    output_path: str,
+    path: str = "/World",
+    format: str = "usdc",
+    flatten: bool = True
+) -> Dict[str, Any]:
+    """Export /World or a subtree to a local USDC/USDA file in one streamed transfer.
+
+    Args:
+        output_path: Local file to write the exported scene to
+        path: Root prim to export
+        format: usdc (binary) or usda (text)
+        flatten: Compose references and layers into plain prims; false keeps the root layer as authored
+    """
+    client = get_client()
+
+    params = {"path": path, "format": format, "flatten": str(bool(flatten)).lower()}
+    timeout = config.get_timeout('scene_transfer')
+    result = await client.download('scene/export', output_path, params=params, timeout=timeout)
+    return result
+
+
+async def worldbuilder_import_scene(
+    file_path: str,
+    mode: str = "sublayer",
+    target_path: str = ""
+) -> Dict[str, Any]:
+    """Upload a local USDC/USDA scene and attach it to the stage in one change block.
+
+    Args:
+        file_path: Local USD file, e.g. one written by worldbuilder_export_scene
+        mode: sublayer (keep prim paths) or reference (instance under target_path)
+        target_path: Prim to create for reference imports (default /World/Imported)
+    """
+    client = get_client()
+
+    params = {"mode": mode}
+    if target_path:
+        params["target_path"] = target_path
+
+    timeout = config.get_timeout('scene_transfer')
+    result = await client.upload('scene/import', file_path, params=params, timeout=timeout)
+    return result
@@ -42,17 +42,82 @@ def create_stdio_server():
                     "required": ["position"]
                 }
             ),
+            Tool(
+                name="worldsurveyor_create_waypoints",
+                description="Create many waypoints in a single transaction; markers are drawn once at the end",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "waypoints": {
+                            "type": "array",
+                            "minItems": 1,
+                            "description": "Waypoints to create",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "position": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "3D position [x, y, z]"},
+                                    "waypoint_type": {"type": "string", "description": "Type of waypoint"},
+                                    "name": {"type": "string", "description": "Optional custom name"},
+                                    "target": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "Optional target coordinates"},
+                                    "metadata": {"type": "object", "description": "Optional additional metadata"},
+                                    "group_ids": {"type": "array", "items": {"type": "string"}, "description": "Optional groups to join"}
+                                },
+                                "required": ["position"]
+                            }
+                        }
+                    },
+                    "required": ["waypoints"]
+                }
+            ),
             Tool(
                 name="worldsurveyor_list_waypoints",
-                description="List all waypoints in the scene with optional filtering",
+                description="List waypoints with optional filtering, keyset paging and field projection",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "waypoint_type": {"type": "string", "description": "Optional filter by waypoint type"},
-                        "group_id": {"type": "string", "description": "Optional filter by group ID"}
+                        "group_id": {"type": "string", "description": "Optional filter by group ID"},
+                        "limit": {"type": "integer", "minimum": 1, "maximum": 10000, "description": "Optional page size; the response carries has_more and next_cursor"},
+                        "cursor": {"type": "string", "description": "next_cursor of the previous page (same order_by and order)"},
+                        "after_id": {"type": "string", "description": "Continue after this waypoint ID (next_after_id of the previous page); prefer cursor"},
+                        "order_by": {"type": "string", "enum": ["timestamp", "name", "id"], "description": "Sort key"},
+                        "order": {"type": "string", "enum": ["asc", "desc"], "description": "Sort direction"},
+                        "fields": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": ["id", "name", "position", "target", "waypoint_type", "timestamp", "session_id", "metadata", "groups"]},
+                            "description": "Optional projection; metadata and groups are skipped unless listed"
+                        }
                     }
                 }
             ),
+            Tool(
+                name="worldsurveyor_nearest_waypoints",
+                description="Find the k waypoints closest to a point, optionally within a radius (spatial index)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "position": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "3D query point [x, y, z]"},
+                        "k": {"type": "integer", "minimum": 1, "maximum": 1000, "default": 10, "description": "Maximum number of waypoints to return"},
+                        "radius": {"type": "number", "minimum": 0, "description": "Optional search radius"},
+                        "waypoint_type": {"type": "string", "description": "Optional filter by waypoint type"}
+                    },
+                    "required": ["position"]
+                }
+            ),
+            Tool(
+                name="worldsurveyor_waypoints_in_bounds",
+                description="Find waypoints inside an axis-aligned bounding box (spatial index)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "min": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "Minimum corner [x, y, z]"},
+                        "max": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "Maximum corner [x, y, z]"},
+                        "waypoint_type": {"type": "string", "description": "Optional filter by waypoint type"},
+                        "limit": {"type": "integer", "minimum": 1, "maximum": 10000, "default": 1000, "description": "Maximum number of waypoints to return"}
+                    },
+                    "required": ["min", "max"]
+                }
+            ),
             Tool(
                 name="worldsurveyor_remove_waypoint",
                 description="Remove a waypoint from the scene",
@@ -255,14 +320,26 @@ def create_stdio_server():
             ),
             Tool(
                 name="worldsurveyor_import_waypoints",
-                description="Import waypoints from file",
+                description="Import waypoints from a file (streamed, runs in the background) or inline data",
                 inputSchema={
                     "type": "object",
                     "properties": {
-                        "file_path": {"type": "string", "description": "Path to import file"},
-                        "merge": {"type": "boolean", "description": "Whether to merge with existing waypoints"}
+                        "file_path": {"type": "string", "description": "Path to an export document, JSON array or NDJSON file"},
+                        "waypoint_data": {"type": "object", "description": "Export document to import inline"},
+                        "merge_mode": {"type": "string", "enum": ["replace", "merge"], "description": "replace existing data (default) or merge with it"},
+                        "merge": {"type": "boolean", "description": "Shorthand for merge_mode=merge"}
+                    }
+                }
+            ),
+            Tool(
+                name="worldsurveyor_get_import_status",
+                description="Get progress of a waypoint import",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "import_id": {"type": "string", "description": "ID returned when the import was started"}
                     },
-                    "required": ["file_path"]
+                    "required": ["import_id"]
                 }
             ),
 
@@ -299,8 +376,14 @@ def create_stdio_server():
             # Waypoint Management Tools
             if name == "worldsurveyor_create_waypoint":
                 return await waypoints.worldsurveyor_create_waypoint(**arguments)
+            elif name == "worldsurveyor_create_waypoints":
+                return await waypoints.worldsurveyor_create_waypoints(**arguments)
             elif name == "worldsurveyor_list_waypoints":
                 return await waypoints.worldsurveyor_list_waypoints(**arguments)
+            elif name == "worldsurveyor_nearest_waypoints":
+                return await waypoints.worldsurveyor_nearest_waypoints(**arguments)
+            elif name == "worldsurveyor_waypoints_in_bounds":
+                return await waypoints.worldsurveyor_waypoints_in_bounds(**arguments)
             elif name == "worldsurveyor_remove_waypoint":
                 return await waypoints.worldsurveyor_remove_waypoint(**arguments)
             elif name == "worldsurveyor_update_waypoint":
@@ -347,6 +430,8 @@ def create_stdio_server():
                 return await import_export.worldsurveyor_export_waypoints(**arguments)
             elif name == "worldsurveyor_import_waypoints":
                 return await import_export.worldsurveyor_import_waypoints(**arguments)
+            elif name == "worldsurveyor_get_import_status":
+                return await import_export.worldsurveyor_get_import_status(**arguments)
 
             # System Tools
             elif name == "worldsurveyor_health_check":
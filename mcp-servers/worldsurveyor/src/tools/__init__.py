@@ -14,7 +14,10 @@ def get_tool_functions():
     return {
         # Waypoint Management Tools
         "worldsurveyor_create_waypoint": waypoints.worldsurveyor_create_waypoint,
+        "worldsurveyor_create_waypoints": waypoints.worldsurveyor_create_waypoints,
         "worldsurveyor_list_waypoints": waypoints.worldsurveyor_list_waypoints,
+        "worldsurveyor_nearest_waypoints": waypoints.worldsurveyor_nearest_waypoints,
+        "worldsurveyor_waypoints_in_bounds": waypoints.worldsurveyor_waypoints_in_bounds,
         "worldsurveyor_remove_waypoint": waypoints.worldsurveyor_remove_waypoint,
         "worldsurveyor_update_waypoint": waypoints.worldsurveyor_update_waypoint,
         "worldsurveyor_goto_waypoint": waypoints.worldsurveyor_goto_waypoint,
@@ -41,6 +44,7 @@ def get_tool_functions():
         # Import/Export Tools
         "worldsurveyor_export_waypoints": import_export.worldsurveyor_export_waypoints,
         "worldsurveyor_import_waypoints": import_export.worldsurveyor_import_waypoints,
+        "worldsurveyor_get_import_status": import_export.worldsurveyor_get_import_status,
 
         # System Tools
         "worldsurveyor_health_check": system.worldsurveyor_health_check,
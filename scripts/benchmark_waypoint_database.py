@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Concurrent reader/writer benchmark for the WorldSurveyor waypoint database.
+
+Seeds a temporary SQLite database through ``WaypointDatabase`` and then runs
+reader threads (``list_waypoints`` by type and ``get_waypoint``) alongside
+writer threads (``create_waypoint``, ``update_waypoint`` and
+``remove_waypoint``) for a fixed duration, once per configuration:
+
+    legacy  rollback journal, reads serialized behind the writer lock
+            (the behaviour before WAL support)
+    delete  rollback journal, lock-free reads
+    wal     WAL journal with the tuned pragmas, lock-free reads
+
+Only the standard library is needed; the extension package is loaded without
+its Kit entry point.
+
+Usage:
+    python scripts/benchmark_waypoint_database.py [--modes legacy,delete,wal]
+        [--waypoints 5000] [--readers 4] [--writers 1] [--duration 5]
+        [--json results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CORE_SRC = REPO_ROOT / "agentworld-core" / "src"
+WORLDSURVEYOR_OMNI = REPO_ROOT / "agentworld-extensions" / "omni.agent.worldsurveyor" / "omni"
+
+MODES = ("legacy", "delete", "wal")
+WAYPOINT_TYPES = ("point_of_interest", "camera_position", "observation_point", "target_location")
+
+
+def _load_database_module():
+    """Import ``waypoint_database`` without running the extension's ``__init__``."""
+    if str(CORE_SRC) not in sys.path:
+        sys.path.insert(0, str(CORE_SRC))
+    for name, path in (("omni", WORLDSURVEYOR_OMNI),
+                       ("omni.agent", WORLDSURVEYOR_OMNI / "agent"),
+                       ("omni.agent.worldsurveyor", WORLDSURVEYOR_OMNI / "agent" / "worldsurveyor")):
+        module = sys.modules.get(name) or types.ModuleType(name)
+        module.__path__ = [str(path)]  # type: ignore[attr-defined]
+        sys.modules[name] = module
+    from omni.agent.worldsurveyor import waypoint_database
+    return waypoint_database
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pick(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000.0, 3)
+
+    return {"count": len(ordered), "mean_ms": round(statistics.fmean(ordered) * 1000.0, 3),
+            "p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99), "max_ms": pick(1.0)}
+
+
+def bench_mode(module, mode: str, waypoints: int, readers: int, writers: int,
+               duration: float, seed: int) -> Dict[str, Any]:
+    config = module.get_config()
+    config.set("database_journal_mode", "wal" if mode == "wal" else "delete")
+    config.set("max_waypoints", max(config.max_waypoints, waypoints * 10))
+
+    directory = tempfile.mkdtemp(prefix="waypoint_bench_")
+    database = module.WaypointDatabase(os.path.join(directory, "waypoints.db"))
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    ids: List[str] = []
+    with database._write_transaction():
+        for index in range(waypoints):
+            ids.append(database.create_waypoint(
+                position=(rng.uniform(-100, 100), rng.uniform(0, 10), rng.uniform(-100, 100)),
+                waypoint_type=WAYPOINT_TYPES[index % len(WAYPOINT_TYPES)],
+            ))
+    seed_seconds = time.perf_counter() - start
+
+    stop = threading.Event()
+    read_samples: List[List[float]] = [[] for _ in range(readers)]
+    write_samples: List[List[float]] = [[] for _ in range(writers)]
+    errors: List[str] = []
+
+    def read_loop(slot: int) -> None:
+        local = random.Random(seed + 1 + slot)
+        try:
+            while not stop.is_set():
+                began = time.perf_counter()
+                if mode == "legacy":
+                    with database._write_lock:
+                        _read_once(database, local, ids)
+                else:
+                    _read_once(database, local, ids)
+                read_samples[slot].append(time.perf_counter() - began)
+            database.close()
+        except Exception as exc:  # pragma: no cover - reported in results
+            errors.append(f"reader: {exc}")
+
+    def write_loop(slot: int) -> None:
+        local = random.Random(seed + 100 + slot)
+        try:
+            while not stop.is_set():
+                began = time.perf_counter()
+                roll = local.random()
+                if roll < 0.6:
+                    database.create_waypoint(position=(local.random(), local.random(), local.random()),
+                                             waypoint_type=local.choice(WAYPOINT_TYPES))
+                elif roll < 0.9:
+                    database.update_waypoint(local.choice(ids), name=f"renamed {local.random():.4f}")
+                else:
+                    database.remove_waypoint(local.choice(ids))
+                write_samples[slot].append(time.perf_counter() - began)
+            database.close()
+        except Exception as exc:  # pragma: no cover - reported in results
+            errors.append(f"writer: {exc}")
+
+    threads = [threading.Thread(target=read_loop, args=(slot,)) for slot in range(readers)]
+    threads += [threading.Thread(target=write_loop, args=(slot,)) for slot in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    journal_mode = database.journal_mode
+    database.close()
+    reads = [sample for samples in read_samples for sample in samples]
+    writes = [sample for samples in write_samples for sample in samples]
+    return {
+        "mode": mode,
+        "journal_mode": journal_mode,
+        "waypoints": waypoints,
+        "readers": readers,
+        "writers": writers,
+        "seed_waypoints_per_sec": round(waypoints / seed_seconds, 1) if seed_seconds else 0.0,
+        "reads_per_sec": round(len(reads) / duration, 1),
+        "writes_per_sec": round(len(writes) / duration, 1),
+        "read_latency": _percentiles(reads),
+        "write_latency": _percentiles(writes),
+        "errors": errors[:5],
+    }
+
+
+def _read_once(database, rng: random.Random, ids: List[str]) -> None:
+    if rng.random() < 0.5:
+        database.list_waypoints(waypoint_type=rng.choice(WAYPOINT_TYPES))
+    else:
+        database.get_waypoint(rng.choice(ids))
+
+
+def _print_report(results: List[Dict[str, Any]]) -> None:
+    for run in results:
+        print(f"\n=== {run['mode']} (journal_mode={run['journal_mode']}, {run['waypoints']:,} waypoints, "
+              f"{run['readers']} readers / {run['writers']} writers) ===")
+        print(f"  seed                {run['seed_waypoints_per_sec']:>10,.0f} waypoints/s (one transaction)")
+        for label, rate, latency in (("reads", run["reads_per_sec"], run["read_latency"]),
+                                     ("writes", run["writes_per_sec"], run["write_latency"])):
+            if not latency.get("count"):
+                print(f"  {label:<18}  none completed")
+                continue
+            print(f"  {label:<18}{rate:>10,.1f} ops/s  p50 {latency['p50_ms']:>8.3f}  p95 {latency['p95_ms']:>8.3f}  "
+                  f"p99 {latency['p99_ms']:>8.3f}  max {latency['max_ms']:>8.3f}ms")
+        for error in run["errors"]:
+            print(f"  error: {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", default=",".join(MODES), help="comma separated: legacy, delete, wal")
+    parser.add_argument("--waypoints", type=int, default=5000, help="waypoints seeded before the run")
+    parser.add_argument("--readers", type=int, default=4, help="reader threads")
+    parser.add_argument("--writers", type=int, default=1, help="writer threads")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per mode")
+    parser.add_argument("--seed", type=int, default=7, help="random seed")
+    parser.add_argument("--json", dest="json_path", help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(unknown)}")
+
+    import logging
+    logging.disable(logging.WARNING)
+    module = _load_database_module()
+
+    results = [bench_mode(module, mode, args.waypoints, args.readers, args.writers, args.duration, args.seed)
+               for mode in modes]
+    _print_report(results)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 1 if any(run["errors"] for run in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""Offline WorldBuilder throughput benchmark against a usd-core stage.
+
+Runs the WorldBuilder scene modules (ElementFactory, BatchManager,
+CleanupOperations, SceneBuilder inspection and the spatial/type/transform
+queries) against an in-memory ``Usd.Stage`` from the pip ``usd-core`` package.
+Only the ``omni`` and ``carb`` modules are stubbed, so the numbers reflect the
+real USD work without launching Isaac Sim. Inspection and queries go through
+``WorldBuilderService`` from a client thread while the benchmark thread drains
+the main-thread queue, as the HTTP handler and Kit's update loop do.
+
+Usage:
+    pip install usd-core numpy
+    python scripts/benchmark_worldbuilder.py [--sizes 1000,10000,100000]
+        [--queries 200] [--json results.json] [--authoring-backend usd|sdf]
+        [--baseline baseline.json --max-regression 0.25]
+
+Reported per scene size:
+    - prims/sec for element creation, batch creation and removals
+    - cold latency (median of calls made with every scene cache reset) for
+      inspection and queries, plus percentiles of uncached inspection calls
+      and of repeated queries; cached inspection percentiles are informational
+    - resident memory growth while building the scene
+
+With ``--baseline`` the run exits with status 1 when a throughput drops, or a
+cold or p95 latency grows, by more than ``--max-regression`` against the
+baseline JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CORE_SRC = REPO_ROOT / "agentworld-core" / "src"
+WORLDBUILDER_OMNI = REPO_ROOT / "agentworld-extensions" / "omni.agent.worldbuilder" / "omni"
+
+DEFAULT_SIZES = "1000,10000,100000"
+GROUP_SIZE = 1000
+BATCH_SIZE = 100
+ELEMENT_TYPES = ("cube", "sphere", "cylinder", "cone")
+COLD_REPEATS = 3
+# Latency growth below this is treated as timer noise
+LATENCY_NOISE_FLOOR_MS = 0.5
+
+
+class _StageHolder:
+    """Stand-in for ``omni.usd.UsdContext`` serving the benchmark stage."""
+
+    def __init__(self) -> None:
+        self.stage = None
+
+    def get_stage(self):
+        return self.stage
+
+
+_CONTEXT = _StageHolder()
+
+
+def _install_stubs() -> None:
+    """Provide just enough of ``omni``/``carb`` for the WorldBuilder scene modules."""
+    if str(CORE_SRC) not in sys.path:
+        sys.path.insert(0, str(CORE_SRC))
+
+    def _package(name: str, path: Optional[Path] = None) -> types.ModuleType:
+        module = sys.modules.get(name) or types.ModuleType(name)
+        module.__path__ = [str(path)] if path else []  # type: ignore[attr-defined]
+        sys.modules[name] = module
+        return module
+
+    omni = _package("omni", WORLDBUILDER_OMNI)
+    _package("omni.agent", WORLDBUILDER_OMNI / "agent")
+    _package("omni.agent.worldbuilder", WORLDBUILDER_OMNI / "agent" / "worldbuilder")
+
+    omni_usd = types.ModuleType("omni.usd")
+    omni_usd.get_context = lambda *_args: _CONTEXT  # type: ignore[attr-defined]
+    sys.modules["omni.usd"] = omni_usd
+    omni.usd = omni_usd  # type: ignore[attr-defined]
+
+    omni.kit = _package("omni.kit")  # type: ignore[attr-defined]
+    kit_app = types.ModuleType("omni.kit.app")
+    kit_app.get_app = lambda: None  # type: ignore[attr-defined]
+    sys.modules["omni.kit.app"] = kit_app
+    omni.kit.app = kit_app  # type: ignore[attr-defined]
+
+    carb = _package("carb")
+    carb_settings = types.ModuleType("carb.settings")
+    carb_settings.get_settings = lambda: types.SimpleNamespace(get=lambda _key: None)  # type: ignore[attr-defined]
+    carb.settings = carb_settings  # type: ignore[attr-defined]
+    sys.modules["carb.settings"] = carb_settings
+
+
+# ----------------------------------------------------------------------
+# Measurement helpers
+# ----------------------------------------------------------------------
+
+def _rss_mb() -> float:
+    """Current resident set size in MiB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples_ms)
+
+    def _pick(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+    return {
+        "p50_ms": round(_pick(0.50), 3),
+        "p95_ms": round(_pick(0.95), 3),
+        "p99_ms": round(_pick(0.99), 3),
+        "max_ms": round(ordered[-1], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def _time_ms(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def _latency(func: Callable[[], Any], repeats: int, reset: Callable[[], None],
+             uncached: bool = False) -> Dict[str, Any]:
+    """
+    Cold latency plus percentiles of ``repeats`` further calls.
+
+    ``cold_ms`` is the median of ``COLD_REPEATS`` calls each made right after
+    ``reset`` (untimed). With ``uncached`` every sample is preceded by a reset
+    too, and the percentiles of repeated cache hits are reported separately.
+    """
+    cold = []
+    for _ in range(COLD_REPEATS):
+        reset()
+        cold.append(_time_ms(func))
+    samples = []
+    for _ in range(repeats):
+        if uncached:
+            reset()
+        samples.append(_time_ms(func))
+    result: Dict[str, Any] = {"cold_ms": round(statistics.median(cold), 3), **_percentiles(samples)}
+    if uncached:
+        result["cached"] = _percentiles([_time_ms(func) for _ in range(repeats)])
+    return result
+
+
+def _throughput(count: int, elapsed_s: float) -> Dict[str, float]:
+    return {
+        "prims": count,
+        "seconds": round(elapsed_s, 3),
+        "prims_per_sec": round(count / elapsed_s, 1) if elapsed_s > 0 else 0.0,
+    }
+
+
+# ----------------------------------------------------------------------
+# Benchmark phases
+# ----------------------------------------------------------------------
+
+def _new_api():
+    """The real ``HTTPAPIInterface`` (query helpers, scene builder) without binding its port."""
+    from pxr import Usd, UsdGeom
+
+    from omni.agent.worldbuilder.api_interface import HTTPAPIInterface
+
+    class _OfflineAPI(HTTPAPIInterface):
+        def _start_server(self):
+            pass
+
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Xform.Define(stage, "/World")
+    _CONTEXT.stage = stage
+    return _OfflineAPI(), stage
+
+
+class _Client:
+    """
+    Call service endpoints the way the HTTP handler does.
+
+    The endpoint runs on a worker thread and hands its USD work to the scene
+    builder's main-thread queue; the calling thread drains that queue like
+    Kit's update loop until the response is ready.
+    """
+
+    def __init__(self, api) -> None:
+        self._api = api
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="benchmark-client")
+
+    def __call__(self, endpoint: Callable[..., Dict[str, Any]], *args: Any) -> Dict[str, Any]:
+        future = self._executor.submit(endpoint, *args)
+        while not future.done():
+            self._api.process_queued_operations()
+            time.sleep(0)  # let the client thread take the GIL
+        response = future.result()
+        if not response.get("success", False):
+            raise RuntimeError(f"{endpoint.__name__} failed: {response.get('error')}")
+        return response
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+
+def _reset_scene_caches(builder) -> None:
+    """Rebind the stage so every stage-derived cache and index starts cold."""
+    observer = builder._stage_observer
+    stage = _CONTEXT.stage
+    _CONTEXT.stage = None
+    observer.current_stage()
+    _CONTEXT.stage = stage
+    observer.current_stage()
+
+
+def _grid_position(index: int, extent: float) -> tuple:
+    side = max(1, int(round(extent)))
+    return (float(index % side) * 2.0, 0.5, float(index // side) * 2.0)
+
+
+def bench_size(size: int, queries: int, rng: random.Random, backend: str = "usd") -> Dict[str, Any]:
+    from pxr import UsdGeom
+
+    from omni.agent.worldbuilder.scene.scene_types import PrimitiveType, SceneElement
+    from omni.agent.worldbuilder.services.worldbuilder_service import WorldBuilderService
+
+    gc.collect()
+    rss_start = _rss_mb()
+    api, stage = _new_api()
+    builder = api.scene_builder
+    factory = builder._element_factory
+    batches = builder._batch_manager
+    cleanup = builder._cleanup_operations
+    results: Dict[str, Any] = {"size": size, "authoring_backend": backend}
+    extent = (size ** 0.5) or 1.0
+
+    # ElementFactory: half the scene as individual elements in groups of GROUP_SIZE
+    individual = size // 2
+    for group in range((individual + GROUP_SIZE - 1) // GROUP_SIZE):
+        UsdGeom.Xform.Define(stage, f"/World/Group_{group:04d}")
+    start = time.perf_counter()
+    for i in range(individual):
+        factory.create_element(SceneElement(
+            name=f"elem_{i:06d}",
+            primitive_type=PrimitiveType(ELEMENT_TYPES[i % len(ELEMENT_TYPES)]),
+            position=_grid_position(i, extent),
+            color=(rng.random(), rng.random(), rng.random()),
+            parent_path=f"/World/Group_{i // GROUP_SIZE:04d}",
+            authoring_backend=backend,
+        ))
+    results["create_elements"] = _throughput(individual, time.perf_counter() - start)
+
+    # BatchManager: the other half as batches of BATCH_SIZE
+    batched = size - individual
+    start = time.perf_counter()
+    for batch in range((batched + BATCH_SIZE - 1) // BATCH_SIZE):
+        count = min(BATCH_SIZE, batched - batch * BATCH_SIZE)
+        elements = [{
+            "name": f"item_{j:03d}",
+            "element_type": ELEMENT_TYPES[j % len(ELEMENT_TYPES)],
+            "position": list(_grid_position(individual + batch * BATCH_SIZE + j, extent)),
+            "authoring_backend": backend,
+        } for j in range(count)]
+        batches.create_batch(f"batch_{batch:05d}", elements, {"position": (0.0, 0.0, 0.0)})
+    results["create_batches"] = _throughput(batched, time.perf_counter() - start)
+    results["memory"] = {"rss_growth_mb": round(_rss_mb() - rss_start, 1)}
+
+    service = WorldBuilderService(api)
+    client = _Client(api)
+    reset = lambda: _reset_scene_caches(builder)  # noqa: E731
+
+    # Inspection endpoints: samples after a cache reset, then cache hits
+    repeats = max(5, queries // 20)
+    results["inspection"] = {
+        "get_scene_contents": _latency(
+            lambda: client(service.get_scene, {"path": "/World", "include_metadata": False}), repeats, reset, True),
+        "list_elements": _latency(lambda: client(service.list_elements, {"page_size": 100}), repeats, reset, True),
+        "browse_hierarchy": _latency(
+            lambda: client(service.browse_scene, {"path": "/World", "depth": 2, "limit": 100}), repeats, reset, True),
+        "scene_statistics": _latency(lambda: client(service.get_scene_status), repeats, reset, True),
+        "list_batches": _latency(lambda: client(service.list_batches), repeats, reset, True),
+    }
+
+    # Query endpoints: cold calls rebuild the indexes, then randomized lookups
+    span = extent * 2.0
+    element_paths = [f"/World/Group_{i // GROUP_SIZE:04d}/elem_{i:06d}" for i in range(individual)]
+
+    def _box():
+        x, z = rng.uniform(0, span), rng.uniform(0, span)
+        return client(service.query_objects_in_bounds, {"min": [x, -1.0, z], "max": [x + 10.0, 2.0, z + 10.0]})
+
+    def _radius():
+        point = [rng.uniform(0, span), 0.5, rng.uniform(0, span)]
+        return client(service.query_objects_near_point, {"point": point, "radius": 5.0})
+
+    def _ground():
+        position = [rng.uniform(0, span), 0.0, rng.uniform(0, span)]
+        return client(service.find_ground_level, {"position": position, "search_radius": 10.0})
+
+    def _bounds():
+        return client(service.calculate_bounds, {"objects": rng.sample(element_paths, min(100, len(element_paths)))})
+
+    results["queries"] = {
+        "objects_in_bounds": _latency(_box, queries, reset),
+        "objects_near_point": _latency(_radius, queries, reset),
+        "objects_by_type": _latency(
+            lambda: client(service.query_objects_by_type, {"type": rng.choice(ELEMENT_TYPES)}), queries, reset),
+        "find_ground_level": _latency(_ground, queries, reset),
+        "calculate_bounds_100": _latency(_bounds, queries, reset) if element_paths else {},
+    }
+    client.close()
+
+    # CleanupOperations: single removals, then whole groups
+    singles = element_paths[:min(1000, len(element_paths)) // 2]
+    start = time.perf_counter()
+    for path in singles:
+        cleanup.remove_element(path)
+    results["remove_elements"] = _throughput(len(singles), time.perf_counter() - start)
+
+    world_before = len(list(stage.Traverse()))
+    start = time.perf_counter()
+    cleanup.clear_by_pattern("Group_*", parent_path="/World")
+    cleanup.clear_by_pattern("batch_*", parent_path="/World")
+    elapsed = time.perf_counter() - start
+    results["clear_groups"] = _throughput(world_before - len(list(stage.Traverse())), elapsed)
+
+    results["memory"]["rss_total_mb"] = round(_rss_mb(), 1)
+    api.shutdown()
+    _CONTEXT.stage = None
+    return results
+
+
+# ----------------------------------------------------------------------
+# Reporting
+# ----------------------------------------------------------------------
+
+def _print_report(results: List[Dict[str, Any]]) -> None:
+    for run in results:
+        print(f"\n=== {run['size']:,} prims ===")
+        for phase in ("create_elements", "create_batches", "remove_elements", "clear_groups"):
+            data = run[phase]
+            print(f"  {phase:<22} {data['prims_per_sec']:>12,.0f} prims/s  ({data['prims']:,} in {data['seconds']}s)")
+        for section in ("inspection", "queries"):
+            for name, data in run[section].items():
+                if not data:
+                    continue
+                cached = f"  (cached p50 {data['cached']['p50_ms']:.3f}ms)" if "cached" in data else ""
+                print(f"  {name:<22} cold {data['cold_ms']:>9.2f}ms  p50 {data['p50_ms']:>8.3f}  "
+                      f"p95 {data['p95_ms']:>8.3f}  p99 {data['p99_ms']:>8.3f}ms{cached}")
+        memory = run["memory"]
+        print(f"  memory                 +{memory['rss_growth_mb']} MiB while building, {memory['rss_total_mb']} MiB RSS")
+
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+                        max_regression: float) -> List[str]:
+    """Return human readable regressions of ``results`` against ``baseline``."""
+    previous = {run["size"]: run for run in baseline}
+    regressions = []
+    for run in results:
+        base = previous.get(run["size"])
+        if not base:
+            continue
+        for phase in ("create_elements", "create_batches", "remove_elements", "clear_groups"):
+            old, new = base.get(phase, {}).get("prims_per_sec"), run[phase]["prims_per_sec"]
+            if old and new < old * (1.0 - max_regression):
+                regressions.append(f"{run['size']}: {phase} {new:,.0f} prims/s < baseline {old:,.0f}")
+        for section in ("inspection", "queries"):
+            for name, data in run[section].items():
+                for metric in ("cold_ms", "p95_ms"):
+                    old = base.get(section, {}).get(name, {}).get(metric)
+                    new = data.get(metric)
+                    if old and new and new > max(old * (1.0 + max_regression), old + LATENCY_NOISE_FLOOR_MS):
+                        label = metric[:-3]
+                        regressions.append(f"{run['size']}: {name} {label} {new}ms > baseline {old}ms")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated scene sizes (prims)")
+    parser.add_argument("--queries", type=int, default=200, help="samples per query latency measurement")
+    parser.add_argument("--seed", type=int, default=7, help="random seed for colors and query points")
+    parser.add_argument("--authoring-backend", choices=("usd", "sdf"), default="usd",
+                        help="element authoring backend for the creation phases (default usd)")
+    parser.add_argument("--json", dest="json_path", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="allowed fractional slowdown against --baseline (default 0.25)")
+    args = parser.parse_args(argv)
+
+    try:
+        import pxr  # noqa: F401
+    except ImportError:
+        print("usd-core is required: pip install usd-core numpy", file=sys.stderr)
+        return 2
+
+    _install_stubs()
+    import logging
+    logging.disable(logging.WARNING)
+
+    rng = random.Random(args.seed)
+    sizes = [int(part) for part in args.sizes.split(",") if part.strip()]
+    results = [bench_size(size, args.queries, rng, args.authoring_backend) for size in sizes]
+    _print_report(results)
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json_path}")
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, json.loads(Path(args.baseline).read_text()), args.max_regression)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())